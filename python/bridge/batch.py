@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Batch Execution for the Bridge Server
+
+Clients sorting many small arrays (one per table row, say) used to send one
+/execute request each, paying HTTP overhead, JSON parsing and algorithm
+construction per array. A batch request carries all of them for one
+algorithm and option set, either as a list of arrays or packed:
+
+- ``datasets``: a list of arrays; results come back as a list of arrays
+- ``data`` + ``offsets``: one concatenated array and the row boundaries
+  (``offsets[i]:offsets[i + 1]`` is row i, the final boundary may be
+  omitted); results come back in the same layout with the same offsets.
+  Binary bodies (see uploads.py) use this layout with ``offsets`` among the
+  request fields
+
+Rows are split into contiguous chunks of similar element counts, one task
+per chunk, so the pool works on them in parallel while each worker builds
+the algorithm once per chunk. Packed numeric inputs live in one
+shared-memory segment: workers read their rows from it and write the
+sorted rows back in place, so only per-row metrics cross the process
+boundary. Batched runs never record history.
+
+A row that fails (budget, error) is reported in ``errors`` and leaves its
+slot unsorted; the other rows are unaffected.
+
+Configuration (environment variables):
+    BRIDGE_BATCH_MAX_ROWS   Largest number of rows in one request (default 100000)
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import array
+from multiprocessing import shared_memory
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+from python.bridge.executor import (
+    ExecutionBackend, InputRef, _cpu_limit, _create_algorithm, WORKER_CPU_SECONDS
+)
+from python.core.budget import BudgetExceeded
+
+BATCH_MAX_ROWS = int(os.environ.get('BRIDGE_BATCH_MAX_ROWS', 100000))
+
+# Per-row metrics, returned as columns
+BATCH_METRICS = ('comparisons', 'swaps', 'execution_time')
+# Chunks per pool worker, so that uneven rows still balance
+CHUNKS_PER_WORKER = 4
+
+
+def row_bounds(offsets: List[int], length: int) -> List[Tuple[int, int]]:
+    """
+    Turn row offsets into (start, end) element ranges.
+
+    Args:
+        offsets: Row start offsets, optionally followed by the total length
+        length: Number of elements in the packed array
+
+    Returns:
+        One (start, end) pair per row
+
+    Raises:
+        ValueError: If the offsets do not describe the packed array
+    """
+    offsets = [int(offset) for offset in offsets]
+    if not offsets or offsets[-1] != length:
+        offsets.append(length)
+    if offsets[0] != 0:
+        raise ValueError("Offsets must start at 0")
+    if any(end < start for start, end in zip(offsets, offsets[1:])):
+        raise ValueError("Offsets must be non-decreasing and within the data")
+    if len(offsets) - 1 > BATCH_MAX_ROWS:
+        raise ValueError(f"A batch holds at most {BATCH_MAX_ROWS} rows")
+    return list(zip(offsets, offsets[1:]))
+
+
+def partition_rows(sizes: List[int], chunks: int) -> List[Tuple[int, int]]:
+    """
+    Split rows into contiguous chunks of similar total size.
+
+    Args:
+        sizes: Number of elements per row
+        chunks: Desired number of chunks
+
+    Returns:
+        (first row, end row) ranges covering every row in order
+    """
+    if not sizes:
+        return []
+    chunks = max(1, min(chunks, len(sizes)))
+    # Count every row as at least one element so empty rows still spread out
+    target = sum(max(size, 1) for size in sizes) / chunks
+
+    ranges, first, filled = [], 0, 0
+    for row, size in enumerate(sizes):
+        filled += max(size, 1)
+        if filled >= target * (len(ranges) + 1) and len(ranges) < chunks - 1:
+            ranges.append((first, row + 1))
+            first = row + 1
+    if first < len(sizes):
+        ranges.append((first, len(sizes)))
+    return ranges
+
+
+def _run_row(algorithm: Any, row: List[Any]) -> Tuple[Optional[List[Any]], Dict[str, Any]]:
+    """Sort one row, returning (result, entry) or (None, error entry)."""
+    try:
+        with _cpu_limit(WORKER_CPU_SECONDS):
+            result = algorithm.execute(row)
+    except BudgetExceeded as e:
+        return None, {'error': f"BudgetExceeded: {str(e)}", 'budget_exceeded': e.to_dict()}
+    except Exception as e:
+        return None, {'error': f"{type(e).__name__}: {str(e)}"}
+    return result, {metric: algorithm.metrics[metric] for metric in BATCH_METRICS}
+
+
+def run_batch_chunk(algorithm_key: str, source: Union[InputRef, List[List[Any]]],
+                    bounds: Optional[List[Tuple[int, int]]], options: Dict[str, Any],
+                    limits: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Sort a chunk of batch rows with one algorithm instance.
+
+    Module-level so that it can be pickled for the process pool.
+
+    Args:
+        algorithm_key: Registry key
+        source: Shared packed array (rows given by ``bounds``, sorted in
+            place), or the rows themselves
+        bounds: (start, end) element ranges of the rows in a shared array
+        options: Python-style algorithm options (history is disabled)
+        limits: Per-request limits, applied to each row
+
+    Returns:
+        One entry per row: its metrics (plus "result" for list rows), or an
+        "error" (with "budget_exceeded" when a limit stopped it)
+    """
+    algorithm = _create_algorithm(algorithm_key, dict(options, record_history=False), limits)
+    entries = []
+
+    if not isinstance(source, InputRef):
+        for row in source:
+            result, entry = _run_row(algorithm, row)
+            if result is not None:
+                entry['result'] = result
+            entries.append(entry)
+        return entries
+
+    shm = shared_memory.SharedMemory(name=source.name)
+    try:
+        view = shm.buf[:source.length * array.array(source.typecode).itemsize].cast(source.typecode)
+        try:
+            for start, end in bounds:
+                result, entry = _run_row(algorithm, view[start:end].tolist())
+                if result is not None:
+                    view[start:end] = array.array(source.typecode, result)
+                entries.append(entry)
+        finally:
+            view.release()
+    finally:
+        shm.close()
+    return entries
+
+
+def run_batch(backend: ExecutionBackend, algorithm_key: str, rows: Union[InputRef, List[List[Any]]],
+              bounds: Optional[List[Tuple[int, int]]], options: Dict[str, Any],
+              limits: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Sort every row of a batch on the pool.
+
+    Args:
+        backend: Pool to run the chunks on
+        algorithm_key: Registry key
+        rows: Shared packed array (see run_batch_chunk) or list of rows
+        bounds: Row ranges of a shared array (None for a list of rows)
+        options: Python-style algorithm options
+        limits: Per-request limits, applied to each row
+
+    Returns:
+        One entry per row, in row order (see run_batch_chunk)
+    """
+    sizes = [end - start for start, end in bounds] if bounds is not None else [len(row) for row in rows]
+    chunks = 1 if backend.mode == 'inline' else backend.workers * CHUNKS_PER_WORKER
+
+    futures = []
+    for first, last in partition_rows(sizes, chunks):
+        if bounds is not None:
+            futures.append(backend.submit(run_batch_chunk, algorithm_key, rows, bounds[first:last],
+                                          options, limits))
+        else:
+            futures.append(backend.submit(run_batch_chunk, algorithm_key, rows[first:last], None,
+                                          options, limits))
+
+    entries: List[Dict[str, Any]] = []
+    for future in futures:
+        entries.extend(future.result())
+    return entries
+
+
+def metric_columns(entries: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Transpose per-row metrics into columns (None for failed rows).
+
+    Args:
+        entries: Entries from run_batch
+
+    Returns:
+        Mapping of metric name to one value per row
+    """
+    return {metric: [entry.get(metric) for entry in entries] for metric in BATCH_METRICS}
+
+
+def row_errors(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Collect the failed rows of a batch.
+
+    Args:
+        entries: Entries from run_batch
+
+    Returns:
+        {"index", "error"[, "budget_exceeded"]} per failed row
+    """
+    return [dict({key: value for key, value in entry.items() if key != 'result'}, index=index)
+            for index, entry in enumerate(entries) if 'error' in entry]
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Scaling Benchmarks for the Bridge Server
+
+Measuring how an algorithm scales used to mean generating arrays in the
+client, uploading each one and looping over /compare. A benchmark request
+instead names a generator spec (``utils.data_generators.generate_dataset``)
+and a size sweep:
+
+- Workers generate each dataset themselves from the spec and a per-size seed,
+  so every algorithm sorts identical inputs and nothing is uploaded
+- Each (algorithm, size) point runs without history, ``repeats`` times; the
+  operation counts come from the first run and the time is the median
+- Operation counts and times are fitted to ``value = constant * n^exponent``
+  by least squares on log(n), log(value), with r² as a goodness-of-fit
+
+Points run on the pool they are given (the server uses the batch pool so
+concurrent points do not skew each other's timings).
+
+Configuration (environment variables):
+    BRIDGE_BENCHMARK_MAX_SIZE     Largest size in a sweep (default 1000000)
+    BRIDGE_BENCHMARK_MAX_POINTS   Largest algorithms x sizes product (default 200)
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import math
+import statistics
+from typing import Dict, Any, List, Optional
+
+from python.bridge.executor import (
+    COMPARE_TIMEOUT, TIMEOUT_GRACE, ExecutionBackend, _create_algorithm, _cpu_limit, _deadline,
+    _outcome, WORKER_CPU_SECONDS
+)
+from python.core.budget import BudgetExceeded
+
+BENCHMARK_MAX_SIZE = int(os.environ.get('BRIDGE_BENCHMARK_MAX_SIZE', 1000000))
+BENCHMARK_MAX_POINTS = int(os.environ.get('BRIDGE_BENCHMARK_MAX_POINTS', 200))
+MAX_REPEATS = 10
+
+# Metrics reported per point and fitted per algorithm
+COUNTERS = ('comparisons', 'swaps', 'reads', 'writes', 'memory_accesses')
+FITTED = ('comparisons', 'swaps', 'memory_accesses', 'execution_time')
+
+
+def sweep_sizes(sizes: Optional[List[int]] = None, start: int = 0, stop: int = 0,
+                factor: float = 2.0) -> List[int]:
+    """
+    Resolve the sizes of a sweep.
+
+    Args:
+        sizes: Explicit sizes (take precedence)
+        start: First size of a geometric sweep
+        stop: Last size (inclusive) of a geometric sweep
+        factor: Ratio between consecutive sizes
+
+    Returns:
+        Sorted distinct sizes
+
+    Raises:
+        ValueError: If the sweep is empty, invalid or exceeds BENCHMARK_MAX_SIZE
+    """
+    if sizes:
+        result = sorted({int(size) for size in sizes})
+    else:
+        if start < 1 or stop < start or factor <= 1:
+            raise ValueError("A sweep needs 'sizes' or 1 <= start <= stop and factor > 1")
+        result, size = [], float(start)
+        while round(size) <= stop:
+            if not result or round(size) != result[-1]:
+                result.append(round(size))
+            size *= factor
+
+    if not result or result[0] < 1:
+        raise ValueError("Sizes must be positive")
+    if result[-1] > BENCHMARK_MAX_SIZE:
+        raise ValueError(f"Size {result[-1]} exceeds the {BENCHMARK_MAX_SIZE} limit")
+    return result
+
+
+def fit_power_law(sizes: List[int], values: List[float]) -> Optional[Dict[str, float]]:
+    """
+    Fit ``value = constant * size^exponent`` by log-log least squares.
+
+    Args:
+        sizes: Input sizes
+        values: Measured values (non-positive values are skipped)
+
+    Returns:
+        Dictionary with exponent, constant, r2 and points, or None with
+        fewer than two usable points
+    """
+    points = [(math.log(size), math.log(value)) for size, value in zip(sizes, values)
+              if size > 0 and value and value > 0]
+    if len(points) < 2 or len({x for x, _ in points}) < 2:
+        return None
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    syy = sum((y - mean_y) ** 2 for _, y in points)
+
+    exponent = sxy / sxx
+    intercept = mean_y - exponent * mean_x
+    return {
+        'exponent': exponent,
+        'constant': math.exp(intercept),
+        'r2': (sxy * sxy) / (sxx * syy) if syy > 0 else 1.0,
+        'points': len(points)
+    }
+
+
+def run_benchmark_point(algorithm_key: str, dataset: Dict[str, Any], size: int, options: Dict[str, Any],
+                        repeats: int = 1, timeout: Optional[float] = None,
+                        limits: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Generate one dataset and measure an algorithm on it.
+
+    Module-level so that it can be pickled for the process pool.
+
+    Args:
+        algorithm_key: Registry key
+        dataset: {"type": generator name, "options": generator options}
+            where a "seed" option (default 0) is offset by the size
+        size: Number of elements
+        options: Python-style algorithm options (history is disabled)
+        repeats: Timed runs; the reported time is their median
+        timeout: Seconds allowed per run
+        limits: Per-request limits (max_comparisons, ...)
+
+    Returns:
+        Point with size, operation counters, execution_time and times
+    """
+    from python.utils.data_generators import generate_dataset
+
+    generator_options = dict(dataset.get('options', {}))
+    generator_options['seed'] = generator_options.get('seed', 0) + size
+    data = generate_dataset(dataset.get('type', 'random'), size, **generator_options)
+
+    if timeout:
+        limits = dict(limits or {})
+        limits['deadline'] = min(timeout, limits.get('deadline') or timeout)
+    options = dict(options, record_history=False)
+    point: Dict[str, Any] = {'size': size}
+    times = []
+    for repeat in range(repeats):
+        algorithm = _create_algorithm(algorithm_key, options, limits)
+        backstop = timeout + TIMEOUT_GRACE / 2 if timeout else None
+        with _deadline(backstop), _cpu_limit(WORKER_CPU_SECONDS):
+            algorithm.execute(list(data))
+        if repeat == 0:
+            point.update({counter: algorithm.metrics[counter] for counter in COUNTERS})
+        times.append(algorithm.metrics['execution_time'])
+
+    point['execution_time'] = statistics.median(times)
+    point['times'] = times
+    return point
+
+
+def run_benchmark(backend: ExecutionBackend, algorithms: List[str], dataset: Dict[str, Any],
+                  sizes: List[int], options_map: Dict[str, Dict[str, Any]], repeats: int = 1,
+                  timeout: float = COMPARE_TIMEOUT, limits: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Run a size sweep for several algorithms and fit their growth.
+
+    All points are submitted at once; a point that fails or times out is
+    reported with an error and left out of the fits.
+
+    Args:
+        backend: Pool to run the points on
+        algorithms: Registry keys
+        dataset: Generator spec (see run_benchmark_point)
+        sizes: Sizes from sweep_sizes()
+        options_map: Python-style options per key
+        repeats: Timed runs per point
+        timeout: Seconds allowed per run
+        limits: Per-request limits applied to every run
+
+    Returns:
+        Mapping of key to {"points": [...], "fits": {metric: fit or None}}
+    """
+    repeats = max(1, min(int(repeats), MAX_REPEATS))
+    futures = {(key, size): backend.submit(run_benchmark_point, key, dataset, size,
+                                           options_map.get(key, {}), repeats, timeout, limits)
+               for key in algorithms for size in sizes}
+
+    results: Dict[str, Any] = {}
+    for key in algorithms:
+        points = []
+        for size in sizes:
+            outcome = _outcome(futures[(key, size)], timeout * repeats)
+            if isinstance(outcome, Exception):
+                point = {'size': size, 'error': f"{type(outcome).__name__}: {str(outcome)}"}
+                if isinstance(outcome, BudgetExceeded):
+                    point['budget_exceeded'] = outcome.to_dict()
+                points.append(point)
+            else:
+                points.append(outcome)
+
+        measured = [point for point in points if 'error' not in point]
+        results[key] = {
+            'points': points,
+            'fits': {metric: fit_power_law([point['size'] for point in measured],
+                                           [point[metric] for point in measured])
+                     for metric in FITTED}
+        }
+    return results
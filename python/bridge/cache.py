@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Result Cache for the Bridge Server
+
+The front end often re-requests the same (algorithm, options, dataset)
+triple, e.g. when a user replays a run. This cache stores serialized run
+results keyed by a hash of the request kind, algorithm key, normalized
+options and input data:
+
+- LRU eviction under a byte budget (payload sizes)
+- Optional write-through persistence to a directory, consulted on misses
+- Single-flight: identical requests arriving while the first is still being
+  computed wait for its result instead of computing it again
+
+Runs that raise (including exceeded budgets) are never cached.
+
+Configuration (environment variables):
+    BRIDGE_CACHE_MB    In-memory byte budget in MiB (default 256, 0 disables)
+    BRIDGE_CACHE_DIR   Directory for on-disk persistence (default: none)
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import json
+import array
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional, Callable, Tuple, Union
+
+from python.bridge.executor import InputRef, RunOutput, input_buffer
+
+CACHE_MAX_BYTES = int(float(os.environ.get('BRIDGE_CACHE_MB', 256)) * 1024 * 1024)
+CACHE_DIR = os.environ.get('BRIDGE_CACHE_DIR') or None
+
+# Bumped when the cached payload format changes
+CACHE_FORMAT_VERSION = 3
+
+
+def _data_digest(hasher: Any, data: Union[InputRef, List[Any]]) -> None:
+    """Feed an input array into a hash, packing homogeneous numbers as bytes."""
+    if isinstance(data, InputRef):
+        # Binary uploads are hashed in place (keys differ from the JSON form's)
+        hasher.update(b'r' + data.typecode.encode('ascii'))
+        with input_buffer(data) as view:
+            hasher.update(view)
+        return
+
+    if data and all(type(value) is int for value in data):
+        try:
+            hasher.update(b'q')
+            hasher.update(array.array('q', data).tobytes())
+            return
+        except OverflowError:
+            pass
+    elif data and all(type(value) is float for value in data):
+        hasher.update(b'd')
+        hasher.update(array.array('d', data).tobytes())
+        return
+
+    hasher.update(b'j')
+    hasher.update(json.dumps(data, separators=(',', ':'), default=str).encode('utf-8'))
+
+
+def cache_key(kind: str, algorithm_key: str, options: Dict[str, Any], data: Union[InputRef, List[Any]],
+              limits: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Compute the content address of a run.
+
+    Limits are part of the key so that a request with a tighter budget still
+    gets its 422 instead of a result computed under a looser one (for
+    /compare, with the per-algorithm timeout as their deadline).
+
+    Args:
+        kind: Payload kind ("execute:json", "execute:binary" or "compare")
+        algorithm_key: Registry key
+        options: Normalized (snake_case) algorithm options
+        data: Input array or shared-memory reference
+        limits: Normalized run limits
+
+    Returns:
+        Hex digest
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+    header = [CACHE_FORMAT_VERSION, kind, algorithm_key, options, limits or {}]
+    hasher.update(json.dumps(header, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8'))
+    _data_digest(hasher, data)
+    return hasher.hexdigest()
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache of RunOutput values with single-flight loading.
+
+    Attributes:
+        max_bytes (int): In-memory byte budget (0 disables caching)
+        directory (Optional[str]): Persistence directory
+        stats (Dict[str, int]): hits, misses, coalesced, evictions,
+            disk_hits counters
+    """
+
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES, directory: Optional[str] = CACHE_DIR):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.bytes = 0
+        self.stats = {'hits': 0, 'misses': 0, 'coalesced': 0, 'evictions': 0, 'disk_hits': 0}
+
+        self._entries: "OrderedDict[str, RunOutput]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether results are cached at all."""
+        return self.max_bytes > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------- Persistence -------
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.run")
+
+    def _load(self, key: str) -> Optional[RunOutput]:
+        """Read a persisted entry (None if absent or unreadable)."""
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key), 'rb') as f:
+                header = json.loads(f.readline())
+                payload = f.read()
+        except (OSError, ValueError):
+            return None
+        return RunOutput(payload, header['history_states'], header['execution_time'], header['mimetype'],
+                         header['comparisons'])
+
+    def _store(self, key: str, output: RunOutput) -> None:
+        """Persist an entry atomically (write to a temporary file, then rename)."""
+        if not self.directory:
+            return
+        header = json.dumps({'history_states': output.history_states,
+                             'execution_time': output.execution_time,
+                             'mimetype': output.mimetype,
+                             'comparisons': output.comparisons}).encode('utf-8')
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header + b'\n')
+                f.write(output.payload)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            pass
+
+    # ------- Memory -------
+
+    def _insert(self, key: str, output: RunOutput) -> None:
+        """Insert under the lock, evicting least recently used entries."""
+        size = len(output.payload)
+        if size > self.max_bytes:
+            return
+
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.bytes -= len(previous.payload)
+
+        while self._entries and self.bytes + size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= len(evicted.payload)
+            self.stats['evictions'] += 1
+
+        self._entries[key] = output
+        self.bytes += size
+
+    def get(self, key: str) -> Optional[RunOutput]:
+        """
+        Look up an entry in memory, then on disk.
+
+        Args:
+            key: Content address from cache_key
+
+        Returns:
+            Cached RunOutput, or None
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            output = self._entries.get(key)
+            if output is not None:
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return output
+
+        output = self._load(key)
+        if output is not None:
+            with self._lock:
+                self._insert(key, output)
+                self.stats['hits'] += 1
+                self.stats['disk_hits'] += 1
+        return output
+
+    def put(self, key: str, output: RunOutput) -> None:
+        """
+        Store an entry in memory and, if configured, on disk.
+
+        Args:
+            key: Content address from cache_key
+            output: Run result to cache
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._insert(key, output)
+        self._store(key, output)
+
+    def get_or_compute(self, key: str, compute: Callable[[], RunOutput]) -> Tuple[RunOutput, bool]:
+        """
+        Get an entry, computing it at most once across concurrent callers.
+
+        Args:
+            key: Content address from cache_key
+            compute: Produces the result on a miss (exceptions propagate to
+                every waiting caller and nothing is cached)
+
+        Returns:
+            Tuple of (result, whether it was served without computing)
+        """
+        if not self.enabled:
+            return compute(), False
+
+        cached = self.get(key)
+        if cached is not None:
+            return cached, True
+
+        with self._lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = self._inflight[key] = Future()
+                owner = True
+            else:
+                self.stats['coalesced'] += 1
+                owner = False
+
+        if not owner:
+            return pending.result(), True
+
+        try:
+            output = compute()
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            self.put(key, output)
+            pending.set_result(output)
+            return output, False
+        finally:
+            with self._lock:
+                self.stats['misses'] += 1
+                del self._inflight[key]
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (persisted entries are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def describe(self) -> Dict[str, Any]:
+        """Describe the cache for status responses."""
+        with self._lock:
+            return dict(self.stats, entries=len(self._entries), bytes=self.bytes,
+                        max_bytes=self.max_bytes, directory=self.directory)
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Column-Oriented History Encoding
+
+A JSON /execute response repeats every key of every history state: the
+whole array, a full metrics dictionary and a long message. Serializing it
+also walks each state twice (``serialize_algorithm_state``, then the JSON
+encoder). This module transposes a history into columns in a single pass,
+using what is known about its shape:
+
+- ``array``      The first state in full, then only the changed positions
+                 (or a full record when the length changes or a diff would
+                 be larger)
+- Strings        Interned (a name table plus codes); columns with many
+                 distinct values, like ``message``, are split into interned
+                 templates and a column of the integers they contained
+- Integers       Delta-encoded, so counters such as ``metrics.comparisons``
+                 become runs of small steps
+- Dictionaries   One column per key (``metrics`` becomes ``metrics.swaps``,
+                 ``metrics.reads``, ...)
+- Any column     Run-length encoded when that is shorter
+
+The history part of a response looks like:
+
+    {"format": "columns", "version": 1, "length": N,
+     "array": {"initial": [...], "offsets": [...], "indices": [...],
+               "values": [...], "full": {"step": [...]}},
+     "fields": {"type": {"names": [...], "codes": <seq>},
+                "metrics": {"fields": {"comparisons": {"deltas": <seq>}, ...},
+                            "length": N},
+                "message": {"templates": [[literal, ...]], "codes": <seq>,
+                            "args": <seq>}, ...}}
+
+A ``<seq>`` is a list, or ``{"rle": [value, count, ...]}``. A column
+present in only some states carries a ``steps`` list of the states that
+have it. ``decode_history_columns`` restores the serialized states exactly
+(key order aside).
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import re
+import json
+from typing import Dict, Any, List
+
+COLUMNS_MIMETYPE = 'application/vnd.algorithm-columns+json'
+COLUMNS_VERSION = 1
+
+# Arrays are compared in blocks so unchanged stretches are skipped in C
+DIFF_BLOCK = 64
+
+# String columns with more distinct values than this share of their length
+# are split into templates and numbers
+TEMPLATE_RATIO = 0.125
+
+# Unsigned integers of at most 15 digits (exact as JavaScript numbers);
+# the capturing group keeps them in re.split's output
+_NUMBER = re.compile(r'(0|[1-9][0-9]{0,14})')
+
+_SCALARS = (int, float, str, bool, type(None))
+
+
+def _plain(value: Any) -> Any:
+    """Convert a value the way serialize_algorithm_state does."""
+    if type(value) in _SCALARS:
+        return value
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_plain(item) if type(item) is dict else item for item in value]
+    if isinstance(value, set):
+        return list(value)
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return value
+
+
+def _rle(values: List[Any]) -> Any:
+    """Run-length encode a sequence when that is shorter."""
+    runs: List[Any] = []
+    previous, previous_type, count = None, None, 0
+    for value in values:
+        if count and value == previous and type(value) is previous_type:
+            count += 1
+            continue
+        if count:
+            runs += (previous, count)
+            if len(runs) >= len(values):
+                return values
+        previous, previous_type, count = value, type(value), 1
+    if count:
+        runs += (previous, count)
+    return {'rle': runs} if len(runs) < len(values) else values
+
+
+def _unrle(sequence: Any) -> List[Any]:
+    if isinstance(sequence, dict):
+        runs = sequence['rle']
+        values: List[Any] = []
+        for index in range(0, len(runs), 2):
+            values += [runs[index]] * runs[index + 1]
+        return values
+    return sequence
+
+
+def _changed_positions(previous: List[Any], values: List[Any]) -> List[int]:
+    """Indices where two equally long lists differ."""
+    changed = []
+    length = len(values)
+    for start in range(0, length, DIFF_BLOCK):
+        end = min(start + DIFF_BLOCK, length)
+        if previous[start:end] != values[start:end]:
+            changed += [index for index in range(start, end)
+                        if previous[index] != values[index]]
+    return changed
+
+
+def _encode_arrays(arrays: List[List[Any]]) -> Dict[str, Any]:
+    """Encode the per-state arrays as an initial array plus diffs."""
+    offsets = [0]
+    indices: List[int] = []
+    values: List[Any] = []
+    full: Dict[str, List[Any]] = {}
+
+    previous = arrays[0]
+    for step in range(1, len(arrays)):
+        current = arrays[step]
+        if current is previous or current == previous:
+            offsets.append(len(indices))
+            continue
+        changed = _changed_positions(previous, current) if len(current) == len(previous) else None
+        if changed is None or 2 * len(changed) > len(current):
+            full[str(step)] = current
+        else:
+            indices += changed
+            values += [current[index] for index in changed]
+        offsets.append(len(indices))
+        previous = current
+
+    return {'initial': arrays[0], 'offsets': offsets, 'indices': indices, 'values': values, 'full': full}
+
+
+def _decode_arrays(column: Dict[str, Any], length: int) -> List[List[Any]]:
+    offsets, indices, values, full = column['offsets'], column['indices'], column['values'], column['full']
+    current = list(column['initial'])
+    arrays = [current]
+    for step in range(1, length):
+        replacement = full.get(str(step))
+        if replacement is not None:
+            current = list(replacement)
+        else:
+            start, end = offsets[step - 1], offsets[step]
+            if start != end:
+                current = list(current)
+                for position in range(start, end):
+                    current[indices[position]] = values[position]
+        arrays.append(current)
+    return arrays
+
+
+def _encode_strings(values: List[str]) -> Dict[str, Any]:
+    names: Dict[str, int] = {}
+    codes = [names.setdefault(value, len(names)) for value in values]
+    if len(names) <= max(1, TEMPLATE_RATIO * len(values)):
+        return {'names': list(names), 'codes': _rle(codes)}
+
+    templates: Dict[tuple, int] = {}
+    codes, args = [], []
+    for value in values:
+        parts = _NUMBER.split(value)
+        codes.append(templates.setdefault(tuple(parts[0::2]), len(templates)))
+        args += [int(number) for number in parts[1::2]]
+    return {'templates': [list(template) for template in templates], 'codes': _rle(codes),
+            'args': _rle(args)}
+
+
+def _decode_strings(column: Dict[str, Any]) -> List[str]:
+    codes = _unrle(column['codes'])
+    if 'names' in column:
+        names = column['names']
+        return [names[code] for code in codes]
+
+    templates, args = column['templates'], _unrle(column['args'])
+    values, position = [], 0
+    for code in codes:
+        literals = templates[code]
+        pieces = [literals[0]]
+        for literal in literals[1:]:
+            pieces += (str(args[position]), literal)
+            position += 1
+        values.append(''.join(pieces))
+    return values
+
+
+def _encode_column(values: List[Any]) -> Dict[str, Any]:
+    """Encode the values one key takes across the states that have it."""
+    if all(type(value) is str for value in values):
+        return _encode_strings(values)
+
+    if all(type(value) is int for value in values):
+        deltas, previous = [], 0
+        for value in values:
+            deltas.append(value - previous)
+            previous = value
+        return {'deltas': _rle(deltas)}
+
+    if all(type(value) is dict for value in values):
+        return {'fields': _encode_fields(values), 'length': len(values)}
+
+    return {'values': _rle([_plain(value) for value in values])}
+
+
+def _decode_column(column: Dict[str, Any]) -> List[Any]:
+    if 'deltas' in column:
+        values, total = [], 0
+        for delta in _unrle(column['deltas']):
+            total += delta
+            values.append(total)
+        return values
+    if 'fields' in column:
+        return _decode_fields(column['fields'], column['length'])
+    if 'values' in column:
+        return _unrle(column['values'])
+    return _decode_strings(column)
+
+
+def _encode_fields(states: List[Dict[str, Any]], skip: tuple = ()) -> Dict[str, Any]:
+    """Transpose dictionaries into one column per key."""
+    keys = list(states[0]) if states else []
+    if all(list(state) == keys for state in states):
+        # Same keys in the same order everywhere (metrics): transpose in C
+        columns = dict(zip(keys, map(list, zip(*[state.values() for state in states]))))
+        steps: Dict[str, List[int]] = {}
+    else:
+        columns, steps = {}, {}
+        for step, state in enumerate(states):
+            for key, value in state.items():
+                column = columns.get(key)
+                if column is None:
+                    column = columns[key] = []
+                    steps[key] = []
+                column.append(value)
+                steps[key].append(step)
+
+    fields: Dict[str, Any] = {}
+    for key, column in columns.items():
+        if key in skip:
+            continue
+        encoded = _encode_column(column)
+        if len(column) != len(states):
+            encoded['steps'] = steps[key]
+        fields[key] = encoded
+    return fields
+
+
+def _decode_fields(fields: Dict[str, Any], length: int) -> List[Dict[str, Any]]:
+    states: List[Dict[str, Any]] = [{} for _ in range(length)]
+    for key, column in fields.items():
+        values = _decode_column(column)
+        for step, value in zip(column.get('steps', range(length)), values):
+            states[step][key] = value
+    return states
+
+
+def encode_history_columns(history: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Transpose raw algorithm states into columns.
+
+    Args:
+        history: States as recorded by the algorithm (no prior serialization
+            needed; numpy arrays and sets are converted here)
+
+    Returns:
+        JSON-serializable column block (see module docstring)
+    """
+    arrays = [state.get('array') for state in history]
+    diffable = bool(history) and all(isinstance(values, list) for values in arrays)
+
+    columns: Dict[str, Any] = {'format': 'columns', 'version': COLUMNS_VERSION, 'length': len(history)}
+    if diffable:
+        columns['array'] = _encode_arrays(arrays)
+    columns['fields'] = _encode_fields(history, ('array',) if diffable else ())
+    return columns
+
+
+def decode_history_columns(columns: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Restore the states encoded by encode_history_columns.
+
+    Args:
+        columns: Column block
+
+    Returns:
+        Serialized states, as serialize_algorithm_state would produce them
+
+    Raises:
+        ValueError: If the block is not a supported column encoding
+    """
+    if columns.get('format') != 'columns' or columns.get('version') != COLUMNS_VERSION:
+        raise ValueError("Not a supported column encoding")
+
+    length = columns['length']
+    states = _decode_fields(columns['fields'], length)
+    if 'array' in columns:
+        for state, values in zip(states, _decode_arrays(columns['array'], length)):
+            state['array'] = values
+    return states
+
+
+def encode_execution_columns(result: List[Any], metrics: Dict[str, Any],
+                             history: List[Dict[str, Any]]) -> bytes:
+    """
+    Encode an /execute response body with a column-oriented history.
+
+    Args:
+        result: Sorted output array
+        metrics: Serialized metrics
+        history: Raw algorithm states
+
+    Returns:
+        Compact JSON bytes {"result", "metrics", "history": <columns>}
+    """
+    return json.dumps({'result': result, 'metrics': metrics, 'history': encode_history_columns(history)},
+                      separators=(',', ':'), default=str).encode('utf-8')
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Server-Side Datasets for the Bridge Server
+
+Clients used to generate large arrays in JavaScript and upload them. A
+request can instead describe its input with a generator spec in place of
+the ``data`` list:
+
+    "data": {"type": "gaussian", "size": 1000000, "seed": 7, "minVal": 1, ...}
+
+The bridge materializes it with ``utils.data_generators.generate_dataset``
+(``type`` and ``size`` select the generator, the other fields are its
+options) and caches the result by the hash of the normalized spec:
+
+- Numeric datasets live in a shared-memory segment, so every request and
+  every algorithm of a /compare reads the same copy without re-sending it
+- Requests hold a lease on the dataset; eviction under the byte budget
+  (LRU) unlinks a segment only once its last lease is released
+- Identical specs arriving while the first is being generated wait for it
+- Specs without a seed are random by definition and are generated afresh
+  for every request instead of being cached
+
+The generators share one module-level random state, so generation is
+serialized to keep seeded specs reproducible.
+
+Configuration (environment variables):
+    BRIDGE_DATASET_CACHE_MB    Byte budget for cached datasets in MiB (default 256)
+    BRIDGE_DATASET_MAX_SIZE    Largest generated dataset (default 10000000)
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import json
+import atexit
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional, Union
+
+from python.bridge.executor import InputRef, SharedInput
+
+DATASET_CACHE_MAX_BYTES = int(float(os.environ.get('BRIDGE_DATASET_CACHE_MB', 256)) * 1024 * 1024)
+DATASET_MAX_SIZE = int(os.environ.get('BRIDGE_DATASET_MAX_SIZE', 10000000))
+
+# generate_dataset seeds a module-level generator, so runs must not interleave
+_GENERATE_LOCK = threading.Lock()
+
+
+def _snake_case(key: str) -> str:
+    return ''.join(['_' + c.lower() if c.isupper() else c for c in key]).lstrip('_')
+
+
+def normalize_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate a dataset spec and bring it into canonical form.
+
+    Args:
+        spec: {"type", "size", generator options...} with camelCase or
+            snake_case option names
+
+    Returns:
+        {"type": lower-case name, "size": int, "options": {...}}
+
+    Raises:
+        ValueError: If the spec is malformed or too large
+    """
+    if not isinstance(spec, dict):
+        raise ValueError("A dataset spec must be an object")
+    options = {_snake_case(key): value for key, value in spec.items()}
+    data_type = options.pop('type', None)
+    if not isinstance(data_type, str) or not data_type:
+        raise ValueError("A dataset spec needs a 'type'")
+    try:
+        size = int(options.pop('size'))
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("A dataset spec needs an integer 'size'")
+    if not 0 <= size <= DATASET_MAX_SIZE:
+        raise ValueError(f"Dataset size must be between 0 and {DATASET_MAX_SIZE}")
+    return {'type': data_type.lower(), 'size': size, 'options': options}
+
+
+def spec_digest(spec: Dict[str, Any]) -> str:
+    """
+    Compute the content address of a normalized spec.
+
+    Args:
+        spec: Spec from normalize_spec
+
+    Returns:
+        Hex SHA-256 of the spec's canonical JSON
+    """
+    canonical = json.dumps(spec, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def generate(spec: Dict[str, Any]) -> List[Any]:
+    """
+    Materialize a normalized spec.
+
+    Raises:
+        ValueError: If the generator rejects the spec
+    """
+    from python.utils.data_generators import generate_dataset
+
+    with _GENERATE_LOCK:
+        try:
+            return list(generate_dataset(spec['type'], spec['size'], **spec['options']))
+        except TypeError as e:
+            raise ValueError(f"Invalid options for dataset type '{spec['type']}': {e}")
+
+
+class _Dataset:
+    """A materialized dataset and the requests currently using it."""
+
+    def __init__(self, digest: str, values: List[Any]):
+        self.digest = digest
+        self.shared = SharedInput(values)
+        # Non-numeric datasets stay a list (SharedInput.ref is then the list itself)
+        self.nbytes = 8 * len(values)
+        self.leases = 0
+        self.evicted = False
+
+
+class DatasetLease(SharedInput):
+    """
+    A request's hold on a dataset.
+
+    Behaves like the SharedInput of a binary upload (``ref`` is passed to
+    the backend, ``close`` is called when the request is done), but closing
+    only releases the lease; the cache owns the segment.
+
+    Attributes:
+        ref (Union[InputRef, List[Any]]): What to pass to workers (read-only)
+        digest (str): Content address of the spec
+        spec (Dict[str, Any]): Normalized spec
+    """
+
+    def __init__(self, cache: "DatasetCache", dataset: _Dataset, spec: Dict[str, Any]):
+        self._shm = None
+        self._cache: Optional[DatasetCache] = cache
+        self._dataset = dataset
+        self.ref: Union[InputRef, List[Any]] = dataset.shared.ref
+        self.digest = dataset.digest
+        self.spec = spec
+
+    def close(self) -> None:
+        """Release the lease (idempotent)."""
+        if self._cache is not None:
+            self._cache._release(self._dataset)
+            self._cache = None
+
+
+class DatasetCache:
+    """
+    Thread-safe LRU cache of generated datasets, addressed by spec hash.
+
+    Attributes:
+        max_bytes (int): Byte budget for cached datasets
+        stats (Dict[str, int]): hits, misses, coalesced, evictions, uncached
+    """
+
+    def __init__(self, max_bytes: int = DATASET_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.stats = {'hits': 0, 'misses': 0, 'coalesced': 0, 'evictions': 0, 'uncached': 0}
+
+        self._entries: "OrderedDict[str, _Dataset]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lease(self, spec: Dict[str, Any]) -> DatasetLease:
+        """
+        Get a dataset for a request, generating it at most once.
+
+        Args:
+            spec: Dataset spec (normalized here)
+
+        Returns:
+            DatasetLease; the caller closes it when done
+
+        Raises:
+            ValueError: If the spec is invalid
+        """
+        spec = normalize_spec(spec)
+        return self._lease(spec, spec_digest(spec))
+
+    def _lease(self, spec: Dict[str, Any], digest: str) -> DatasetLease:
+        if spec['options'].get('seed') is None or self.max_bytes <= 0:
+            dataset = _Dataset(digest, generate(spec))
+            dataset.evicted = True
+            with self._lock:
+                self.stats['uncached'] += 1
+                return self._acquire(dataset, spec)
+
+        with self._lock:
+            dataset = self._entries.get(digest)
+            if dataset is not None:
+                self._entries.move_to_end(digest)
+                self.stats['hits'] += 1
+                return self._acquire(dataset, spec)
+
+            pending = self._inflight.get(digest)
+            owner = pending is None
+            if owner:
+                pending = self._inflight[digest] = Future()
+            else:
+                self.stats['coalesced'] += 1
+
+        if not owner:
+            dataset = pending.result()
+            with self._lock:
+                if not (dataset.evicted and not dataset.leases):
+                    return self._acquire(dataset, spec)
+            # Evicted and unlinked before this request got to it
+            return self._lease(spec, digest)
+
+        try:
+            dataset = _Dataset(digest, generate(spec))
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[digest]
+            pending.set_exception(e)
+            raise
+
+        with self._lock:
+            del self._inflight[digest]
+            self.stats['misses'] += 1
+            lease = self._acquire(dataset, spec)
+            self._insert(dataset)
+        pending.set_result(dataset)
+        return lease
+
+    def _acquire(self, dataset: _Dataset, spec: Dict[str, Any]) -> DatasetLease:
+        """Take a lease under the lock."""
+        dataset.leases += 1
+        return DatasetLease(self, dataset, spec)
+
+    def _insert(self, dataset: _Dataset) -> None:
+        """Insert under the lock, evicting least recently used datasets."""
+        if dataset.nbytes > self.max_bytes:
+            dataset.evicted = True
+            return
+
+        while self._entries and self.bytes + dataset.nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._evict(evicted)
+            self.stats['evictions'] += 1
+
+        self._entries[dataset.digest] = dataset
+        self.bytes += dataset.nbytes
+
+    def _evict(self, dataset: _Dataset) -> None:
+        """Drop a dataset under the lock; its segment goes with its last lease."""
+        self.bytes -= dataset.nbytes
+        dataset.evicted = True
+        if not dataset.leases:
+            dataset.shared.close()
+
+    def _release(self, dataset: _Dataset) -> None:
+        with self._lock:
+            dataset.leases -= 1
+            if dataset.evicted and not dataset.leases:
+                dataset.shared.close()
+
+    def clear(self) -> None:
+        """Drop every cached dataset (segments in use stay until released)."""
+        with self._lock:
+            while self._entries:
+                self._evict(self._entries.popitem(last=False)[1])
+
+    def describe(self) -> Dict[str, Any]:
+        """Describe the cache for status responses."""
+        with self._lock:
+            return dict(self.stats, entries=len(self._entries), bytes=self.bytes,
+                        max_bytes=self.max_bytes)
+
+
+# Process-wide dataset cache used by request parsing
+DATASETS = DatasetCache()
+atexit.register(DATASETS.clear)
@@ -0,0 +1,692 @@
+#!/usr/bin/env python3
+"""
+Process-Pool Execution Backend for the Bridge Server
+
+Running algorithms inside the Flask request thread serializes all requests on
+the GIL: one long bubble sort blocks every other request. This module runs
+algorithm executions in a pool of worker processes instead:
+
+- Workers preload every discovered algorithm module in their initializer, so
+  the first request served by a worker does not pay for imports
+- Workers serialize the response to JSON bytes themselves; only one bytes
+  object crosses the process boundary instead of a pickled history
+- An inline mode runs the same code in the calling thread (debugging, tests)
+- Comparisons run concurrently against one shared-memory copy of the input,
+  with a per-algorithm timeout, and are collected as they finish. Fair
+  timing runs them one at a time on a single pinned CPU instead
+- Per-request limits become a RunBudget enforced inside the algorithm,
+  capped by server-wide limits; worker rlimits (address space, CPU time per
+  task) are the backstop for code that never reaches a budget check
+
+Configuration (environment variables):
+    BRIDGE_EXECUTION      "process" (default) or "inline"
+    BRIDGE_WORKERS        Pool size (default: CPU count)
+    BRIDGE_START_METHOD   multiprocessing start method (default: forkserver
+                          where available, otherwise spawn)
+    BRIDGE_WARM_UP        "1" to run every algorithm once when a worker starts
+    BRIDGE_COMPARE_TIMEOUT    Default per-algorithm /compare timeout in seconds
+    BRIDGE_SHARED_INPUT_MIN   Minimum input size placed in shared memory
+    BRIDGE_MAX_DEADLINE, BRIDGE_MAX_COMPARISONS, BRIDGE_MAX_HISTORY_STATES,
+    BRIDGE_MAX_MEMORY_MB      Server-wide caps on per-request limits
+    BRIDGE_WORKER_MEMORY_MB   Address-space rlimit per worker process
+    BRIDGE_WORKER_CPU_SECONDS CPU-time rlimit per task
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import json
+import array
+import signal
+import time
+import threading
+import multiprocessing
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, List, Optional, NamedTuple, Tuple, Union
+
+from python.bridge.registry import AlgorithmRegistry
+from python.bridge.wire import WIRE_MIMETYPE, WireEncodingError, encode_execution
+from python.bridge.columnar import COLUMNS_MIMETYPE, encode_execution_columns
+from python.core.budget import BudgetExceeded, RunBudget
+
+EXECUTION_MODE = os.environ.get('BRIDGE_EXECUTION', 'process')
+WARM_UP = os.environ.get('BRIDGE_WARM_UP', '0') == '1'
+COMPARE_TIMEOUT = float(os.environ.get('BRIDGE_COMPARE_TIMEOUT', 60))
+SHARED_INPUT_MIN = int(os.environ.get('BRIDGE_SHARED_INPUT_MIN', 10000))
+
+# Extra time the coordinator waits beyond a timeout before giving up on a worker
+TIMEOUT_GRACE = 1.0
+
+
+def _env_number(name: str, cast: type) -> Optional[Union[int, float]]:
+    """Read an optional numeric setting from the environment."""
+    value = os.environ.get(name)
+    return cast(value) if value else None
+
+
+# Server-wide caps applied to every run (None = unlimited)
+SERVER_BUDGET = RunBudget.from_dict({
+    'deadline': _env_number('BRIDGE_MAX_DEADLINE', float),
+    'max_comparisons': _env_number('BRIDGE_MAX_COMPARISONS', int),
+    'max_history_states': _env_number('BRIDGE_MAX_HISTORY_STATES', int),
+    'max_memory_mb': _env_number('BRIDGE_MAX_MEMORY_MB', float),
+})
+
+# Worker rlimits (0 = unlimited)
+WORKER_MEMORY_MB = int(os.environ.get('BRIDGE_WORKER_MEMORY_MB', 0))
+WORKER_CPU_SECONDS = int(os.environ.get('BRIDGE_WORKER_CPU_SECONDS', 0))
+
+POOL_WORKERS = int(os.environ.get('BRIDGE_WORKERS', 0)) or os.cpu_count() or 1
+START_METHOD = os.environ.get(
+    'BRIDGE_START_METHOD',
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+# Process-wide registry (one per worker and one in the server process)
+_REGISTRY: Optional[AlgorithmRegistry] = None
+
+
+class RunOutput(NamedTuple):
+    """Serialized run result plus the figures the server records."""
+    payload: bytes
+    history_states: int
+    execution_time: float
+    mimetype: str = 'application/json'
+    comparisons: int = 0
+
+
+class InputRef(NamedTuple):
+    """Reference to an input array stored in shared memory."""
+    name: str
+    typecode: str
+    length: int
+
+
+class SharedInput:
+    """
+    Read-only input array placed in shared memory for a comparison.
+
+    Only homogeneous int (int64) or float (double) arrays are shared; other
+    inputs are passed to workers as regular pickled lists. Use as a context
+    manager; the segment is unlinked on exit.
+
+    Attributes:
+        ref (Union[InputRef, List[Any]]): What to pass to workers
+    """
+
+    def __init__(self, data: List[Any]):
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self.ref: Union[InputRef, List[Any]] = data
+
+        typecode = _shared_typecode(data)
+        if typecode is None:
+            return
+
+        packed = array.array(typecode, data)
+        self._allocate(typecode, len(packed))
+        with self.buffer as view:
+            view[:] = packed.tobytes()
+
+    @classmethod
+    def allocate(cls, typecode: str, length: int) -> "SharedInput":
+        """
+        Create an empty shared input to be filled through ``buffer``.
+
+        Lets binary uploads be written straight into shared memory without
+        building a Python list in the server process.
+
+        Args:
+            typecode: array typecode of the elements
+            length: Number of elements
+        """
+        shared = cls([])
+        shared._allocate(typecode, length)
+        return shared
+
+    def _allocate(self, typecode: str, length: int) -> None:
+        itemsize = array.array(typecode).itemsize
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, length * itemsize))
+        self.ref = InputRef(self._shm.name, typecode, length)
+
+    @property
+    def buffer(self) -> memoryview:
+        """Writable view of the segment's element bytes."""
+        return self._shm.buf[:self.ref.length * array.array(self.ref.typecode).itemsize]
+
+    def close(self) -> None:
+        """Release and unlink the shared segment."""
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self) -> "SharedInput":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _shared_typecode(data: List[Any]) -> Optional[str]:
+    """Get the array typecode for sharing an input, or None if unsupported."""
+    if not data:
+        return None
+    if all(type(value) is int for value in data):
+        try:
+            array.array('q', data)
+        except OverflowError:
+            return None
+        return 'q'
+    if all(type(value) is float for value in data):
+        return 'd'
+    return None
+
+
+def input_length(data: Union[InputRef, List[Any]]) -> int:
+    """Get the number of input elements of a list or InputRef."""
+    return data.length if isinstance(data, InputRef) else len(data)
+
+
+@contextmanager
+def input_buffer(ref: InputRef):
+    """
+    Expose the bytes of a shared input without copying them.
+
+    Args:
+        ref: Shared input reference
+
+    Yields:
+        Read-only memoryview of the element bytes
+    """
+    shm = shared_memory.SharedMemory(name=ref.name)
+    try:
+        view = shm.buf[:ref.length * array.array(ref.typecode).itemsize].toreadonly()
+        try:
+            yield view
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def resolve_input(data: Union[InputRef, List[Any]]) -> List[Any]:
+    """
+    Get an input list in a worker, reading it from shared memory if needed.
+
+    Args:
+        data: Input list or InputRef
+
+    Returns:
+        Private list copy of the input
+    """
+    if not isinstance(data, InputRef):
+        return data
+
+    shm = shared_memory.SharedMemory(name=data.name)
+    try:
+        view = shm.buf[:data.length * array.array(data.typecode).itemsize].cast(data.typecode)
+        try:
+            return view.tolist()
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+@contextmanager
+def _deadline(seconds: Optional[float]):
+    """
+    Raise TimeoutError in the running task once ``seconds`` have elapsed.
+
+    Uses an interval timer, so it only applies on the main thread of a
+    POSIX process (pool workers); elsewhere it is a no-op.
+    """
+    if (not seconds or not hasattr(signal, 'setitimer')
+            or threading.current_thread() is not threading.main_thread()):
+        yield
+        return
+
+    def on_timeout(signum, frame):
+        raise TimeoutError(f"Timed out after {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, on_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+@contextmanager
+def _cpu_limit(seconds: int):
+    """
+    Cap the CPU time of the running task with a soft RLIMIT_CPU.
+
+    The soft limit is set relative to the CPU time the worker has already
+    used; exceeding it delivers SIGXCPU, which is turned into BudgetExceeded.
+    Only applies on the main thread of a POSIX worker process.
+    """
+    try:
+        import resource
+    except ImportError:
+        resource = None
+
+    if (not seconds or resource is None or not hasattr(signal, 'SIGXCPU')
+            or threading.current_thread() is not threading.main_thread()):
+        yield
+        return
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    used = resource.getrusage(resource.RUSAGE_SELF)
+    limit = int(used.ru_utime + used.ru_stime) + seconds
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+
+    def on_cpu_limit(signum, frame):
+        raise BudgetExceeded("cpu_time", seconds, None)
+
+    previous = signal.signal(signal.SIGXCPU, on_cpu_limit)
+    resource.setrlimit(resource.RLIMIT_CPU, (limit, hard))
+    try:
+        yield
+    finally:
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+        signal.signal(signal.SIGXCPU, previous)
+
+
+@contextmanager
+def _pinned(cpu: Optional[int]):
+    """Restrict the current process to one CPU for the duration."""
+    if cpu is None or not hasattr(os, 'sched_setaffinity'):
+        yield
+        return
+
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, {cpu})
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, previous)
+
+
+def get_registry() -> AlgorithmRegistry:
+    """
+    Get the process-wide algorithm registry, discovering on first use.
+
+    Returns:
+        Shared AlgorithmRegistry instance
+    """
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = AlgorithmRegistry()
+        _REGISTRY.discover()
+    return _REGISTRY
+
+
+def serialize_algorithm_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Prepare algorithm state for JSON serialization.
+
+    Args:
+        state: Algorithm state dictionary
+
+    Returns:
+        Serializable state dictionary
+    """
+    serialized = {}
+
+    for key, value in state.items():
+        # Convert numpy arrays to lists
+        if hasattr(value, 'tolist'):
+            serialized[key] = value.tolist()
+        # Convert sets to lists
+        elif isinstance(value, set):
+            serialized[key] = list(value)
+        # Handle nested dictionaries
+        elif isinstance(value, dict):
+            serialized[key] = serialize_algorithm_state(value)
+        # Handle nested lists
+        elif isinstance(value, list):
+            serialized[key] = [
+                serialize_algorithm_state(item) if isinstance(item, dict)
+                else item for item in value
+            ]
+        else:
+            serialized[key] = value
+
+    return serialized
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Encode a response payload as compact JSON bytes."""
+    return json.dumps(payload, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def _create_algorithm(algorithm_key: str, options: Dict[str, Any],
+                      limits: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    Instantiate an algorithm from the process registry.
+
+    Args:
+        algorithm_key: Registry key
+        options: Python-style algorithm options
+        limits: Per-request limits (RunBudget fields), capped by SERVER_BUDGET
+    """
+    algorithm_class, error = get_registry().load(algorithm_key)
+    if error:
+        raise ImportError(error)
+
+    budget = RunBudget.from_dict(limits)
+    budget = budget.tightened(SERVER_BUDGET) if budget else SERVER_BUDGET
+    if budget is not None:
+        options = dict(options, budget=budget)
+    return algorithm_class(options)
+
+
+def run_execute(algorithm_key: str, data: Union[InputRef, List[Any]], options: Dict[str, Any],
+                limits: Optional[Dict[str, Any]] = None, encoding: str = 'json') -> RunOutput:
+    """
+    Execute one algorithm and serialize the /execute response body.
+
+    Module-level so that it can be pickled for the process pool.
+
+    Args:
+        algorithm_key: Registry key
+        data: Input array or shared-memory reference
+        options: Python-style algorithm options
+        limits: Per-request limits (deadline, max_comparisons, ...)
+        encoding: "json", "columns" for a column-oriented history, or
+            "binary" for the wire format (falls back to JSON when the
+            arrays are not homogeneous numbers)
+
+    Returns:
+        RunOutput with the response body and its mimetype
+
+    Raises:
+        BudgetExceeded: If the run exceeded its limits (with a partial report)
+    """
+    algorithm = _create_algorithm(algorithm_key, options, limits)
+    data = resolve_input(data)
+    with _cpu_limit(WORKER_CPU_SECONDS):
+        result = algorithm.execute(data)
+
+    metrics = serialize_algorithm_state(algorithm.metrics)
+    if encoding == 'columns':
+        # Transposed straight from the raw states in one pass
+        payload = encode_execution_columns(result, metrics, algorithm.history)
+        return RunOutput(payload, len(algorithm.history), algorithm.metrics['execution_time'],
+                         COLUMNS_MIMETYPE, algorithm.metrics['comparisons'])
+
+    history = [serialize_algorithm_state(state) for state in algorithm.history]
+    if encoding == 'binary':
+        try:
+            payload = encode_execution(result, metrics, history)
+            return RunOutput(payload, len(history), algorithm.metrics['execution_time'], WIRE_MIMETYPE,
+                             algorithm.metrics['comparisons'])
+        except WireEncodingError:
+            pass
+
+    payload = _dumps({'result': result, 'metrics': metrics, 'history': history})
+    return RunOutput(payload, len(history), algorithm.metrics['execution_time'],
+                     comparisons=algorithm.metrics['comparisons'])
+
+
+def run_compare_entry(algorithm_key: str, data: Union[InputRef, List[Any]], options: Dict[str, Any],
+                      timeout: Optional[float] = None, pin_cpu: Optional[int] = None,
+                      limits: Optional[Dict[str, Any]] = None) -> RunOutput:
+    """
+    Execute one algorithm of a comparison and serialize its entry.
+
+    Args:
+        algorithm_key: Registry key
+        data: Input array or shared-memory reference
+        options: Python-style algorithm options
+        timeout: Seconds after which the run stops (cooperatively through the
+            budget deadline, with an interval timer as backstop)
+        pin_cpu: CPU to pin the worker to while running (fair timing)
+        limits: Per-request limits (deadline, max_comparisons, ...)
+
+    Returns:
+        RunOutput with the JSON entry (result, metrics, execution_time)
+    """
+    if timeout:
+        limits = dict(limits or {})
+        limits['deadline'] = min(timeout, limits.get('deadline') or timeout)
+    algorithm = _create_algorithm(algorithm_key, options, limits)
+    data = resolve_input(data)
+
+    backstop = timeout + TIMEOUT_GRACE / 2 if timeout else None
+    with _pinned(pin_cpu), _deadline(backstop), _cpu_limit(WORKER_CPU_SECONDS):
+        sorted_data = algorithm.execute(data)
+    execution_time = algorithm.metrics['execution_time']
+
+    payload = _dumps({
+        'result': sorted_data,
+        'metrics': serialize_algorithm_state(algorithm.metrics),
+        'execution_time': execution_time
+    })
+    return RunOutput(payload, len(algorithm.history), execution_time,
+                     comparisons=algorithm.metrics['comparisons'])
+
+
+def _init_worker() -> None:
+    """Pool initializer: apply rlimits, then import (or warm) every algorithm."""
+    if WORKER_MEMORY_MB:
+        import resource
+        limit = WORKER_MEMORY_MB * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    if WARM_UP:
+        get_registry().warm_up()
+    else:
+        get_registry().preload()
+
+
+def _outcome(future: Future, timeout: float) -> Union[RunOutput, Exception]:
+    """Get a future's result, returning (not raising) its exception."""
+    try:
+        return future.result(timeout=timeout + TIMEOUT_GRACE if timeout else None)
+    except FutureTimeoutError:
+        future.cancel()
+        return TimeoutError(f"Timed out after {timeout}s")
+    except Exception as e:
+        return e
+
+
+class _InlineExecutor(Executor):
+    """Executor running tasks synchronously in the calling thread."""
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+class ExecutionBackend:
+    """
+    Dispatch algorithm runs to a process pool (or inline).
+
+    The pool is created on first use so that importing the server stays cheap.
+
+    Attributes:
+        mode (str): "process" or "inline"
+        workers (int): Number of worker processes
+        start_method (str): multiprocessing start method for workers
+    """
+
+    def __init__(self, mode: str = EXECUTION_MODE, workers: int = POOL_WORKERS,
+                 start_method: str = START_METHOD):
+        if mode not in ('process', 'inline'):
+            raise ValueError(f"Unknown execution mode: {mode}")
+
+        self.mode = mode
+        self.workers = workers
+        self.start_method = start_method
+        self._executor: Optional[Executor] = None
+
+    @property
+    def executor(self) -> Executor:
+        """Get the underlying executor, starting it if necessary."""
+        if self._executor is None:
+            self.start()
+        return self._executor
+
+    def start(self, prestart: bool = False) -> None:
+        """
+        Start the worker pool.
+
+        Workers preload algorithms as they spawn. Process pools spawn workers
+        on demand, so ``prestart`` submits one trivial task per worker to
+        bring the whole pool up before the first request.
+
+        Args:
+            prestart: Spawn and initialize all workers now
+        """
+        if self._executor is None:
+            if self.mode == 'inline':
+                _init_worker()
+                self._executor = _InlineExecutor()
+            else:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_init_worker
+                )
+
+        if prestart and self.mode == 'process':
+            for future in [self._executor.submit(os.getpid) for _ in range(self.workers)]:
+                future.result()
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """
+        Submit a module-level function to the backend.
+
+        A pool broken by a killed worker (e.g. an rlimit or the OOM killer)
+        is replaced before submitting.
+
+        Returns:
+            Future for the function result
+        """
+        try:
+            return self.executor.submit(fn, *args, **kwargs)
+        except BrokenProcessPool:
+            self.shutdown(wait=False)
+            return self.executor.submit(fn, *args, **kwargs)
+
+    def execute(self, algorithm_key: str, data: Union[InputRef, List[Any]], options: Dict[str, Any],
+                limits: Optional[Dict[str, Any]] = None, encoding: str = 'json') -> RunOutput:
+        """
+        Run an /execute request and wait for it.
+
+        Exceptions raised by the algorithm (including BudgetExceeded) are
+        re-raised here.
+        """
+        return self.submit(run_execute, algorithm_key, data, options, limits, encoding).result()
+
+    def compare(self, algorithms: List[str], data: Union[InputRef, List[Any]],
+                options_map: Dict[str, Dict[str, Any]],
+                timeouts: Optional[Dict[str, float]] = None, fair_timing: bool = False,
+                shared_input_min: int = SHARED_INPUT_MIN,
+                limits: Optional[Dict[str, Any]] = None) -> List[Tuple[str, Union[RunOutput, Exception]]]:
+        """
+        Run a comparison and collect entries as they finish.
+
+        Algorithms run concurrently on one shared-memory copy of the input,
+        at most one per worker at a time so that each timeout counts from
+        when its run is dispatched rather than from when it was queued.
+        With ``fair_timing`` they run one at a time, each pinned to the
+        same CPU, so timings are not skewed by contention (latency becomes
+        the sum of the runs).
+
+        Args:
+            algorithms: Registry keys to compare
+            data: Input array, or an InputRef already in shared memory
+            options_map: Python-style options per key
+            timeouts: Per-key timeout in seconds (COMPARE_TIMEOUT by default)
+            fair_timing: Serialize runs on a pinned CPU
+            shared_input_min: Minimum input size placed in shared memory
+            limits: Per-request limits applied to every algorithm
+
+        Returns:
+            (key, RunOutput or exception) pairs in completion order; runs that
+            hit their timeout report BudgetExceeded (with a partial report),
+            or TimeoutError if they had to be stopped by the backstop
+        """
+        timeouts = timeouts or {}
+        limit = {key: timeouts.get(key, COMPARE_TIMEOUT) for key in algorithms}
+        use_shared = (self.mode == 'process' and not isinstance(data, InputRef)
+                      and len(data) >= shared_input_min)
+        pin_cpu = min(os.sched_getaffinity(0)) if fair_timing and hasattr(os, 'sched_getaffinity') else None
+        completed: List[Tuple[str, Union[RunOutput, Exception]]] = []
+
+        with SharedInput(data if use_shared else []) as shared:
+            source = shared.ref if use_shared else data
+
+            def submit(key: str) -> Future:
+                return self.submit(run_compare_entry, key, source, options_map.get(key, {}),
+                                   limit[key], pin_cpu, limits)
+
+            if fair_timing:
+                for key in algorithms:
+                    completed.append((key, _outcome(submit(key), limit[key])))
+                return completed
+
+            pending = list(algorithms)
+            running: Dict[Future, Tuple[str, float]] = {}
+            while pending or running:
+                while pending and len(running) < max(1, self.workers):
+                    key = pending.pop(0)
+                    running[submit(key)] = (key, time.monotonic() + limit[key] + TIMEOUT_GRACE)
+
+                backstop = min(deadline for _, deadline in running.values())
+                done, _ = wait(running, timeout=max(0.0, backstop - time.monotonic()),
+                               return_when=FIRST_COMPLETED)
+                for future in done:
+                    completed.append((running.pop(future)[0], _outcome(future, 0)))
+
+                now = time.monotonic()
+                for future, (key, deadline) in list(running.items()):
+                    if deadline <= now and not future.done():
+                        # Workers that ignored their deadline (e.g. stuck in C code)
+                        future.cancel()
+                        del running[future]
+                        completed.append((key, TimeoutError(f"Timed out after {limit[key]}s")))
+
+        return completed
+
+    def worker_pids(self) -> List[int]:
+        """Get the process ids of the running pool workers (none inline)."""
+        if not isinstance(self._executor, ProcessPoolExecutor):
+            return []
+        return list(self._executor._processes or {})
+
+    def shutdown(self, wait: bool = True, terminate: bool = False) -> None:
+        """
+        Stop the worker pool.
+
+        Args:
+            wait: Wait for the pool workers to exit
+            terminate: Cancel queued calls and kill workers still running one
+                (a process exiting with ``os._exit`` would otherwise leave
+                them orphaned, holding its inherited pipes open)
+        """
+        if self._executor is not None:
+            pids = self.worker_pids() if terminate else []
+            self._executor.shutdown(wait=False, cancel_futures=terminate)
+            for pid in pids:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            if wait:
+                self._executor.shutdown(wait=True)
+            self._executor = None
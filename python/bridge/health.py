@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Live Operational Health for the Bridge Server
+
+``/status`` describes configuration; ``/metrics`` exports cumulative
+Prometheus series that need a scraper to turn into rates. This module keeps
+what a load balancer or on-call engineer needs right now, over a rolling
+window, in constant memory:
+
+- Requests in flight per endpoint
+- p50/p95/p99 request latency per endpoint and algorithm
+- Request, rejection (413, 422, 429, 503) and server error counts
+- Result cache hit rates per endpoint
+
+Latencies go into rolling histograms: a ring of time slots, each holding
+counts over fixed log-spaced buckets (about 9% apart). Observing is O(1),
+old slots are reset lazily as the ring turns, and quantiles are read from
+the summed live slots, so memory is fixed per (endpoint, algorithm) pair
+however many requests arrive. Labels are bounded as in telemetry.py.
+
+Configuration (environment variables):
+    BRIDGE_HEALTH_WINDOW          Rolling window in seconds (default 60)
+    BRIDGE_HEALTH_SLOTS           Slots the window is divided into (default 12)
+    BRIDGE_HEALTH_MAX_IN_FLIGHT   Requests in flight at which the server reports
+                                  itself saturated (default 4 per pool worker)
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import math
+import time
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+from python.bridge.executor import POOL_WORKERS
+from python.core.budget import _resident_bytes
+
+HEALTH_WINDOW = float(os.environ.get('BRIDGE_HEALTH_WINDOW', 60))
+HEALTH_SLOTS = int(os.environ.get('BRIDGE_HEALTH_SLOTS', 12))
+HEALTH_MAX_IN_FLIGHT = int(os.environ.get('BRIDGE_HEALTH_MAX_IN_FLIGHT', 0)) or 4 * POOL_WORKERS
+
+# Latency buckets: LOWEST * GROWTH^i seconds, from 100 us to about 20 minutes
+LOWEST = 1e-4
+GROWTH = 2 ** 0.125
+BUCKETS = 188
+
+QUANTILES = (0.5, 0.95, 0.99)
+REJECTED_STATUSES = (413, 422, 429, 503)
+
+# Endpoints that only report on the server and are left out of the figures
+UNTRACKED_ENDPOINTS = ('/health', '/metrics')
+
+
+class _Rolling:
+    """Ring of time slots that are reset lazily once they fall out of the window."""
+
+    def __init__(self, window: float = HEALTH_WINDOW, slots: int = HEALTH_SLOTS):
+        self.window = window
+        self.slots = slots
+        self._slot_seconds = window / slots
+        self._epochs = [-1] * slots
+
+    def _slot(self, now: float) -> int:
+        """Index of the slot for ``now``, cleared if it still holds an old epoch."""
+        epoch = int(now / self._slot_seconds)
+        index = epoch % self.slots
+        if self._epochs[index] != epoch:
+            self._epochs[index] = epoch
+            self._reset(index)
+        return index
+
+    def _live(self, now: float) -> List[int]:
+        """Indices of the slots inside the window ending at ``now``."""
+        epoch = int(now / self._slot_seconds)
+        return [index for index in range(self.slots) if epoch - self._epochs[index] < self.slots]
+
+    def _reset(self, index: int) -> None:
+        raise NotImplementedError
+
+
+class RollingCounter(_Rolling):
+    """Event count over the rolling window."""
+
+    def __init__(self, window: float = HEALTH_WINDOW, slots: int = HEALTH_SLOTS):
+        super().__init__(window, slots)
+        self._counts = [0] * slots
+
+    def _reset(self, index: int) -> None:
+        self._counts[index] = 0
+
+    def add(self, amount: int = 1, now: Optional[float] = None) -> None:
+        """Count events at ``now`` (default: the current time)."""
+        self._counts[self._slot(time.time() if now is None else now)] += amount
+
+    def total(self, now: Optional[float] = None) -> int:
+        """Events inside the window."""
+        return sum(self._counts[index] for index in self._live(time.time() if now is None else now))
+
+
+class RollingHistogram(_Rolling):
+    """
+    Distribution of values over the rolling window.
+
+    Values below LOWEST fall into the first bucket and values beyond the
+    last bucket into an overflow bucket reported as the largest bound.
+    """
+
+    def __init__(self, window: float = HEALTH_WINDOW, slots: int = HEALTH_SLOTS):
+        super().__init__(window, slots)
+        self._counts = [[0] * (BUCKETS + 1) for _ in range(slots)]
+
+    def _reset(self, index: int) -> None:
+        self._counts[index] = [0] * (BUCKETS + 1)
+
+    def observe(self, value: float, now: Optional[float] = None) -> None:
+        """Record one value at ``now`` (default: the current time)."""
+        if value <= LOWEST:
+            bucket = 0
+        else:
+            bucket = min(BUCKETS, int(math.log(value / LOWEST) / math.log(GROWTH)) + 1)
+        self._counts[self._slot(time.time() if now is None else now)][bucket] += 1
+
+    def quantiles(self, quantiles: Tuple[float, ...] = QUANTILES,
+                  now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Estimate quantiles from the live slots.
+
+        Args:
+            quantiles: Quantiles in (0, 1]
+            now: End of the window (default: the current time)
+
+        Returns:
+            {"count": n, "p50": seconds, ...}; quantiles are None without data.
+            Each estimate is the geometric middle of its bucket
+        """
+        live = self._live(time.time() if now is None else now)
+        merged = [sum(self._counts[index][bucket] for index in live) for bucket in range(BUCKETS + 1)]
+        count = sum(merged)
+        result: Dict[str, Any] = {'count': count}
+
+        for quantile in quantiles:
+            name = f"p{quantile * 100:g}"
+            if not count:
+                result[name] = None
+                continue
+            rank, seen = quantile * count, 0
+            for bucket, bucket_count in enumerate(merged):
+                seen += bucket_count
+                if seen >= rank:
+                    break
+            if bucket == 0:
+                result[name] = LOWEST
+            else:
+                result[name] = LOWEST * GROWTH ** (min(bucket, BUCKETS) - 0.5)
+        return result
+
+
+def resident_bytes(pid: int) -> Optional[int]:
+    """
+    Get another process's resident set size.
+
+    Args:
+        pid: Process id
+
+    Returns:
+        RSS in bytes, or None where /proc is unavailable or the process is gone
+    """
+    try:
+        with open(f"/proc/{pid}/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class HealthMonitor:
+    """
+    Thread-safe rolling request figures for the health endpoint.
+
+    Attributes:
+        window (float): Rolling window in seconds
+        slots (int): Slots per window
+        max_in_flight (int): In-flight requests at which the server is saturated
+    """
+
+    def __init__(self, window: float = HEALTH_WINDOW, slots: int = HEALTH_SLOTS,
+                 max_in_flight: int = HEALTH_MAX_IN_FLIGHT):
+        self.window = window
+        self.slots = slots
+        self.max_in_flight = max_in_flight
+        self.started = time.time()
+
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, int] = {}
+        self._latency: Dict[Tuple[str, str], RollingHistogram] = {}
+        self._counters: Dict[Tuple[str, str], RollingCounter] = {}
+
+    def _counter(self, endpoint: str, name: str) -> RollingCounter:
+        counter = self._counters.get((endpoint, name))
+        if counter is None:
+            counter = self._counters[(endpoint, name)] = RollingCounter(self.window, self.slots)
+        return counter
+
+    def request_started(self, endpoint: str) -> None:
+        """Count a request as in flight."""
+        with self._lock:
+            self._in_flight[endpoint] = self._in_flight.get(endpoint, 0) + 1
+
+    def request_finished(self, endpoint: str, algorithm: str, seconds: float, status: int,
+                         now: Optional[float] = None) -> None:
+        """
+        Record a finished request.
+
+        Args:
+            endpoint: Bounded endpoint label
+            algorithm: Bounded algorithm label
+            seconds: Request latency
+            status: HTTP status of the response
+            now: Completion time (default: the current time)
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            self._in_flight[endpoint] = max(0, self._in_flight.get(endpoint, 0) - 1)
+            histogram = self._latency.get((endpoint, algorithm))
+            if histogram is None:
+                histogram = self._latency[(endpoint, algorithm)] = RollingHistogram(self.window, self.slots)
+            histogram.observe(seconds, now)
+
+            self._counter(endpoint, 'requests').add(1, now)
+            if status in REJECTED_STATUSES:
+                self._counter(endpoint, f'rejected:{status}').add(1, now)
+            elif status >= 500:
+                self._counter(endpoint, 'errors').add(1, now)
+
+    def observe_cache(self, endpoint: str, hit: bool, now: Optional[float] = None) -> None:
+        """Record a result cache lookup."""
+        with self._lock:
+            self._counter(endpoint, 'cache:hit' if hit else 'cache:miss').add(1, now)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently being served."""
+        with self._lock:
+            return sum(self._in_flight.values())
+
+    def describe(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Summarize the rolling window.
+
+        Returns:
+            Dictionary with window, in_flight (total and per endpoint),
+            latency (per endpoint, then algorithm), requests, rejected,
+            errors and cache (hits, misses, hit_rate) per endpoint
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            latency: Dict[str, Dict[str, Any]] = {}
+            for (endpoint, algorithm), histogram in self._latency.items():
+                summary = histogram.quantiles(QUANTILES, now)
+                if summary['count']:
+                    latency.setdefault(endpoint, {})[algorithm] = summary
+
+            requests, rejected, errors, cache = {}, {}, {}, {}
+            for (endpoint, name), counter in self._counters.items():
+                total = counter.total(now)
+                if not total:
+                    continue
+                if name == 'requests':
+                    requests[endpoint] = total
+                elif name == 'errors':
+                    errors[endpoint] = total
+                elif name.startswith('rejected:'):
+                    rejected.setdefault(endpoint, {})[name.split(':', 1)[1]] = total
+                else:
+                    cache.setdefault(endpoint, {'hits': 0, 'misses': 0})[
+                        'hits' if name == 'cache:hit' else 'misses'] = total
+            for lookups in cache.values():
+                lookups['hit_rate'] = lookups['hits'] / (lookups['hits'] + lookups['misses'])
+
+            in_flight = {endpoint: count for endpoint, count in self._in_flight.items() if count}
+
+        return {
+            'window_seconds': self.window,
+            'uptime_seconds': now - self.started,
+            'in_flight': {'total': sum(in_flight.values()), 'endpoints': in_flight},
+            'latency': latency,
+            'requests': requests,
+            'rejected': rejected,
+            'errors': errors,
+            'cache': cache
+        }
+
+
+def process_memory(worker_pids: List[int]) -> Dict[str, Any]:
+    """
+    Get the resident memory of the server and its worker processes.
+
+    Args:
+        worker_pids: Pool worker process ids
+
+    Returns:
+        {"server": bytes, "workers": {pid: bytes}, "total": bytes}
+    """
+    workers = {}
+    for pid in worker_pids:
+        rss = resident_bytes(pid)
+        if rss is not None:
+            workers[str(pid)] = rss
+    server = _resident_bytes()
+    return {'server': server, 'workers': workers, 'total': server + sum(workers.values())}
+
+
+# Process-wide monitor fed by the request hooks and telemetry.observe_cache
+MONITOR = HealthMonitor()
+
+
+def init_app(app: Any) -> None:
+    """
+    Register the request hooks that feed MONITOR on a Flask app.
+
+    Args:
+        app: Flask application
+    """
+    from flask import g, request, Response
+
+    @app.before_request
+    def start_health_timer() -> None:
+        rule = request.url_rule
+        endpoint = rule.rule if rule is not None else "unmatched"
+        if endpoint in UNTRACKED_ENDPOINTS:
+            return
+        g.health_endpoint = endpoint
+        g.health_start = time.perf_counter()
+        MONITOR.request_started(endpoint)
+
+    @app.after_request
+    def record_health(response: Response) -> Response:
+        endpoint = g.pop("health_endpoint", None)
+        if endpoint is not None:
+            MONITOR.request_finished(endpoint, g.get("telemetry_algorithm", "unknown"),
+                                     time.perf_counter() - g.health_start, response.status_code)
+        return response
+
+    @app.teardown_request
+    def finish_health(exception: Optional[BaseException] = None) -> None:
+        # Requests that raised never reached after_request
+        endpoint = g.pop("health_endpoint", None)
+        if endpoint is not None:
+            MONITOR.request_finished(endpoint, g.get("telemetry_algorithm", "unknown"),
+                                     time.perf_counter() - g.health_start, 500)
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Asynchronous Job Queue for the Bridge Server
+
+Long runs tie up a synchronous HTTP request until they finish, and under
+bursty load every request waits on the same pool until clients time out.
+Jobs are accepted immediately instead and run from a bounded queue:
+
+- Jobs wait in a priority queue (higher priority first, FIFO within a
+  priority) and at most ``concurrency`` of them occupy the worker pool at a
+  time, leaving the remaining workers to interactive requests
+- When ``max_queued`` jobs are waiting, new jobs are rejected with a retry
+  hint derived from recent run times instead of piling up
+- Each job executes into the run store (see runs.py), so its states can be
+  paged through /runs/<id>/steps once it finishes
+- Each job reports its queue wait and run time separately
+
+Dispatch happens on submission and on job completion; there is no
+scheduler thread. With an inline backend each job runs on its own daemon
+thread instead, so POST /jobs still returns as soon as the job is queued.
+
+The queue itself lives in the process that accepted the job, but every job
+is mirrored into the run store's ``jobs`` table: under the pre-fork launcher
+any worker process can report or cancel a job (a job cancelled elsewhere is
+skipped when it would start), and the master fails the unfinished jobs of a
+worker that exits without finishing them (``RunStore.fail_jobs``).
+
+Configuration (environment variables):
+    BRIDGE_JOB_QUEUE         Jobs allowed to wait in the queue (default 64)
+    BRIDGE_JOB_CONCURRENCY   Jobs running at once (default: number of workers)
+    BRIDGE_JOB_HISTORY       Finished jobs remembered (default 1000)
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import math
+import time
+import heapq
+import secrets
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional, Union
+
+from python.bridge import telemetry
+from python.bridge.executor import POOL_WORKERS, ExecutionBackend, SharedInput, input_length
+from python.bridge.runs import JOB_COLUMNS, RunStore, run_recorded
+from python.bridge.streaming import _start_thread
+
+JOB_QUEUE_SIZE = int(os.environ.get('BRIDGE_JOB_QUEUE', 64))
+JOB_CONCURRENCY = int(os.environ.get('BRIDGE_JOB_CONCURRENCY', 0)) or POOL_WORKERS
+JOB_HISTORY = int(os.environ.get('BRIDGE_JOB_HISTORY', 1000))
+
+# Weight of the latest run in the moving average behind retry hints
+RUN_TIME_SMOOTHING = 0.2
+
+
+class QueueFull(Exception):
+    """
+    Raised when a job is submitted to a full queue.
+
+    Attributes:
+        retry_after (int): Suggested seconds before retrying
+        queued (int): Jobs waiting in the queue
+    """
+
+    def __init__(self, retry_after: int, queued: int):
+        super().__init__(f"Job queue is full ({queued} jobs waiting); retry in {retry_after}s")
+        self.retry_after = retry_after
+        self.queued = queued
+
+
+class Job:
+    """
+    One queued run.
+
+    Attributes:
+        id (str): Job id
+        algorithm (str): Registry key
+        priority (int): Higher runs first
+        status (str): "queued", "running", "complete", "failed" or "cancelled"
+        run_id (Optional[str]): Run store id, once the job started
+        error (Optional[str]): Why the job failed
+    """
+
+    def __init__(self, algorithm_key: str, data: Union[List[Any], SharedInput], options: Dict[str, Any],
+                 limits: Optional[Dict[str, Any]], priority: int):
+        self.id = secrets.token_hex(8)
+        self.algorithm = algorithm_key
+        self.data = data
+        self.options = options
+        self.limits = limits
+        self.priority = priority
+        self.sequence = 0
+        self.input_size = 0
+        self.status = 'queued'
+        self.run_id: Optional[str] = None
+        self.error: Optional[str] = None
+        self.submitted = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.owner = os.getpid()
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'Job':
+        """Rebuild a job queued by another process from its run store row."""
+        job = cls(row['algorithm'], [], {}, None, row['priority'])
+        for column in JOB_COLUMNS:
+            setattr(job, column, row[column])
+        return job
+
+    def to_row(self) -> Dict[str, Any]:
+        """Get the run store row (JOB_COLUMNS) of the job."""
+        return {column: getattr(self, column) for column in JOB_COLUMNS}
+
+    @property
+    def queue_wait(self) -> float:
+        """Seconds spent waiting (so far, while queued)."""
+        return (self.started or self.finished or time.time()) - self.submitted
+
+    @property
+    def run_time(self) -> Optional[float]:
+        """Seconds spent running (so far, while running; None before)."""
+        if self.started is None:
+            return None
+        return (self.finished or time.time()) - self.started
+
+    def release(self) -> None:
+        """Drop the input once it is no longer needed."""
+        if isinstance(self.data, SharedInput):
+            self.data.close()
+        self.data = []
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'algorithm': self.algorithm,
+            'priority': self.priority,
+            'status': self.status,
+            'submitted': self.submitted,
+            'queue_wait': self.queue_wait,
+            'run_time': self.run_time,
+            'run_id': self.run_id,
+            'error': self.error
+        }
+
+
+class JobQueue:
+    """
+    Bounded priority queue of jobs executed on an ExecutionBackend.
+
+    Attributes:
+        backend (ExecutionBackend): Where jobs run
+        store (RunStore): Where job histories are written
+        max_queued (int): Jobs allowed to wait
+        concurrency (int): Jobs running at once
+    """
+
+    def __init__(self, backend: ExecutionBackend, store: RunStore, max_queued: int = JOB_QUEUE_SIZE,
+                 concurrency: int = JOB_CONCURRENCY, history: int = JOB_HISTORY):
+        self.backend = backend
+        self.store = store
+        self.max_queued = max_queued
+        self.concurrency = max(1, concurrency)
+        self.history = history
+
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._heap: List[tuple] = []
+        self._sequence = 0
+        self._queued = 0
+        self._running = 0
+        self._jobs: Dict[str, Job] = {}
+        self._finished: "OrderedDict[str, None]" = OrderedDict()
+        self._average_run_time = 1.0
+
+    def retry_after(self) -> int:
+        """Estimate the seconds until a queue slot frees up."""
+        return max(1, math.ceil(self._average_run_time / self.concurrency))
+
+    def submit(self, algorithm_key: str, data: Union[List[Any], SharedInput], options: Dict[str, Any],
+               limits: Optional[Dict[str, Any]] = None, priority: int = 0) -> Job:
+        """
+        Queue a job.
+
+        The job takes ownership of ``data``: a SharedInput is closed when the
+        job finishes or is cancelled.
+
+        Args:
+            algorithm_key: Registry key
+            data: Input array or shared-memory input
+            options: Python-style algorithm options
+            limits: Per-request limits
+            priority: Higher runs first
+
+        Returns:
+            The queued job
+
+        Raises:
+            QueueFull: If ``max_queued`` jobs are already waiting
+        """
+        job = Job(algorithm_key, data, options, limits, priority)
+        with self._lock:
+            if self._queued >= self.max_queued:
+                raise QueueFull(self.retry_after(), self._queued)
+            job.sequence = self._sequence
+            self._sequence += 1
+            self._jobs[job.id] = job
+            heapq.heappush(self._heap, (-priority, job.sequence, job))
+            self._queued += 1
+            telemetry.set_jobs_queued(self._queued)
+            # Mirrored before dispatch so the job can be claimed
+            self.store.add_job(job.to_row(), self.history)
+
+        self._dispatch()
+        return job
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while below the concurrency limit."""
+        while True:
+            with self._lock:
+                job = None
+                while self._heap and self._running < self.concurrency:
+                    candidate = heapq.heappop(self._heap)[-1]
+                    if candidate.status == 'queued':
+                        job = candidate
+                        break
+                if job is None:
+                    return
+                self._queued -= 1
+                self._running += 1
+                job.status = 'running'
+                job.started = time.time()
+                telemetry.observe_job(job.queue_wait, self._queued)
+
+            if not self.store.claim_job(job.id, job.started):
+                # Cancelled through another process
+                job.finished = time.time()
+                job.release()
+                self.store.delete_job(job.id)
+                with self._lock:
+                    job.status = 'cancelled'
+                    self._running -= 1
+                    self._jobs.pop(job.id, None)
+                    self._idle.notify_all()
+                continue
+
+            try:
+                data = job.data.ref if isinstance(job.data, SharedInput) else job.data
+                job.input_size = input_length(data)
+                job.run_id = self.store.create(job.algorithm, job.input_size)
+                self.store.update_job(job.to_row())
+                args = (self.store.path, job.run_id, job.algorithm, data, job.options, job.limits)
+                if getattr(self.backend, 'mode', None) == 'inline':
+                    # An inline backend would run the job inside the submitting request
+                    future = _start_thread(run_recorded, *args)
+                else:
+                    future = self.backend.submit(run_recorded, *args)
+            except Exception as e:
+                future = Future()
+                future.set_exception(e)
+            future.add_done_callback(lambda done, job=job: self._complete(job, done))
+
+    def _complete(self, job: Job, future: Future) -> None:
+        try:
+            summary = future.result()
+            job.status = summary['status']
+            job.error = summary.get('error')
+            if job.status == 'complete':
+                telemetry.observe_run('/jobs', job.algorithm, job.input_size, summary['steps'],
+                                      summary['metrics'].get('execution_time', 0))
+        except Exception as e:
+            job.status = 'failed'
+            job.error = f"{type(e).__name__}: {str(e)}"
+            if job.run_id is not None:
+                # The worker failed before the run stored its outcome
+                self.store.fail(job.run_id, job.error)
+
+        job.finished = time.time()
+        job.release()
+        self.store.update_job(job.to_row())
+        with self._lock:
+            self._running -= 1
+            self._average_run_time += RUN_TIME_SMOOTHING * (job.run_time - self._average_run_time)
+            self._remember(job)
+            self._idle.notify_all()
+
+        self._dispatch()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until no job is queued or running.
+
+        Args:
+            timeout: Seconds to wait at most (None = no limit)
+
+        Returns:
+            Whether the queue drained in time
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._queued and not self._running, timeout)
+
+    def abandon(self, error: str) -> int:
+        """
+        Fail every job of this queue that has not finished (the process is exiting).
+
+        Args:
+            error: Error message for the jobs and their runs
+
+        Returns:
+            Number of jobs failed
+        """
+        with self._lock:
+            for job in self._jobs.values():
+                if job.status == 'queued':
+                    job.status = 'failed'
+                    job.release()
+            self._heap.clear()
+            self._queued = 0
+        return self.store.fail_jobs(os.getpid(), error)
+
+    def _remember(self, job: Job) -> None:
+        """Keep a finished job, forgetting the oldest beyond ``history`` (lock held)."""
+        self._finished[job.id] = None
+        while len(self._finished) > self.history:
+            self._jobs.pop(self._finished.popitem(last=False)[0], None)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Describe a job.
+
+        Jobs queued by another process are read from the run store (without
+        a queue position).
+
+        Returns:
+            Job description, with its queue position while queued; None if unknown
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                row = self.store.job(job_id)
+                return Job.from_row(row).to_dict() if row is not None else None
+            description = job.to_dict()
+            if job.status == 'queued':
+                order = (-job.priority, job.sequence)
+                description['position'] = sum(1 for priority, sequence, other in self._heap
+                                              if other.status == 'queued' and (priority, sequence) < order)
+        return description
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a queued job, or forget a finished one.
+
+        Returns:
+            The job description (None if unknown)
+
+        Raises:
+            RuntimeError: If the job is already running
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                # Queued by another process: it skips the job when it would start
+                row = self.store.cancel_job(job_id)
+                return Job.from_row(row).to_dict() if row is not None else None
+            if job.status == 'running':
+                raise RuntimeError(f"Job '{job_id}' is already running")
+            if job.status == 'queued':
+                job.status = 'cancelled'
+                job.finished = time.time()
+                job.release()
+                self._queued -= 1
+                telemetry.set_jobs_queued(self._queued)
+            self._jobs.pop(job_id)
+            self._finished.pop(job_id, None)
+            self.store.delete_job(job_id)
+            return job.to_dict()
+
+    def describe(self) -> Dict[str, Any]:
+        """Get queue depth and limits for /status."""
+        with self._lock:
+            return {
+                'queued': self._queued,
+                'running': self._running,
+                'max_queued': self.max_queued,
+                'concurrency': self.concurrency,
+                'average_run_time': self._average_run_time
+            }
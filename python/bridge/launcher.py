@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Pre-Fork Production Launcher for the Bridge Server
+
+``server.py`` run directly uses Flask's development server: one process,
+debug mode and a reloader. This launcher serves the same app from a pool of
+forked worker processes:
+
+1. The master imports the server, every algorithm module and the data
+   generators (optionally running each algorithm once), binds the listening
+   socket, and freezes the garbage collector so that the imported objects
+   are never touched again by collections
+2. Workers are forked from the master and share those pages copy-on-write;
+   a new worker starts serving immediately without import or warm-up cost
+3. Each worker serves one request at a time from the shared socket and
+   dispatches algorithms to its own execution pool (see executor.py), created
+   on its first run, so a /compare still runs its algorithms concurrently
+4. A worker exits after serving its request quota (plus jitter, so workers
+   do not all recycle at once) to bound memory growth; the master forks a
+   replacement
+
+Signals (to the master):
+    SIGHUP            Graceful reload: fork a fresh set of workers, then let
+                      the old ones finish their current request and exit
+    SIGTERM, SIGINT   Graceful shutdown (workers still busy after the
+                      graceful timeout are killed)
+
+The result cache and live-stepping sessions live in process memory, so each
+worker has its own. Jobs run from the queue of the worker that accepted them
+but are mirrored into the shared run store (SQLite), so any worker answers
+GET and DELETE /jobs/<id>. A worker that is recycled or stopped waits for its
+jobs until shortly before the graceful timeout and fails the rest; if it is
+killed first, the master fails its unfinished jobs when it reaps it.
+
+Configuration (environment variables):
+    BRIDGE_LAUNCH_HOST              Address to bind (default 127.0.0.1)
+    BRIDGE_LAUNCH_PORT              Port to bind (default 5000)
+    BRIDGE_LAUNCH_WORKERS           Worker processes (default: CPU count)
+    BRIDGE_LAUNCH_MAX_REQUESTS      Requests before a worker is recycled (default 1000, 0 = never)
+    BRIDGE_LAUNCH_MAX_REQUESTS_JITTER   Random extra requests per worker (default 50)
+    BRIDGE_LAUNCH_GRACEFUL_TIMEOUT  Seconds workers get to finish on shutdown (default 30)
+    BRIDGE_WARM_UP                  "1" to run every algorithm once in the master
+    BRIDGE_WORKERS                  Execution pool size per worker (see executor.py)
+    BRIDGE_EXECUTION                "inline" runs algorithms in the workers themselves
+                                    (a /compare then runs its algorithms one by one)
+
+Usage:
+    python -m python.bridge.launcher
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import gc
+import sys
+import time
+import random
+import signal
+import socket
+import logging
+from typing import Any, Callable, Dict, Optional
+
+LAUNCH_HOST = os.environ.get('BRIDGE_LAUNCH_HOST', '127.0.0.1')
+LAUNCH_PORT = int(os.environ.get('BRIDGE_LAUNCH_PORT', 5000))
+LAUNCH_WORKERS = int(os.environ.get('BRIDGE_LAUNCH_WORKERS', 0)) or os.cpu_count() or 1
+MAX_REQUESTS = int(os.environ.get('BRIDGE_LAUNCH_MAX_REQUESTS', 1000))
+MAX_REQUESTS_JITTER = int(os.environ.get('BRIDGE_LAUNCH_MAX_REQUESTS_JITTER', 50))
+GRACEFUL_TIMEOUT = float(os.environ.get('BRIDGE_LAUNCH_GRACEFUL_TIMEOUT', 30))
+
+# How often idle workers and the master check their flags
+POLL_INTERVAL = 0.5
+
+# Share of the graceful timeout a stopping worker waits for its jobs; the
+# rest leaves time to fail the unfinished ones before the master kills it
+JOB_DRAIN_SHARE = 0.8
+
+logger = logging.getLogger(__name__)
+
+
+def preload(warm_up: bool = False) -> Dict[str, Any]:
+    """
+    Import everything workers need before forking.
+
+    Args:
+        warm_up: Also run every algorithm once
+
+    Returns:
+        Mapping of algorithm key to import error, or to warm-up time/error
+    """
+    from python.bridge.executor import get_registry
+    from python.utils import data_generators
+
+    registry = get_registry()
+    results = registry.warm_up() if warm_up else registry.preload()
+    data_generators._numpy()
+    return results
+
+
+def bind_socket(host: str, port: int, backlog: int = 128) -> socket.socket:
+    """
+    Create the listening socket shared by all workers.
+
+    The socket is non-blocking so that workers woken for the same
+    connection do not block in accept; the losers simply go back to waiting.
+    """
+    family = socket.AF_INET6 if ':' in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.setblocking(False)
+    sock.set_inheritable(True)
+    return sock
+
+
+class _RequestCounter:
+    """WSGI middleware counting the requests a worker has started."""
+
+    def __init__(self, app: Any):
+        self.app = app
+        self.count = 0
+
+    def __call__(self, environ: Dict[str, Any], start_response: Any) -> Any:
+        self.count += 1
+        return self.app(environ, start_response)
+
+
+def serve_worker(app: Any, sock: socket.socket, max_requests: int = 0) -> None:
+    """
+    Serve requests one at a time until recycled or stopped.
+
+    Args:
+        app: WSGI application
+        sock: Shared listening socket
+        max_requests: Requests before exiting (0 = unlimited)
+    """
+    from werkzeug.serving import make_server
+
+    stopping = []
+    signal.signal(signal.SIGTERM, lambda signum, frame: stopping.append(signum))
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+    counter = _RequestCounter(app)
+    server = make_server(sock.getsockname()[0], sock.getsockname()[1], counter, fd=sock.fileno())
+    server.timeout = POLL_INTERVAL
+    try:
+        while not stopping and not (max_requests and counter.count >= max_requests):
+            server.handle_request()
+    finally:
+        server.server_close()
+
+
+class Launcher:
+    """
+    Master process: forks, supervises and recycles workers.
+
+    Attributes:
+        app (Any): WSGI application served by the workers
+        sock (socket.socket): Shared listening socket
+        workers (int): Number of workers to keep running
+        max_requests (int): Requests per worker before it is recycled
+        max_requests_jitter (int): Random extra requests per worker
+        graceful_timeout (float): Seconds workers get to finish when stopped
+        on_fork (Optional[Callable]): Called in each worker after forking
+        on_exit (Optional[Callable]): Called in each worker before it exits
+        on_reap (Optional[Callable]): Called in the master with the pid of
+            each worker that exited
+        recycled (int): Workers replaced after exiting
+    """
+
+    def __init__(self, app: Any, sock: socket.socket, workers: int = LAUNCH_WORKERS,
+                 max_requests: int = MAX_REQUESTS, max_requests_jitter: int = MAX_REQUESTS_JITTER,
+                 graceful_timeout: float = GRACEFUL_TIMEOUT, on_fork: Optional[Callable[[], None]] = None,
+                 on_exit: Optional[Callable[[], None]] = None,
+                 on_reap: Optional[Callable[[int], None]] = None):
+        self.app = app
+        self.sock = sock
+        self.workers = workers
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.graceful_timeout = graceful_timeout
+        self.on_fork = on_fork
+        self.on_exit = on_exit
+        self.on_reap = on_reap
+        self.recycled = 0
+
+        self._children: Dict[int, int] = {}     # pid -> generation
+        self._retiring: Dict[int, float] = {}   # pid -> kill deadline
+        self._generation = 0
+        self._signals = []
+
+    def spawn(self) -> int:
+        """Fork one worker of the current generation."""
+        limit = self.max_requests
+        if limit and self.max_requests_jitter:
+            limit += random.randint(0, self.max_requests_jitter)
+
+        pid = os.fork()
+        if pid == 0:
+            status = 0
+            try:
+                random.seed()
+                if self.on_fork is not None:
+                    self.on_fork()
+                serve_worker(self.app, self.sock, limit)
+            except BaseException:
+                logger.exception("Worker %d failed", os.getpid())
+                status = 1
+            finally:
+                if self.on_exit is not None:
+                    self.on_exit()
+                # Skip the master's atexit handlers and buffered output
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(status)
+
+        self._children[pid] = self._generation
+        return pid
+
+    def _retire(self, pids: Any, now: float) -> None:
+        for pid in pids:
+            if pid not in self._retiring:
+                self._retiring[pid] = now + self.graceful_timeout
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+
+    def _kill_overdue(self) -> None:
+        now = time.monotonic()
+        for pid, deadline in list(self._retiring.items()):
+            if now > deadline:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+
+    def reload(self) -> None:
+        """Replace every worker: start a new generation, then retire the old one."""
+        old = list(self._children)
+        self._generation += 1
+        for _ in range(self.workers):
+            self.spawn()
+        self._retire(old, time.monotonic())
+
+    def _reap(self) -> None:
+        """Collect exited workers and replace current-generation ones."""
+        while self._children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            generation = self._children.pop(pid, None)
+            retired = self._retiring.pop(pid, None) is not None
+            if self.on_reap is not None:
+                try:
+                    self.on_reap(pid)
+                except Exception:
+                    logger.exception("Cleaning up after worker %d failed", pid)
+            if generation == self._generation and not retired:
+                self.recycled += 1
+                self.spawn()
+
+    def run(self) -> None:
+        """Start the workers and supervise them until SIGTERM or SIGINT."""
+        for signum in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, lambda signum, frame: self._signals.append(signum))
+
+        for _ in range(self.workers):
+            self.spawn()
+
+        while True:
+            while self._signals:
+                signum = self._signals.pop(0)
+                if signum == signal.SIGHUP:
+                    logger.info("Reloading workers")
+                    self.reload()
+                else:
+                    return self.stop()
+            self._reap()
+            self._kill_overdue()
+            time.sleep(POLL_INTERVAL / 5)
+
+    def stop(self) -> None:
+        """Stop every worker gracefully, killing those past the timeout."""
+        self._generation += 1
+        self._retire(list(self._children), time.monotonic())
+        while self._children:
+            self._reap()
+            self._kill_overdue()
+            time.sleep(POLL_INTERVAL / 5)
+        self.sock.close()
+
+
+def main() -> None:
+    """Preload the server, bind the socket and run the master."""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(process)d] %(message)s')
+
+    from python.bridge import datasets, server
+
+    # Tracebacks are not returned to clients in production
+    server.DEBUG = False
+    preload(warm_up=os.environ.get('BRIDGE_WARM_UP', '0') == '1')
+    sock = bind_socket(LAUNCH_HOST, LAUNCH_PORT)
+
+    # Keep collections from writing to (and un-sharing) the preloaded pages
+    gc.collect()
+    gc.freeze()
+
+    def on_exit() -> None:
+        # Let jobs finish while there is time, fail the rest, kill the pools,
+        # then unlink the shared datasets this worker generated (see datasets.py)
+        if not server.JOBS.drain(GRACEFUL_TIMEOUT * JOB_DRAIN_SHARE):
+            server.JOBS.abandon("Worker stopped before the job finished")
+        for backend in (server.BACKEND, server.STREAM_BACKEND, server.BATCH_BACKEND, server.LIVE_BACKEND):
+            backend.shutdown(terminate=True)
+        datasets.DATASETS.clear()
+
+    def on_reap(pid: int) -> None:
+        # A worker killed past the graceful timeout could not fail its own jobs
+        server.RUN_STORE.fail_jobs(pid, "Worker exited before the job finished")
+
+    launcher = Launcher(server.app, sock, on_exit=on_exit, on_reap=on_reap)
+    logger.info("Serving on http://%s:%d with %d workers (recycled every %d requests)",
+                LAUNCH_HOST, LAUNCH_PORT, launcher.workers, launcher.max_requests)
+    launcher.run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,611 @@
+#!/usr/bin/env python3
+"""
+WebSocket Live-Stepping Server for the Bridge
+
+Interactive visualizations step through a run rather than replay a finished
+history. This module serves live sessions over WebSocket: a client opens a
+run and pulls states from it, and the algorithm only advances as far as the
+client has asked for.
+
+- LiveSession runs the algorithm in a producer on its own pool (like
+  streamed runs), with a ``history_sink`` that blocks until the client
+  demands another state: demand flows to the producer and serialized states
+  flow back over a pipe. A paused session costs no CPU and holds at most
+  LIVE_BUFFER states; a heavy session cannot hold the server's GIL, and the
+  worker CPU limit and a deadline backstop apply as for other runs. Time
+  spent paused is excluded from the run's metrics, budget deadline and
+  backstop; a session left idle past LIVE_IDLE_TIMEOUT ends its run instead
+- "step" pulls N states; "seek" jumps forward (intermediate states are not
+  serialized) or backward (within the buffer, otherwise by replaying the run
+  from the start)
+- "play" pushes states with credit-based flow control: at most ``window``
+  unacknowledged states are in flight and "ack" returns credits; "pause"
+  stops pushing
+
+Messages use the envelope of the JavaScript CommunicationLayer:
+``{"requestId": 1, "endpoint": "live/step", "data": {...}}`` is answered by
+``{"requestId": 1, "data": {...}}`` or ``{"requestId": 1, "error": "..."}``.
+Pushed states carry no requestId. Other endpoints answer with an error so
+the client falls back to HTTP.
+
+``websockets`` is optional; without it the server cannot be started, but the
+session logic is importable.
+
+Configuration (environment variables):
+    BRIDGE_LIVE_PORT           WebSocket port (default 5001)
+    BRIDGE_LIVE_BUFFER         States retained per session for backward seeks (default 256)
+    BRIDGE_LIVE_MAX_SESSIONS   Maximum concurrent sessions, and the size of the
+                               live pool (each open session holds a worker; default 16)
+    BRIDGE_LIVE_IDLE_TIMEOUT   Seconds a session waits for its client before the
+                               run is abandoned (default 600)
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import json
+import time
+import signal
+import asyncio
+import functools
+import itertools
+import threading
+import multiprocessing
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple
+
+from python.bridge.executor import (
+    ExecutionBackend, START_METHOD, TIMEOUT_GRACE, WORKER_CPU_SECONDS,
+    _cpu_limit, _create_algorithm, _deadline, serialize_algorithm_state
+)
+from python.bridge.serialization import convert_options
+from python.bridge.streaming import POLL_INTERVAL, _start_thread
+from python.core.budget import BudgetExceeded
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+
+LIVE_PORT = int(os.environ.get('BRIDGE_LIVE_PORT', 5001))
+LIVE_BUFFER = int(os.environ.get('BRIDGE_LIVE_BUFFER', 256))
+LIVE_MAX_SESSIONS = int(os.environ.get('BRIDGE_LIVE_MAX_SESSIONS', 16))
+LIVE_IDLE_TIMEOUT = float(os.environ.get('BRIDGE_LIVE_IDLE_TIMEOUT', 600))
+
+# Longest a single step/seek waits for the producer
+STEP_TIMEOUT = 30.0
+
+
+class SessionError(Exception):
+    """Invalid live-session request (reported to the client, not raised further)."""
+    pass
+
+
+class LiveSession:
+    """
+    One pull-driven algorithm run.
+
+    Attributes:
+        algorithm_key (str): Registry key
+        cursor (int): Next step to deliver
+        produced (int): Number of states recorded so far
+        done (bool): Whether the run finished (or failed)
+        outcome (Optional[Dict[str, Any]]): Final result/metrics or error
+        idle_timeout (float): Seconds the run waits for demand before it is
+            abandoned
+        backend (Optional[ExecutionBackend]): Pool running the producer (a
+            thread of this process if None or inline)
+    """
+
+    def __init__(self, algorithm_key: str, data: List[Any], options: Optional[Dict[str, Any]] = None,
+                 limits: Optional[Dict[str, Any]] = None, buffer_size: int = LIVE_BUFFER,
+                 idle_timeout: float = LIVE_IDLE_TIMEOUT, backend: Optional[ExecutionBackend] = None):
+        self.algorithm_key = algorithm_key
+        self.data = data
+        self.options = options or {}
+        self.limits = limits
+        self.buffer_size = buffer_size
+        self.idle_timeout = idle_timeout
+        self.backend = backend
+
+        self._cond = threading.Condition()
+        self._start()
+
+    def _start(self) -> None:
+        """Start (or restart) the producer from the first step."""
+        self.cursor = 0
+        self.produced = 0
+        self.done = False
+        self.outcome: Optional[Dict[str, Any]] = None
+        self._buffer: "deque[Tuple[int, Dict[str, Any]]]" = deque(maxlen=self.buffer_size)
+        self._demand = 0
+
+        # Each run has its own pipe, so a restart cannot be confused with the old run
+        conn, producer_conn = multiprocessing.get_context(START_METHOD).Pipe()
+        args = (self.algorithm_key, self.data, self.options, self.limits, producer_conn, self.idle_timeout)
+        # As in streaming.py, an inline producer thread owns its end of the
+        # pipe; the pool pickles its own copy, which is closed here when done
+        self._inline = self.backend is None or self.backend.mode == 'inline'
+        if self._inline:
+            future = _start_thread(run_live, *args)
+        else:
+            future = self.backend.submit(run_live, *args)
+        self._conn = conn
+        self._producer_conn = producer_conn
+        threading.Thread(target=self._receive, args=(conn, producer_conn, future), daemon=True).start()
+
+    def _receive(self, conn: Any, producer_conn: Any, future: Any) -> None:
+        """Reader thread body: apply the producer's messages to the session."""
+        while True:
+            try:
+                if conn.poll(POLL_INTERVAL):
+                    message = conn.recv()
+                elif future.done() and not conn.poll():
+                    # The producer ended without a final message (e.g. a killed worker)
+                    error = future.exception() or RuntimeError("Live run ended without a result")
+                    message = ('done', {'error': f"{type(error).__name__}: {str(error)}"})
+                else:
+                    continue
+            except (EOFError, OSError):
+                message = None
+
+            with self._cond:
+                current = conn is self._conn
+                if current and message is not None and message[0] == 'state':
+                    _, step, state = message
+                    # Fast-forwarded states are counted but never serialized
+                    if state is not None:
+                        self._buffer.append((step, state))
+                    self.produced = step + 1
+                    self._demand = max(0, self._demand - 1)
+                    self._cond.notify_all()
+                    continue
+                if current and message is not None:
+                    self.done = True
+                    self.outcome = message[1]
+                    self._cond.notify_all()
+                conn.close()
+                if not self._inline:
+                    producer_conn.close()
+                return
+
+    def _send(self, message: Tuple[str, Any]) -> None:
+        """Send a message to the producer (lock held; ignored once the run ended)."""
+        if not self._conn.closed:
+            try:
+                self._conn.send(message)
+            except OSError:
+                pass
+
+    def _wait_for(self, step: int, timeout: float) -> None:
+        """Demand states up to ``step`` (exclusive) and wait for them (lock held)."""
+        missing = step - self.produced - self._demand
+        if missing > 0 and not self.done:
+            self._demand += missing
+            self._send(('demand', missing))
+        if not self._cond.wait_for(lambda: self.produced >= step or self.done, timeout):
+            raise SessionError(f"Timed out waiting for step {step - 1}")
+
+    def _status(self) -> Dict[str, Any]:
+        status = {'cursor': self.cursor, 'produced': self.produced, 'done': self.done}
+        if self.done and self.cursor >= self.produced:
+            status['outcome'] = self.outcome
+        return status
+
+    def step(self, count: int = 1, timeout: float = STEP_TIMEOUT) -> Dict[str, Any]:
+        """
+        Deliver the next ``count`` states, advancing the run as needed.
+
+        Args:
+            count: Number of states (capped at the buffer size)
+            timeout: Seconds to wait for the producer
+
+        Returns:
+            Dictionary with "states" ([{"step", "state"}]) and the session status
+            (the final "outcome" once every state was delivered)
+        """
+        count = max(0, min(int(count), self.buffer_size))
+        with self._cond:
+            self._wait_for(self.cursor + count, timeout)
+            states = [{'step': step, 'state': state} for step, state in self._buffer
+                      if self.cursor <= step < self.cursor + count]
+            self.cursor += len(states)
+            return dict(self._status(), states=states)
+
+    def seek(self, target: int, timeout: float = STEP_TIMEOUT) -> Dict[str, Any]:
+        """
+        Move to ``target`` and deliver its state.
+
+        Forward seeks run the algorithm up to the target without serializing
+        the skipped states. Backward seeks are served from the buffer or, if
+        the state was evicted, by replaying the run from the start.
+
+        Args:
+            target: Step index
+            timeout: Seconds to wait for the producer
+
+        Returns:
+            Dictionary with "step", "state" (None if the run ended earlier)
+            and the session status
+        """
+        target = max(0, int(target))
+        with self._cond:
+            oldest = self._buffer[0][0] if self._buffer else self.produced
+            restart = target < oldest
+
+        if restart:
+            self.close()
+            with self._cond:
+                self._start()
+
+        with self._cond:
+            if target >= self.produced:
+                self._send(('skip', target))
+            self._wait_for(target + 1, timeout)
+            state = next((state for step, state in self._buffer if step == target), None)
+            self.cursor = min(target + 1, self.produced)
+            return dict(self._status(), step=target, state=state)
+
+    def close(self) -> None:
+        """Stop the producer (it exits at its next recorded state)."""
+        with self._cond:
+            self._send(('cancel', "session closed"))
+            # The reader ignores whatever the old run still sends
+            self._conn = _CLOSED
+            if not self._inline:
+                # Closing the pool's copy also cancels a run that did not start yet
+                self._producer_conn.close()
+
+
+class _ClosedConnection:
+    """Stands in for the pipe of a closed session."""
+    closed = True
+
+
+_CLOSED = _ClosedConnection()
+
+
+@contextmanager
+def _backstop_paused():
+    """Suspend the deadline backstop's interval timer while the run waits on its client."""
+    if not hasattr(signal, 'setitimer') or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    remaining, _ = signal.setitimer(signal.ITIMER_REAL, 0)
+    try:
+        yield
+    finally:
+        if remaining:
+            signal.setitimer(signal.ITIMER_REAL, remaining)
+
+
+def run_live(algorithm_key: str, data: List[Any], options: Dict[str, Any],
+             limits: Optional[Dict[str, Any]], conn: Any, idle_timeout: float = LIVE_IDLE_TIMEOUT) -> None:
+    """
+    Run one live session's algorithm, producing states as the client demands them.
+
+    Module-level so that it can be pickled for the process pool. Reads
+    ("demand", n), ("skip", step) and ("cancel", reason) from ``conn`` and
+    writes ("state", step, state or None when skipped) and finally
+    ("done", outcome). A closed pipe cancels the run.
+
+    Args:
+        algorithm_key: Registry key
+        data: Input array
+        options: Python-style algorithm options
+        limits: Per-request limits (deadline, max_comparisons, ...)
+        conn: Producer end of a duplex pipe
+        idle_timeout: Seconds to wait for demand before the run is abandoned
+    """
+    control = {'demand': 0, 'skip_until': 0, 'cancelled': None}
+    running: List[Any] = []
+    abandoned: List[BudgetExceeded] = []
+
+    def receive(timeout: float) -> bool:
+        """Apply the session's messages, waiting up to ``timeout`` for the first."""
+        if not conn.poll(timeout):
+            return False
+        while True:
+            try:
+                kind, value = conn.recv()
+            except (EOFError, OSError):
+                control['cancelled'] = "session closed"
+                return True
+            if kind == 'demand':
+                control['demand'] += value
+            elif kind == 'skip':
+                control['skip_until'] = max(control['skip_until'], value)
+            else:
+                control['cancelled'] = value
+            if not conn.poll():
+                return True
+
+    def sink(step: int, state: Dict[str, Any]) -> None:
+        if abandoned:
+            # The error state recorded after an idle timeout must not wait again
+            raise abandoned[0]
+        receive(0)
+        if not control['demand'] and not control['cancelled']:
+            # Waiting on the client is not run time: keep it out of the
+            # metrics, the deadline and its backstop, bounded by the idle timeout
+            waited_from = time.perf_counter()
+            with _backstop_paused():
+                while not control['demand'] and not control['cancelled']:
+                    remaining = idle_timeout - (time.perf_counter() - waited_from)
+                    if remaining <= 0 or not receive(remaining):
+                        break
+            waited = time.perf_counter() - waited_from
+            if running:
+                running[0].exclude_idle_time(waited)
+            if not control['demand'] and not control['cancelled']:
+                abandoned.append(BudgetExceeded("idle", idle_timeout, round(waited, 3)))
+                raise abandoned[0]
+        if control['cancelled']:
+            raise BudgetExceeded("cancelled", None, control['cancelled'])
+        control['demand'] -= 1
+        serialized = serialize_algorithm_state(state) if step >= control['skip_until'] else None
+        conn.send(('state', step, serialized))
+
+    options = dict(options, record_history=True, history_sink=sink)
+    try:
+        try:
+            algorithm = _create_algorithm(algorithm_key, options, limits)
+            running.append(algorithm)
+            deadline = getattr(algorithm.options.get('budget'), 'deadline', None)
+            backstop = deadline + TIMEOUT_GRACE / 2 if deadline else None
+            with _deadline(backstop), _cpu_limit(WORKER_CPU_SECONDS):
+                result = algorithm.execute(data)
+            outcome = {'result': result, 'metrics': serialize_algorithm_state(algorithm.metrics)}
+        except BudgetExceeded as e:
+            if control['cancelled']:
+                return
+            outcome = {'error': str(e), 'budget_exceeded': e.to_dict()}
+        except (BrokenPipeError, ConnectionResetError):
+            # The session went away
+            return
+        except Exception as e:
+            outcome = {'error': f"{type(e).__name__}: {str(e)}"}
+        conn.send(('done', outcome))
+    except OSError:
+        pass
+    finally:
+        conn.close()
+
+
+def _envelope(request_id: Any, data: Any = None, error: Optional[str] = None) -> str:
+    message = {'requestId': request_id}
+    if error is not None:
+        message['error'] = error
+    else:
+        message['data'] = data
+    return json.dumps(message, separators=(',', ':'), default=str)
+
+
+class LiveConnection:
+    """
+    Sessions and push loops of one WebSocket connection.
+
+    Transport-independent: messages come in through ``handle`` and go out
+    through the ``send`` coroutine, so it can be driven without a socket.
+
+    Attributes:
+        sessions (Dict[str, LiveSession]): Open sessions by id
+        backend (Optional[ExecutionBackend]): Pool running the sessions' producers
+    """
+
+    _ids = itertools.count(1)
+    _open_sessions = 0
+    _open_lock = threading.Lock()
+
+    def __init__(self, send: Callable[[str], Awaitable[None]], registry: Any = None,
+                 max_sessions: int = LIVE_MAX_SESSIONS, backend: Optional[ExecutionBackend] = None):
+        self.send = send
+        self.registry = registry
+        self.max_sessions = max_sessions
+        self.backend = backend
+        self.sessions: Dict[str, LiveSession] = {}
+        self._credits: Dict[str, int] = {}
+        self._players: Dict[str, asyncio.Task] = {}
+        self._credit_events: Dict[str, asyncio.Event] = {}
+
+    def _session(self, data: Dict[str, Any]) -> Tuple[str, LiveSession]:
+        session_id = str(data.get('session'))
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise SessionError(f"Unknown session '{session_id}'")
+        return session_id, session
+
+    async def handle(self, raw: str) -> None:
+        """
+        Answer one client message.
+
+        Args:
+            raw: JSON envelope {"requestId", "endpoint", "data"}
+        """
+        try:
+            message = json.loads(raw)
+            request_id = message.get('requestId')
+            endpoint = message.get('endpoint')
+            data = message.get('data') or {}
+        except (ValueError, AttributeError):
+            await self.send(_envelope(None, error='Invalid message format'))
+            return
+
+        handler = self.HANDLERS.get(endpoint)
+        if handler is None:
+            await self.send(_envelope(request_id, error=f"Unsupported endpoint over WebSocket: {endpoint}"))
+            return
+
+        try:
+            response = await handler(self, data)
+        except SessionError as e:
+            await self.send(_envelope(request_id, error=str(e)))
+        except Exception as e:
+            await self.send(_envelope(request_id, error=f"{type(e).__name__}: {str(e)}"))
+        else:
+            await self.send(_envelope(request_id, response))
+
+    async def _open(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        from python.bridge.executor import get_registry
+
+        key = data.get('algorithm')
+        if key not in (self.registry or get_registry()):
+            raise SessionError(f"Algorithm '{key}' not found in registry")
+
+        with LiveConnection._open_lock:
+            if LiveConnection._open_sessions >= self.max_sessions:
+                raise SessionError("Too many live sessions")
+            LiveConnection._open_sessions += 1
+
+        session_id = str(next(self._ids))
+        self.sessions[session_id] = LiveSession(
+            key, data.get('data', []), convert_options(data.get('options', {})),
+            convert_options(data.get('limits', {})), backend=self.backend
+        )
+        return {'session': session_id}
+
+    async def _step(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        _, session = self._session(data)
+        return await asyncio.to_thread(session.step, data.get('count', 1))
+
+    async def _seek(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        _, session = self._session(data)
+        return await asyncio.to_thread(session.seek, data.get('step', 0))
+
+    async def _play(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        session_id, session = self._session(data)
+        self._credits[session_id] = max(1, int(data.get('window', 16)))
+        self._credit_events.setdefault(session_id, asyncio.Event()).set()
+        if session_id not in self._players:
+            self._players[session_id] = asyncio.create_task(self._push(session_id, session))
+        return {'playing': True, 'window': self._credits[session_id]}
+
+    async def _ack(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        session_id, _ = self._session(data)
+        self._credits[session_id] = self._credits.get(session_id, 0) + max(0, int(data.get('count', 1)))
+        if session_id in self._credit_events:
+            self._credit_events[session_id].set()
+        return {'credits': self._credits[session_id]}
+
+    async def _pause(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        session_id, session = self._session(data)
+        self._stop_player(session_id)
+        return {'playing': False, 'cursor': session.cursor}
+
+    async def _close(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        session_id, _ = self._session(data)
+        self._close_session(session_id)
+        return {'closed': True}
+
+    async def _push(self, session_id: str, session: LiveSession) -> None:
+        """Push states while the client has credits."""
+        event = self._credit_events[session_id]
+        while True:
+            credits = self._credits.get(session_id, 0)
+            if not credits:
+                event.clear()
+                await event.wait()
+                continue
+
+            batch = await asyncio.to_thread(session.step, credits)
+            self._credits[session_id] = credits - len(batch['states'])
+            for item in batch['states']:
+                await self.send(json.dumps({'event': 'state', 'session': session_id, **item},
+                                           separators=(',', ':'), default=str))
+            if 'outcome' in batch:
+                await self.send(json.dumps({'event': 'done', 'session': session_id, **batch['outcome']},
+                                           separators=(',', ':'), default=str))
+                self._players.pop(session_id, None)
+                return
+
+    def _stop_player(self, session_id: str) -> None:
+        player = self._players.pop(session_id, None)
+        if player is not None:
+            player.cancel()
+        self._credits.pop(session_id, None)
+
+    def _close_session(self, session_id: str) -> None:
+        self._stop_player(session_id)
+        self._credit_events.pop(session_id, None)
+        session = self.sessions.pop(session_id, None)
+        if session is not None:
+            session.close()
+            with LiveConnection._open_lock:
+                LiveConnection._open_sessions -= 1
+
+    def close_all(self) -> None:
+        """Close every session of this connection (on disconnect)."""
+        for session_id in list(self.sessions):
+            self._close_session(session_id)
+
+    HANDLERS = {
+        'live/open': _open,
+        'live/step': _step,
+        'live/seek': _seek,
+        'live/play': _play,
+        'live/ack': _ack,
+        'live/pause': _pause,
+        'live/close': _close,
+    }
+
+
+async def handle_connection(websocket: Any, backend: Optional[ExecutionBackend] = None) -> None:
+    """
+    Serve one WebSocket connection.
+
+    Args:
+        websocket: websockets server connection
+        backend: Pool running the sessions' producers
+    """
+    connection = LiveConnection(websocket.send, backend=backend)
+    try:
+        async for message in websocket:
+            await connection.handle(message)
+    finally:
+        connection.close_all()
+
+
+async def serve(host: str = '127.0.0.1', port: int = LIVE_PORT,
+                backend: Optional[ExecutionBackend] = None) -> None:
+    """
+    Run the live-stepping server until cancelled.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind
+        backend: Pool running the sessions' producers (threads if None)
+    """
+    if not WEBSOCKETS_AVAILABLE:
+        raise RuntimeError("websockets is not installed. Install with: pip install websockets")
+
+    async with websockets.serve(functools.partial(handle_connection, backend=backend), host, port):
+        await asyncio.Future()
+
+
+def serve_in_thread(host: str = '127.0.0.1', port: int = LIVE_PORT,
+                    backend: Optional[ExecutionBackend] = None) -> Optional[threading.Thread]:
+    """
+    Start the live-stepping server on a daemon thread next to the HTTP server.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind
+        backend: Pool running the sessions' producers
+
+    Returns:
+        The server thread, or None if websockets is not installed
+    """
+    if not WEBSOCKETS_AVAILABLE:
+        return None
+
+    thread = threading.Thread(target=asyncio.run, args=(serve(host, port, backend),), daemon=True)
+    thread.start()
+    return thread
+
+
+if __name__ == '__main__':
+    asyncio.run(serve(backend=ExecutionBackend(workers=LIVE_MAX_SESSIONS)))
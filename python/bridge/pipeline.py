@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Pipelined History Encoding
+
+``run_execute`` serializes the history only after the algorithm returns, so
+a request waits for the run and then for the encoder, and the worker holds
+every state until the end. This module encodes while the algorithm runs:
+
+1. The run executes with a ``history_sink`` that puts each recorded state on
+   a bounded queue; the algorithm keeps no history
+2. An encoder thread takes states off the queue, transposes every chunk of
+   PIPELINE_CHUNK_STATES states into columns (see columnar.py) and
+   compresses it into one deflate stream, flushed at chunk boundaries
+3. Backpressure: when the encoder falls behind, the queue fills and
+   ``record_state`` blocks until there is room, so memory stays bounded by
+   the queue and one chunk whatever the length of the run
+
+zlib releases the GIL while compressing, so compression runs in parallel
+with the algorithm; column encoding interleaves with it.
+
+The body is NDJSON inside a zlib (HTTP "deflate") stream, one line per
+chunk and a final result line:
+
+    {"type": "chunk", "start": first step, "history": <columns>}
+    {"type": "result", "result": [...], "metrics": {...}, "history_states": N,
+     "pipeline": {"chunks": n, "stall_seconds": s}}
+
+``stall_seconds`` is how long recording waited on a full queue.
+
+Configuration (environment variables):
+    BRIDGE_PIPELINE_CHUNK_STATES     States per encoded chunk (default 1024)
+    BRIDGE_PIPELINE_MAX_QUEUED       States queued before recording blocks (default 4096)
+    BRIDGE_PIPELINE_COMPRESS_LEVEL   zlib level (default 1)
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import json
+import time
+import zlib
+import queue
+import threading
+from typing import Dict, Any, List, Optional, Union, Callable
+
+from python.bridge.columnar import decode_history_columns, encode_history_columns
+from python.bridge.executor import (
+    InputRef, RunOutput, WORKER_CPU_SECONDS, _cpu_limit, _create_algorithm, _dumps, resolve_input,
+    serialize_algorithm_state
+)
+
+PIPELINE_CHUNK_STATES = int(os.environ.get('BRIDGE_PIPELINE_CHUNK_STATES', 1024))
+PIPELINE_MAX_QUEUED = int(os.environ.get('BRIDGE_PIPELINE_MAX_QUEUED', 4096))
+PIPELINE_COMPRESS_LEVEL = int(os.environ.get('BRIDGE_PIPELINE_COMPRESS_LEVEL', 1))
+
+PIPELINE_MIMETYPE = 'application/vnd.algorithm-columns+ndjson'
+
+# Queued after the last state
+_END = object()
+
+
+class HistoryPipeline:
+    """
+    Bounded producer/consumer queue between record_state and an encoder thread.
+
+    Attributes:
+        chunk_states (int): States per encoded chunk
+        chunks (int): Chunks written so far
+        stall_seconds (float): Time the producer spent waiting on a full queue
+        error (Optional[BaseException]): Encoder failure, re-raised to the producer
+    """
+
+    def __init__(self, write: Callable[[bytes], None], chunk_states: int = PIPELINE_CHUNK_STATES,
+                 max_queued: int = PIPELINE_MAX_QUEUED, level: int = PIPELINE_COMPRESS_LEVEL):
+        self.chunk_states = max(1, chunk_states)
+        self.chunks = 0
+        self.stall_seconds = 0.0
+        self.error: Optional[BaseException] = None
+
+        self._write = write
+        self._queue: "queue.Queue[Any]" = queue.Queue(max(1, max_queued))
+        self._compressor = zlib.compressobj(level)
+        self._aborted = False
+        self._thread = threading.Thread(target=self._consume, name='history-encoder', daemon=True)
+        self._thread.start()
+
+    def sink(self, step: int, state: Dict[str, Any]) -> None:
+        """
+        Hand one recorded state to the encoder (``history_sink`` signature).
+
+        Blocks while the queue is full.
+
+        Raises:
+            Exception: The encoder's failure, if it failed
+        """
+        if self.error is not None:
+            raise self.error
+        if self._queue.full():
+            started = time.perf_counter()
+            self._queue.put(state)
+            self.stall_seconds += time.perf_counter() - started
+        else:
+            self._queue.put(state)
+
+    def _line(self, message: Dict[str, Any], mode: int = zlib.Z_SYNC_FLUSH) -> None:
+        """Compress one NDJSON line and flush it so the chunk can be decoded on arrival."""
+        self._write(self._compressor.compress(_dumps(message) + b'\n') + self._compressor.flush(mode))
+
+    def _consume(self) -> None:
+        chunk: List[Dict[str, Any]] = []
+        start = 0
+        while True:
+            state = self._queue.get()
+            if state is _END:
+                break
+            if self.error is not None or self._aborted:
+                # Keep draining so the producer never blocks on a dead encoder
+                continue
+            chunk.append(state)
+            if len(chunk) < self.chunk_states:
+                continue
+            try:
+                self._line({'type': 'chunk', 'start': start, 'history': encode_history_columns(chunk)})
+                self.chunks += 1
+            except Exception as e:
+                self.error = e
+            start += len(chunk)
+            chunk = []
+
+        if chunk and self.error is None and not self._aborted:
+            try:
+                self._line({'type': 'chunk', 'start': start, 'history': encode_history_columns(chunk)})
+                self.chunks += 1
+            except Exception as e:
+                self.error = e
+
+    def finish(self, message: Dict[str, Any]) -> None:
+        """
+        Encode the remaining states, then write ``message`` as the last line.
+
+        Raises:
+            Exception: The encoder's failure, if it failed
+        """
+        self._queue.put(_END)
+        self._thread.join()
+        if self.error is not None:
+            raise self.error
+        message = dict(message, pipeline={'chunks': self.chunks, 'stall_seconds': self.stall_seconds})
+        self._line(message, zlib.Z_FINISH)
+
+    def abort(self) -> None:
+        """Discard queued states and stop the encoder (the run failed)."""
+        self._aborted = True
+        self._queue.put(_END)
+        self._thread.join()
+
+
+def run_pipelined(algorithm_key: str, data: Union[InputRef, List[Any]], options: Dict[str, Any],
+                  limits: Optional[Dict[str, Any]] = None) -> RunOutput:
+    """
+    Execute one algorithm, encoding its history while it runs.
+
+    Module-level so that it can be pickled for the process pool.
+
+    Args:
+        algorithm_key: Registry key
+        data: Input array or shared-memory reference
+        options: Python-style algorithm options
+        limits: Per-request limits (deadline, max_comparisons, ...)
+
+    Returns:
+        RunOutput with the deflate-compressed NDJSON body
+
+    Raises:
+        BudgetExceeded: If the run exceeded its limits (with a partial report)
+    """
+    parts: List[bytes] = []
+    pipeline = HistoryPipeline(parts.append)
+    try:
+        algorithm = _create_algorithm(algorithm_key, dict(options, history_sink=pipeline.sink), limits)
+        data = resolve_input(data)
+        with _cpu_limit(WORKER_CPU_SECONDS):
+            result = algorithm.execute(data)
+    except BaseException:
+        pipeline.abort()
+        raise
+
+    states = len(algorithm.history)
+    pipeline.finish({
+        'type': 'result',
+        'result': result,
+        'metrics': serialize_algorithm_state(algorithm.metrics),
+        'history_states': states
+    })
+    return RunOutput(b''.join(parts), states, algorithm.metrics['execution_time'], PIPELINE_MIMETYPE,
+                     algorithm.metrics['comparisons'])
+
+
+def decode_pipelined(payload: bytes) -> Dict[str, Any]:
+    """
+    Decode a body produced by run_pipelined.
+
+    Args:
+        payload: Deflate-compressed NDJSON
+
+    Returns:
+        {"result", "metrics", "history", "history_states", "pipeline"} with
+        the history as serialized states
+
+    Raises:
+        ValueError: If the body is incomplete or malformed
+    """
+    try:
+        lines = zlib.decompress(payload).splitlines()
+    except zlib.error as e:
+        raise ValueError(f"Invalid pipelined body: {e}")
+
+    history: List[Dict[str, Any]] = []
+    for line in lines:
+        message = json.loads(line)
+        if message.get('type') == 'chunk':
+            if message['start'] != len(history):
+                raise ValueError(f"Chunk starts at step {message['start']}, expected {len(history)}")
+            history += decode_history_columns(message['history'])
+        elif message.get('type') == 'result':
+            decoded = {key: value for key, value in message.items() if key != 'type'}
+            decoded['history'] = history
+            return decoded
+    raise ValueError("Pipelined body has no result line")
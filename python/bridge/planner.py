@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Cost Planner for Bridge Requests
+
+Every algorithm declares its complexity (``get_complexity``), but the bridge
+used to find out what a request costs only by running it: a quadratic sort
+of a large input with history recording would run for minutes and then fail
+on memory. The planner estimates a request before it runs:
+
+1. Cheap input features from a strided sample: size, value range, digit
+   count and sortedness (fraction of ascending sample pairs)
+2. A growth function for the algorithm, read from its declared time
+   complexity and interpolated between the best (sorted input), average
+   (random) and worst (reversed) cases by sortedness
+3. Per-algorithm coefficients for comparisons, history states and seconds,
+   calibrated from the runs the server observes (a moving average of the
+   observed/predicted ratio in log space), starting from generic priors
+
+From the estimates it decides, before execution:
+
+- ``reject`` when even without history the run would exceed PLAN_MAX_SECONDS
+- ``downgrade`` when the history would exceed PLAN_MAX_STATES or
+  PLAN_MAX_MEMORY_MB: the history is sampled (``history_interval``) or, if
+  that is not enough, disabled
+- ``route`` "batch" for runs predicted to take longer than
+  PLAN_INTERACTIVE_SECONDS, so they queue on the batch pool instead of
+  occupying interactive workers
+
+Estimates are order-of-magnitude guides, not guarantees. The generic priors
+overestimate most algorithms (merge sort's history copies are far cheaper
+than assumed), so until PLAN_CALIBRATION_RUNS runs of an algorithm were
+observed its plans are advisory: downgrades and batch routing are reported
+in ``reasons`` but not applied (``advisory: true``). Rejections still apply,
+since they are judged without history, where the priors hold up.
+
+Configuration (environment variables):
+    BRIDGE_PLAN_MAX_SECONDS          Reject above this predicted time (default 600)
+    BRIDGE_PLAN_MAX_STATES           Sample history above this many states (default 100000)
+    BRIDGE_PLAN_MAX_MEMORY_MB        Sample history above this memory (default 1024)
+    BRIDGE_PLAN_INTERACTIVE_SECONDS  Route to the batch pool above this time (default 2)
+    BRIDGE_BATCH_WORKERS             Worker processes of the batch pool (default 1)
+    BRIDGE_PLAN_CALIBRATION_RUNS     Observed runs before downgrades and routing
+                                     apply (default 1)
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import re
+import math
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional, Callable, Union
+
+from python.bridge.executor import InputRef, get_registry, input_buffer
+
+PLAN_MAX_SECONDS = float(os.environ.get('BRIDGE_PLAN_MAX_SECONDS', 600))
+PLAN_MAX_STATES = int(os.environ.get('BRIDGE_PLAN_MAX_STATES', 100000))
+PLAN_MAX_MEMORY_MB = float(os.environ.get('BRIDGE_PLAN_MAX_MEMORY_MB', 1024))
+PLAN_INTERACTIVE_SECONDS = float(os.environ.get('BRIDGE_PLAN_INTERACTIVE_SECONDS', 2))
+BATCH_WORKERS = int(os.environ.get('BRIDGE_BATCH_WORKERS', 1))
+PLAN_CALIBRATION_RUNS = int(os.environ.get('BRIDGE_PLAN_CALIBRATION_RUNS', 1))
+
+FEATURE_SAMPLE = 4096     # Elements sampled for features
+MAX_GROWTH = 1e30         # Cap for factorial growth (keeps estimates finite)
+SMOOTHING = 0.3           # Weight of new observations once calibrated
+SAMPLE_LIMIT = 1000       # Largest history interval before disabling history
+COMPLEXITY_CACHE = 256    # (algorithm, options) complexity lookups kept (LRU)
+
+# Priors: observed/growth ratios before any run was observed
+PRIOR_RATIOS = {
+    'comparisons': 1.0,
+    'history_states': 1.0,
+    'seconds': 2e-6,      # Per unit of work (see _work)
+    'state_bytes': 1.0,   # Per predicted serialized state size (extra arrays in states)
+}
+STATE_WORK = 20           # Work units to record one state, plus one per STATE_ELEMENTS elements
+STATE_ELEMENTS = 8
+STATE_BYTES = 1500        # Memory per recorded state besides its array
+ELEMENT_BYTES = 8
+
+GrowthFunction = Callable[[Dict[str, float]], float]
+
+
+def _log(value: float) -> float:
+    return math.log2(max(value, 2))
+
+
+def _factorial(value: float) -> float:
+    try:
+        return min(math.exp(math.lgamma(value + 1)), MAX_GROWTH)
+    except OverflowError:
+        return MAX_GROWTH
+
+
+# Normalized complexity expression -> growth in terms of the input features
+GROWTH: Dict[str, GrowthFunction] = {
+    '1': lambda f: 1.0,
+    'logn': lambda f: _log(f['n']),
+    'log^2n': lambda f: _log(f['n']) ** 2,
+    'n': lambda f: f['n'],
+    'nlogn': lambda f: f['n'] * _log(f['n']),
+    'nlog^2n': lambda f: f['n'] * _log(f['n']) ** 2,
+    'n^(5/4)': lambda f: f['n'] ** 1.25,
+    'n^(4/3)': lambda f: f['n'] ** (4 / 3),
+    'n^(3/2)': lambda f: f['n'] ** 1.5,
+    'n^2': lambda f: f['n'] ** 2,
+    'n^2/2^k': lambda f: f['n'] ** 2,
+    'n+k': lambda f: f['n'] + f['k'],
+    'n+m': lambda f: f['n'] + f['k'],
+    'w*n': lambda f: f['w'] * f['n'],
+    'n*n!': lambda f: min(f['n'] * _factorial(f['n']), MAX_GROWTH),
+    'Unbounded': lambda f: MAX_GROWTH,
+}
+FALLBACK_GROWTH = 'nlogn'
+
+
+def normalize_complexity(expression: str) -> str:
+    """
+    Normalize a big-O string for lookup in GROWTH.
+
+    "O(n log²(n))" -> "nlog^2n", "O(n × n!)" -> "n*n!"
+
+    Args:
+        expression: Complexity as declared by get_complexity()
+
+    Returns:
+        Normalized expression (without the O(...))
+    """
+    match = re.search(r'O\((.*)\)', expression)
+    body = match.group(1) if match else expression
+    # Drop trailing prose after the closing parenthesis of O(...)
+    depth = 0
+    for index, char in enumerate(body):
+        depth += char == '('
+        depth -= char == ')'
+        if depth < 0:
+            body = body[:index]
+            break
+    body = body.replace('²', '^2').replace('ᵏ', '^k').replace('×', '*').replace(' ', '')
+    return re.sub(r'log(\^\d)?\((\w)\)', r'log\1\2', body)
+
+
+def growth_function(expression: str) -> Optional[GrowthFunction]:
+    """Get the growth function for a big-O string (None if not recognized)."""
+    return GROWTH.get(normalize_complexity(expression))
+
+
+@contextmanager
+def _sample_of(data: Union[InputRef, List[Any]]):
+    """Yield a strided sample of at most FEATURE_SAMPLE elements."""
+    length = data.length if isinstance(data, InputRef) else len(data)
+    stride = max(1, length // FEATURE_SAMPLE)
+    if not isinstance(data, InputRef):
+        yield data[::stride]
+        return
+    with input_buffer(data) as view:
+        values = view.cast(data.typecode)
+        try:
+            yield values[::stride].tolist()
+        finally:
+            values.release()
+
+
+def input_features(data: Union[InputRef, List[Any]]) -> Dict[str, Any]:
+    """
+    Measure cheap input features from a strided sample.
+
+    Args:
+        data: Input list or shared-memory reference
+
+    Returns:
+        Dictionary with n, numeric, k (value range), w (decimal digits of the
+        largest magnitude) and sortedness (fraction of ascending sample pairs,
+        1.0 for sorted and 0.0 for reversed input)
+    """
+    n = data.length if isinstance(data, InputRef) else len(data)
+    with _sample_of(data) as sample:
+        numeric = all(type(value) in (int, float) for value in sample)
+        ascending = 0
+        try:
+            ascending = sum(1 for a, b in zip(sample, sample[1:]) if a <= b)
+        except TypeError:
+            pass
+        low = min(sample) if numeric and sample else 0
+        high = max(sample) if numeric and sample else 0
+
+    pairs = max(1, len(sample) - 1)
+    return {
+        'n': n,
+        'numeric': numeric,
+        'k': int(high - low) + 1 if numeric else n,
+        'w': len(str(int(max(abs(low), abs(high))))) if numeric else 1,
+        'sortedness': ascending / pairs if len(sample) > 1 else 1.0
+    }
+
+
+class Plan:
+    """
+    Estimates and decision for one request.
+
+    Attributes:
+        algorithm (str): Registry key
+        features (Dict[str, Any]): Input features
+        estimates (Dict[str, float]): comparisons, history_states, seconds,
+            memory_bytes and response_bytes for the options as planned
+        decision (str): "accept", "downgrade" or "reject"
+        route (str): "interactive" or "batch"
+        options (Dict[str, Any]): Options to run with (downgraded if needed)
+        reasons (List[str]): Why the request was downgraded or rejected
+        calibrated (int): Observed runs behind the coefficients
+        advisory (bool): Downgrade and route were only reported, not applied
+    """
+
+    def __init__(self, algorithm_key: str, features: Dict[str, Any], options: Dict[str, Any]):
+        self.algorithm = algorithm_key
+        self.features = features
+        self.options = dict(options)
+        self.estimates: Dict[str, float] = {}
+        self.complexity: Dict[str, str] = {}
+        self.decision = 'accept'
+        self.route = 'interactive'
+        self.reasons: List[str] = []
+        self.calibrated = 0
+        self.advisory = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'algorithm': self.algorithm,
+            'features': self.features,
+            'complexity': self.complexity,
+            'estimates': self.estimates,
+            'calibrated': self.calibrated,
+            'advisory': self.advisory,
+            'decision': self.decision,
+            'route': self.route,
+            'options': {key: value for key, value in self.options.items()
+                        if key in ('record_history', 'history_interval')},
+            'reasons': self.reasons
+        }
+
+
+class Planner:
+    """
+    Predicts request costs and calibrates itself from observed runs.
+
+    Thread-safe; calibration is kept per process.
+
+    Attributes:
+        max_seconds (float): Reject above this predicted time
+        max_states (int): Sample history above this many states
+        max_memory_mb (float): Sample history above this memory
+        interactive_seconds (float): Route to the batch pool above this time
+        calibration_runs (int): Observed runs of an algorithm before its
+            downgrades and routing apply (advisory before that)
+    """
+
+    def __init__(self, max_seconds: float = PLAN_MAX_SECONDS, max_states: int = PLAN_MAX_STATES,
+                 max_memory_mb: float = PLAN_MAX_MEMORY_MB,
+                 interactive_seconds: float = PLAN_INTERACTIVE_SECONDS,
+                 calibration_runs: int = PLAN_CALIBRATION_RUNS):
+        self.max_seconds = max_seconds
+        self.max_states = max_states
+        self.max_memory_mb = max_memory_mb
+        self.interactive_seconds = interactive_seconds
+        self.calibration_runs = calibration_runs
+        self._lock = threading.Lock()
+        self._complexity: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+        # (algorithm, quantity) -> [mean log ratio, observations]
+        self._calibration: Dict[tuple, List[float]] = {}
+
+    def _time_complexity(self, algorithm_key: str, options: Dict[str, Any]) -> Dict[str, str]:
+        """Get the declared best/average/worst time complexity (LRU-cached per options)."""
+        cache_key = algorithm_key + repr(sorted(options.items(), key=lambda item: item[0]))
+        with self._lock:
+            complexity = self._complexity.get(cache_key)
+            if complexity is not None:
+                self._complexity.move_to_end(cache_key)
+                return complexity
+
+        algorithm_class, error = get_registry().load(algorithm_key)
+        if error:
+            raise ImportError(error)
+        declared = algorithm_class(options).get_complexity().get('time', {})
+        complexity = {case: declared.get(case, 'O(?)') for case in ('best', 'average', 'worst')}
+        with self._lock:
+            self._complexity[cache_key] = complexity
+            while len(self._complexity) > COMPLEXITY_CACHE:
+                self._complexity.popitem(last=False)
+        return complexity
+
+    def _growth(self, complexity: Dict[str, str], features: Dict[str, Any], reasons: List[str]) -> float:
+        """Interpolate growth between the declared cases by sortedness."""
+        growth = {}
+        for case, expression in complexity.items():
+            function = growth_function(expression)
+            if function is None:
+                function = GROWTH[FALLBACK_GROWTH]
+                reasons.append(f"Unrecognized {case} complexity {expression}; assuming O(n log n)")
+            growth[case] = function(features)
+
+        sortedness = features['sortedness']
+        if sortedness >= 0.5:
+            weight = (1 - sortedness) * 2
+            return growth['best'] + weight * (growth['average'] - growth['best'])
+        weight = (0.5 - sortedness) * 2
+        return growth['average'] + weight * (growth['worst'] - growth['average'])
+
+    def _ratio(self, algorithm_key: str, quantity: str) -> float:
+        entry = self._calibration.get((algorithm_key, quantity))
+        return math.exp(entry[0]) if entry else PRIOR_RATIOS[quantity]
+
+    @staticmethod
+    def _work(growth: float, states: float, n: int) -> float:
+        """Work units of a run: its growth plus the cost of copying states."""
+        return growth + states * (STATE_WORK + n / STATE_ELEMENTS)
+
+    @staticmethod
+    def _state_bytes(features: Dict[str, Any]) -> float:
+        """Serialized size of a state holding only the input array."""
+        digits = features['w'] + 2 if features['numeric'] else 12
+        return features['n'] * digits + STATE_BYTES / 2
+
+    def _estimate(self, plan: Plan, growth: float) -> None:
+        n = plan.features['n']
+        states = 0.0
+        if plan.options.get('record_history', True):
+            states = self._ratio(plan.algorithm, 'history_states') * growth
+            states /= max(1, plan.options.get('history_interval', 1))
+
+        size = self._ratio(plan.algorithm, 'state_bytes')
+        plan.estimates = {
+            'comparisons': self._ratio(plan.algorithm, 'comparisons') * growth,
+            'history_states': states,
+            'seconds': self._ratio(plan.algorithm, 'seconds') * self._work(growth, states, n),
+            'memory_bytes': states * (n * ELEMENT_BYTES + STATE_BYTES) * size + 2 * n * ELEMENT_BYTES,
+            'response_bytes': states * self._state_bytes(plan.features) * size
+        }
+
+    def plan(self, algorithm_key: str, data: Union[InputRef, List[Any]], options: Dict[str, Any],
+             features: Optional[Dict[str, Any]] = None) -> Plan:
+        """
+        Estimate a request and decide how to run it.
+
+        Args:
+            algorithm_key: Registry key
+            data: Input list or shared-memory reference
+            options: Python-style algorithm options
+            features: Precomputed input features (measured if omitted)
+
+        Returns:
+            Plan with estimates, decision, route and the options to run with
+
+        Raises:
+            ImportError: If the algorithm cannot be loaded
+        """
+        plan = Plan(algorithm_key, features or input_features(data), options)
+        plan.complexity = self._time_complexity(algorithm_key, options)
+        growth = self._growth(plan.complexity, plan.features, plan.reasons)
+        notes = len(plan.reasons)
+        with self._lock:
+            plan.calibrated = int(self._calibration.get((algorithm_key, 'comparisons'), [0, 0])[1])
+            self._estimate(plan, growth)
+
+            max_memory = self.max_memory_mb * 1024 * 1024
+            states, memory = plan.estimates['history_states'], plan.estimates['memory_bytes']
+            if states > self.max_states or memory > max_memory:
+                interval = max(math.ceil(states / self.max_states), math.ceil(memory / max_memory))
+                interval *= max(1, plan.options.get('history_interval', 1))
+                if interval > SAMPLE_LIMIT:
+                    plan.options['record_history'] = False
+                    plan.reasons.append(f"History of ~{states:.3g} states disabled")
+                else:
+                    plan.options['history_interval'] = interval
+                    plan.reasons.append(f"History of ~{states:.3g} states sampled every {interval} steps")
+                plan.decision = 'downgrade'
+                self._estimate(plan, growth)
+
+            if plan.estimates['seconds'] > self.max_seconds:
+                without_history = Plan(algorithm_key, plan.features, dict(plan.options, record_history=False))
+                self._estimate(without_history, growth)
+                if without_history.estimates['seconds'] > self.max_seconds:
+                    plan.decision = 'reject'
+                    plan.reasons.append(f"Predicted {plan.estimates['seconds']:.3g}s exceeds the "
+                                        f"{self.max_seconds:g}s limit")
+                else:
+                    plan.options['record_history'] = False
+                    plan.decision = 'downgrade'
+                    plan.reasons.append("History disabled to stay within the time limit")
+                    plan.estimates = without_history.estimates
+
+        if plan.estimates['seconds'] > self.interactive_seconds:
+            plan.route = 'batch'
+
+        if plan.calibrated < self.calibration_runs and plan.decision != 'reject':
+            # Uncalibrated priors: report what would be done, run as requested
+            if plan.decision == 'downgrade' or plan.route == 'batch':
+                plan.advisory = True
+                if plan.route == 'batch':
+                    plan.reasons.append(f"Predicted {plan.estimates['seconds']:.3g}s; would run on the batch pool")
+                plan.reasons[notes:] = [f"Advisory until calibrated: {reason}" for reason in plan.reasons[notes:]]
+                plan.options = dict(options)
+                plan.decision = 'accept'
+                plan.route = 'interactive'
+                with self._lock:
+                    self._estimate(plan, growth)
+        return plan
+
+    def observe(self, plan: Plan, comparisons: int, history_states: int, seconds: float,
+                response_bytes: Optional[int] = None) -> None:
+        """
+        Calibrate from a finished run.
+
+        Args:
+            plan: Plan the run was executed with
+            comparisons: Observed comparisons
+            history_states: Observed history states
+            seconds: Observed execution time
+            response_bytes: Size of the JSON response, if known (calibrates
+                the size of states that carry more than the input array)
+        """
+        growth = self._growth(plan.complexity, plan.features, [])
+        if growth <= 0:
+            return
+
+        observed = {'comparisons': comparisons, 'seconds': seconds}
+        if plan.options.get('record_history', True):
+            observed['history_states'] = history_states * max(1, plan.options.get('history_interval', 1))
+            if response_bytes and history_states:
+                observed['state_bytes'] = response_bytes / history_states
+
+        with self._lock:
+            for quantity, value in observed.items():
+                if quantity == 'seconds':
+                    base = self._work(growth, history_states, plan.features['n'])
+                elif quantity == 'state_bytes':
+                    base = self._state_bytes(plan.features)
+                else:
+                    base = growth
+                if value <= 0 or base <= 0:
+                    continue
+                ratio = math.log(value / base)
+                entry = self._calibration.setdefault((plan.algorithm, quantity), [0.0, 0])
+                entry[1] += 1
+                weight = max(1 / entry[1], SMOOTHING)
+                entry[0] += weight * (ratio - entry[0])
+
+    def describe(self) -> Dict[str, Any]:
+        """Get the calibrated ratios for /status."""
+        with self._lock:
+            calibration: Dict[str, Dict[str, Any]] = {}
+            for (algorithm, quantity), (mean, count) in self._calibration.items():
+                calibration.setdefault(algorithm, {})[quantity] = {'ratio': math.exp(mean), 'runs': count}
+        return calibration
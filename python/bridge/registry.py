@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Algorithm Discovery Registry for the Bridge Server
+
+Algorithm implementations live in hyphenated files (``bubble-sort.py``) that
+cannot be imported by dotted module path, and they import the base class as
+``algorithms.base_algorithm``. This registry:
+
+1. Discovers every Algorithm subclass under ``python/algorithms`` by parsing
+   the source files (no imports at discovery time)
+2. Loads a module by file path on first use, aliasing the base class module
+   so the shared Algorithm class is reused
+3. Caches loaded classes so later requests skip the import machinery
+4. Optionally pre-imports and warms all algorithms at startup
+
+Keys are derived from file names: ``quick-select-py.py`` -> ``quick-select``,
+``cocktail_shaker_sort.py`` -> ``cocktail-shaker-sort``. Loaded modules are
+registered as ``python.algorithms.<category>.<key_with_underscores>`` so that
+classes stay picklable by reference.
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import ast
+import time
+import threading
+import importlib.util
+from dataclasses import dataclass
+from typing import Dict, Any, List, Tuple, Optional, Iterable
+
+ALGORITHMS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "algorithms")
+MODULE_PREFIX = "python.algorithms"
+BASE_CLASS_NAME = "Algorithm"
+BASE_MODULE_ALIAS = "algorithms.base_algorithm"
+
+
+@dataclass
+class AlgorithmEntry:
+    """Discovered algorithm and its load state."""
+    key: str
+    category: str
+    path: str
+    class_name: str
+    module_name: str
+    algorithm_class: Optional[type] = None
+    error: Optional[str] = None
+    load_time: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Describe the entry for status responses."""
+        return {
+            "key": self.key,
+            "category": self.category,
+            "class_name": self.class_name,
+            "loaded": self.algorithm_class is not None,
+            "error": self.error
+        }
+
+
+def algorithm_key(filename: str) -> str:
+    """
+    Derive a registry key from an algorithm file name.
+
+    Args:
+        filename: File name such as "quick-select-py.py"
+
+    Returns:
+        Normalized hyphenated key such as "quick-select"
+    """
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    if stem.endswith("-py"):
+        stem = stem[:-3]
+    return stem.replace("_", "-")
+
+
+def _find_algorithm_classes(path: str) -> List[str]:
+    """
+    Find classes deriving directly from Algorithm without importing the file.
+
+    Args:
+        path: Source file path
+
+    Returns:
+        Class names in definition order
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    names = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for base in node.bases:
+            base_name = base.id if isinstance(base, ast.Name) else getattr(base, "attr", None)
+            if base_name == BASE_CLASS_NAME:
+                names.append(node.name)
+                break
+    return names
+
+
+def _alias_base_module() -> None:
+    """Make ``algorithms.base_algorithm`` resolve to the shared core module."""
+    if BASE_MODULE_ALIAS in sys.modules:
+        return
+
+    from python.core import base_algorithm
+    sys.modules[BASE_MODULE_ALIAS] = base_algorithm
+
+
+class AlgorithmRegistry:
+    """
+    Discover, load and cache algorithm classes.
+
+    Loading is thread-safe; each module is imported at most once.
+
+    Attributes:
+        root (str): Directory scanned for algorithm files
+        entries (Dict[str, AlgorithmEntry]): Discovered algorithms by key
+    """
+
+    def __init__(self, root: str = ALGORITHMS_DIR):
+        self.root = root
+        self.entries: Dict[str, AlgorithmEntry] = {}
+        self._lock = threading.Lock()
+
+    def discover(self) -> Dict[str, AlgorithmEntry]:
+        """
+        Scan the algorithm tree for Algorithm subclasses.
+
+        Returns:
+            Mapping of key to entry (also stored in ``entries``)
+        """
+        entries = {}
+
+        for category in sorted(os.listdir(self.root)):
+            category_dir = os.path.join(self.root, category)
+            if not os.path.isdir(category_dir) or category.startswith(("_", ".")):
+                continue
+
+            for filename in sorted(os.listdir(category_dir)):
+                if not filename.endswith(".py") or filename.startswith("_"):
+                    continue
+
+                path = os.path.join(category_dir, filename)
+                try:
+                    class_names = _find_algorithm_classes(path)
+                except (SyntaxError, OSError, UnicodeDecodeError):
+                    continue
+                if not class_names:
+                    continue
+
+                key = algorithm_key(filename)
+                entries[key] = AlgorithmEntry(
+                    key=key,
+                    category=category,
+                    path=path,
+                    class_name=class_names[0],
+                    module_name=f"{MODULE_PREFIX}.{category}.{key.replace('-', '_')}"
+                )
+
+        with self._lock:
+            # Keep classes that were already loaded
+            for key, entry in entries.items():
+                previous = self.entries.get(key)
+                if previous is not None and previous.path == entry.path:
+                    entries[key] = previous
+            self.entries = entries
+
+        return self.entries
+
+    def keys(self) -> List[str]:
+        """Get the discovered algorithm keys."""
+        return list(self.entries.keys())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _import(self, entry: AlgorithmEntry) -> None:
+        """Import an entry's module by path and cache its class."""
+        _alias_base_module()
+
+        start = time.perf_counter()
+        module = sys.modules.get(entry.module_name)
+        try:
+            if module is None:
+                spec = importlib.util.spec_from_file_location(entry.module_name, entry.path)
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[entry.module_name] = module
+                try:
+                    spec.loader.exec_module(module)
+                except BaseException:
+                    del sys.modules[entry.module_name]
+                    raise
+            entry.algorithm_class = getattr(module, entry.class_name)
+            entry.error = None
+        except Exception as e:
+            entry.error = f"Failed to import {entry.key}: {str(e)}"
+        entry.load_time = time.perf_counter() - start
+
+    def load(self, key: str) -> Tuple[Optional[type], Optional[str]]:
+        """
+        Get an algorithm class, importing it on first use.
+
+        Args:
+            key: Registry key
+
+        Returns:
+            Tuple of (AlgorithmClass, error_message)
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None, f"Algorithm '{key}' not found in registry"
+
+        # Fast path: no lock once the class is cached
+        if entry.algorithm_class is not None:
+            return entry.algorithm_class, None
+
+        with self._lock:
+            if entry.algorithm_class is None:
+                self._import(entry)
+
+        return entry.algorithm_class, entry.error
+
+    def preload(self, keys: Optional[Iterable[str]] = None) -> Dict[str, Optional[str]]:
+        """
+        Import algorithm modules ahead of the first request.
+
+        Args:
+            keys: Keys to load (all discovered algorithms if omitted)
+
+        Returns:
+            Mapping of key to import error (None on success)
+        """
+        return {key: self.load(key)[1] for key in (keys or self.keys())}
+
+    def warm_up(self, keys: Optional[Iterable[str]] = None, size: int = 16) -> Dict[str, Any]:
+        """
+        Run every algorithm once on a small input.
+
+        Exercises the algorithm's code paths and the base class machinery so
+        the first real request does not pay for them, and measures the
+        overhead calibration profile of the default tracer (for requests
+        with ``overheadCorrection``). Failures are recorded, not raised: one
+        broken algorithm must not keep the server down.
+
+        Args:
+            keys: Keys to warm (all discovered algorithms if omitted)
+            size: Warm-up input size
+
+        Returns:
+            Mapping of key to warm-up time in seconds or an error message
+        """
+        from python.core.calibration import get_calibration
+
+        sample = list(range(size, 0, -1))
+        results: Dict[str, Any] = {}
+        get_calibration()
+
+        for key in (keys or self.keys()):
+            algorithm_class, error = self.load(key)
+            if error:
+                results[key] = error
+                continue
+            try:
+                start = time.perf_counter()
+                algorithm_class({"record_history": False}).execute(sample)
+                results[key] = time.perf_counter() - start
+            except Exception as e:
+                results[key] = f"Warm-up failed for {key}: {type(e).__name__}: {str(e)}"
+
+        return results
+
+    def describe(self) -> List[Dict[str, Any]]:
+        """Describe all discovered algorithms."""
+        return [entry.to_dict() for entry in self.entries.values()]
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Persistent Run Store for the Bridge Server
+
+/execute ships a run's whole history in one response and keeps nothing. This
+module stores runs server-side in SQLite so the front end can page through
+them:
+
+- A stored run executes in a worker with a ``history_sink``: states are
+  written to the database in batches as they are recorded, so neither the
+  worker nor the server holds the full history
+- Each state is one zlib-compressed row keyed by (run id, step). The array is
+  stored in full every KEYFRAME_INTERVAL steps and as changed positions
+  otherwise, so a page is rebuilt from at most one keyframe interval of rows
+- Summaries (status, metrics, result, step count) live in a separate table
+- Queued jobs (see jobs.py) are mirrored into a ``jobs`` table, so that any
+  server process can report or cancel a job whichever process queued it
+
+The database runs in WAL mode so workers can write while the server reads.
+
+Configuration (environment variables):
+    BRIDGE_RUN_STORE        Database path (default: algorithm-bridge-runs.sqlite3
+                            in the temporary directory)
+    BRIDGE_RUN_STORE_MAX    Runs kept before the oldest are pruned (default 200)
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import json
+import time
+import zlib
+import secrets
+import sqlite3
+import tempfile
+from contextlib import closing, contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Union
+
+from python.bridge.executor import (
+    InputRef, WORKER_CPU_SECONDS, _cpu_limit, _create_algorithm, _dumps, resolve_input,
+    serialize_algorithm_state
+)
+from python.core.budget import BudgetExceeded
+
+RUN_STORE_PATH = os.environ.get('BRIDGE_RUN_STORE') or os.path.join(
+    tempfile.gettempdir(), 'algorithm-bridge-runs.sqlite3')
+RUN_STORE_MAX = int(os.environ.get('BRIDGE_RUN_STORE_MAX', 200))
+
+KEYFRAME_INTERVAL = 64    # Steps between full arrays
+WRITE_BATCH = 512         # States buffered per insert transaction
+MAX_PAGE = 1000           # Largest step range served at once
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY,
+    algorithm TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created REAL NOT NULL,
+    input_size INTEGER NOT NULL,
+    steps INTEGER NOT NULL DEFAULT 0,
+    summary BLOB
+);
+CREATE TABLE IF NOT EXISTS steps (
+    run_id TEXT NOT NULL,
+    step INTEGER NOT NULL,
+    record BLOB NOT NULL,
+    PRIMARY KEY (run_id, step)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    algorithm TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    submitted REAL NOT NULL,
+    started REAL,
+    finished REAL,
+    run_id TEXT,
+    error TEXT,
+    owner INTEGER NOT NULL
+);
+"""
+
+# Columns of a job row, in table order
+JOB_COLUMNS = ('id', 'algorithm', 'priority', 'status', 'submitted', 'started', 'finished',
+               'run_id', 'error', 'owner')
+_SELECT_JOB = f"SELECT {', '.join(JOB_COLUMNS)} FROM jobs WHERE id = ?"
+
+
+def _encode_state(state: Dict[str, Any], previous: Optional[List[Any]], keyframe: bool) -> bytes:
+    """Compress one serialized state, storing its array as changes unless a keyframe."""
+    values = state.get('array')
+    fields = {key: value for key, value in state.items() if key != 'array'}
+    record: Dict[str, Any] = {'s': fields}
+
+    if isinstance(values, list):
+        if keyframe or previous is None or len(previous) != len(values):
+            record['a'] = values
+        else:
+            changed = [index for index, (old, new) in enumerate(zip(previous, values)) if old != new]
+            record['c'] = [changed, [values[index] for index in changed]]
+
+    return zlib.compress(_dumps(record), 1)
+
+
+def _decode_state(record: bytes, previous: Optional[List[Any]]) -> Dict[str, Any]:
+    """Rebuild a serialized state from its record and the previous array."""
+    data = json.loads(zlib.decompress(record))
+    state = data['s']
+    if 'a' in data:
+        state['array'] = data['a']
+    elif 'c' in data:
+        values = list(previous or [])
+        for index, value in zip(*data['c']):
+            values[index] = value
+        state['array'] = values
+    return state
+
+
+class RunStore:
+    """
+    SQLite-backed store of runs and their states.
+
+    Connections are opened per use so that the store can be shared between
+    threads and worker processes.
+
+    Attributes:
+        path (str): Database path
+        max_runs (int): Runs kept before the oldest are pruned
+    """
+
+    def __init__(self, path: str = RUN_STORE_PATH, max_runs: int = RUN_STORE_MAX):
+        self.path = path
+        self.max_runs = max_runs
+        with self._transaction() as db:
+            db.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.path, timeout=30)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Open a connection for one transaction and close it afterwards.
+
+        ``with connection`` only commits or rolls back; without closing, every
+        call would leave a connection (and its file descriptors) to the
+        garbage collector.
+        """
+        with closing(self._connect()) as db, db:
+            yield db
+
+    def create(self, algorithm_key: str, input_size: int) -> str:
+        """
+        Register a new run and prune the oldest beyond ``max_runs``.
+
+        Runs still recording are never pruned (their worker is writing to
+        them); they are pruned once finished and old enough.
+
+        Args:
+            algorithm_key: Registry key
+            input_size: Number of input elements
+
+        Returns:
+            New run id
+        """
+        run_id = secrets.token_hex(8)
+        with self._transaction() as db:
+            db.execute("INSERT INTO runs (id, algorithm, status, created, input_size) VALUES (?, ?, ?, ?, ?)",
+                       (run_id, algorithm_key, 'running', time.time(), input_size))
+            stale = [row[0] for row in db.execute(
+                "SELECT id FROM (SELECT id, status FROM runs ORDER BY created DESC LIMIT -1 OFFSET ?) "
+                "WHERE status != 'running'", (self.max_runs,))]
+            for stale_id in stale:
+                db.execute("DELETE FROM steps WHERE run_id = ?", (stale_id,))
+                db.execute("DELETE FROM runs WHERE id = ?", (stale_id,))
+        return run_id
+
+    def record(self, run_id: str, algorithm_key: str, data: List[Any], options: Dict[str, Any],
+               limits: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Execute an algorithm, writing its states to the store as they are recorded.
+
+        Args:
+            run_id: Id from create()
+            algorithm_key: Registry key
+            data: Input array
+            options: Python-style algorithm options
+            limits: Per-request limits
+
+        Returns:
+            The stored summary
+        """
+        db = self._connect()
+        pending: List[tuple] = []
+        previous: List[Optional[List[Any]]] = [None]
+
+        def flush() -> None:
+            if pending:
+                with db:
+                    db.executemany("INSERT INTO steps (run_id, step, record) VALUES (?, ?, ?)", pending)
+                    db.execute("UPDATE runs SET steps = ? WHERE id = ?", (pending[-1][1] + 1, run_id))
+                pending.clear()
+
+        def sink(step: int, state: Dict[str, Any]) -> None:
+            state = serialize_algorithm_state(state)
+            pending.append((run_id, step, _encode_state(state, previous[0], step % KEYFRAME_INTERVAL == 0)))
+            previous[0] = state.get('array')
+            if len(pending) >= WRITE_BATCH:
+                flush()
+
+        try:
+            options = dict(options, record_history=True, history_sink=sink)
+            algorithm = _create_algorithm(algorithm_key, options, limits)
+            try:
+                with _cpu_limit(WORKER_CPU_SECONDS):
+                    result = algorithm.execute(data)
+                summary = {'status': 'complete', 'result': result,
+                           'metrics': serialize_algorithm_state(algorithm.metrics)}
+            except BudgetExceeded as e:
+                summary = {'status': 'failed', 'error': str(e), 'budget_exceeded': e.to_dict()}
+            except Exception as e:
+                summary = {'status': 'failed', 'error': f"{type(e).__name__}: {str(e)}"}
+            flush()
+
+            summary['steps'] = len(algorithm.history)
+            with db:
+                db.execute("UPDATE runs SET status = ?, steps = ?, summary = ? WHERE id = ?",
+                           (summary['status'], summary['steps'], zlib.compress(_dumps(summary), 1), run_id))
+            return summary
+        finally:
+            db.close()
+
+    def fail(self, run_id: str, error: str) -> None:
+        """
+        Mark a run as failed when its worker died without storing a summary.
+
+        Runs that already finished are left unchanged.
+
+        Args:
+            run_id: Run id
+            error: Error message for the summary
+        """
+        summary = {'status': 'failed', 'error': error}
+        with self._transaction() as db:
+            db.execute("UPDATE runs SET status = ?, summary = ? WHERE id = ? AND status = 'running'",
+                       ('failed', zlib.compress(_dumps(summary), 1), run_id))
+
+    def summary(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a run's summary.
+
+        Args:
+            run_id: Run id
+
+        Returns:
+            Summary with id, algorithm, status, created, input_size, steps and,
+            once finished, result and metrics (or error); None if unknown
+        """
+        with self._transaction() as db:
+            row = db.execute("SELECT algorithm, status, created, input_size, steps, summary FROM runs "
+                             "WHERE id = ?", (run_id,)).fetchone()
+        if row is None:
+            return None
+
+        algorithm, status, created, input_size, steps, stored = row
+        summary = json.loads(zlib.decompress(stored)) if stored else {}
+        summary.update(id=run_id, algorithm=algorithm, status=status, created=created,
+                       input_size=input_size, steps=steps)
+        return summary
+
+    def steps(self, run_id: str, start: int, stop: int) -> List[Dict[str, Any]]:
+        """
+        Read states ``start`` (inclusive) to ``stop`` (exclusive).
+
+        Only the rows from the keyframe at or before ``start`` are read.
+
+        Args:
+            run_id: Run id
+            start: First step
+            stop: Step after the last one
+
+        Returns:
+            List of {"step", "state"} entries (shorter if the run has fewer steps)
+        """
+        keyframe = start - start % KEYFRAME_INTERVAL
+        with self._transaction() as db:
+            rows = db.execute("SELECT step, record FROM steps WHERE run_id = ? AND step >= ? AND step < ? "
+                              "ORDER BY step", (run_id, keyframe, stop)).fetchall()
+
+        states = []
+        previous = None
+        for step, record in rows:
+            state = _decode_state(record, previous)
+            previous = state.get('array')
+            if step >= start:
+                states.append({'step': step, 'state': state})
+        return states
+
+    def delete(self, run_id: str) -> bool:
+        """
+        Delete a run and its states.
+
+        Returns:
+            Whether the run existed
+        """
+        with self._transaction() as db:
+            db.execute("DELETE FROM steps WHERE run_id = ?", (run_id,))
+            return db.execute("DELETE FROM runs WHERE id = ?", (run_id,)).rowcount > 0
+
+
+    def add_job(self, job: Dict[str, Any], history: int) -> None:
+        """
+        Mirror a newly queued job and prune the oldest finished jobs.
+
+        Args:
+            job: Job row (JOB_COLUMNS)
+            history: Finished jobs kept
+        """
+        with self._transaction() as db:
+            db.execute(f"INSERT INTO jobs ({', '.join(JOB_COLUMNS)}) VALUES ({', '.join('?' * len(JOB_COLUMNS))})",
+                       [job[column] for column in JOB_COLUMNS])
+            db.execute("DELETE FROM jobs WHERE id IN (SELECT id FROM jobs WHERE status NOT IN "
+                       "('queued', 'running') ORDER BY submitted DESC LIMIT -1 OFFSET ?)", (history,))
+
+    def update_job(self, job: Dict[str, Any]) -> None:
+        """
+        Store a job's status, timestamps, run id and error.
+
+        Args:
+            job: Job row (JOB_COLUMNS)
+        """
+        with self._transaction() as db:
+            db.execute("UPDATE jobs SET status = ?, started = ?, finished = ?, run_id = ?, error = ? "
+                       "WHERE id = ?", (job['status'], job['started'], job['finished'], job['run_id'],
+                                        job['error'], job['id']))
+
+    def claim_job(self, job_id: str, started: float) -> bool:
+        """
+        Mark a queued job as running, unless another process cancelled it.
+
+        Returns:
+            Whether the job was still queued
+        """
+        with self._transaction() as db:
+            return db.execute("UPDATE jobs SET status = 'running', started = ? WHERE id = ? AND status = 'queued'",
+                              (started, job_id)).rowcount > 0
+
+    def job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a job row.
+
+        Returns:
+            Job row (JOB_COLUMNS), or None if unknown
+        """
+        with self._transaction() as db:
+            row = db.execute(_SELECT_JOB, (job_id,)).fetchone()
+        return dict(zip(JOB_COLUMNS, row)) if row is not None else None
+
+    def cancel_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a queued job, or forget a finished one.
+
+        The process that queued a cancelled job skips it when it would start.
+
+        Returns:
+            The job row (None if unknown)
+
+        Raises:
+            RuntimeError: If the job is already running
+        """
+        with self._transaction() as db:
+            row = db.execute(_SELECT_JOB, (job_id,)).fetchone()
+            if row is None:
+                return None
+            job = dict(zip(JOB_COLUMNS, row))
+            if job['status'] == 'queued':
+                # Conditional: the owner may be starting it right now
+                finished = time.time()
+                if db.execute("UPDATE jobs SET status = 'cancelled', finished = ? WHERE id = ? AND status = 'queued'",
+                              (finished, job_id)).rowcount:
+                    job.update(status='cancelled', finished=finished)
+                    return job
+                job['status'] = 'running'
+            if job['status'] == 'running':
+                raise RuntimeError(f"Job '{job_id}' is already running")
+            db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+            return job
+
+    def delete_job(self, job_id: str) -> None:
+        """Forget a job."""
+        with self._transaction() as db:
+            db.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+    def fail_jobs(self, owner: int, error: str) -> int:
+        """
+        Fail the unfinished jobs (and their runs) of a process that exited.
+
+        Args:
+            owner: Process id that queued the jobs
+            error: Error message
+
+        Returns:
+            Number of jobs failed
+        """
+        with self._transaction() as db:
+            run_ids = [row[0] for row in db.execute(
+                "SELECT run_id FROM jobs WHERE owner = ? AND status IN ('queued', 'running') "
+                "AND run_id IS NOT NULL", (owner,))]
+            failed = db.execute("UPDATE jobs SET status = 'failed', finished = ?, error = ? "
+                                "WHERE owner = ? AND status IN ('queued', 'running')",
+                                (time.time(), error, owner)).rowcount
+        for run_id in run_ids:
+            self.fail(run_id, error)
+        return failed
+
+
+def run_recorded(path: str, run_id: str, algorithm_key: str, data: Union[InputRef, List[Any]],
+                 options: Dict[str, Any], limits: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Worker entry point: execute a run into the store at ``path``.
+
+    Module-level so that it can be pickled for the process pool.
+    """
+    return RunStore(path).record(run_id, algorithm_key, resolve_input(data), options, limits)
@@ -33,11 +33,13 @@ Authors:
 import json
 import math
 import base64
+import sys
 import zlib
-import numpy as np
 from typing import Dict, List, Any, Union, Optional, Tuple, Callable, Set
 from datetime import datetime
 
+from python.bridge.wire import WIRE_MAGIC, WireEncodingError, decode_array, encode_array
+
 # Type aliases for clarity
 AlgorithmState = Dict[str, Any]
 AlgorithmHistory = List[AlgorithmState]
@@ -71,13 +73,16 @@ def _convert_to_serializable(obj: Any) -> Any:
     if obj is None:
         return None
     
-    # NumPy array handling
-    if isinstance(obj, np.ndarray):
-        return obj.tolist()
-    
-    # NumPy scalar type handling
-    if isinstance(obj, (np.integer, np.floating, np.bool_)):
-        return obj.item()
+    # NumPy values can only exist if NumPy was imported elsewhere
+    np = sys.modules.get("numpy")
+    if np is not None:
+        # NumPy array handling
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        
+        # NumPy scalar type handling
+        if isinstance(obj, (np.integer, np.floating, np.bool_)):
+            return obj.item()
     
     # Set handling
     if isinstance(obj, set):
@@ -113,6 +118,25 @@ def _convert_to_serializable(obj: Any) -> Any:
     # Default case: return the object itself if it's a basic type
     return obj
 
+def convert_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert JavaScript-style options to Python-style options.
+    
+    Args:
+        options: JavaScript-style options dictionary
+        
+    Returns:
+        Python-style options dictionary
+    """
+    python_options = {}
+    
+    # Convert camelCase to snake_case
+    for key, value in options.items():
+        snake_key = ''.join(['_' + c.lower() if c.isupper() else c for c in key]).lstrip('_')
+        python_options[snake_key] = value
+    
+    return python_options
+
 def serialize_algorithm_state(state: AlgorithmState, include_array: bool = True) -> Dict[str, Any]:
     """
     Serialize an algorithm state for transmission to JavaScript.
@@ -332,23 +356,44 @@ def compress_array_data(array: List[Any]) -> str:
     """
     Compress array data for efficient transmission.
     
+    Homogeneous numeric arrays are packed as a typed wire column; other
+    arrays fall back to JSON. Either is then zlib-compressed and base64-encoded.
+    
     Args:
         array: List of values to compress
         
     Returns:
         Compressed and encoded string representation
     """
-    # Convert to JSON string
-    json_data = json.dumps(array)
+    try:
+        raw = encode_array(array)
+    except WireEncodingError:
+        # Fallback: JSON text
+        raw = json.dumps(array).encode('utf-8')
     
     # Compress with zlib
-    compressed = zlib.compress(json_data.encode('utf-8'))
+    compressed = zlib.compress(raw)
     
     # Encode to base64
     encoded = encode_binary_data(compressed)
     
     return encoded
 
+def decompress_array_data(encoded: str) -> List[Any]:
+    """
+    Restore an array produced by compress_array_data.
+    
+    Args:
+        encoded: Compressed and encoded string representation
+        
+    Returns:
+        The original list of values
+    """
+    raw = zlib.decompress(base64.b64decode(encoded))
+    if raw.startswith(WIRE_MAGIC):
+        return decode_array(raw)
+    return json.loads(raw.decode('utf-8'))
+
 def calculate_state_difference(
     current_state: AlgorithmState,
     previous_state: AlgorithmState
@@ -22,7 +22,6 @@ import os
 import sys
 import json
 import time
-import importlib
 import traceback
 from typing import Dict, Any, List, Tuple, Optional, Union
 
@@ -46,44 +45,76 @@ except ImportError:
     print("Algorithm base class not found. Ensure the project structure is correct.")
     sys.exit(1)
 
+from python.bridge import datasets, health, telemetry, live
+from python.bridge.cache import ResultCache, cache_key
+from python.bridge.runs import MAX_PAGE, RunStore, run_recorded
+from python.bridge.jobs import JobQueue, QueueFull
+from python.bridge.planner import BATCH_WORKERS, Planner, input_features
+from python.bridge.benchmark import BENCHMARK_MAX_POINTS, run_benchmark, sweep_sizes
+from python.utils.data_generators import generate_dataset
+from python.bridge.batch import (
+    BATCH_MAX_ROWS, BATCH_METRICS, metric_columns, row_bounds, row_errors, run_batch
+)
+from python.bridge.columnar import COLUMNS_MIMETYPE
+from python.bridge.pipeline import PIPELINE_MIMETYPE, run_pipelined
+from python.bridge.wire import COLUMN_HEADER, WIRE_MAGIC, WIRE_MIMETYPE, WIRE_VERSION
+from python.bridge.serialization import convert_options
+from python.bridge.datasets import DatasetLease
+from python.bridge.uploads import UploadError, backend_input, read_request, release_input
+from python.bridge.streaming import (
+    NDJSON_MIMETYPE, SSE_MIMETYPE, STREAM_WORKERS, format_ndjson, format_sse, stream_run
+)
+from python.core.budget import BudgetExceeded
+from python.bridge.executor import (
+    COMPARE_TIMEOUT, ExecutionBackend, InputRef, SharedInput, get_registry, input_length,
+    resolve_input, serialize_algorithm_state
+)
+
 # Initialize Flask application with CORS support
 app = Flask(__name__)
 CORS(app)
+telemetry.init_app(app)
+health.init_app(app)
 
 # Configuration
 DEBUG = True
 PORT = 5000
 HOST = '0.0.0.0' if not DEBUG else '127.0.0.1'
 
-# Algorithm registry - maps algorithm keys to module paths
-ALGORITHM_REGISTRY = {
-    # Comparison sorts
-    'bubble-sort': ('python.algorithms.comparison.bubble_sort', 'BubbleSort'),
-    'merge-sort': ('python.algorithms.comparison.merge_sort', 'MergeSort'),
-    'quick-sort': ('python.algorithms.comparison.quick_sort', 'QuickSort'),
-    'heap-sort': ('python.algorithms.comparison.heap_sort', 'HeapSort'),
-    'insertion-sort': ('python.algorithms.comparison.insertion_sort', 'InsertionSort'),
-    'selection-sort': ('python.algorithms.comparison.selection_sort', 'SelectionSort'),
-    'shell-sort': ('python.algorithms.comparison.shell_sort', 'ShellSort'),
-    
-    # Distribution sorts
-    'counting-sort': ('python.algorithms.distribution.counting_sort', 'CountingSort'),
-    'radix-sort': ('python.algorithms.distribution.radix_sort', 'RadixSort'),
-    'bucket-sort': ('python.algorithms.distribution.bucket_sort', 'BucketSort'),
-    
-    # Special sorts
-    'bogo-sort': ('python.algorithms.special.bogo_sort', 'BogoSort'),
-    'pancake-sort': ('python.algorithms.special.pancake_sort', 'PancakeSort'),
-    
-    # Selection algorithms
-    'quick-select': ('python.algorithms.selection.quick_select', 'QuickSelect')
-}
+# Spawn the worker pool (which preloads algorithms) before serving
+PRELOAD_ALGORITHMS = os.environ.get('BRIDGE_PRELOAD', '1') == '1'
+
+# Algorithm registry - discovers Algorithm subclasses under python/algorithms
+ALGORITHMS = get_registry()
+ALGORITHM_REGISTRY = ALGORITHMS.entries
+
+# Execution backend - runs algorithms in worker processes (see executor.py)
+BACKEND = ExecutionBackend()
+
+# Streamed runs occupy a worker for as long as the client reads (see streaming.py)
+STREAM_BACKEND = ExecutionBackend(workers=STREAM_WORKERS)
+
+# Live sessions hold a worker each while open (see live.py)
+LIVE_BACKEND = ExecutionBackend(workers=live.LIVE_MAX_SESSIONS)
+
+# Runs the planner predicts to be long queue here instead of on BACKEND
+BATCH_BACKEND = ExecutionBackend(workers=BATCH_WORKERS)
+PLANNER = Planner()
+
+# Result cache - replays identical runs without recomputing them (see cache.py)
+RESULT_CACHE = ResultCache()
+
+# Stored runs, paged through /runs/<id>/steps
+RUN_STORE = RunStore()
+
+# Asynchronous runs, executed into the run store
+JOBS = JobQueue(BACKEND, RUN_STORE)
 
 # ------- Utility Functions -------
 
 def import_algorithm(algorithm_key: str) -> Tuple[Any, Optional[str]]:
     """
-    Dynamically import an algorithm class based on registry key.
+    Get an algorithm class based on registry key (imported once, then cached).
     
     Args:
         algorithm_key: Identifier for the algorithm in the registry
@@ -91,68 +122,32 @@ def import_algorithm(algorithm_key: str) -> Tuple[Any, Optional[str]]:
     Returns:
         Tuple of (AlgorithmClass, error_message)
     """
-    if algorithm_key not in ALGORITHM_REGISTRY:
-        return None, f"Algorithm '{algorithm_key}' not found in registry"
-    
-    try:
-        module_path, class_name = ALGORITHM_REGISTRY[algorithm_key]
-        module = importlib.import_module(module_path)
-        algorithm_class = getattr(module, class_name)
-        return algorithm_class, None
-    except (ImportError, AttributeError) as e:
-        return None, f"Failed to import {algorithm_key}: {str(e)}"
+    return ALGORITHMS.load(algorithm_key)
 
-def convert_options(options: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Convert JavaScript-style options to Python-style options.
-    
-    Args:
-        options: JavaScript-style options dictionary
-        
-    Returns:
-        Python-style options dictionary
-    """
-    python_options = {}
-    
-    # Convert camelCase to snake_case
-    for key, value in options.items():
-        snake_key = ''.join(['_' + c.lower() if c.isupper() else c for c in key]).lstrip('_')
-        python_options[snake_key] = value
-    
-    return python_options
+def _compare_limits(limits: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+    """Get the limits a /compare entry effectively runs under (its timeout as deadline)."""
+    deadline = limits.get('deadline')
+    return dict(limits, deadline=min(timeout, deadline) if deadline else timeout)
+
+def _rejection(plan: Any) -> Response:
+    """Build the 422 response for a request the planner rejected."""
+    return jsonify({'error': '; '.join(plan.reasons), 'plan': plan.to_dict()}), 422
 
-def serialize_algorithm_state(state: Dict[str, Any]) -> Dict[str, Any]:
+def _comparison_body(entries: List[Tuple[str, bytes]], input_size: int) -> bytes:
     """
-    Prepare algorithm state for JSON serialization.
+    Assemble the /compare response from pre-serialized per-algorithm entries.
     
     Args:
-        state: Algorithm state dictionary
+        entries: (algorithm key, JSON entry) pairs in completion order
+        input_size: Number of input elements
         
     Returns:
-        Serializable state dictionary
-    """
-    serialized = {}
-    
-    for key, value in state.items():
-        # Convert numpy arrays to lists
-        if hasattr(value, 'tolist'):
-            serialized[key] = value.tolist()
-        # Convert sets to lists
-        elif isinstance(value, set):
-            serialized[key] = list(value)
-        # Handle nested dictionaries
-        elif isinstance(value, dict):
-            serialized[key] = serialize_algorithm_state(value)
-        # Handle nested lists
-        elif isinstance(value, list):
-            serialized[key] = [
-                serialize_algorithm_state(item) if isinstance(item, dict) 
-                else item for item in value
-            ]
-        else:
-            serialized[key] = value
-    
-    return serialized
+        JSON response body
+    """
+    keys = [json.dumps(key) for key, _ in entries]
+    comparison = b','.join(key.encode('utf-8') + b':' + payload for key, (_, payload) in zip(keys, entries))
+    return (b'{"comparison":{' + comparison + b'},"completion_order":[' + ','.join(keys).encode('utf-8')
+            + b'],"input_size":' + str(input_size).encode('ascii') + b'}')
 
 # ------- API Endpoints -------
 
@@ -167,9 +162,45 @@ def status() -> Response:
     return jsonify({
         'status': 'running',
         'algorithms': list(ALGORITHM_REGISTRY.keys()),
+        'cache': RESULT_CACHE.describe(),
+        'datasets': datasets.DATASETS.describe(),
+        'jobs': JOBS.describe(),
+        'planner': PLANNER.describe(),
         'message': 'Python algorithm bridge server is operational'
     })
 
+@app.route('/health', methods=['GET'])
+def health_check() -> Response:
+    """
+    Live operational health for load balancers and on-call.
+    
+    Figures cover the rolling window of health.py: requests in flight, p50,
+    p95 and p99 latency per endpoint and algorithm, request, rejection and
+    error counts and cache hit rates, plus the job queue depth, the resident
+    memory of the server and its pool workers, and the result and dataset
+    caches.
+    
+    Returns:
+        JSON health report; 503 with status "saturated" when the job queue is
+        full or in-flight requests reached BRIDGE_HEALTH_MAX_IN_FLIGHT
+    """
+    report = health.MONITOR.describe()
+    jobs = JOBS.describe()
+    saturated = (jobs['queued'] >= jobs['max_queued']
+                 or report['in_flight']['total'] >= health.MONITOR.max_in_flight)
+    
+    worker_pids = (BACKEND.worker_pids() + STREAM_BACKEND.worker_pids() + BATCH_BACKEND.worker_pids()
+                   + LIVE_BACKEND.worker_pids())
+    report.update({
+        'status': 'saturated' if saturated else 'ok',
+        'max_in_flight': health.MONITOR.max_in_flight,
+        'jobs': jobs,
+        'memory': health.process_memory(worker_pids),
+        'result_cache': RESULT_CACHE.describe(),
+        'datasets': datasets.DATASETS.describe()
+    })
+    return jsonify(report), 503 if saturated else 200
+
 @app.route('/execute', methods=['POST'])
 def execute_algorithm() -> Response:
     """
@@ -179,47 +210,115 @@ def execute_algorithm() -> Response:
     {
         "algorithm": "algorithm-key",
         "data": [...],
-        "options": {...}
+        "options": {...},
+        "limits": {                             // optional
+            "deadline": 5.0,                    // seconds
+            "maxComparisons": 1000000,
+            "maxHistoryStates": 10000,
+            "maxMemoryMb": 256
+        },
+        "cache": true,                          // optional, false forces a fresh run
+        "plan": true                            // optional, false skips the cost planner
     }
     
+    The planner (see planner.py) may reject the request up front (422 with
+    the plan), sample or disable its history, and send long runs to the batch
+    pool (the latter two only once the algorithm's estimates are calibrated
+    from an observed run); the X-Plan header reports the decision and route.
+    
+    Clients that prefer application/vnd.algorithm-wire in their Accept header
+    get the binary wire format (see wire.py) when the arrays are numeric;
+    application/vnd.algorithm-columns+json gets JSON with a column-oriented
+    history (see columnar.py), far smaller and faster to produce. Clients
+    that also accept the deflate content encoding can ask for
+    application/vnd.algorithm-columns+ndjson: the history is then encoded
+    and compressed while the algorithm runs (see pipeline.py).
+    
+    Large inputs can be sent as application/octet-stream or multipart bodies
+    instead of a JSON "data" list (see uploads.py), or generated server-side
+    from a dataset spec such as {"type": "gaussian", "size": 100000, "seed": 7}
+    in place of the list (see datasets.py).
+    
     Returns:
-        JSON response with algorithm results and metrics
+        JSON or binary response with algorithm results and metrics (X-Cache:
+        HIT or MISS), or 422 with a partial-result report when a limit was exceeded
     """
+    upload = []
     try:
-        # Parse request data
-        request_data = request.json
+        # Parse request data (JSON, or binary input with JSON fields)
+        request_data, upload = read_request(request)
         if not request_data:
             return jsonify({'error': 'Invalid request format'}), 400
         
         algorithm_key = request_data.get('algorithm')
-        data = request_data.get('data', [])
+        data = backend_input(upload)
         options = request_data.get('options', {})
         
         if not algorithm_key:
             return jsonify({'error': 'Algorithm key is required'}), 400
         
-        # Import algorithm class
-        algorithm_class, error = import_algorithm(algorithm_key)
-        if error:
-            return jsonify({'error': error}), 404
+        if algorithm_key not in ALGORITHMS:
+            return jsonify({'error': f"Algorithm '{algorithm_key}' not found in registry"}), 404
+        telemetry.set_request_algorithm(algorithm_key)
         
         # Convert options to Python style
         python_options = convert_options(options)
         
-        # Initialize and execute algorithm
-        algorithm = algorithm_class(python_options)
-        result = algorithm.execute(data)
+        # Estimate the cost before running anything
+        plan = None
+        backend = BACKEND
+        if request_data.get('plan', True):
+            plan = PLANNER.plan(algorithm_key, data, python_options)
+            if plan.decision == 'reject':
+                return _rejection(plan)
+            python_options = plan.options
+            if plan.route == 'batch':
+                backend = BATCH_BACKEND
         
-        # Prepare response with results and metrics
-        response = {
-            'result': result,
-            'metrics': serialize_algorithm_state(algorithm.metrics),
-            'history': [
-                serialize_algorithm_state(state) for state in algorithm.history
-            ]
-        }
+        # Execute in a worker; the response body is serialized there
+        limits = convert_options(request_data.get('limits', {}))
+        offered = ['application/json', WIRE_MIMETYPE, COLUMNS_MIMETYPE]
+        if request.accept_encodings['deflate']:
+            offered.append(PIPELINE_MIMETYPE)
+        preferred = request.accept_mimetypes.best_match(offered)
+        encoding = {WIRE_MIMETYPE: 'binary', COLUMNS_MIMETYPE: 'columns',
+                    PIPELINE_MIMETYPE: 'pipeline'}.get(preferred, 'json')
+        if encoding == 'pipeline':
+            run = lambda: backend.submit(run_pipelined, algorithm_key, data, python_options, limits).result()
+        else:
+            run = lambda: backend.execute(algorithm_key, data, python_options, limits, encoding)
+        if request_data.get('cache', True):
+            key = cache_key(f'execute:{encoding}', algorithm_key, python_options, data, limits)
+            output, hit = RESULT_CACHE.get_or_compute(key, run)
+            telemetry.observe_cache('/execute', hit)
+        else:
+            output, hit = run(), False
+        if not hit:
+            telemetry.observe_run('/execute', algorithm_key, input_length(data), output.history_states,
+                                  output.execution_time)
+            if plan is not None:
+                json_bytes = len(output.payload) if output.mimetype == 'application/json' else None
+                PLANNER.observe(plan, output.comparisons, output.history_states, output.execution_time,
+                                json_bytes)
         
-        return jsonify(response)
+        response = Response(output.payload, mimetype=output.mimetype)
+        if output.mimetype == PIPELINE_MIMETYPE:
+            response.headers['Content-Encoding'] = 'deflate'
+        response.headers['X-Cache'] = 'HIT' if hit else 'MISS'
+        if plan is not None:
+            response.headers['X-Plan'] = f'{plan.decision}; route={plan.route}'
+        response.vary.add('Accept')
+        response.vary.add('Accept-Encoding')
+        return response
+    
+    except UploadError as e:
+        return jsonify({'error': str(e)}), e.status
+    
+    except BudgetExceeded as e:
+        return jsonify({'error': str(e), 'budget_exceeded': e.to_dict()}), 422
+    
+    except ImportError as e:
+        return jsonify({'error': str(e)}), 404
     
     except Exception as e:
         # Provide detailed error information in debug mode
@@ -230,6 +329,186 @@ def execute_algorithm() -> Response:
             }), 500
         
         return jsonify({'error': 'Internal server error'}), 500
+    
+    finally:
+        release_input(upload)
+
+@app.route('/execute/stream', methods=['POST'])
+def execute_algorithm_stream() -> Response:
+    """
+    Execute an algorithm and stream its states as they are recorded.
+    
+    Expected request body: as for /execute, plus
+    {
+        "delta": false                          // optional, send diffs between states
+    }
+    
+    The response is NDJSON (one {"type": ..., ...} object per line) or, when
+    the client accepts text/event-stream, Server-Sent Events named after the
+    message type. Messages are "state"/"delta" per step, then "result" or
+    "error". The run advances only as fast as the client reads.
+    
+    Returns:
+        Streaming response
+    """
+    request_data = request.get_json(silent=True)
+    if not request_data:
+        return jsonify({'error': 'Invalid request format'}), 400
+    
+    algorithm_key = request_data.get('algorithm')
+    if not algorithm_key:
+        return jsonify({'error': 'Algorithm key is required'}), 400
+    
+    if algorithm_key not in ALGORITHMS:
+        return jsonify({'error': f"Algorithm '{algorithm_key}' not found in registry"}), 404
+    telemetry.set_request_algorithm(algorithm_key)
+    
+    data = request_data.get('data', [])
+    if isinstance(data, dict):
+        # Dataset spec: streamed runs take a private copy (see datasets.py)
+        try:
+            with datasets.DATASETS.lease(data) as dataset:
+                data = resolve_input(dataset.ref)
+        except ValueError as e:
+            return jsonify({'error': f"Invalid dataset spec: {e}"}), 400
+
+    def on_complete(history_states: int, execution_time: float) -> None:
+        telemetry.observe_run('/execute/stream', algorithm_key, len(data), history_states, execution_time)
+    
+    messages = stream_run(STREAM_BACKEND, algorithm_key, data,
+                          convert_options(request_data.get('options', {})),
+                          delta=bool(request_data.get('delta', False)),
+                          limits=convert_options(request_data.get('limits', {})),
+                          on_complete=on_complete)
+    
+    use_sse = request.accept_mimetypes.best_match([NDJSON_MIMETYPE, SSE_MIMETYPE]) == SSE_MIMETYPE
+    frame = format_sse if use_sse else format_ndjson
+    
+    def generate():
+        for kind, body in messages:
+            yield frame(kind, body)
+    
+    response = Response(generate(), mimetype=SSE_MIMETYPE if use_sse else NDJSON_MIMETYPE)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+@app.route('/execute/batch', methods=['POST'])
+def execute_batch() -> Response:
+    """
+    Execute one algorithm on many arrays.
+
+    Expected request body:
+    {
+        "algorithm": "algorithm-key",
+        "datasets": [[...], [...], ...],        // or:
+        "data": [...],                          // all rows concatenated
+        "offsets": [0, 3, 7, ...],              // row starts (final length optional)
+        "options": {...},
+        "limits": {...}                         // optional, applied to each row
+    }
+
+    Binary bodies (see uploads.py) carry the concatenated rows, with
+    "offsets" among the request fields. Rows run in parallel chunks on the
+    pool without history (see batch.py).
+
+    Returns:
+        For "datasets": {"results": [[...], ...], "metrics": {...}, "errors": [...]}
+        For "data"/"offsets": {"data": [...], "offsets": [...], "metrics": {...},
+        "errors": [...]}, with every row sorted in place
+        For binary bodies: the sorted rows as a wire column, with per-batch
+        totals in X-Batch-Metrics and failed rows in X-Batch-Errors
+        Metrics are columns with one value per row (null for failed rows)
+    """
+    upload = []
+    try:
+        request_data, upload = read_request(request)
+        if not request_data:
+            return jsonify({'error': 'Invalid request format'}), 400
+
+        algorithm_key = request_data.get('algorithm')
+        if not algorithm_key:
+            return jsonify({'error': 'Algorithm key is required'}), 400
+
+        if algorithm_key not in ALGORITHMS:
+            return jsonify({'error': f"Algorithm '{algorithm_key}' not found in registry"}), 404
+        telemetry.set_request_algorithm(algorithm_key)
+
+        python_options = convert_options(request_data.get('options', {}))
+        limits = convert_options(request_data.get('limits', {}))
+        binary = isinstance(upload, SharedInput) and not isinstance(upload, DatasetLease)
+
+        if 'datasets' in request_data:
+            rows = request_data['datasets']
+            if not isinstance(rows, list) or not all(isinstance(row, list) for row in rows):
+                return jsonify({'error': "'datasets' must be a list of arrays"}), 400
+            if len(rows) > BATCH_MAX_ROWS:
+                return jsonify({'error': f"A batch holds at most {BATCH_MAX_ROWS} rows"}), 400
+            entries = run_batch(BACKEND, algorithm_key, rows, None, python_options, limits)
+            body = {'results': [entry.get('result') for entry in entries]}
+            elements = sum(len(row) for row in rows)
+        else:
+            if 'offsets' not in request_data:
+                return jsonify({'error': "'datasets' or 'offsets' is required"}), 400
+            data = backend_input(upload)
+            elements = input_length(data)
+            bounds = row_bounds(request_data['offsets'], elements)
+            offsets = [start for start, _ in bounds] + [elements]
+            if isinstance(data, InputRef) and not binary:
+                # Rows are sorted in place, so cached datasets are copied first
+                data = resolve_input(data)
+
+            # Packed numbers are sorted in place in shared memory; anything else goes row by row
+            packed = upload if binary else SharedInput(data)
+            with packed:
+                if isinstance(packed.ref, InputRef):
+                    entries = run_batch(BACKEND, algorithm_key, packed.ref, bounds, python_options, limits)
+                    if binary:
+                        with packed.buffer as view:
+                            payload = COLUMN_HEADER.pack(WIRE_MAGIC, WIRE_VERSION,
+                                                         packed.ref.typecode.encode('ascii'),
+                                                         packed.ref.length) + bytes(view)
+                    else:
+                        with packed.buffer as view, view.cast(packed.ref.typecode) as values:
+                            result = values.tolist()
+                else:
+                    entries = run_batch(BACKEND, algorithm_key, [data[start:end] for start, end in bounds],
+                                        None, python_options, limits)
+                    result = [value for entry, (start, end) in zip(entries, bounds)
+                              for value in entry.get('result', data[start:end])]
+            if not binary:
+                body = {'data': result, 'offsets': offsets}
+
+        totals = {metric: sum(entry.get(metric, 0) for entry in entries) for metric in BATCH_METRICS}
+        telemetry.observe_run('/execute/batch', algorithm_key, elements, 0, totals['execution_time'])
+        errors = row_errors(entries)
+
+        if binary:
+            response = Response(payload, mimetype=WIRE_MIMETYPE)
+            response.headers['X-Batch-Metrics'] = json.dumps(dict(totals, rows=len(entries)))
+            response.headers['X-Batch-Errors'] = ','.join(str(error['index']) for error in errors)
+            return response
+
+        body.update({'metrics': metric_columns(entries), 'errors': errors})
+        return jsonify(body)
+
+    except (UploadError, ValueError) as e:
+        return jsonify({'error': str(e)}), getattr(e, 'status', 400)
+
+    except ImportError as e:
+        return jsonify({'error': str(e)}), 404
+
+    except Exception as e:
+        if DEBUG:
+            return jsonify({
+                'error': str(e),
+                'traceback': traceback.format_exc()
+            }), 500
+
+        return jsonify({'error': 'Internal server error'}), 500
+
+    finally:
+        release_input(upload)
 
 @app.route('/compare', methods=['POST'])
 def compare_algorithms() -> Response:
@@ -244,56 +523,124 @@ def compare_algorithms() -> Response:
             "algorithm-key-1": {...},
             "algorithm-key-2": {...},
             ...
-        }
+        },
+        "timeout": 60,                          // optional, seconds per algorithm
+        "timeouts": {"algorithm-key-1": 5},     // optional, per-algorithm override
+        "fairTiming": false,                    // optional, serialize runs on a pinned CPU
+        "limits": {...},                        // optional, as for /execute
+        "cache": true,                          // optional, false forces fresh runs
+        "plan": true                            // optional, false skips the cost planner
     }
     
+    The input may also be sent as a binary body or a dataset spec, as for
+    /execute; every algorithm then reads the same cached copy.
+    
+    Algorithms run concurrently; a failing or timed-out algorithm reports an
+    error entry without affecting the others. Cached entries are reused and
+    only the remaining algorithms run (fair-timing requests always run).
+    Algorithms the planner rejects get an error entry with their plan; the
+    others run with the planner's options.
+    
     Returns:
         JSON response with comparative results
     """
+    upload = []
     try:
-        # Parse request data
-        request_data = request.json
+        # Parse request data (JSON, or binary input with JSON fields)
+        request_data, upload = read_request(request)
         if not request_data:
             return jsonify({'error': 'Invalid request format'}), 400
         
         algorithms = request_data.get('algorithms', [])
-        data = request_data.get('data', [])
+        data = backend_input(upload)
         options_map = request_data.get('options', {})
         
         if not algorithms:
             return jsonify({'error': 'At least one algorithm is required'}), 400
         
-        results = {}
+        entries = []
+        if len(algorithms) > 1:
+            telemetry.set_request_algorithm('multiple')
+        elif algorithms[0] in ALGORITHM_REGISTRY:
+            telemetry.set_request_algorithm(algorithms[0])
         
-        # Execute each algorithm
+        # Unknown algorithms get error entries without running anything
         for algorithm_key in algorithms:
-            # Import algorithm class
-            algorithm_class, error = import_algorithm(algorithm_key)
-            if error:
-                results[algorithm_key] = {'error': error}
+            if algorithm_key not in ALGORITHMS:
+                error = f"Algorithm '{algorithm_key}' not found in registry"
+                entries.append((algorithm_key, json.dumps({'error': error}).encode('utf-8')))
+        
+        # Get algorithm-specific options and timeouts
+        runnable = [key for key in dict.fromkeys(algorithms) if key in ALGORITHMS]
+        options_map = {key: convert_options(options_map.get(key, {})) for key in runnable}
+        timeouts = {key: float(value) for key, value in request_data.get('timeouts', {}).items()
+                    if key in runnable}
+        if request_data.get('timeout') is not None:
+            timeouts = {key: timeouts.get(key, float(request_data['timeout'])) for key in runnable}
+        
+        fair_timing = bool(request_data.get('fairTiming', False))
+        limits = convert_options(request_data.get('limits', {}))
+        
+        # Plan every algorithm on one measurement of the input
+        plans = {}
+        if request_data.get('plan', True) and runnable:
+            features = input_features(data)
+            for algorithm_key in list(runnable):
+                plan = PLANNER.plan(algorithm_key, data, options_map[algorithm_key], features)
+                if plan.decision == 'reject':
+                    runnable.remove(algorithm_key)
+                    entries.append((algorithm_key, json.dumps(
+                        {'error': '; '.join(plan.reasons), 'plan': plan.to_dict()}).encode('utf-8')))
+                    continue
+                plans[algorithm_key] = plan
+                options_map[algorithm_key] = plan.options
+        
+        # Serve cached entries first; only the misses run
+        keys = {}
+        if request_data.get('cache', True) and not fair_timing and RESULT_CACHE.enabled:
+            keys = {key: cache_key('compare', key, options_map[key], data,
+                                   _compare_limits(limits, timeouts.get(key, COMPARE_TIMEOUT)))
+                    for key in runnable}
+        cached = set()
+        for algorithm_key, key in keys.items():
+            output = RESULT_CACHE.get(key)
+            telemetry.observe_cache('/compare', output is not None)
+            if output is not None:
+                cached.add(algorithm_key)
+                entries.append((algorithm_key, output.payload))
+        missing = [key for key in runnable if key not in cached]
+        
+        # Execute concurrently in workers and keep serialized entries as they finish
+        outcomes = BACKEND.compare(missing, data, options_map, timeouts,
+                                   fair_timing=fair_timing, limits=limits) if missing else []
+        for algorithm_key, output in outcomes:
+            if isinstance(output, Exception):
+                error = {'error': f"{type(output).__name__}: {str(output)}"}
+                if isinstance(output, BudgetExceeded):
+                    error['budget_exceeded'] = output.to_dict()
+                if isinstance(output, TimeoutError) or getattr(output, 'reason', None) == 'deadline':
+                    error['timeout'] = timeouts.get(algorithm_key, COMPARE_TIMEOUT)
+                entries.append((algorithm_key, json.dumps(error, default=str).encode('utf-8')))
                 continue
             
-            # Get algorithm-specific options
-            options = options_map.get(algorithm_key, {})
-            python_options = convert_options(options)
-            
-            # Initialize and execute algorithm
-            algorithm = algorithm_class(python_options)
-            start_time = time.time()
-            sorted_data = algorithm.execute(data)
-            execution_time = time.time() - start_time
-            
-            # Store results
-            results[algorithm_key] = {
-                'result': sorted_data,
-                'metrics': serialize_algorithm_state(algorithm.metrics),
-                'execution_time': execution_time
-            }
-        
-        return jsonify({
-            'comparison': results,
-            'input_size': len(data)
-        })
+            telemetry.observe_run('/compare', algorithm_key, input_length(data), output.history_states,
+                                  output.execution_time)
+            if algorithm_key in plans:
+                PLANNER.observe(plans[algorithm_key], output.comparisons, output.history_states,
+                                output.execution_time)
+            if algorithm_key in keys:
+                RESULT_CACHE.put(keys[algorithm_key], output)
+            entries.append((algorithm_key, output.payload))
+        
+        response = Response(_comparison_body(entries, input_length(data)), mimetype='application/json')
+        if not cached:
+            response.headers['X-Cache'] = 'MISS'
+        else:
+            response.headers['X-Cache'] = 'PARTIAL' if missing else 'HIT'
+        return response
+    
+    except UploadError as e:
+        return jsonify({'error': str(e)}), e.status
     
     except Exception as e:
         # Provide detailed error information in debug mode
@@ -304,10 +651,381 @@ def compare_algorithms() -> Response:
             }), 500
         
         return jsonify({'error': 'Internal server error'}), 500
+    
+    finally:
+        release_input(upload)
+
+@app.route('/plan', methods=['POST'])
+def plan_request() -> Response:
+    """
+    Estimate the cost of an /execute or /compare request without running it.
+    
+    Expected request body: as for /execute ("algorithm") or /compare
+    ("algorithms"), JSON or binary input.
+    
+    Returns:
+        JSON plan (features, complexity, estimated comparisons, history
+        states, seconds, memory and response bytes, decision, route and the
+        options the request would run with); for "algorithms", a mapping of
+        key to plan under "plans"
+    """
+    upload = []
+    try:
+        request_data, upload = read_request(request)
+        if not request_data:
+            return jsonify({'error': 'Invalid request format'}), 400
+        
+        data = backend_input(upload)
+        algorithms = request_data.get('algorithms') or [request_data.get('algorithm')]
+        if not all(algorithms):
+            return jsonify({'error': 'Algorithm key is required'}), 400
+        
+        unknown = [key for key in algorithms if key not in ALGORITHMS]
+        if unknown:
+            return jsonify({'error': f"Algorithm '{unknown[0]}' not found in registry"}), 404
+        
+        features = input_features(data)
+        options = request_data.get('options', {})
+        plans = {}
+        for algorithm_key in algorithms:
+            algorithm_options = options.get(algorithm_key, {}) if 'algorithms' in request_data else options
+            plans[algorithm_key] = PLANNER.plan(algorithm_key, data, convert_options(algorithm_options),
+                                                features).to_dict()
+        
+        if 'algorithms' in request_data:
+            return jsonify({'plans': plans})
+        return jsonify(plans[algorithms[0]])
+    
+    except UploadError as e:
+        return jsonify({'error': str(e)}), e.status
+    
+    except ImportError as e:
+        return jsonify({'error': str(e)}), 404
+    
+    except Exception as e:
+        if DEBUG:
+            return jsonify({
+                'error': str(e),
+                'traceback': traceback.format_exc()
+            }), 500
+        
+        return jsonify({'error': 'Internal server error'}), 500
+    
+    finally:
+        release_input(upload)
+
+@app.route('/benchmark', methods=['POST'])
+def benchmark_algorithms() -> Response:
+    """
+    Measure how algorithms scale over a size sweep of generated datasets.
+    
+    Expected request body:
+    {
+        "algorithms": ["algorithm-key-1", ...],
+        "dataset": {                            // utils.data_generators.generate_dataset spec
+            "type": "random",
+            "options": {"minVal": 1, "maxVal": 1000, "seed": 0}
+        },
+        "sizes": [100, 200, 400],               // or
+        "sweep": {"start": 100, "stop": 3200, "factor": 2},
+        "repeats": 1,                           // optional, timed runs per point (median)
+        "options": {"algorithm-key-1": {...}},  // optional
+        "timeout": 60,                          // optional, seconds per run
+        "limits": {...}                         // optional, as for /execute
+    }
+    
+    Datasets are generated in the workers and points run on the batch pool.
+    
+    Returns:
+        JSON with per-algorithm points (operation counts and times per size)
+        and fits {"exponent", "constant", "r2"} of value = constant * n^exponent
+    """
+    request_data = request.get_json(silent=True)
+    if not request_data:
+        return jsonify({'error': 'Invalid request format'}), 400
+    
+    algorithms = list(dict.fromkeys(request_data.get('algorithms', [])))
+    if not algorithms:
+        return jsonify({'error': 'At least one algorithm is required'}), 400
+    unknown = [key for key in algorithms if key not in ALGORITHMS]
+    if unknown:
+        return jsonify({'error': f"Algorithm '{unknown[0]}' not found in registry"}), 404
+    telemetry.set_request_algorithm(algorithms[0] if len(algorithms) == 1 else 'multiple')
+    
+    try:
+        sweep = request_data.get('sweep', {})
+        sizes = sweep_sizes(request_data.get('sizes'), int(sweep.get('start', 0)), int(sweep.get('stop', 0)),
+                            float(sweep.get('factor', 2)))
+        repeats = int(request_data.get('repeats', 1))
+        timeout = float(request_data.get('timeout', COMPARE_TIMEOUT))
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+    if len(algorithms) * len(sizes) > BENCHMARK_MAX_POINTS:
+        return jsonify({'error': f"{len(algorithms) * len(sizes)} points exceed the "
+                                 f"{BENCHMARK_MAX_POINTS} point limit"}), 400
+    
+    dataset = request_data.get('dataset', {})
+    dataset = {'type': dataset.get('type', 'random'), 'options': convert_options(dataset.get('options', {}))}
+    try:
+        # Reject unknown generators here rather than once per point
+        generate_dataset(dataset['type'], 1, **dataset['options'])
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': f"Invalid dataset: {e}"}), 400
+    options_map = {key: convert_options(request_data.get('options', {}).get(key, {})) for key in algorithms}
+    
+    try:
+        results = run_benchmark(BATCH_BACKEND, algorithms, dataset, sizes, options_map, repeats, timeout,
+                                convert_options(request_data.get('limits', {})))
+    except Exception as e:
+        if DEBUG:
+            return jsonify({
+                'error': str(e),
+                'traceback': traceback.format_exc()
+            }), 500
+        
+        return jsonify({'error': 'Internal server error'}), 500
+    
+    for key, result in results.items():
+        for point in result['points']:
+            if 'error' not in point:
+                telemetry.observe_run('/benchmark', key, point['size'], 0, point['execution_time'])
+    
+    return jsonify({'dataset': dataset, 'sizes': sizes, 'repeats': repeats, 'results': results})
+
+@app.route('/runs', methods=['POST'])
+def create_run() -> Response:
+    """
+    Execute an algorithm and store its history server-side.
+    
+    Expected request body: as for /execute (JSON or binary input). The
+    history is written to the run store as it is recorded instead of being
+    returned, so runs of millions of steps can be paged through afterwards.
+    
+    Returns:
+        201 with the run summary (including its "id"); the summary's status is
+        "failed" with an error when the run raised or exceeded its limits
+    """
+    upload = []
+    try:
+        request_data, upload = read_request(request)
+        if not request_data:
+            return jsonify({'error': 'Invalid request format'}), 400
+        
+        algorithm_key = request_data.get('algorithm')
+        if not algorithm_key:
+            return jsonify({'error': 'Algorithm key is required'}), 400
+        
+        if algorithm_key not in ALGORITHMS:
+            return jsonify({'error': f"Algorithm '{algorithm_key}' not found in registry"}), 404
+        telemetry.set_request_algorithm(algorithm_key)
+        
+        data = backend_input(upload)
+        run_id = RUN_STORE.create(algorithm_key, input_length(data))
+        try:
+            summary = BACKEND.submit(run_recorded, RUN_STORE.path, run_id, algorithm_key, data,
+                                     convert_options(request_data.get('options', {})),
+                                     convert_options(request_data.get('limits', {}))).result()
+        except Exception as e:
+            # The worker failed before the run stored its outcome (e.g. a broken pool)
+            RUN_STORE.fail(run_id, f"{type(e).__name__}: {str(e)}")
+            summary = {'status': 'failed'}
+        if summary['status'] == 'complete':
+            telemetry.observe_run('/runs', algorithm_key, input_length(data), summary['steps'],
+                                  summary['metrics'].get('execution_time', 0))
+        
+        return jsonify(RUN_STORE.summary(run_id)), 201
+    
+    except UploadError as e:
+        return jsonify({'error': str(e)}), e.status
+    
+    except Exception as e:
+        if DEBUG:
+            return jsonify({
+                'error': str(e),
+                'traceback': traceback.format_exc()
+            }), 500
+        
+        return jsonify({'error': 'Internal server error'}), 500
+    
+    finally:
+        release_input(upload)
+
+@app.route('/runs/<run_id>/summary', methods=['GET'])
+def run_summary(run_id: str) -> Response:
+    """
+    Get a stored run's status, step count, result and metrics.
+    
+    Returns:
+        JSON summary, or 404 for unknown runs
+    """
+    summary = RUN_STORE.summary(run_id)
+    if summary is None:
+        return jsonify({'error': f"Run '{run_id}' not found"}), 404
+    return jsonify(summary)
+
+@app.route('/runs/<run_id>/steps', methods=['GET'])
+def run_steps(run_id: str) -> Response:
+    """
+    Page through a stored run's states.
+    
+    Query parameters:
+        from    First step (default 0)
+        to      Step after the last one (default and cap: from + MAX_PAGE)
+    
+    Returns:
+        JSON {"id", "from", "to", "total", "next", "steps": [{"step", "state"}]}
+        where "next" is the "from" of the following page (null at the end),
+        400 for invalid ranges, or 404 for unknown runs
+    """
+    summary = RUN_STORE.summary(run_id)
+    if summary is None:
+        return jsonify({'error': f"Run '{run_id}' not found"}), 404
+    
+    try:
+        start = int(request.args.get('from', 0))
+        stop = int(request.args.get('to', start + MAX_PAGE))
+    except ValueError:
+        return jsonify({'error': "'from' and 'to' must be integers"}), 400
+    if start < 0 or stop < start:
+        return jsonify({'error': "Expected 0 <= from <= to"}), 400
+    
+    total = summary['steps']
+    stop = min(stop, start + MAX_PAGE, total)
+    start = min(start, stop)
+    response = jsonify({
+        'id': run_id,
+        'from': start,
+        'to': stop,
+        'total': total,
+        'next': stop if stop < total else None,
+        'steps': RUN_STORE.steps(run_id, start, stop)
+    })
+    if summary['status'] != 'running':
+        # Finished runs never change
+        response.headers['Cache-Control'] = 'private, max-age=3600'
+    return response
+
+@app.route('/runs/<run_id>', methods=['DELETE'])
+def delete_run(run_id: str) -> Response:
+    """
+    Delete a stored run.
+    
+    Returns:
+        204, or 404 for unknown runs
+    """
+    if not RUN_STORE.delete(run_id):
+        return jsonify({'error': f"Run '{run_id}' not found"}), 404
+    return Response(status=204)
+
+@app.route('/jobs', methods=['POST'])
+def create_job() -> Response:
+    """
+    Queue an algorithm run and return immediately.
+    
+    Expected request body: as for /execute (JSON or binary input), plus
+    {
+        "priority": 0                           // optional, higher runs first
+    }
+    
+    The run executes into the run store; once complete its states are paged
+    through /runs/<run_id>/steps.
+    
+    Returns:
+        202 with the job description and a Location header, or 429 with a
+        Retry-After header when the queue is full
+    """
+    upload = []
+    try:
+        request_data, upload = read_request(request)
+        if not request_data:
+            return jsonify({'error': 'Invalid request format'}), 400
+        
+        algorithm_key = request_data.get('algorithm')
+        if not algorithm_key:
+            return jsonify({'error': 'Algorithm key is required'}), 400
+        
+        if algorithm_key not in ALGORITHMS:
+            return jsonify({'error': f"Algorithm '{algorithm_key}' not found in registry"}), 404
+        telemetry.set_request_algorithm(algorithm_key)
+        
+        try:
+            priority = int(request_data.get('priority', 0))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'Priority must be an integer'}), 400
+        
+        # The job owns the input from here on
+        job = JOBS.submit(algorithm_key, upload, convert_options(request_data.get('options', {})),
+                          convert_options(request_data.get('limits', {})), priority)
+        upload = []
+        
+        response = jsonify(JOBS.get(job.id) or job.to_dict())
+        response.status_code = 202
+        response.headers['Location'] = f'/jobs/{job.id}'
+        return response
+    
+    except QueueFull as e:
+        response = jsonify({'error': str(e), 'retry_after': e.retry_after, 'queued': e.queued})
+        response.status_code = 429
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response
+    
+    except UploadError as e:
+        return jsonify({'error': str(e)}), e.status
+    
+    except Exception as e:
+        if DEBUG:
+            return jsonify({
+                'error': str(e),
+                'traceback': traceback.format_exc()
+            }), 500
+        
+        return jsonify({'error': 'Internal server error'}), 500
+    
+    finally:
+        release_input(upload)
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id: str) -> Response:
+    """
+    Get a job's status, queue position, queue wait and run time.
+    
+    Finished jobs include the summary of their stored run under "run".
+    
+    Returns:
+        JSON job description, or 404 for unknown jobs
+    """
+    job = JOBS.get(job_id)
+    if job is None:
+        return jsonify({'error': f"Job '{job_id}' not found"}), 404
+    if job['status'] in ('complete', 'failed') and job['run_id']:
+        job['run'] = RUN_STORE.summary(job['run_id'])
+    return jsonify(job)
+
+@app.route('/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id: str) -> Response:
+    """
+    Cancel a queued job, or forget a finished one (its stored run is kept).
+    
+    Returns:
+        JSON job description, 404 for unknown jobs, or 409 if it is running
+    """
+    try:
+        job = JOBS.cancel(job_id)
+    except RuntimeError as e:
+        return jsonify({'error': str(e)}), 409
+    if job is None:
+        return jsonify({'error': f"Job '{job_id}' not found"}), 404
+    return jsonify(job)
 
 # ------- Server Initialization -------
 
 if __name__ == '__main__':
+    # Skip the pool in the debug reloader's watcher process
+    if not DEBUG or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        BACKEND.start(prestart=PRELOAD_ALGORITHMS)
+        # WebSocket live stepping on its own port (see live.py)
+        live.serve_in_thread(HOST, live.LIVE_PORT, LIVE_BACKEND)
+    
     print(f"Starting Python bridge server on http://{HOST}:{PORT}")
     print(f"Available algorithms: {', '.join(ALGORITHM_REGISTRY.keys())}")
     app.run(host=HOST, port=PORT, debug=DEBUG)
\ No newline at end of file
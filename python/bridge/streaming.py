@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Streaming History Delivery for the Bridge Server
+
+``/execute`` builds the whole history before serializing it, so the first
+frame arrives only after the run and its serialization finish, and the
+server holds every state twice. This module streams states while the run
+produces them:
+
+1. The run executes in a worker with a ``history_sink``: each recorded state
+   is serialized and written to a pipe, and the algorithm keeps no history
+2. The request handler relays pipe messages to the client as NDJSON lines or
+   Server-Sent Events, optionally as diffs against the previous state
+3. Flow control is end to end: a slow client stops reading, the response
+   write blocks, the pipe fills, and the worker blocks inside record_state.
+   A worker blocked longer than the stall timeout abandons the run
+
+Each message has a type: "state" (full state), "delta" (diff against the
+previous state, with a full state every FULL_STATE_INTERVAL steps), "result"
+(final result and metrics) or "error".
+
+Streams run on their own pool so that slow consumers cannot starve /execute.
+
+Configuration (environment variables):
+    BRIDGE_STREAM_WORKERS         Pool size for streamed runs (default 4)
+    BRIDGE_STREAM_STALL_TIMEOUT   Seconds a worker waits on a stalled client (default 30)
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import select
+import struct
+import threading
+import multiprocessing
+from concurrent.futures import Future
+from typing import Dict, Any, List, Optional, Iterator, Tuple, Callable
+
+from python.bridge.executor import (
+    ExecutionBackend, START_METHOD, WORKER_CPU_SECONDS,
+    _cpu_limit, _create_algorithm, _dumps, serialize_algorithm_state
+)
+from python.bridge.serialization import FULL_STATE_INTERVAL, calculate_state_difference
+from python.core.budget import BudgetExceeded
+
+STREAM_WORKERS = int(os.environ.get('BRIDGE_STREAM_WORKERS', 4))
+STREAM_STALL_TIMEOUT = float(os.environ.get('BRIDGE_STREAM_STALL_TIMEOUT', 30))
+
+# How often the relay checks whether the producer died without a final message
+POLL_INTERVAL = 0.25
+
+# Largest single write to the pipe; each chunk waits on select() separately
+WRITE_CHUNK = 65536
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+SSE_MIMETYPE = 'text/event-stream'
+
+
+def _send(conn: Any, kind: str, message: Dict[str, Any], stall_timeout: float) -> None:
+    """
+    Write one typed message to the pipe.
+
+    The message is framed like ``Connection.send_bytes`` so the reader can
+    use ``recv_bytes``, but it is written in chunks of at most WRITE_CHUNK
+    bytes to a non-blocking descriptor, each chunk gated by select(): a
+    large state cannot block the worker past the stall timeout.
+
+    Raises:
+        TimeoutError: If the pipe accepted nothing for ``stall_timeout`` seconds
+    """
+    payload = kind.encode('ascii') + b' ' + _dumps(message)
+    size = len(payload)
+    header = struct.pack('!i', size) if size <= 0x7fffffff else struct.pack('!iQ', -1, size)
+    fd = conn.fileno()
+    for part in (memoryview(header), memoryview(payload)):
+        while part:
+            if not select.select([], [fd], [], stall_timeout)[1]:
+                raise TimeoutError(f"Client stalled for {stall_timeout}s")
+            try:
+                part = part[os.write(fd, part[:WRITE_CHUNK]):]
+            except BlockingIOError:
+                continue
+
+
+def run_stream(algorithm_key: str, data: List[Any], options: Dict[str, Any], conn: Any,
+               delta: bool = False, limits: Optional[Dict[str, Any]] = None,
+               stall_timeout: float = STREAM_STALL_TIMEOUT) -> Tuple[int, Optional[float]]:
+    """
+    Execute one algorithm, writing each state to ``conn`` as it is recorded.
+
+    Module-level so that it can be pickled for the process pool. Failures
+    are reported as "error" messages; a consumer that went away ends the run.
+
+    Args:
+        algorithm_key: Registry key
+        data: Input array
+        options: Python-style algorithm options
+        conn: Write end of a pipe
+        delta: Send diffs against the previous state
+        limits: Per-request limits (deadline, max_comparisons, ...)
+        stall_timeout: Seconds to wait for a full pipe to drain
+
+    Returns:
+        Tuple of (states recorded, execution time or None if the run failed)
+    """
+    previous: List[Optional[Dict[str, Any]]] = [None]
+    os.set_blocking(conn.fileno(), False)
+
+    def sink(step: int, state: Dict[str, Any]) -> None:
+        state = serialize_algorithm_state(state)
+        if delta and previous[0] is not None and step % FULL_STATE_INTERVAL:
+            _send(conn, 'delta', {'step': step, 'diff': calculate_state_difference(state, previous[0])},
+                  stall_timeout)
+        else:
+            _send(conn, 'state', {'step': step, 'state': state}, stall_timeout)
+        previous[0] = state
+
+    steps, execution_time = 0, None
+    try:
+        algorithm = _create_algorithm(algorithm_key, dict(options, record_history=True, history_sink=sink),
+                                      limits)
+        try:
+            with _cpu_limit(WORKER_CPU_SECONDS):
+                result = algorithm.execute(data)
+        finally:
+            steps = len(algorithm.history)
+
+        _send(conn, 'result', {
+            'result': result,
+            'metrics': serialize_algorithm_state(algorithm.metrics),
+            'history_states': steps
+        }, stall_timeout)
+        execution_time = algorithm.metrics['execution_time']
+
+    except (BrokenPipeError, ConnectionResetError, TimeoutError):
+        # The consumer disconnected or stopped reading
+        pass
+
+    except Exception as e:
+        error = {'error': f"{type(e).__name__}: {str(e)}"}
+        if isinstance(e, BudgetExceeded):
+            error['budget_exceeded'] = e.to_dict()
+        try:
+            _send(conn, 'error', error, stall_timeout)
+        except (OSError, TimeoutError):
+            pass
+
+    finally:
+        conn.close()
+
+    return steps, execution_time
+
+
+def _start_thread(fn, *args) -> Future:
+    """Run a producer on a daemon thread (inline backends cannot block the caller)."""
+    future = Future()
+
+    def target():
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=target, daemon=True).start()
+    return future
+
+
+def stream_run(backend: ExecutionBackend, algorithm_key: str, data: List[Any], options: Dict[str, Any],
+               delta: bool = False, limits: Optional[Dict[str, Any]] = None,
+               stall_timeout: float = STREAM_STALL_TIMEOUT,
+               on_complete: Optional[Callable[[int, float], None]] = None) -> Iterator[Tuple[str, bytes]]:
+    """
+    Start a streamed run and relay its messages as they arrive.
+
+    Closing the iterator (e.g. the client disconnected) closes the read end
+    of the pipe, which stops the run at its next recorded state.
+
+    Args:
+        backend: Backend whose pool runs the producer
+        algorithm_key: Registry key
+        data: Input array
+        options: Python-style algorithm options
+        delta: Send diffs against the previous state
+        limits: Per-request limits
+        stall_timeout: Seconds the producer waits on a stalled consumer
+        on_complete: Called with (states, execution time) after a successful run
+
+    Returns:
+        Iterator of (message type, JSON body) pairs
+    """
+    reader, writer = multiprocessing.get_context(START_METHOD).Pipe(duplex=False)
+    args = (algorithm_key, data, options, writer, delta, limits, stall_timeout)
+    # The producer owns the write end and closes it when it stops. An inline
+    # producer thread shares this process's descriptor, so closing it here
+    # could hand the fd number to another stream while the thread still
+    # writes to it; the pool pickles its own copy
+    inline = backend.mode == 'inline'
+    if inline:
+        future = _start_thread(run_stream, *args)
+    else:
+        future = backend.submit(run_stream, *args)
+
+    try:
+        while True:
+            if reader.poll(POLL_INTERVAL):
+                kind, _, body = reader.recv_bytes().partition(b' ')
+                yield kind.decode('ascii'), body
+                if kind == b'result' and on_complete is not None:
+                    steps, execution_time = future.result()
+                    if execution_time is not None:
+                        on_complete(steps, execution_time)
+                if kind in (b'result', b'error'):
+                    return
+            elif future.done():
+                # The producer ended without a final message (e.g. a killed worker).
+                # With no write end left open, a message it died writing raises
+                # EOFError instead of blocking the drain
+                if not inline:
+                    writer.close()
+                try:
+                    while reader.poll():
+                        kind, _, body = reader.recv_bytes().partition(b' ')
+                        yield kind.decode('ascii'), body
+                except EOFError:
+                    pass
+                error = future.exception() or RuntimeError("Stream ended without a result")
+                yield 'error', _dumps({'error': f"{type(error).__name__}: {str(error)}"})
+                return
+    finally:
+        # Closing the read end makes the producer's next write fail, which ends the run
+        reader.close()
+        if not inline:
+            writer.close()
+
+
+def format_ndjson(kind: str, body: bytes) -> bytes:
+    """Frame a message as one NDJSON line ({"type": ..., ...})."""
+    return b'{"type":"' + kind.encode('ascii') + b'",' + body[1:] + b'\n'
+
+
+def format_sse(kind: str, body: bytes) -> bytes:
+    """Frame a message as a Server-Sent Event named after its type."""
+    return b'event: ' + kind.encode('ascii') + b'\ndata: ' + body + b'\n\n'
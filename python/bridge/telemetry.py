@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Prometheus Metrics Exporter for the Bridge Server
+
+This module instruments the Flask bridge with Prometheus metrics and exposes
+them on a ``/metrics`` endpoint:
+
+- bridge_request_latency_seconds      Request latency by endpoint and algorithm
+- bridge_algorithm_run_seconds        Algorithm execution time by endpoint and algorithm
+- bridge_input_size_elements          Input sizes by endpoint and algorithm
+- bridge_history_states               Recorded history states by algorithm
+- bridge_response_bytes               Serialized response size by endpoint
+- bridge_requests_in_flight           Requests currently being served by endpoint
+- bridge_request_errors_total         Error responses by endpoint, algorithm and status
+- bridge_cache_lookups_total          Result cache lookups by endpoint and result
+- bridge_job_queue_wait_seconds       Time jobs waited in the queue before running
+- bridge_jobs_queued                  Jobs currently waiting in the queue
+
+Labels are bounded: endpoints use the matched URL rule and algorithms are only
+labelled once the key resolved in the registry ("unknown" otherwise), so
+arbitrary client input cannot create new time series.
+
+``prometheus-client`` is optional. Without it every hook is a no-op and
+``/metrics`` answers 501. Cache lookups also feed the rolling figures of
+``/health`` (see health.py), which do not depend on it.
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import time
+from typing import Optional, Any
+
+from python.bridge import health
+
+try:
+    from prometheus_client import (
+        CollectorRegistry, Counter, Gauge, Histogram,
+        generate_latest, CONTENT_TYPE_LATEST
+    )
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+UNKNOWN_ALGORITHM = "unknown"
+
+# Bucket boundaries sized for sorting workloads (sub-millisecond to minutes)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+SIZE_BUCKETS = (1, 10, 100, 1000, 5000, 10000, 50000, 100000, 500000, 1000000, 5000000)
+STATE_BUCKETS = (0, 10, 100, 1000, 10000, 50000, 100000, 500000, 1000000)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304,
+                 16777216, 67108864, 268435456)
+
+if PROMETHEUS_AVAILABLE:
+    # Dedicated registry so that only bridge metrics are exported
+    REGISTRY = CollectorRegistry()
+
+    REQUEST_LATENCY = Histogram(
+        "bridge_request_latency_seconds", "Request latency",
+        ["endpoint", "algorithm"], buckets=LATENCY_BUCKETS, registry=REGISTRY
+    )
+    RUN_LATENCY = Histogram(
+        "bridge_algorithm_run_seconds", "Algorithm execution time",
+        ["endpoint", "algorithm"], buckets=LATENCY_BUCKETS, registry=REGISTRY
+    )
+    INPUT_SIZE = Histogram(
+        "bridge_input_size_elements", "Input array size",
+        ["endpoint", "algorithm"], buckets=SIZE_BUCKETS, registry=REGISTRY
+    )
+    HISTORY_STATES = Histogram(
+        "bridge_history_states", "Recorded history states per run",
+        ["algorithm"], buckets=STATE_BUCKETS, registry=REGISTRY
+    )
+    RESPONSE_BYTES = Histogram(
+        "bridge_response_bytes", "Serialized response size",
+        ["endpoint"], buckets=BYTES_BUCKETS, registry=REGISTRY
+    )
+    IN_FLIGHT = Gauge(
+        "bridge_requests_in_flight", "Requests currently being served",
+        ["endpoint"], registry=REGISTRY
+    )
+    ERRORS = Counter(
+        "bridge_request_errors_total", "Error responses",
+        ["endpoint", "algorithm", "status"], registry=REGISTRY
+    )
+    CACHE_LOOKUPS = Counter(
+        "bridge_cache_lookups_total", "Result cache lookups",
+        ["endpoint", "result"], registry=REGISTRY
+    )
+    JOB_QUEUE_WAIT = Histogram(
+        "bridge_job_queue_wait_seconds", "Time jobs waited in the queue",
+        buckets=LATENCY_BUCKETS, registry=REGISTRY
+    )
+    JOBS_QUEUED = Gauge(
+        "bridge_jobs_queued", "Jobs waiting in the queue", registry=REGISTRY
+    )
+
+
+def _endpoint_label(request: Any) -> str:
+    """Get a bounded endpoint label for the current request."""
+    rule = request.url_rule
+    return rule.rule if rule is not None else "unmatched"
+
+
+def set_request_algorithm(algorithm_key: str) -> None:
+    """
+    Label the current request with a resolved algorithm key.
+
+    Call only after the key was found in the registry.
+
+    Args:
+        algorithm_key: Registry key of the algorithm
+    """
+    from flask import g
+    g.telemetry_algorithm = algorithm_key
+
+
+def observe_run(endpoint: str, algorithm_key: str, input_size: int,
+                history_states: int, seconds: float) -> None:
+    """
+    Record one algorithm execution.
+
+    Args:
+        endpoint: Endpoint that ran the algorithm (e.g. "/execute")
+        algorithm_key: Registry key of the algorithm
+        input_size: Number of input elements
+        history_states: Number of recorded history states
+        seconds: Execution time in seconds
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    RUN_LATENCY.labels(endpoint, algorithm_key).observe(seconds)
+    INPUT_SIZE.labels(endpoint, algorithm_key).observe(input_size)
+    HISTORY_STATES.labels(algorithm_key).observe(history_states)
+
+
+def observe_cache(endpoint: str, hit: bool) -> None:
+    """
+    Record one result cache lookup.
+
+    Args:
+        endpoint: Endpoint that looked up the result (e.g. "/execute")
+        hit: Whether the result was served from the cache
+    """
+    health.MONITOR.observe_cache(endpoint, hit)
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    CACHE_LOOKUPS.labels(endpoint, "hit" if hit else "miss").inc()
+
+
+def observe_job(queue_wait: float, queued: int) -> None:
+    """
+    Record a job leaving the queue.
+
+    Args:
+        queue_wait: Seconds the job waited before running
+        queued: Jobs still waiting
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    JOB_QUEUE_WAIT.observe(queue_wait)
+    JOBS_QUEUED.set(queued)
+
+
+def set_jobs_queued(queued: int) -> None:
+    """
+    Record the current queue depth.
+
+    Args:
+        queued: Jobs waiting in the queue
+    """
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    JOBS_QUEUED.set(queued)
+
+
+def init_app(app: Any) -> None:
+    """
+    Register request hooks and the /metrics endpoint on a Flask app.
+
+    Args:
+        app: Flask application
+    """
+    from flask import g, request, Response
+
+    @app.route('/metrics', methods=['GET'])
+    def metrics() -> Response:
+        """
+        Prometheus scrape endpoint.
+
+        Returns:
+            Metrics in the Prometheus text exposition format
+        """
+        if not PROMETHEUS_AVAILABLE:
+            return Response("prometheus-client is not installed\n", status=501, mimetype="text/plain")
+        return Response(generate_latest(REGISTRY), mimetype=CONTENT_TYPE_LATEST)
+
+    if not PROMETHEUS_AVAILABLE:
+        return
+
+    @app.before_request
+    def start_request_timer() -> None:
+        endpoint = _endpoint_label(request)
+        g.telemetry_endpoint = endpoint
+        g.telemetry_start = time.perf_counter()
+        IN_FLIGHT.labels(endpoint).inc()
+
+    @app.after_request
+    def record_request(response: Response) -> Response:
+        endpoint = g.get("telemetry_endpoint")
+        if endpoint is None:
+            return response
+
+        algorithm = g.get("telemetry_algorithm", UNKNOWN_ALGORITHM)
+        REQUEST_LATENCY.labels(endpoint, algorithm).observe(time.perf_counter() - g.telemetry_start)
+
+        # Streamed responses have no length up front
+        length = response.calculate_content_length() if not response.is_streamed else None
+        if length is not None:
+            RESPONSE_BYTES.labels(endpoint).observe(length)
+
+        if response.status_code >= 400:
+            ERRORS.labels(endpoint, algorithm, str(response.status_code)).inc()
+
+        return response
+
+    @app.teardown_request
+    def finish_request(exception: Optional[BaseException] = None) -> None:
+        endpoint = g.pop("telemetry_endpoint", None)
+        if endpoint is None:
+            return
+
+        IN_FLIGHT.labels(endpoint).dec()
+        if exception is not None:
+            ERRORS.labels(endpoint, g.get("telemetry_algorithm", UNKNOWN_ALGORITHM), "500").inc()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Binary Request Bodies for the Bridge Server
+
+A JSON ``data`` list of millions of elements costs a full JSON parse into
+boxed integers before any sorting starts. /execute and /compare also accept
+binary inputs that are read straight into a shared-memory segment, in
+chunks, without per-element parsing in the server process:
+
+- ``application/octet-stream``: the body is the array. Request fields
+  (algorithm, options, ...) come as JSON in the ``X-Request`` header or the
+  ``request`` query parameter
+- ``multipart/form-data``: a ``request`` field with the JSON fields and a
+  ``data`` file part with the array
+
+The array is either a wire column (``wire.encode_array``: 12-byte header
+with typecode and length, then the values) or raw little-endian values
+described by the ``dtype`` ("int32", "int64", "float32" or "float64") and
+optional ``length`` request fields. Workers receive an InputRef and read the
+segment directly.
+
+A JSON ``data`` object instead of a list is a dataset spec, served from the
+shared dataset cache (see datasets.py).
+
+Configuration (environment variables):
+    BRIDGE_MAX_UPLOAD_MB   Largest accepted binary input in MiB (default 1024)
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import json
+import array
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+from python.bridge import datasets
+from python.bridge.executor import InputRef, SharedInput
+from python.bridge.wire import COLUMN_HEADER, WIRE_MAGIC, WIRE_VERSION
+
+BINARY_MIMETYPE = 'application/octet-stream'
+MULTIPART_MIMETYPE = 'multipart/form-data'
+
+DTYPES = {'int32': 'i', 'int64': 'q', 'float32': 'f', 'float64': 'd'}
+MAX_UPLOAD_BYTES = int(float(os.environ.get('BRIDGE_MAX_UPLOAD_MB', 1024)) * 1024 * 1024)
+UPLOAD_CHUNK = 1024 * 1024
+
+
+class UploadError(ValueError):
+    """
+    Invalid binary request body.
+
+    Attributes:
+        status (int): HTTP status to answer with
+    """
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+def _read_exact(stream: Any, size: int) -> bytes:
+    """Read up to ``size`` bytes, stopping early only at the end of the stream."""
+    chunks, remaining = [], size
+    while remaining:
+        chunk = stream.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+def _readinto(stream: Any, view: memoryview) -> int:
+    """Fill ``view`` from the stream, without an intermediate copy where supported."""
+    if hasattr(stream, 'readinto'):
+        return stream.readinto(view) or 0
+    chunk = stream.read(len(view))
+    view[:len(chunk)] = chunk
+    return len(chunk)
+
+
+def _stream_size(stream: Any) -> Optional[int]:
+    """Get the bytes remaining in a seekable stream (None if not seekable)."""
+    try:
+        position = stream.tell()
+        end = stream.seek(0, os.SEEK_END)
+        stream.seek(position)
+        return end - position
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def receive_binary(stream: Any, size: Optional[int], dtype: Optional[str] = None,
+                   length: Optional[int] = None) -> SharedInput:
+    """
+    Read a binary array into shared memory chunk by chunk.
+
+    Args:
+        stream: Body stream
+        size: Body size in bytes, if known
+        dtype: Element type of a raw body (ignored for wire columns)
+        length: Number of elements of a raw body (default: size / itemsize)
+
+    Returns:
+        SharedInput holding the array (the caller closes it)
+
+    Raises:
+        UploadError: If the body is malformed, too large or of unknown size
+    """
+    head = _read_exact(stream, COLUMN_HEADER.size)
+    if len(head) == COLUMN_HEADER.size and head.startswith(WIRE_MAGIC):
+        _, version, typecode, length = COLUMN_HEADER.unpack(head)
+        typecode = typecode.decode('ascii')
+        if version != WIRE_VERSION or typecode not in DTYPES.values():
+            raise UploadError(f"Unsupported wire column (version {version}, typecode '{typecode}')")
+        prefix = b''
+    else:
+        if dtype not in DTYPES:
+            raise UploadError(f"A dtype ({', '.join(DTYPES)}) is required for raw binary data")
+        typecode = DTYPES[dtype]
+        prefix = head
+        if length is None:
+            if size is None:
+                raise UploadError("Content-Length or a length field is required", 411)
+            if size % array.array(typecode).itemsize:
+                raise UploadError(f"Body size {size} is not a multiple of the {dtype} item size")
+            length = size // array.array(typecode).itemsize
+
+    length = int(length)
+    nbytes = length * array.array(typecode).itemsize
+    if length < 0 or nbytes > MAX_UPLOAD_BYTES:
+        raise UploadError(f"Binary input of {nbytes} bytes exceeds the {MAX_UPLOAD_BYTES} byte limit", 413)
+    if len(prefix) > nbytes:
+        raise UploadError("Body is longer than the declared length")
+
+    shared = SharedInput.allocate(typecode, length)
+    try:
+        with shared.buffer as view:
+            view[:len(prefix)] = prefix
+            offset = len(prefix)
+            while offset < nbytes:
+                received = _readinto(stream, view[offset:offset + UPLOAD_CHUNK])
+                if not received:
+                    raise UploadError(f"Body ended after {offset} of {nbytes} bytes")
+                offset += received
+        if stream.read(1):
+            raise UploadError("Body is longer than the declared length")
+    except BaseException:
+        shared.close()
+        raise
+    return shared
+
+
+def _fields(raw: Optional[str]) -> Dict[str, Any]:
+    """Parse the JSON request fields that accompany a binary body."""
+    if not raw:
+        return {}
+    try:
+        fields = json.loads(raw)
+    except ValueError as e:
+        raise UploadError(f"Request fields are not valid JSON: {e}")
+    if not isinstance(fields, dict):
+        raise UploadError("Request fields must be a JSON object")
+    return fields
+
+
+def read_request(request: Any) -> Tuple[Optional[Dict[str, Any]], Union[List[Any], SharedInput]]:
+    """
+    Parse a JSON, octet-stream or multipart request body.
+
+    Args:
+        request: Flask request
+
+    Returns:
+        Tuple of (request fields or None if the body is invalid, input data);
+        binary inputs come back as a SharedInput, dataset specs as a
+        DatasetLease (a read-only SharedInput)
+
+    Raises:
+        UploadError: If a binary body or dataset spec is malformed
+    """
+    if request.mimetype == BINARY_MIMETYPE:
+        fields = _fields(request.headers.get('X-Request') or request.args.get('request'))
+        return fields, receive_binary(request.stream, request.content_length,
+                                      fields.get('dtype'), fields.get('length'))
+
+    if request.mimetype == MULTIPART_MIMETYPE:
+        fields = _fields(request.form.get('request'))
+        upload = request.files.get('data')
+        if upload is None:
+            raise UploadError("Multipart requests need a 'data' file part")
+        return fields, receive_binary(upload.stream, _stream_size(upload.stream),
+                                      fields.get('dtype'), fields.get('length'))
+
+    fields = request.get_json(silent=True)
+    if not isinstance(fields, dict):
+        return None, []
+    data = fields.get('data', [])
+    if isinstance(data, dict):
+        try:
+            return fields, datasets.DATASETS.lease(data)
+        except ValueError as e:
+            raise UploadError(f"Invalid dataset spec: {e}")
+    return fields, data
+
+
+def backend_input(data: Union[List[Any], SharedInput]) -> Union[List[Any], InputRef]:
+    """Get what to hand to the backend for an input from read_request."""
+    return data.ref if isinstance(data, SharedInput) else data
+
+
+def release_input(data: Union[List[Any], SharedInput]) -> None:
+    """Release the shared memory of an input from read_request (no-op for lists)."""
+    if isinstance(data, SharedInput):
+        data.close()
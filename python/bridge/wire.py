@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Binary Wire Format for Algorithm Results and Histories
+
+JSON arrays of integers are several times larger than the values they carry
+and slow to parse in the browser. This module encodes /execute responses as
+typed columns that JavaScript can view without parsing (``Int32Array``,
+``BigInt64Array``, ``Float64Array`` over the response buffer):
+
+    Header (16 bytes, little-endian)
+        magic       4s  b"ASVW"
+        version     B   WIRE_VERSION
+        typecode    c   b"i" (int32), b"q" (int64) or b"d" (float64)
+        flags       H   FLAG_RESULT: the last record is the result
+        records     I   Number of array records
+        meta_len    I   Length of the JSON metadata block
+    Metadata        JSON {"metrics": {...}, "states": [state without "array", ...]}
+    Records, one per history state (then the result)
+        kind        B   RECORD_FULL or RECORD_OPS
+        (padding)   3x
+        count       I   Number of values (full) or changed positions (ops)
+        full:       values[count]
+        ops:        indices uint32[count], values[count] replacing the
+                    previous record's values at those indices
+
+A standalone array (``encode_array``) is a 12-byte column header (magic,
+version, typecode, count) followed by the values.
+
+Every block starts on an 8-byte boundary so typed-array views need no copy.
+A state is sent as ops when that is smaller than the full array.
+
+Arrays that are not homogeneous numbers (strings, objects, mixed types)
+cannot be encoded; callers fall back to JSON.
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import sys
+import json
+import array
+import struct
+from typing import Dict, Any, List, Optional, Tuple
+
+WIRE_MIMETYPE = 'application/vnd.algorithm-wire'
+WIRE_MAGIC = b'ASVW'
+WIRE_VERSION = 1
+
+RECORD_FULL = 0
+RECORD_OPS = 1
+FLAG_RESULT = 0x1
+
+HEADER = struct.Struct('<4sBcHII')
+RECORD_HEADER = struct.Struct('<B3xI')
+COLUMN_HEADER = struct.Struct('<4sBc2xI')
+ALIGNMENT = 8
+
+INT32_RANGE = (-2 ** 31, 2 ** 31 - 1)
+INT64_RANGE = (-2 ** 63, 2 ** 63 - 1)
+# Largest integer magnitude a float64 represents exactly
+FLOAT_EXACT = 2 ** 53
+
+
+class WireEncodingError(ValueError):
+    """Raised when values cannot be represented in the binary format."""
+    pass
+
+
+def _padding(length: int) -> bytes:
+    return b'\0' * (-length % ALIGNMENT)
+
+
+def column_typecode(values: List[Any]) -> Optional[str]:
+    """
+    Choose the narrowest column type for a list of values.
+
+    Args:
+        values: Values to encode
+
+    Returns:
+        "i" (int32), "q" (int64), "d" (float64), or None if the values are
+        not homogeneous numbers
+    """
+    if all(type(value) is int for value in values):
+        if not values:
+            return 'i'
+        low, high = min(values), max(values)
+        if INT32_RANGE[0] <= low and high <= INT32_RANGE[1]:
+            return 'i'
+        if INT64_RANGE[0] <= low and high <= INT64_RANGE[1]:
+            return 'q'
+        return None
+
+    if all(type(value) in (int, float) for value in values):
+        if any(type(value) is int and abs(value) > FLOAT_EXACT for value in values):
+            return None
+        return 'd'
+
+    return None
+
+
+def encode_column(values: List[Any], typecode: str) -> bytes:
+    """
+    Pack values as a little-endian typed column.
+
+    Raises:
+        WireEncodingError: If a value does not fit the column type
+    """
+    try:
+        column = array.array(typecode, values)
+    except (TypeError, OverflowError) as e:
+        raise WireEncodingError(f"Values do not fit column type '{typecode}': {e}")
+    if sys.byteorder != 'little':
+        column.byteswap()
+    return column.tobytes()
+
+
+def decode_column(data: bytes, typecode: str) -> List[Any]:
+    """Unpack a little-endian typed column."""
+    column = array.array(typecode)
+    column.frombytes(data)
+    if sys.byteorder != 'little':
+        column.byteswap()
+    return column.tolist()
+
+
+def encode_array(values: List[Any]) -> bytes:
+    """
+    Encode one array as a self-describing typed column.
+
+    Raises:
+        WireEncodingError: If the values are not homogeneous numbers
+    """
+    typecode = column_typecode(values)
+    if typecode is None:
+        raise WireEncodingError("Values are not homogeneous numbers")
+    return COLUMN_HEADER.pack(WIRE_MAGIC, WIRE_VERSION, typecode.encode('ascii'), len(values)) + \
+        encode_column(values, typecode)
+
+
+def decode_array(data: bytes) -> List[Any]:
+    """
+    Decode an array produced by encode_array.
+
+    Raises:
+        WireEncodingError: If the data is not a supported wire column
+    """
+    if len(data) < COLUMN_HEADER.size:
+        raise WireEncodingError("Column too short")
+    magic, version, typecode, count = COLUMN_HEADER.unpack_from(data)
+    if magic != WIRE_MAGIC or version != WIRE_VERSION:
+        raise WireEncodingError("Not a supported wire column")
+    return _read_column(data, COLUMN_HEADER.size, count, typecode.decode('ascii'))[0]
+
+
+def _record(previous: Optional[List[Any]], values: List[Any], typecode: str) -> bytes:
+    """Encode one array record, as ops against ``previous`` when smaller."""
+    itemsize = array.array(typecode).itemsize
+
+    if previous is not None and len(previous) == len(values):
+        changed = [index for index, (old, new) in enumerate(zip(previous, values)) if old != new]
+        if len(changed) * (4 + itemsize) < len(values) * itemsize:
+            indices = encode_column(changed, 'I')
+            column = encode_column([values[index] for index in changed], typecode)
+            return (RECORD_HEADER.pack(RECORD_OPS, len(changed))
+                    + indices + _padding(len(indices)) + column + _padding(len(column)))
+
+    column = encode_column(values, typecode)
+    return RECORD_HEADER.pack(RECORD_FULL, len(values)) + column + _padding(len(column))
+
+
+def encode_execution(result: List[Any], metrics: Dict[str, Any], history: List[Dict[str, Any]]) -> bytes:
+    """
+    Encode an /execute response body.
+
+    Args:
+        result: Sorted output array
+        metrics: Serialized metrics
+        history: Serialized states (each with an "array" list)
+
+    Returns:
+        Binary payload
+
+    Raises:
+        WireEncodingError: If the arrays are not homogeneous numbers
+    """
+    arrays = [state.get('array') for state in history]
+    if any(not isinstance(values, list) for values in arrays) or not isinstance(result, list):
+        raise WireEncodingError("Every state needs an array")
+
+    typecode = column_typecode(arrays[0] + result if arrays else result)
+    if typecode is None:
+        raise WireEncodingError("Arrays are not homogeneous numbers")
+
+    meta = json.dumps({
+        'metrics': metrics,
+        'states': [{key: value for key, value in state.items() if key != 'array'} for state in history]
+    }, separators=(',', ':'), default=str).encode('utf-8')
+
+    parts = [HEADER.pack(WIRE_MAGIC, WIRE_VERSION, typecode.encode('ascii'), FLAG_RESULT,
+                         len(arrays) + 1, len(meta)),
+             meta, _padding(len(meta))]
+
+    previous = None
+    for values in arrays:
+        parts.append(_record(previous, values, typecode))
+        previous = values
+    parts.append(_record(None, result, typecode))
+
+    return b''.join(parts)
+
+
+def _read_column(payload: bytes, offset: int, count: int, typecode: str) -> Tuple[List[Any], int]:
+    size = count * array.array(typecode).itemsize
+    values = decode_column(payload[offset:offset + size], typecode)
+    return values, offset + size + (-size % ALIGNMENT)
+
+
+def decode_execution(payload: bytes) -> Dict[str, Any]:
+    """
+    Decode a binary /execute body into the JSON response shape.
+
+    Args:
+        payload: Binary payload from encode_execution
+
+    Returns:
+        Dictionary with "result", "metrics" and "history"
+
+    Raises:
+        WireEncodingError: If the payload is not a supported wire message
+    """
+    if len(payload) < HEADER.size:
+        raise WireEncodingError("Payload too short")
+    magic, version, typecode, flags, records, meta_len = HEADER.unpack_from(payload)
+    if magic != WIRE_MAGIC:
+        raise WireEncodingError("Not a wire payload")
+    if version != WIRE_VERSION:
+        raise WireEncodingError(f"Unsupported wire version {version}")
+    typecode = typecode.decode('ascii')
+
+    offset = HEADER.size
+    meta = json.loads(payload[offset:offset + meta_len])
+    offset += meta_len + (-meta_len % ALIGNMENT)
+
+    arrays: List[List[Any]] = []
+    previous: List[Any] = []
+    for _ in range(records):
+        kind, count = RECORD_HEADER.unpack_from(payload, offset)
+        offset += RECORD_HEADER.size
+        if kind == RECORD_FULL:
+            values, offset = _read_column(payload, offset, count, typecode)
+        elif kind == RECORD_OPS:
+            indices, offset = _read_column(payload, offset, count, 'I')
+            changes, offset = _read_column(payload, offset, count, typecode)
+            values = list(previous)
+            for index, value in zip(indices, changes):
+                values[index] = value
+        else:
+            raise WireEncodingError(f"Unknown record kind {kind}")
+        arrays.append(values)
+        previous = values
+
+    result = arrays.pop() if flags & FLAG_RESULT else None
+    history = [dict(state, array=values) for state, values in zip(meta['states'], arrays)]
+    return {'result': result, 'metrics': meta['metrics'], 'history': history}
@@ -17,11 +17,13 @@ Version: 2.0.0
 import time
 import copy
 import math
-import inspect
 from typing import List, Dict, Any, Callable, Optional, Tuple, Set, Union, TypeVar, Generic
 
 T = TypeVar('T')  # Generic type for elements being sorted
 
+# History states that are recorded even when the history is sampled
+TERMINAL_STATE_TYPES = ("final", "error")
+
 class Algorithm(Generic[T]):
     """
     Abstract base class for all sorting and selection algorithms.
@@ -73,6 +75,15 @@ class Algorithm(Generic[T]):
             "step_execution": False,       # Execute one step at a time
             "collect_stats": True,         # Collect statistical information
             "profile_call_stack": False,   # Track function call stack
+            "overhead_correction": False,  # Report instrumentation-corrected time (calibrates once)
+            "paired_timing": False,        # Also time a raw run back-to-back
+            "counting_backend": "wrappers",  # "wrappers" or "monitoring" (PEP 669)
+            "tracer": "counters",          # "none", "counters", "full", "sampling" or a Tracer
+            "trace_sample_interval": 100,  # Operations per sample for the sampling tracer
+            "budget": None,                # RunBudget or limits dict (deadline, max_comparisons, ...)
+            "cancellation_token": None,    # CancellationToken checked with the budget
+            "history_sink": None,          # Callable(step, state) streaming states instead of keeping them
+            "history_interval": 1,         # Record every n-th state (1 = all)
         }
         
         # Override defaults with any provided options
@@ -98,6 +109,9 @@ class Algorithm(Generic[T]):
             "start_time": 0,           # Execution start timestamp
             "end_time": 0,             # Execution end timestamp
             "execution_time": 0,       # Total execution time
+            "instrumentation_overhead": 0,  # Estimated bookkeeping time
+            "corrected_execution_time": 0,  # Execution time minus bookkeeping
+            "raw_execution_time": 0,   # Time of the paired raw run (if requested)
             
             # Advanced metrics
             "call_depth": 0,           # Current recursion/call depth
@@ -120,6 +134,27 @@ class Algorithm(Generic[T]):
         # Call stack tracking for profiling
         self.call_stack: List[Dict[str, Any]] = []
         
+        # Time spent inside record_state (for overhead correction)
+        self._state_recording_time: float = 0.0
+        
+        # Time spent blocked on the history consumer (left out of the timing)
+        self._idle_time: float = 0.0
+
+        # record_state calls of the current run (for history sampling)
+        self._state_calls: int = 0
+
+        # Budget checker bound for the current run (None when unlimited)
+        self._budget_guard = None
+
+        # Backend that produced the operation counts of the last run
+        self.counting_backend: str = "wrappers"
+        
+        # Tracer bound for the last run (see core.tracers)
+        self.tracer = None
+        
+        # Merged worker metrics of the last parallel run (see execute_parallel)
+        self.parallel_metrics: Optional[Dict[str, Any]] = None
+        
         # Event system
         self.event_listeners: Dict[str, List[Callable]] = {
             "step": [],           # Triggered after each state recording
@@ -154,19 +189,28 @@ class Algorithm(Generic[T]):
             "start_time": 0,
             "end_time": 0,
             "execution_time": 0,
+            "instrumentation_overhead": 0,
+            "corrected_execution_time": 0,
+            "raw_execution_time": 0,
             "call_depth": 0,
             "max_call_depth": 0,
             "branch_operations": 0,
         }
         
-        # Reset history and state
-        self.history = []
+        # Reset history and state (a sink streams states out instead of keeping them)
+        sink = self.options.get("history_sink")
+        self.history = HistoryStream(sink) if sink is not None else []
         self.current_step = 0
         self.is_running = False
         self.is_paused = False
         self.is_complete = False
         self.current_phase = "initialization"
         self.call_stack = []
+        self._state_recording_time = 0.0
+        self._idle_time = 0.0
+        self._state_calls = 0
+        self._budget_guard = None
+        self.parallel_metrics = None
         
         return self
     
@@ -185,14 +229,19 @@ class Algorithm(Generic[T]):
         Returns:
             The processed (sorted) array
         """
-        # Reset state for new execution
-        self.reset()
-        
         # Create merged options (defaults + instance options + runtime options)
         merged_options = self.options.copy()
         if options:
             merged_options.update(options)
-            
+        
+        # Time the raw variant first so both runs see the same warm caches
+        raw_time = None
+        if merged_options.get("paired_timing"):
+            raw_time = self._time_raw_run(array, merged_options)
+        
+        # Reset state for new execution
+        self.reset()
+        
         # Set execution flags
         self.is_running = True
         self.metrics["start_time"] = time.time()
@@ -207,13 +256,31 @@ class Algorithm(Generic[T]):
                 "message": "Initial array state"
             })
         
+        # Count operations through sys.monitoring when requested and supported
+        monitor = None
+        if merged_options.get("counting_backend") == "monitoring":
+            monitor = self._start_operation_monitor(merged_options)
+        self.counting_backend = "monitoring" if monitor else "wrappers"
+        
+        # Bind the tracer once so unselected features cost nothing in hot loops
+        # (a monitored run binds bare primitives; the monitor counts their calls)
+        tracer = self._bind_tracer(merged_options, "none" if monitor else None)
+        
+        # Wrap the bound primitives with budget checks (nothing is bound without limits)
+        self._budget_guard = self._bind_budget(merged_options)
+        
         # Execute the algorithm's run method, which must be implemented by subclasses
         try:
             result = self.run(array_copy, merged_options)
         except Exception as e:
-            # Record error state if there was an exception
+            # Attach what was computed so far when a budget or rlimit stopped the run
+            from .budget import BudgetExceeded
+            if isinstance(e, BudgetExceeded) and e.report is None:
+                e.report = self._budget_report(array_copy)
+            
+            # Record error state if there was an exception (bypassing the budget checks)
             if merged_options["record_history"]:
-                self.record_state(array_copy, {
+                type(self).record_state(self, array_copy, {
                     "type": "error",
                     "message": f"Execution error: {str(e)}",
                     "error": str(e)
@@ -221,10 +288,26 @@ class Algorithm(Generic[T]):
             self.is_running = False
             self.is_complete = True
             raise
+        finally:
+            if monitor:
+                monitor.stop()
+            tracer.finish(self)
+            tracer.unbind(self)
+        
+        if monitor:
+            self.metrics["monitored_operations"] = dict(monitor.counts)
         
         # Record execution time
         self.metrics["end_time"] = time.time()
-        self.metrics["execution_time"] = self.metrics["end_time"] - self.metrics["start_time"]
+        self.metrics["execution_time"] = (self.metrics["end_time"] - self.metrics["start_time"]
+                                          - self._idle_time)
+        
+        # Subtract the calibrated bookkeeping cost from the measured time
+        if merged_options.get("overhead_correction"):
+            self._apply_overhead_correction(len(array_copy), monitor)
+        
+        if raw_time is not None:
+            self.metrics["raw_execution_time"] = raw_time
         
         # Update execution state
         self.is_running = False
@@ -248,6 +331,242 @@ class Algorithm(Generic[T]):
         
         return result
     
+    def execute_parallel(self, array: List[T], workers: Optional[int] = None,
+                         options: Optional[Dict[str, Any]] = None, executor: Any = None) -> List[T]:
+        """
+        Execute the algorithm on partitions of the array in worker processes.
+        
+        Each worker sorts a contiguous partition with its own instance and
+        sends its counters back on completion; the partitions are then
+        k-way merged here. Merged counters are stored in metrics, and the
+        per-worker, per-phase and load-imbalance breakdown is reported by
+        get_info under "parallel". History is not recorded in workers.
+        
+        Args:
+            array: The input array to process
+            workers: Number of worker partitions (defaults to the CPU count)
+            options: Optional runtime options for the workers
+            executor: Optional executor to run partitions on
+            
+        Returns:
+            The sorted array
+            
+        Raises:
+            ValueError: If the algorithm does not sort (e.g. selection), or
+                the options include a cancellation token or tracer instance,
+                which cannot be sent to workers
+        """
+        from .metrics_aggregation import UNMERGEABLE_CATEGORIES, parallel_execute, prepare_worker_options
+        
+        if self.category in UNMERGEABLE_CATEGORIES:
+            raise ValueError(f"{self.name} does not sort ({self.category}); its partitions cannot be merged")
+        
+        worker_options = self.options.copy()
+        if options:
+            worker_options.update(options)
+        worker_options = prepare_worker_options(worker_options)
+        
+        self.reset()
+        
+        self.is_running = True
+        self.metrics["start_time"] = time.time()
+        
+        try:
+            result, aggregator = parallel_execute(type(self), array, workers, worker_options, executor)
+        finally:
+            self.is_running = False
+            self.is_complete = True
+        
+        self.metrics["end_time"] = time.time()
+        self.metrics["execution_time"] = self.metrics["end_time"] - self.metrics["start_time"]
+        self.metrics.update(aggregator.totals())
+        self.parallel_metrics = aggregator.summary()
+        
+        self.set_phase("completed")
+        self.emit("complete", {
+            "metrics": self.metrics,
+            "result": result
+        })
+        
+        return result
+    
+    def _bind_tracer(self, options: Dict[str, Any], tracer_spec: Any = None):
+        """
+        Resolve the tracer for a run and install its primitives.
+        
+        When history recording is disabled, record_state is also replaced by
+        a no-op so that per-step recording calls cost a single function call.
+        
+        Args:
+            options: Merged runtime options
+            tracer_spec: Tracer to use instead of the "tracer" option
+            
+        Returns:
+            The bound tracer (unbind it after the run)
+        """
+        from .tracers import resolve_tracer
+        
+        tracer = resolve_tracer(tracer_spec if tracer_spec is not None else options.get("tracer"))
+        tracer.bind(self, options)
+        
+        if not self.options["record_history"] and type(self).record_state is Algorithm.record_state:
+            self.record_state = _skip_record_state
+        
+        self.tracer = tracer
+        return tracer
+    
+    def _bind_budget(self, options: Dict[str, Any]):
+        """
+        Bind budget and cancellation checks for a run, if any were requested.
+        
+        Args:
+            options: Merged runtime options ("budget", "cancellation_token")
+            
+        Returns:
+            The bound BudgetGuard, or None when the run is unlimited
+        """
+        if options.get("budget") is None and options.get("cancellation_token") is None:
+            return None
+        
+        from .budget import resolve_budget
+        
+        guard = resolve_budget(options.get("budget"), options.get("cancellation_token"))
+        if guard is not None:
+            guard.bind(self)
+        return guard
+    
+    def exclude_idle_time(self, seconds: float) -> None:
+        """
+        Leave time the run spent waiting on its consumer out of its timing.
+        
+        Called from a history sink that blocked (e.g. a paused live session):
+        the wait counts neither towards the reported execution time nor
+        towards the budget deadline. The start and end timestamps stay the
+        actual wall-clock times.
+        
+        Args:
+            seconds: Time spent blocked
+        """
+        self._idle_time += seconds
+        # The sink runs inside record_state, whose time feeds overhead correction
+        self._state_recording_time -= seconds
+        if self._budget_guard is not None:
+            self._budget_guard.pause(seconds)
+    
+    def _budget_report(self, array: List[T]) -> Dict[str, Any]:
+        """
+        Build the partial-result report for a run stopped by its budget.
+        
+        Args:
+            array: The working array at the time the run stopped (algorithms
+                that sort out of place may not have written their progress back)
+            
+        Returns:
+            Dictionary with the partial array, metrics, phase and elapsed time
+        """
+        elapsed = time.time() - self.metrics["start_time"] - self._idle_time
+        return {
+            "partial_result": list(array),
+            "metrics": dict(self.metrics, execution_time=elapsed),
+            "phase": self.current_phase,
+            "history_states": len(self.history),
+            "elapsed": elapsed
+        }
+    
+    def _start_operation_monitor(self, options: Dict[str, Any]):
+        """
+        Start a sys.monitoring counter scoped to this algorithm's code.
+        
+        Args:
+            options: Merged runtime options
+        
+        Returns:
+            The active OperationMonitor, or None when the interpreter lacks
+            sys.monitoring, another monitored run is in progress, or the run
+            needs the wrappers (an analysis tracer, or listeners for
+            operation events); the wrapper counters are used instead
+        """
+        from .monitoring import MONITORING_AVAILABLE, create_monitor
+        
+        if not MONITORING_AVAILABLE:
+            return None
+        if options.get("tracer") not in ("counters", "none", None):
+            return None
+        if any(self.event_listeners.get(event) for event in ("comparison", "swap", "access")):
+            return None
+        
+        monitor = create_monitor(type(self), self.metrics)
+        return monitor if monitor.start() else None
+    
+    def _time_raw_run(self, array: List[T], options: Dict[str, Any]) -> float:
+        """
+        Time a run with the "none" tracer, no history and no event dispatch.
+        
+        The primitives reduce to the bare operations, so this is the lightest
+        variant available without modifying the algorithm itself.
+        
+        Args:
+            array: The input array (copied before running)
+            options: Merged runtime options
+            
+        Returns:
+            Wall-clock time of the raw run in seconds
+        """
+        saved_listeners = self.event_listeners
+        saved_record_history = self.options["record_history"]
+        
+        self.event_listeners = {event: [] for event in saved_listeners}
+        self.options["record_history"] = False
+        raw_options = dict(options, record_history=False)
+        
+        self.reset()
+        tracer = self._bind_tracer(raw_options, "none")
+        try:
+            self._bind_budget(raw_options)
+            start_time = time.time()
+            self.run(array.copy(), raw_options)
+            return time.time() - start_time
+        finally:
+            tracer.unbind(self)
+            self.options["record_history"] = saved_record_history
+            self.event_listeners = saved_listeners
+    
+    def _apply_overhead_correction(self, n: int, monitor: Any = None) -> None:
+        """
+        Estimate instrumentation overhead and report the corrected time.
+        
+        Uses the process-wide calibration profile for the primitives as they
+        were bound, measuring it on first use: the bound tracer (custom
+        tracers use the counters profile), the class methods of primitives
+        with event listeners, or the monitored primitives and instruction
+        events of a monitored run. Unmonitored runs with the "none" tracer
+        count nothing to charge, so only their record_state time is removed.
+        record_state times itself because its cost grows with the history.
+        
+        Args:
+            n: Input size, used as the array length copied per recorded state
+            monitor: OperationMonitor of a monitored run (None otherwise)
+        """
+        from .calibration import get_calibration
+        from .tracers import TRACERS
+        
+        tracer_name = self.tracer.name if self.tracer and self.tracer.name in TRACERS else "counters"
+        if tracer_name == "none" and monitor is None:
+            overhead = max(0.0, self._state_recording_time)
+        else:
+            listened = [event for event in ("comparison", "swap", "access") if self.event_listeners.get(event)]
+            profile = get_calibration(tracer_name, listened, monitored=monitor is not None)
+            overhead = profile.estimate_overhead(
+                self.metrics,
+                states=len(self.history),
+                elements_per_state=n,
+                state_time=self._state_recording_time,
+                events=monitor.instruction_events if monitor is not None else 0
+            )
+        
+        self.metrics["instrumentation_overhead"] = overhead
+        self.metrics["corrected_execution_time"] = max(0.0, self.metrics["execution_time"] - overhead)
+    
     def run(self, array: List[T], options: Dict[str, Any]) -> List[T]:
         """
         The core algorithm implementation.
@@ -464,6 +783,16 @@ class Algorithm(Generic[T]):
         if not self.options["record_history"]:
             return
         
+        # Keep only every n-th state when history is sampled (the final and
+        # error states are always kept so a sampled history ends on the outcome)
+        self._state_calls += 1
+        interval = self.options.get("history_interval", 1)
+        if interval > 1 and (self._state_calls - 1) % interval and \
+                not (metadata and metadata.get("type") in TERMINAL_STATE_TYPES):
+            return
+        
+        recording_start = time.perf_counter()
+        
         # Create state snapshot with current metrics and timestamp
         state = {
             "array": array.copy(),
@@ -484,6 +813,8 @@ class Algorithm(Generic[T]):
             "step": len(self.history) - 1,
             "state": self.history[-1]
         })
+        
+        self._state_recording_time += time.perf_counter() - recording_start
     
     def get_step(self, step_index: int) -> Optional[Dict[str, Any]]:
         """
@@ -580,7 +911,8 @@ class Algorithm(Generic[T]):
         
         # Track call stack if enabled
         if self.options["profile_call_stack"]:
-            # Get caller information
+            # Get caller information (inspect is only needed for call stack profiling)
+            import inspect
             frame = inspect.currentframe().f_back
             caller_info = inspect.getframeinfo(frame)
             
@@ -636,20 +968,32 @@ class Algorithm(Generic[T]):
         Returns:
             Dictionary containing algorithm metadata
         """
-        return {
+        info = {
             "name": self.name,
             "category": self.category,
             "metrics": copy.deepcopy(self.metrics),
             "complexity": self.get_complexity(),
             "stability": self.is_stable(),
             "in_place": self.is_in_place(),
+            "counting_backend": self.counting_backend,
             "execution_status": {
                 "running": self.is_running,
                 "paused": self.is_paused,
                 "complete": self.is_complete,
                 "current_phase": self.current_phase
-            }
+            },
+            "tracer": self.tracer.name if self.tracer else None
         }
+        
+        if self.parallel_metrics is not None:
+            info["parallel"] = copy.deepcopy(self.parallel_metrics)
+        
+        # Rich analysis from instrumentation-backed tracers
+        report = self.tracer.report() if self.tracer else None
+        if report is not None:
+            info["instrumentation"] = report
+        
+        return info
     
     def get_complexity(self) -> Dict[str, Dict[str, str]]:
         """
@@ -794,3 +1138,47 @@ class Algorithm(Generic[T]):
             metrics_str = f", comparisons={self.metrics['comparisons']}, swaps={self.metrics['swaps']}"
         
         return f"{self.__class__.__name__}(name='{self.name}', category='{self.category}'{metrics_str})"
+
+
+def _skip_record_state(array: Any, metadata: Optional[Dict[str, Any]] = None) -> None:
+    """No-op record_state bound while history recording is disabled."""
+    return None
+
+
+class HistoryStream:
+    """
+    History that hands each state to a sink instead of retaining it.
+
+    Keeps only the state count and the latest state, so a streamed run holds
+    O(1) states however long it is. Supports the list operations used during
+    a run: append, len, and indexing or iterating over the latest state.
+
+    Attributes:
+        sink (Callable[[int, Dict[str, Any]], None]): Receives (step, state)
+        last (Optional[Dict[str, Any]]): Most recently recorded state
+    """
+
+    def __init__(self, sink: Callable[[int, Dict[str, Any]], None]):
+        self.sink = sink
+        self.last: Optional[Dict[str, Any]] = None
+        self._length = 0
+
+    def append(self, state: Dict[str, Any]) -> None:
+        self.last = state
+        self._length += 1
+        self.sink(self._length - 1, state)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if self.last is not None and index in (-1, self._length - 1):
+            return self.last
+        raise IndexError("Streamed history only retains the latest state")
+
+    def __iter__(self):
+        return iter(() if self.last is None else (self.last,))
+
+    def clear(self) -> None:
+        self.last = None
+        self._length = 0
@@ -0,0 +1,309 @@
+"""
+Cooperative Cancellation and Run Budgets
+
+Nothing inside an algorithm's run loop stops a runaway execution (a BogoSort,
+or an O(n^2) sort on a huge input) short of killing the process. This module
+lets a run carry a budget that is checked from the instrumentation primitives:
+
+- CancellationToken: Thread-safe flag another thread can set to stop a run
+- RunBudget:         Wall-clock deadline, maximum comparisons, maximum history
+                     states and maximum memory growth
+- BudgetGuard:       Per-run checker bound onto the primitives at execute time
+- BudgetExceeded:    Raised from inside the run; Algorithm.execute attaches a
+                     partial-result report before propagating it
+
+Checks are amortized: compare, write and record_state only decrement a
+countdown, and the full check (clock, counters, memory) runs once every
+``check_interval`` operations, so limits may be overshot by up to one interval. History states
+are checked exactly on every recorded state. Runs without a budget bind
+nothing and pay nothing.
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import time
+import threading
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, Union
+
+DEFAULT_CHECK_INTERVAL = 1024
+
+
+class BudgetExceeded(Exception):
+    """
+    Raised when a run exceeds its budget or is cancelled.
+
+    Attributes:
+        reason (str): "cancelled", "deadline", "comparisons",
+            "history_states", "memory", "cpu_time" (worker rlimit) or
+            "idle" (a live session waited too long for its client)
+        limit: The configured limit
+        observed: The observed value when the check failed
+        report (Optional[Dict[str, Any]]): Partial-result report attached by
+            Algorithm.execute (partial array, metrics, phase, elapsed time)
+    """
+
+    def __init__(self, reason: str, limit: Any = None, observed: Any = None,
+                 report: Optional[Dict[str, Any]] = None):
+        super().__init__(f"Run budget exceeded ({reason}): limit {limit}, observed {observed}")
+        self.reason = reason
+        self.limit = limit
+        self.observed = observed
+        self.report = report
+
+    def __reduce__(self):
+        # Keep the attributes when crossing process boundaries
+        return (type(self), (self.reason, self.limit, self.observed, self.report))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Describe the failure for API responses."""
+        return {
+            "reason": self.reason,
+            "limit": self.limit,
+            "observed": self.observed,
+            "report": self.report
+        }
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation flag shared between a run and its controller.
+
+    Attributes:
+        reason (Optional[str]): Reason passed to cancel()
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """
+        Request cancellation; the run stops at its next budget check.
+
+        Args:
+            reason: Description reported in BudgetExceeded.observed
+        """
+        self.reason = reason
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation was requested."""
+        return self._event.is_set()
+
+
+@dataclass
+class RunBudget:
+    """
+    Limits for a single run (None disables a limit).
+
+    Attributes:
+        deadline: Wall-clock seconds from the start of the run
+        max_comparisons: Maximum comparisons
+        max_history_states: Maximum recorded history states
+        max_memory_mb: Maximum growth of the process resident set in MiB
+        check_interval: Primitive calls between full checks
+    """
+    deadline: Optional[float] = None
+    max_comparisons: Optional[int] = None
+    max_history_states: Optional[int] = None
+    max_memory_mb: Optional[float] = None
+    check_interval: int = DEFAULT_CHECK_INTERVAL
+
+    @classmethod
+    def from_dict(cls, limits: Optional[Dict[str, Any]]) -> Optional["RunBudget"]:
+        """
+        Build a budget from a limits dictionary, ignoring unknown keys.
+
+        Args:
+            limits: Limits keyed by field name
+
+        Returns:
+            RunBudget, or None if no limit is set
+        """
+        if not limits:
+            return None
+        fields = {key: value for key, value in limits.items()
+                  if key in cls.__dataclass_fields__ and value is not None}
+        return cls(**fields) if fields else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary."""
+        return asdict(self)
+
+    def tightened(self, other: Optional["RunBudget"]) -> "RunBudget":
+        """
+        Combine with another budget, keeping the stricter limit of each.
+
+        Args:
+            other: Budget to combine with (e.g. server-wide caps)
+
+        Returns:
+            New budget
+        """
+        if other is None:
+            return self
+
+        def stricter(a, b):
+            if a is None:
+                return b
+            if b is None:
+                return a
+            return min(a, b)
+
+        return RunBudget(
+            deadline=stricter(self.deadline, other.deadline),
+            max_comparisons=stricter(self.max_comparisons, other.max_comparisons),
+            max_history_states=stricter(self.max_history_states, other.max_history_states),
+            max_memory_mb=stricter(self.max_memory_mb, other.max_memory_mb),
+            check_interval=min(self.check_interval, other.check_interval)
+        )
+
+
+def _resident_bytes() -> int:
+    """Get the current resident set size (peak RSS where unavailable)."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return 0
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    scale = 1 if os.uname().sysname == "Darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+class BudgetGuard:
+    """
+    Budget checker for one run, bound onto an algorithm's primitives.
+
+    Attributes:
+        budget (RunBudget): Limits being enforced
+        token (Optional[CancellationToken]): Cancellation flag
+        start_time (float): perf_counter value at bind time
+    """
+
+    def __init__(self, budget: Optional[RunBudget], token: Optional[CancellationToken] = None):
+        self.budget = budget or RunBudget()
+        self.token = token
+        self.start_time = time.perf_counter()
+        self.start_memory = _resident_bytes() if self.budget.max_memory_mb is not None else 0
+        self.algorithm = None
+
+    def check(self) -> None:
+        """
+        Run the full budget check.
+
+        Raises:
+            BudgetExceeded: If cancelled or any limit is exceeded
+        """
+        budget = self.budget
+
+        if self.token is not None and self.token.cancelled:
+            raise BudgetExceeded("cancelled", None, self.token.reason)
+
+        if budget.deadline is not None:
+            elapsed = time.perf_counter() - self.start_time
+            if elapsed > budget.deadline:
+                raise BudgetExceeded("deadline", budget.deadline, round(elapsed, 6))
+
+        if budget.max_comparisons is not None:
+            comparisons = self.algorithm.metrics["comparisons"]
+            if comparisons > budget.max_comparisons:
+                raise BudgetExceeded("comparisons", budget.max_comparisons, comparisons)
+
+        if budget.max_memory_mb is not None:
+            growth_mb = (_resident_bytes() - self.start_memory) / (1024 * 1024)
+            if growth_mb > budget.max_memory_mb:
+                raise BudgetExceeded("memory", budget.max_memory_mb, round(growth_mb, 2))
+
+    def pause(self, seconds: float) -> None:
+        """
+        Exclude time the run spent blocked from the deadline.
+
+        Args:
+            seconds: Time spent blocked
+        """
+        self.start_time += seconds
+
+    def bind(self, algorithm: Any) -> None:
+        """
+        Wrap the algorithm's current primitives with countdown checks.
+
+        Only compare, write and record_state are wrapped: every sorting loop
+        compares or writes (reads and swaps accompany them), and each extra
+        wrapper layer costs a function call per operation.
+
+        Must run after the tracer is bound so that the tracer's closures are
+        wrapped; Tracer.unbind removes the wrappers with them.
+
+        Args:
+            algorithm: Algorithm instance about to run
+        """
+        self.algorithm = algorithm
+        check = self.check
+        interval = max(1, int(self.budget.check_interval))
+        countdown = [interval]
+
+        inner_compare = algorithm.compare
+        inner_write = algorithm.write
+        inner_record_state = algorithm.record_state
+
+        def compare(a, b, comparator=None):
+            countdown[0] -= 1
+            if not countdown[0]:
+                countdown[0] = interval
+                check()
+            return inner_compare(a, b, comparator)
+
+        def write(array, index, value):
+            countdown[0] -= 1
+            if not countdown[0]:
+                countdown[0] = interval
+                check()
+            inner_write(array, index, value)
+
+        max_states = self.budget.max_history_states
+        history = algorithm.history
+
+        def record_state(array, metadata=None):
+            if max_states is not None and len(history) >= max_states:
+                raise BudgetExceeded("history_states", max_states, len(history) + 1)
+            countdown[0] -= 1
+            if not countdown[0]:
+                countdown[0] = interval
+                check()
+            inner_record_state(array, metadata)
+
+        algorithm.compare = compare
+        algorithm.write = write
+        algorithm.record_state = record_state
+
+        # Fail fast if already cancelled
+        check()
+
+
+def resolve_budget(budget: Union[RunBudget, Dict[str, Any], None],
+                   token: Optional[CancellationToken] = None) -> Optional[BudgetGuard]:
+    """
+    Create a guard from the ``budget`` and ``cancellation_token`` options.
+
+    Args:
+        budget: RunBudget, limits dictionary or None
+        token: Optional cancellation token
+
+    Returns:
+        BudgetGuard, or None when there is nothing to enforce
+    """
+    if isinstance(budget, dict):
+        budget = RunBudget.from_dict(budget)
+    if budget is None and token is None:
+        return None
+    return BudgetGuard(budget, token)
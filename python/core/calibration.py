@@ -0,0 +1,369 @@
+"""
+Instrumentation Overhead Calibration
+
+This module measures how much wall-clock time the instrumentation primitives
+of the Algorithm base class (compare, swap, read, write, record_state,
+recursion and branch tracking) add on the current machine, so that measured
+execution times can be corrected for bookkeeping cost.
+
+Each primitive is timed in a tight loop against a baseline loop performing the
+equivalent bare operation (e.g. ``a < b`` for compare, tuple swap for swap).
+The difference, divided by the iteration count, is the per-call overhead. The
+minimum over several repeats is used to suppress scheduler noise.
+
+``record_state`` copies the array, so its cost is fitted as a linear model
+``base + per_element * n`` from two probe sizes.
+
+Profiles are kept per binding of the primitives, since their cost depends
+on it: per tracer, per set of listened operation events for the counters
+tracer (primitives with listeners keep the class methods, which emit), and
+for monitored runs, whose "none" primitives each trigger a sys.monitoring
+callback and whose own code adds one callback per counted instruction
+(charged at the ``event`` cost).
+
+Usage Example:
+    from core.calibration import get_calibration
+
+    profile = get_calibration()
+    overhead = profile.estimate_overhead(algorithm.metrics, states=120, elements_per_state=64)
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterable, Optional, Callable, Tuple
+
+from .base_algorithm import Algorithm
+
+# Primitives whose per-call overhead is measured. emit is not listed: the
+# primitives call it themselves, so its cost is already part of theirs (the
+# remaining calls, once per phase change or run, are negligible)
+PRIMITIVES = (
+    "compare",
+    "swap",
+    "read",
+    "write",
+    "record_state",
+    "recursive_call",
+    "branch",
+)
+
+# Defaults balance calibration accuracy against first-run latency
+DEFAULT_ITERATIONS = 2000
+DEFAULT_REPEATS = 5
+RECORD_STATE_PROBE_SIZES = (16, 512)
+
+# Process-wide calibration profiles per profile key (machine characteristics
+# do not change per run)
+_PROFILES: Dict[str, 'CalibrationProfile'] = {}
+
+
+@dataclass
+class CalibrationProfile:
+    """Per-primitive instrumentation cost measured on the current machine."""
+    per_call: Dict[str, float]
+    record_state_per_element: float
+    iterations: int
+    repeats: int
+    tracer: str = "counters"
+    timestamp: float = field(default_factory=time.time)
+
+    def estimate_overhead(self, metrics: Dict[str, Any], states: int = 0,
+                          elements_per_state: int = 0,
+                          state_time: Optional[float] = None,
+                          events: int = 0) -> float:
+        """
+        Estimate the total instrumentation overhead of a run in seconds.
+
+        Args:
+            metrics: Operation counts of the run (Algorithm.metrics)
+            states: Number of record_state calls inside the timed window
+            elements_per_state: Average array length copied per recorded state
+            state_time: Measured time spent in record_state, if available.
+                Preferred over the linear model because a growing history
+                adds garbage-collection cost that a short probe cannot see.
+            events: Instruction events of a monitored run's own code
+
+        Returns:
+            Estimated overhead in seconds
+        """
+        swaps = metrics.get("swaps", 0)
+
+        # swap() bumps reads/writes by two each without calling read()/write()
+        direct_reads = max(0, metrics.get("reads", 0) - 2 * swaps)
+        direct_writes = max(0, metrics.get("writes", 0) - 2 * swaps)
+
+        overhead = (
+            metrics.get("comparisons", 0) * self.per_call["compare"] +
+            swaps * self.per_call["swap"] +
+            direct_reads * self.per_call["read"] +
+            direct_writes * self.per_call["write"] +
+            metrics.get("recursive_calls", 0) * self.per_call["recursive_call"] +
+            metrics.get("branch_operations", 0) * self.per_call["branch"] +
+            events * self.per_call.get("event", 0.0)
+        )
+
+        if state_time is not None:
+            overhead += state_time
+        else:
+            overhead += states * (self.per_call["record_state"] +
+                                  elements_per_state * self.record_state_per_element)
+
+        return overhead
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the profile to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with per-call costs in seconds
+        """
+        return {
+            "per_call": dict(self.per_call),
+            "record_state_per_element": self.record_state_per_element,
+            "iterations": self.iterations,
+            "repeats": self.repeats,
+            "tracer": self.tracer,
+            "timestamp": self.timestamp
+        }
+
+
+class _CalibrationProbe(Algorithm):
+    """Minimal algorithm used only as a receiver for primitive calls."""
+
+    def __init__(self):
+        super().__init__("Calibration Probe", "internal", {"record_history": True})
+
+    def compare_ops(self, k):
+        # Monitored like an algorithm's own code: one counted instruction per iteration
+        a, b = 2, 1
+        for _ in range(k):
+            a < b
+
+
+def _compare_ops(k):
+    a, b = 2, 1
+    for _ in range(k):
+        a < b
+
+
+def _ignore(data: Any) -> None:
+    """No-op listener (a listened primitive is charged for the event dispatch only)."""
+
+
+def profile_key(tracer: str = "counters", listened: Iterable[str] = (), monitored: bool = False) -> str:
+    """
+    Name the profile for a binding of the primitives.
+
+    Args:
+        tracer: Name of the bound tracer
+        listened: Operation events with listeners (matter for the counters tracer)
+        monitored: Whether the run counted through sys.monitoring
+
+    Returns:
+        "monitoring", "counters+<events>" or the tracer name
+    """
+    if monitored:
+        return "monitoring"
+    listened = sorted(set(listened))
+    if tracer == "counters" and listened:
+        return "counters+" + "+".join(listened)
+    return tracer
+
+
+def _best_time(loop: Callable[[int], None], iterations: int, repeats: int) -> float:
+    """
+    Return the minimum wall time of a loop over several repeats.
+
+    Args:
+        loop: Function executing the measured body ``iterations`` times
+        iterations: Iteration count passed to the loop
+        repeats: Number of timed repetitions
+
+    Returns:
+        Minimum elapsed time in seconds
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        loop(iterations)
+        elapsed = time.perf_counter() - start
+        if elapsed < best:
+            best = elapsed
+    return best
+
+
+def _per_call(instrumented: Callable[[int], None], baseline: Callable[[int], None],
+              iterations: int, repeats: int) -> float:
+    """
+    Measure the per-call cost of an instrumented loop over its baseline.
+
+    Returns:
+        Overhead per call in seconds (never negative)
+    """
+    cost = _best_time(instrumented, iterations, repeats) - _best_time(baseline, iterations, repeats)
+    return max(0.0, cost / iterations)
+
+
+def calibrate(iterations: int = DEFAULT_ITERATIONS, repeats: int = DEFAULT_REPEATS,
+              tracer: str = "counters", listened: Iterable[str] = (),
+              monitored: bool = False) -> CalibrationProfile:
+    """
+    Measure per-primitive instrumentation cost and cache the result.
+
+    Args:
+        iterations: Calls per timed loop
+        repeats: Timed repetitions per loop (minimum is kept)
+        tracer: Name of the tracer whose primitives are measured
+        listened: Operation events ("comparison", "swap", "access") with
+            listeners during the measured runs
+        monitored: Measure the "none" primitives under sys.monitoring, plus
+            the per-instruction ``event`` cost. If another monitored run
+            holds the monitor, the profile is measured without it and not
+            cached.
+
+    Returns:
+        Fresh calibration profile
+    """
+    from .tracers import resolve_tracer
+
+    listened = tuple(listened)
+    probe = _CalibrationProbe()
+    for event in listened:
+        probe.on(event, _ignore)
+    resolve_tracer("none" if monitored else tracer).bind(probe, probe.options)
+    array = [2, 1, 3, 4]
+
+    monitor = None
+    if monitored:
+        from .monitoring import create_monitor
+        monitor = create_monitor(_CalibrationProbe, probe.metrics)
+        if not monitor.start():
+            monitor = None
+    try:
+        per_call, per_element = _measure(probe, array, iterations, repeats)
+        if monitored:
+            per_call["event"] = _per_call(probe.compare_ops, _compare_ops, iterations, repeats)
+    finally:
+        if monitor is not None:
+            monitor.stop()
+
+    profile = CalibrationProfile(
+        per_call=per_call,
+        record_state_per_element=per_element,
+        iterations=iterations,
+        repeats=repeats,
+        tracer=profile_key(tracer, listened, monitored)
+    )
+    if monitor is not None or not monitored:
+        _PROFILES[profile.tracer] = profile
+    return profile
+
+
+def _measure(probe: Algorithm, array: list, iterations: int, repeats: int) -> Tuple[Dict[str, float], float]:
+    """
+    Time the primitives bound on a probe.
+
+    Returns:
+        Tuple of (per-call costs, record_state cost per element)
+    """
+    def compare_loop(k):
+        for _ in range(k):
+            probe.compare(2, 1)
+
+    def compare_base(k):
+        for _ in range(k):
+            if 2 < 1:
+                pass
+            elif 2 > 1:
+                pass
+
+    def swap_loop(k):
+        for _ in range(k):
+            probe.swap(array, 0, 1)
+
+    def swap_base(k):
+        for _ in range(k):
+            array[0], array[1] = array[1], array[0]
+
+    def read_loop(k):
+        for _ in range(k):
+            probe.read(array, 2)
+
+    def read_base(k):
+        for _ in range(k):
+            array[2]
+
+    def write_loop(k):
+        for _ in range(k):
+            probe.write(array, 3, 4)
+
+    def write_base(k):
+        for _ in range(k):
+            array[3] = 4
+
+    def recursion_loop(k):
+        for _ in range(k):
+            probe.enter_recursive_call("calibration")
+            probe.exit_recursive_call()
+
+    def branch_loop(k):
+        for _ in range(k):
+            probe.track_branch(True)
+
+    def empty_loop(k):
+        for _ in range(k):
+            pass
+
+    per_call = {
+        "compare": _per_call(compare_loop, compare_base, iterations, repeats),
+        "swap": _per_call(swap_loop, swap_base, iterations, repeats),
+        "read": _per_call(read_loop, read_base, iterations, repeats),
+        "write": _per_call(write_loop, write_base, iterations, repeats),
+        "recursive_call": _per_call(recursion_loop, empty_loop, iterations, repeats),
+        "branch": _per_call(branch_loop, empty_loop, iterations, repeats),
+    }
+
+    # record_state is linear in the array length: fit base + slope from two sizes
+    small_size, large_size = RECORD_STATE_PROBE_SIZES
+    state_iterations = max(1, iterations // 10)
+    costs = []
+    for size in (small_size, large_size):
+        state_array = list(range(size))
+
+        def record_loop(k, state_array=state_array):
+            for _ in range(k):
+                probe.record_state(state_array)
+            probe.history.clear()
+
+        costs.append(_per_call(record_loop, empty_loop, state_iterations, repeats))
+
+    per_element = max(0.0, (costs[1] - costs[0]) / (large_size - small_size))
+    per_call["record_state"] = max(0.0, costs[0] - per_element * small_size)
+    return per_call, per_element
+
+
+def get_calibration(tracer: str = "counters", listened: Iterable[str] = (),
+                    monitored: bool = False) -> CalibrationProfile:
+    """
+    Get the process-wide calibration profile, measuring it on first use.
+
+    Args:
+        tracer: Name of the tracer the profile applies to
+        listened: Operation events with listeners
+        monitored: Whether the run counted through sys.monitoring
+
+    Returns:
+        Cached calibration profile
+    """
+    profile = _PROFILES.get(profile_key(tracer, listened, monitored))
+    if profile is None:
+        return calibrate(tracer=tracer, listened=listened, monitored=monitored)
+    return profile
+
+
+def reset_calibration() -> None:
+    """Discard the cached profiles so the next request recalibrates."""
+    _PROFILES.clear()
@@ -1180,8 +1180,8 @@ class AlgorithmInstrumentation:
         distances = self.statistics["memory_access_distances"]
         max_distance = max(distances) if distances else 1
         
-        # Convert distances to locality scores (1.0 for distance 1, approaching 0 for large distances)
-        locality_scores = [1.0 / min(d, max_distance) for d in distances]
+        # Convert distances to locality scores (1.0 for distance 0 or 1, approaching 0 for large distances)
+        locality_scores = [1.0 / max(1, min(d, max_distance)) for d in distances]
         
         # Return average locality score
         return sum(locality_scores) / len(locality_scores) if locality_scores else 1.0
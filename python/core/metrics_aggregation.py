@@ -0,0 +1,434 @@
+"""
+Multi-Process Metrics Aggregation
+
+When a sort is parallelized across processes, each worker runs its own
+Algorithm instance whose metrics would otherwise be lost with the process.
+This module collects per-worker counters (sent back to the coordinator when
+the worker completes), merges them per phase and per worker, and computes
+load-imbalance statistics that show whether a parallel run scales or stalls
+on a straggler.
+
+Components:
+- PhaseRecorder:      Attributes counter deltas and time to algorithm phases
+                      via the "phase_change" event
+- WorkerMetrics:      Picklable per-worker result record
+- MetricsAggregator:  Merges worker records into totals, per-phase and
+                      per-worker breakdowns and imbalance statistics
+- parallel_execute:   Partition/sort/merge driver used by
+                      Algorithm.execute_parallel
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import time
+import heapq
+import math
+import statistics
+from dataclasses import dataclass, field, asdict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+
+# Additive operation counters merged across workers
+COUNTERS = (
+    "comparisons",
+    "swaps",
+    "reads",
+    "writes",
+    "memory_accesses",
+    "recursive_calls",
+    "moves",
+    "branch_operations",
+)
+
+# Categories whose algorithms do not return a sorted permutation of their
+# input, so partition results cannot be merged (e.g. quick select)
+UNMERGEABLE_CATEGORIES = frozenset({"selection"})
+
+
+class PhaseRecorder:
+    """
+    Attribute counter deltas and wall time to algorithm phases.
+
+    Subscribes to the algorithm's "phase_change" event. Each transition
+    charges the counters accumulated since the previous transition to the
+    phase being left.
+
+    Attributes:
+        phases (Dict[str, Dict[str, float]]): Phase -> counters and "time"
+    """
+
+    def __init__(self, algorithm: Any):
+        """
+        Attach the recorder to an algorithm instance.
+
+        Args:
+            algorithm: Algorithm whose phases are recorded
+        """
+        self.algorithm = algorithm
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self._last_counts = {name: 0 for name in COUNTERS}
+        self._last_time = time.perf_counter()
+        algorithm.on("phase_change", self._on_phase_change)
+
+    def _charge(self, phase: str) -> None:
+        """Charge the counters since the last snapshot to a phase."""
+        now = time.perf_counter()
+        metrics = self.algorithm.metrics
+        entry = self.phases.setdefault(phase, dict.fromkeys(COUNTERS + ("time",), 0))
+
+        for name in COUNTERS:
+            current = metrics.get(name, 0)
+            # execute() resets metrics; a drop means a new run started
+            delta = current - self._last_counts[name] if current >= self._last_counts[name] else current
+            entry[name] += delta
+            self._last_counts[name] = current
+
+        entry["time"] += now - self._last_time
+        self._last_time = now
+
+    def _on_phase_change(self, data: Dict[str, Any]) -> None:
+        self._charge(data["old_phase"])
+
+    def finish(self) -> Dict[str, Dict[str, float]]:
+        """
+        Charge the remainder to the current phase.
+
+        Returns:
+            Per-phase counters and time
+        """
+        self._charge(self.algorithm.current_phase)
+        return self.phases
+
+
+@dataclass
+class WorkerMetrics:
+    """Metrics reported by one worker at completion."""
+    worker_id: int
+    pid: int
+    input_size: int
+    wall_time: float
+    cpu_time: float
+    counters: Dict[str, int]
+    phases: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    max_call_depth: int = 0
+    auxiliary_space: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary (cheap to pickle and serialize)."""
+        return asdict(self)
+
+
+def _imbalance(values: List[float]) -> Dict[str, Any]:
+    """
+    Compute load-imbalance statistics for per-worker values.
+
+    Returns:
+        Dictionary with mean, min, max, stdev, coefficient of variation,
+        imbalance ratio (max / mean) and the index of the maximum
+    """
+    if not values:
+        return {}
+
+    mean = statistics.mean(values)
+    stdev = statistics.pstdev(values)
+    maximum = max(values)
+
+    return {
+        "mean": mean,
+        "min": min(values),
+        "max": maximum,
+        "stdev": stdev,
+        "coefficient_of_variation": stdev / mean if mean else 0.0,
+        "imbalance_ratio": maximum / mean if mean else 1.0,
+        "argmax": values.index(maximum)
+    }
+
+
+class MetricsAggregator:
+    """
+    Merge metrics from parallel workers.
+
+    Attributes:
+        workers (List[WorkerMetrics]): Worker records in arrival order
+        coordinator_phases (Dict[str, Dict[str, float]]): Phases run in the
+            coordinating process (e.g. the final merge)
+        estimates (Dict[str, int]): Modelled (not counted) operation counts,
+            kept out of the totals
+    """
+
+    def __init__(self):
+        self.workers: List[WorkerMetrics] = []
+        self.coordinator_phases: Dict[str, Dict[str, float]] = {}
+        self.estimates: Dict[str, int] = {}
+
+    def add(self, worker: Any) -> None:
+        """
+        Add a worker record.
+
+        Args:
+            worker: WorkerMetrics or its dictionary form
+        """
+        if isinstance(worker, dict):
+            worker = WorkerMetrics(**worker)
+        self.workers.append(worker)
+
+    def add_coordinator_phase(self, phase: str, elapsed: float, **counters: int) -> None:
+        """
+        Record a phase executed by the coordinator.
+
+        Args:
+            phase: Phase name
+            elapsed: Wall time of the phase in seconds
+            **counters: Optional operation counts for the phase
+        """
+        entry = self.coordinator_phases.setdefault(phase, dict.fromkeys(COUNTERS + ("time",), 0))
+        entry["time"] += elapsed
+        for name, value in counters.items():
+            entry[name] = entry.get(name, 0) + value
+
+    def totals(self) -> Dict[str, Any]:
+        """
+        Merge worker counters into run totals.
+
+        Counters are summed; recursion depth is the maximum over workers and
+        auxiliary space is summed because workers hold it concurrently.
+
+        Returns:
+            Metrics dictionary compatible with Algorithm.metrics
+        """
+        totals: Dict[str, Any] = {name: 0 for name in COUNTERS}
+        for worker in self.workers:
+            for name in COUNTERS:
+                totals[name] += worker.counters.get(name, 0)
+        for phase in self.coordinator_phases.values():
+            for name in COUNTERS:
+                totals[name] += phase.get(name, 0)
+
+        totals["max_call_depth"] = max((w.max_call_depth for w in self.workers), default=0)
+        totals["auxiliary_space"] = sum(w.auxiliary_space for w in self.workers)
+        return totals
+
+    def per_phase(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Merge phase breakdowns across workers and the coordinator.
+
+        Returns:
+            Phase -> summed counters, total and max worker time, and a
+            per-worker time list (for spotting phase-level stragglers)
+        """
+        merged: Dict[str, Dict[str, Any]] = {}
+
+        for index, worker in enumerate(self.workers):
+            for phase, values in worker.phases.items():
+                entry = merged.setdefault(phase, dict.fromkeys(COUNTERS, 0))
+                entry.setdefault("worker_times", [0.0] * len(self.workers))
+                for name in COUNTERS:
+                    entry[name] += values.get(name, 0)
+                entry["worker_times"][index] += values.get("time", 0.0)
+
+        for phase, entry in merged.items():
+            entry["total_time"] = sum(entry["worker_times"])
+            entry["max_worker_time"] = max(entry["worker_times"])
+
+        for phase, values in self.coordinator_phases.items():
+            entry = merged.setdefault(phase, dict.fromkeys(COUNTERS, 0))
+            for name in COUNTERS:
+                entry[name] += values.get(name, 0)
+            entry["coordinator_time"] = entry.get("coordinator_time", 0.0) + values["time"]
+
+        return merged
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Build the parallel-run section reported by Algorithm.get_info.
+
+        Returns:
+            Dictionary with totals, per-phase and per-worker breakdowns,
+            estimated counts and imbalance statistics for wall time, CPU
+            time and comparisons
+        """
+        wall_times = [w.wall_time for w in self.workers]
+        slowest = max(wall_times, default=0.0)
+        busy = sum(wall_times)
+
+        wall_stats = _imbalance(wall_times)
+        if wall_stats:
+            wall_stats["straggler_worker"] = self.workers[wall_stats["argmax"]].worker_id
+
+        return {
+            "workers": len(self.workers),
+            "totals": self.totals(),
+            "per_phase": self.per_phase(),
+            "per_worker": [w.to_dict() for w in self.workers],
+            "estimates": dict(self.estimates),
+            "imbalance": {
+                "wall_time": wall_stats,
+                "cpu_time": _imbalance([w.cpu_time for w in self.workers]),
+                "comparisons": _imbalance([float(w.counters.get("comparisons", 0)) for w in self.workers]),
+                "input_size": _imbalance([float(w.input_size) for w in self.workers]),
+                # Fraction of the slowest worker's span the average worker was busy
+                "parallel_efficiency": busy / (len(wall_times) * slowest) if slowest else 1.0
+            }
+        }
+
+
+def run_partition(algorithm_class: type, options: Optional[Dict[str, Any]],
+                  chunk: List[Any], worker_id: int) -> Tuple[List[Any], Dict[str, Any]]:
+    """
+    Sort one partition in a worker and report its metrics.
+
+    Module-level so that it can be pickled for process pools.
+
+    Args:
+        algorithm_class: Algorithm subclass to run
+        options: Algorithm options
+        chunk: Partition of the input
+        worker_id: Index of the partition
+
+    Returns:
+        Tuple of (sorted chunk, WorkerMetrics dictionary)
+    """
+    algorithm = algorithm_class(options)
+    recorder = PhaseRecorder(algorithm)
+
+    if algorithm.options.get("overhead_correction"):
+        # A fresh worker calibrates on its first corrected run; do it before
+        # the timer so the wall and CPU times cover only the sort
+        from .calibration import get_calibration
+        from .monitoring import MONITORING_AVAILABLE
+        from .tracers import TRACERS
+
+        tracer = algorithm.options.get("tracer")
+        tracer = tracer if isinstance(tracer, str) and tracer in TRACERS else "counters"
+        monitored = (MONITORING_AVAILABLE and algorithm.options.get("counting_backend") == "monitoring"
+                     and tracer in ("counters", "none"))
+        if tracer != "none" or monitored:
+            get_calibration(tracer, monitored=monitored)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    result = algorithm.execute(chunk)
+    cpu_time = time.process_time() - cpu_start
+    wall_time = time.perf_counter() - wall_start
+
+    worker = WorkerMetrics(
+        worker_id=worker_id,
+        pid=os.getpid(),
+        input_size=len(chunk),
+        wall_time=wall_time,
+        cpu_time=cpu_time,
+        counters={name: algorithm.metrics.get(name, 0) for name in COUNTERS},
+        phases=recorder.finish(),
+        max_call_depth=algorithm.metrics.get("max_call_depth", 0),
+        auxiliary_space=algorithm.metrics.get("auxiliary_space", 0)
+    )
+    return result, worker.to_dict()
+
+
+def partition(array: List[Any], parts: int) -> List[List[Any]]:
+    """
+    Split an array into contiguous chunks of near-equal size.
+
+    Args:
+        array: Input array
+        parts: Number of chunks
+
+    Returns:
+        List of chunks (fewer than ``parts`` if the array is shorter)
+    """
+    parts = max(1, min(parts, len(array)))
+    size, remainder = divmod(len(array), parts)
+    chunks = []
+    start = 0
+    for index in range(parts):
+        end = start + size + (1 if index < remainder else 0)
+        chunks.append(array[start:end])
+        start = end
+    return chunks
+
+
+def prepare_worker_options(options: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Prepare algorithm options for worker processes.
+
+    Workers record no history, so a history sink is dropped. Options that
+    only work inside this process are rejected before anything is
+    submitted, rather than failing to pickle (or silently doing nothing)
+    in the pool.
+
+    Args:
+        options: Algorithm options
+
+    Returns:
+        Options safe to send to workers
+
+    Raises:
+        ValueError: If a cancellation token or a tracer instance or class is set
+    """
+    options = dict(options or {})
+    options.pop("history_sink", None)
+    options["record_history"] = False
+    if options.get("cancellation_token") is not None:
+        raise ValueError("A cancellation token cannot reach worker processes; use a budget deadline instead")
+    tracer = options.get("tracer")
+    if tracer is not None and not isinstance(tracer, str):
+        raise ValueError("Parallel runs need a registered tracer name, not a tracer instance or class")
+    return options
+
+
+def parallel_execute(algorithm_class: type, array: List[Any], workers: Optional[int] = None,
+                     options: Optional[Dict[str, Any]] = None,
+                     executor: Optional[Executor] = None) -> Tuple[List[Any], MetricsAggregator]:
+    """
+    Sort partitions in worker processes and k-way merge the results.
+
+    Args:
+        algorithm_class: Algorithm subclass (must be importable by workers)
+        array: Input array
+        workers: Number of partitions (defaults to the CPU count)
+        options: Algorithm options for every worker
+        executor: Executor to run partitions on (a temporary process pool
+            is created if omitted)
+
+    Returns:
+        Tuple of (sorted array, aggregator holding the merged metrics)
+
+    Raises:
+        ValueError: If the options cannot be sent to workers
+    """
+    options = prepare_worker_options(options)
+    workers = workers or os.cpu_count() or 1
+    chunks = partition(array, workers)
+    aggregator = MetricsAggregator()
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=len(chunks))
+
+    try:
+        futures = [
+            executor.submit(run_partition, algorithm_class, options, chunk, worker_id)
+            for worker_id, chunk in enumerate(chunks)
+        ]
+        sorted_chunks = []
+        for future in futures:
+            chunk_result, worker = future.result()
+            sorted_chunks.append(chunk_result)
+            aggregator.add(worker)
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    # Final k-way merge in the coordinator. heapq.merge is not instrumented,
+    # so its comparisons (about log2(k) per element) are reported as an
+    # estimate rather than added to the measured totals
+    merge_start = time.perf_counter()
+    result = list(heapq.merge(*sorted_chunks)) if len(sorted_chunks) > 1 else (sorted_chunks[0] if sorted_chunks else [])
+    aggregator.add_coordinator_phase("merge", time.perf_counter() - merge_start)
+    aggregator.estimates["merge_comparisons"] = (
+        int(len(result) * math.ceil(math.log2(len(sorted_chunks)))) if len(sorted_chunks) > 1 else 0
+    )
+
+    return result, aggregator
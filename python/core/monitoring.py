@@ -0,0 +1,366 @@
+"""
+Operation Counting via sys.monitoring (PEP 669)
+
+This module provides an alternative counting backend for the Algorithm base
+class. Instead of routing every operation through wrapper methods
+(``self.compare``, ``self.read``, ...), it subscribes to per-instruction
+``sys.monitoring`` events on the algorithm's own code objects and counts:
+
+- comparisons   (COMPARE_OP)
+- reads         (subscript loads: BINARY_SUBSCR, or BINARY_OP ``[]`` on 3.14+)
+- writes        (subscript stores: STORE_SUBSCR)
+- calls         (CALL, CALL_KW, CALL_FUNCTION_EX)
+
+A monitored run binds the "none" tracer, so ``self.compare``, ``self.read``
+and the other primitives reduce to the bare operation with no counting
+closure. The monitor counts their calls instead, through one instruction of
+each primitive's code, and maintains the usual ``Algorithm.metrics``
+counters from them (so budgets and reports keep working). Element
+comparisons made through ``self.compare`` are therefore included in the
+monitored counts along with the bare operations.
+
+Events are enabled only on these code objects (local events), and every
+instruction that is not counted returns ``sys.monitoring.DISABLE`` on its
+first hit, so the interpreter stops reporting it. Stopping the monitor
+clears the local events and releases the tool id, leaving no residual cost.
+
+On interpreters without ``sys.monitoring`` (< 3.12) the monitor reports that
+it is unavailable and the Algorithm falls back to its wrapper counters.
+
+Note that local events are per code object and process-wide: another thread
+running the same code would trigger them too. The monitor only counts events
+from the thread that started it, and only one monitored run is active at a
+time; concurrent requests fall back to wrappers.
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import sys
+import dis
+import threading
+import types
+from typing import Dict, Any, List, Optional, Set, Iterable
+
+# Whether the running interpreter supports PEP 669
+MONITORING_AVAILABLE = hasattr(sys, "monitoring")
+
+TOOL_NAME = "sorting-visualizer"
+
+# Opcode name -> counter name
+_OPCODE_KINDS = {
+    "COMPARE_OP": "comparisons",
+    "BINARY_SUBSCR": "reads",
+    "STORE_SUBSCR": "writes",
+    "CALL": "calls",
+    "CALL_KW": "calls",
+    "CALL_FUNCTION_EX": "calls",
+}
+
+# Primitives of the "none" tracer whose calls are counted
+PRIMITIVE_CALLS = (
+    "compare",
+    "swap",
+    "read",
+    "write",
+    "enter_recursive_call",
+    "exit_recursive_call",
+    "track_branch",
+)
+
+# Only one monitored run at a time (events are process-global)
+_ACTIVE_LOCK = threading.Lock()
+
+# Algorithm class -> offset tables of its code objects (bytecode is immutable)
+_TABLE_CACHE: Dict[type, Dict[types.CodeType, Dict[int, str]]] = {}
+
+# Offset tables of the "none" tracer's primitives (built on first use)
+_PRIMITIVE_TABLES: Dict[types.CodeType, Dict[int, str]] = {}
+
+
+def _instruction_kind(instruction: dis.Instruction) -> Optional[str]:
+    """
+    Classify a bytecode instruction as a counted operation.
+
+    Args:
+        instruction: Instruction from dis.get_instructions
+
+    Returns:
+        Counter name, or None if the instruction is not counted
+    """
+    kind = _OPCODE_KINDS.get(instruction.opname)
+    if kind is None and instruction.opname == "BINARY_OP" and instruction.argrepr == "[]":
+        # Python 3.14 folds subscript loads into BINARY_OP
+        kind = "reads"
+    return kind
+
+
+def _iter_code_objects(code: types.CodeType) -> Iterable[types.CodeType]:
+    """Yield a code object and all code objects nested in its constants."""
+    yield code
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _iter_code_objects(const)
+
+
+def build_offset_tables(code_objects: Iterable[types.CodeType]) -> Dict[types.CodeType, Dict[int, str]]:
+    """
+    Map each code object's counted instruction offsets to counter names.
+
+    Args:
+        code_objects: Code objects to disassemble
+
+    Returns:
+        Dictionary of code object -> {offset: counter name}
+    """
+    tables = {}
+    for code in code_objects:
+        table = {}
+        for instruction in dis.get_instructions(code):
+            kind = _instruction_kind(instruction)
+            if kind is not None:
+                table[instruction.offset] = kind
+        tables[code] = table
+    return tables
+
+
+def primitive_tables() -> Dict[types.CodeType, Dict[int, str]]:
+    """
+    Map each primitive installed by the "none" tracer to one counted offset.
+
+    The offset is the primitive's first reported instruction, so it is hit
+    once per call; for swap it is the store that only runs when i != j, as
+    the counters tracer does not count self-swaps.
+
+    Returns:
+        Dictionary of code object -> {offset: primitive name}
+    """
+    if not _PRIMITIVE_TABLES:
+        from .tracers import NullTracer
+
+        for code in _iter_code_objects(NullTracer.bind.__code__):
+            if code.co_name not in PRIMITIVE_CALLS:
+                continue
+            for instruction in dis.get_instructions(code):
+                if instruction.opname in ("RESUME", "COPY_FREE_VARS", "MAKE_CELL"):
+                    continue
+                if code.co_name == "swap" and instruction.opname != "STORE_SUBSCR":
+                    continue
+                _PRIMITIVE_TABLES[code] = {instruction.offset: code.co_name}
+                break
+    return _PRIMITIVE_TABLES
+
+
+def collect_code_objects(algorithm_class: type, exclude_modules: Set[str] = frozenset()) -> List[types.CodeType]:
+    """
+    Collect the code objects that implement an algorithm class.
+
+    Walks the class MRO and gathers functions, static/class methods and
+    property accessors, skipping classes defined in excluded modules (the
+    base class machinery) so that wrapper internals are not counted.
+
+    Args:
+        algorithm_class: Algorithm subclass to scope monitoring to
+        exclude_modules: Module names whose classes are skipped
+
+    Returns:
+        List of code objects (including nested functions and lambdas)
+    """
+    codes: List[types.CodeType] = []
+    seen: Set[types.CodeType] = set()
+
+    for cls in algorithm_class.__mro__:
+        if cls is object or cls.__module__ in exclude_modules:
+            continue
+
+        for attr in vars(cls).values():
+            if isinstance(attr, (staticmethod, classmethod)):
+                attr = attr.__func__
+
+            functions = []
+            if isinstance(attr, property):
+                functions = [f for f in (attr.fget, attr.fset, attr.fdel) if f is not None]
+            elif isinstance(attr, types.FunctionType):
+                functions = [attr]
+
+            for function in functions:
+                for code in _iter_code_objects(function.__code__):
+                    if code not in seen:
+                        seen.add(code)
+                        codes.append(code)
+
+    return codes
+
+
+class OperationMonitor:
+    """
+    Count operations in a set of code objects using sys.monitoring.
+
+    Attributes:
+        counts (Dict[str, int]): Counters for comparisons, reads, writes and
+            calls, including those made through the primitives
+        metrics (Dict[str, Any]): Algorithm metrics updated for primitive calls
+            the way the counters tracer would
+        instruction_events (int): Counted instructions of the algorithm's own
+            code (primitive calls excluded)
+        active (bool): Whether events are currently being delivered
+    """
+
+    def __init__(self, code_objects: List[types.CodeType],
+                 tables: Optional[Dict[types.CodeType, Dict[int, str]]] = None,
+                 metrics: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the monitor.
+
+        Args:
+            code_objects: Code objects to scope events to
+            tables: Precomputed offset tables (built from code_objects if omitted)
+            metrics: Algorithm metrics to maintain from primitive calls
+        """
+        self.code_objects = code_objects
+        self.counts: Dict[str, int] = {"comparisons": 0, "reads": 0, "writes": 0, "calls": 0}
+        self.metrics: Dict[str, Any] = metrics if metrics is not None else {
+            name: 0 for name in ("comparisons", "swaps", "reads", "writes", "memory_accesses",
+                                 "recursive_calls", "call_depth", "max_call_depth", "branch_operations")
+        }
+        self.instruction_events: int = 0
+        self.active: bool = False
+        self._tool_id: Optional[int] = None
+        self._thread: Optional[int] = None
+
+        # Per code object: offset -> counter or primitive name (uncounted offsets are absent)
+        self._tables = tables if tables is not None else build_offset_tables(code_objects)
+
+    def _on_instruction(self, code: types.CodeType, offset: int):
+        """INSTRUCTION event callback."""
+        table = self._tables.get(code)
+        kind = table.get(offset) if table is not None else None
+        if kind is None:
+            return sys.monitoring.DISABLE
+        if threading.get_ident() != self._thread:
+            # Same code running on another thread (never DISABLE: that is global)
+            return None
+        counts = self.counts
+        if kind in counts:
+            counts[kind] += 1
+            self.instruction_events += 1
+            return None
+
+        metrics = self.metrics
+        if kind == "compare":
+            counts["comparisons"] += 1
+            metrics["comparisons"] += 1
+        elif kind == "read":
+            counts["reads"] += 1
+            metrics["reads"] += 1
+            metrics["memory_accesses"] += 1
+        elif kind == "write":
+            counts["writes"] += 1
+            metrics["writes"] += 1
+            metrics["memory_accesses"] += 1
+        elif kind == "swap":
+            counts["reads"] += 2
+            counts["writes"] += 2
+            metrics["swaps"] += 1
+            metrics["reads"] += 2
+            metrics["writes"] += 2
+            metrics["memory_accesses"] += 4
+        elif kind == "enter_recursive_call":
+            metrics["recursive_calls"] += 1
+            metrics["call_depth"] += 1
+            if metrics["call_depth"] > metrics["max_call_depth"]:
+                metrics["max_call_depth"] = metrics["call_depth"]
+        elif kind == "exit_recursive_call":
+            metrics["call_depth"] = max(0, metrics["call_depth"] - 1)
+        else:
+            metrics["branch_operations"] += 1
+        return None
+
+    def start(self) -> bool:
+        """
+        Start counting.
+
+        Returns:
+            True if monitoring is active, False if unavailable or busy
+        """
+        if not MONITORING_AVAILABLE or self.active:
+            return self.active
+
+        if not _ACTIVE_LOCK.acquire(blocking=False):
+            return False
+
+        monitoring = sys.monitoring
+        tool_id = None
+        for candidate in range(6):
+            if monitoring.get_tool(candidate) is None:
+                tool_id = candidate
+                break
+
+        if tool_id is None:
+            _ACTIVE_LOCK.release()
+            return False
+
+        monitoring.use_tool_id(tool_id, TOOL_NAME)
+        monitoring.register_callback(tool_id, monitoring.events.INSTRUCTION, self._on_instruction)
+        for code in self.code_objects:
+            monitoring.set_local_events(tool_id, code, monitoring.events.INSTRUCTION)
+
+        self._tool_id = tool_id
+        self._thread = threading.get_ident()
+        self.active = True
+        return True
+
+    def stop(self) -> Dict[str, int]:
+        """
+        Stop counting and release the monitoring tool id.
+
+        Returns:
+            Final operation counts
+        """
+        if not self.active:
+            return self.counts
+
+        monitoring = sys.monitoring
+        tool_id = self._tool_id
+        for code in self.code_objects:
+            monitoring.set_local_events(tool_id, code, monitoring.events.NO_EVENTS)
+        monitoring.register_callback(tool_id, monitoring.events.INSTRUCTION, None)
+        monitoring.free_tool_id(tool_id)
+
+        self._tool_id = None
+        self.active = False
+        _ACTIVE_LOCK.release()
+        return self.counts
+
+    def __enter__(self) -> 'OperationMonitor':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+
+def create_monitor(algorithm_class: type, metrics: Optional[Dict[str, Any]] = None) -> OperationMonitor:
+    """
+    Create a monitor scoped to an algorithm class's own code and the
+    primitives of the "none" tracer.
+
+    Code defined in the base algorithm module is excluded so that the wrapper
+    methods themselves are not counted; primitive calls are counted once per
+    call instead.
+
+    Args:
+        algorithm_class: Algorithm subclass
+        metrics: Algorithm metrics to maintain from primitive calls
+
+    Returns:
+        Unstarted OperationMonitor
+    """
+    tables = _TABLE_CACHE.get(algorithm_class)
+    if tables is None:
+        from . import base_algorithm
+        codes = collect_code_objects(algorithm_class, {base_algorithm.__name__})
+        tables = build_offset_tables(codes)
+        tables.update(primitive_tables())
+        tables = _TABLE_CACHE[algorithm_class] = tables
+    return OperationMonitor(list(tables), tables, metrics)
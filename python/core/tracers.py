@@ -0,0 +1,451 @@
+"""
+Pluggable Tracers for Algorithm Instrumentation
+
+A tracer decides what the instrumentation primitives of an Algorithm
+(compare, swap, read, write, recursion and branch tracking) do during a run.
+It is bound once at ``execute`` time by installing specialized closures on the
+algorithm instance, which shadow the class methods for the duration of the run.
+Features that were not selected are therefore compiled out of the closures
+instead of being re-checked on every operation in hot loops.
+
+Built-in tracers (selected with the ``tracer`` option):
+
+- ``"none"``:     No counting, no events. Primitives reduce to the bare operation.
+- ``"counters"``: Operation counters in ``Algorithm.metrics`` (the default).
+                  Event dispatch is only compiled in for events with listeners.
+- ``"full"``:     Counters plus forwarding of every operation to an
+                  ``AlgorithmInstrumentation`` for access-pattern, cache,
+                  movement and phase analysis.
+- ``"sampling"``: Counters plus forwarding of every k-th operation to an
+                  ``AlgorithmInstrumentation`` (``trace_sample_interval``).
+
+Custom tracers subclass ``Tracer`` and may be passed as an instance, a class,
+or registered by name with ``register_tracer``.
+
+Listeners registered while a run is in progress are not seen by primitives
+bound without event dispatch.
+
+Author: Advanced Sorting Algorithm Visualization Platform Team
+License: MIT
+"""
+
+from typing import Dict, Any, Optional, Type, Union, Callable
+
+# Instance attributes a tracer may install (removed again on unbind)
+BOUND_PRIMITIVES = (
+    "compare",
+    "swap",
+    "read",
+    "write",
+    "record_state",
+    "set_phase",
+    "enter_recursive_call",
+    "exit_recursive_call",
+    "track_branch",
+    "allocate_auxiliary",
+)
+
+DEFAULT_SAMPLE_INTERVAL = 100
+
+
+def _is_base_primitive(algorithm: Any, name: str) -> bool:
+    """
+    Check whether a primitive is the unmodified base class implementation.
+
+    Specialized closures replicate base-class semantics, so they are only
+    installed when the algorithm class does not override the primitive.
+    """
+    from .base_algorithm import Algorithm
+    return getattr(type(algorithm), name) is getattr(Algorithm, name)
+
+
+class Tracer:
+    """
+    Base class for tracers.
+
+    Subclasses override ``bind`` to install primitives on the algorithm
+    instance (``algorithm.compare = ...``) and ``report`` to contribute data
+    to ``Algorithm.get_info``.
+
+    Attributes:
+        name (str): Tracer identifier reported in get_info
+    """
+
+    name = "custom"
+
+    def bind(self, algorithm: Any, options: Dict[str, Any]) -> None:
+        """
+        Install primitives on the algorithm instance before a run.
+
+        Args:
+            algorithm: Algorithm instance about to run
+            options: Merged runtime options
+        """
+        pass
+
+    def finish(self, algorithm: Any) -> None:
+        """
+        Finalize tracing after the run completes or fails.
+
+        Args:
+            algorithm: Algorithm instance that ran
+        """
+        pass
+
+    def unbind(self, algorithm: Any) -> None:
+        """
+        Remove installed primitives, restoring the class methods.
+
+        Args:
+            algorithm: Algorithm instance that ran
+        """
+        for name in BOUND_PRIMITIVES:
+            algorithm.__dict__.pop(name, None)
+
+    def report(self) -> Optional[Dict[str, Any]]:
+        """
+        Get tracer-specific analysis for get_info.
+
+        Returns:
+            Report dictionary, or None if the tracer collects nothing extra
+        """
+        return None
+
+
+class NullTracer(Tracer):
+    """Tracer that disables counting and events entirely."""
+
+    name = "none"
+
+    def bind(self, algorithm: Any, options: Dict[str, Any]) -> None:
+        if _is_base_primitive(algorithm, "compare"):
+            def compare(a, b, comparator=None):
+                if comparator:
+                    return comparator(a, b)
+                if a < b:
+                    return -1
+                if a > b:
+                    return 1
+                return 0
+            algorithm.compare = compare
+
+        if _is_base_primitive(algorithm, "swap"):
+            def swap(array, i, j):
+                if i != j:
+                    array[i], array[j] = array[j], array[i]
+            algorithm.swap = swap
+
+        if _is_base_primitive(algorithm, "read"):
+            def read(array, index):
+                return array[index]
+            algorithm.read = read
+
+        if _is_base_primitive(algorithm, "write"):
+            def write(array, index, value):
+                array[index] = value
+            algorithm.write = write
+
+        # Named functions (not lambdas) so that monitoring can tell them apart
+        if _is_base_primitive(algorithm, "enter_recursive_call"):
+            def enter_recursive_call(function_name="", args=None):
+                return None
+
+            def exit_recursive_call():
+                return None
+            algorithm.enter_recursive_call = enter_recursive_call
+            algorithm.exit_recursive_call = exit_recursive_call
+
+        if _is_base_primitive(algorithm, "track_branch"):
+            def track_branch(condition, description=""):
+                return condition
+            algorithm.track_branch = track_branch
+
+
+class CounterTracer(Tracer):
+    """Tracer that maintains operation counters (the default)."""
+
+    name = "counters"
+
+    def bind(self, algorithm: Any, options: Dict[str, Any]) -> None:
+        metrics = algorithm.metrics
+        listeners = algorithm.event_listeners
+
+        # Primitives with listeners keep the class methods (which emit events)
+        if _is_base_primitive(algorithm, "compare") and not listeners.get("comparison"):
+            def compare(a, b, comparator=None):
+                metrics["comparisons"] += 1
+                if comparator:
+                    return comparator(a, b)
+                if a < b:
+                    return -1
+                if a > b:
+                    return 1
+                return 0
+            algorithm.compare = compare
+
+        if _is_base_primitive(algorithm, "swap") and not listeners.get("swap"):
+            def swap(array, i, j):
+                if i == j:
+                    return
+                metrics["swaps"] += 1
+                metrics["reads"] += 2
+                metrics["writes"] += 2
+                metrics["memory_accesses"] += 4
+                array[i], array[j] = array[j], array[i]
+            algorithm.swap = swap
+
+        if not listeners.get("access"):
+            if _is_base_primitive(algorithm, "read"):
+                def read(array, index):
+                    metrics["reads"] += 1
+                    metrics["memory_accesses"] += 1
+                    return array[index]
+                algorithm.read = read
+
+            if _is_base_primitive(algorithm, "write"):
+                def write(array, index, value):
+                    metrics["writes"] += 1
+                    metrics["memory_accesses"] += 1
+                    array[index] = value
+                algorithm.write = write
+
+
+class InstrumentationTracer(Tracer):
+    """
+    Tracer that forwards operations to an AlgorithmInstrumentation.
+
+    Counters in Algorithm.metrics are maintained by the class methods as
+    usual; the instrumentation additionally records access patterns, cache
+    behaviour, element movement and phases.
+
+    Attributes:
+        instrumentation: The AlgorithmInstrumentation receiving operations
+    """
+
+    name = "full"
+
+    def __init__(self, instrumentation_options: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the tracer.
+
+        Args:
+            instrumentation_options: Options passed to AlgorithmInstrumentation
+        """
+        self.instrumentation_options = instrumentation_options
+        self.instrumentation = None
+
+    def _create_instrumentation(self, options: Dict[str, Any]):
+        """Create a fresh instrumentation instance for a run."""
+        from .instrumentation import AlgorithmInstrumentation
+
+        instrumentation_options = self.instrumentation_options
+        if instrumentation_options is None:
+            instrumentation_options = options.get("instrumentation_options")
+        return AlgorithmInstrumentation(instrumentation_options)
+
+    def _should_trace(self) -> Optional[Callable[[], bool]]:
+        """
+        Get the per-operation forwarding predicate.
+
+        Returns:
+            Predicate called per operation, or None to forward every
+            operation (no predicate is compiled into the closures)
+        """
+        return None
+
+    def bind(self, algorithm: Any, options: Dict[str, Any]) -> None:
+        instrumentation = self.instrumentation = self._create_instrumentation(options)
+        instrumentation.start_timing()
+        should_trace = self._should_trace()
+        cls = type(algorithm)
+
+        cls_compare = cls.compare
+        cls_swap = cls.swap
+        cls_read = cls.read
+        cls_write = cls.write
+        cls_set_phase = cls.set_phase
+        cls_enter = cls.enter_recursive_call
+        cls_exit = cls.exit_recursive_call
+        cls_branch = cls.track_branch
+        cls_allocate = cls.allocate_auxiliary
+
+        if should_trace is None:
+            def compare(a, b, comparator=None):
+                result = cls_compare(algorithm, a, b, comparator)
+                instrumentation.track_comparison(a, b, result)
+                return result
+
+            def swap(array, i, j):
+                if i != j:
+                    instrumentation.track_swap(array, i, j)
+                cls_swap(algorithm, array, i, j)
+
+            def read(array, index):
+                value = cls_read(algorithm, array, index)
+                instrumentation.track_read(array, index)
+                return value
+
+            def write(array, index, value):
+                cls_write(algorithm, array, index, value)
+                instrumentation.track_write(array, index, value)
+        else:
+            def compare(a, b, comparator=None):
+                result = cls_compare(algorithm, a, b, comparator)
+                if should_trace():
+                    instrumentation.track_comparison(a, b, result)
+                return result
+
+            def swap(array, i, j):
+                if i != j and should_trace():
+                    instrumentation.track_swap(array, i, j)
+                cls_swap(algorithm, array, i, j)
+
+            def read(array, index):
+                value = cls_read(algorithm, array, index)
+                if should_trace():
+                    instrumentation.track_read(array, index)
+                return value
+
+            def write(array, index, value):
+                cls_write(algorithm, array, index, value)
+                if should_trace():
+                    instrumentation.track_write(array, index, value)
+
+        def set_phase(phase):
+            cls_set_phase(algorithm, phase)
+            instrumentation.set_phase(phase)
+
+        def enter_recursive_call(function_name="", args=None):
+            cls_enter(algorithm, function_name, args)
+            instrumentation.track_function_call(function_name or "recursive", [], is_recursive=True)
+
+        def exit_recursive_call():
+            cls_exit(algorithm)
+            if instrumentation.profile["call_stack"]:
+                top = instrumentation.profile["call_stack"][-1].function
+                instrumentation.track_function_return(top, None, is_recursive=True)
+
+        def track_branch(condition, description=""):
+            instrumentation.track_branch(condition, {"description": description} if description else None)
+            return cls_branch(algorithm, condition, description)
+
+        def allocate_auxiliary(size, purpose=""):
+            cls_allocate(algorithm, size, purpose)
+            instrumentation.track_memory_allocation(size, purpose)
+
+        algorithm.compare = compare
+        algorithm.swap = swap
+        algorithm.read = read
+        algorithm.write = write
+        algorithm.set_phase = set_phase
+        algorithm.enter_recursive_call = enter_recursive_call
+        algorithm.exit_recursive_call = exit_recursive_call
+        algorithm.track_branch = track_branch
+        algorithm.allocate_auxiliary = allocate_auxiliary
+
+    def finish(self, algorithm: Any) -> None:
+        if self.instrumentation is not None:
+            self.instrumentation.end_timing()
+
+    def report(self) -> Optional[Dict[str, Any]]:
+        if self.instrumentation is None:
+            return None
+        return self.instrumentation.generate_report()
+
+
+class SamplingTracer(InstrumentationTracer):
+    """
+    Tracer that forwards every k-th operation to an AlgorithmInstrumentation.
+
+    Counters remain exact; the rich analysis is computed from a systematic
+    sample, trading detail for speed on large inputs.
+    """
+
+    name = "sampling"
+
+    def __init__(self, interval: Optional[int] = None,
+                 instrumentation_options: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the tracer.
+
+        Args:
+            interval: Forward one operation out of every ``interval``
+                (defaults to the ``trace_sample_interval`` option)
+            instrumentation_options: Options passed to AlgorithmInstrumentation
+        """
+        super().__init__(instrumentation_options)
+        self.interval = interval
+        self.sampled_operations = 0
+
+    def bind(self, algorithm: Any, options: Dict[str, Any]) -> None:
+        if self.interval is None:
+            self.interval = max(1, int(options.get("trace_sample_interval", DEFAULT_SAMPLE_INTERVAL)))
+        self.sampled_operations = 0
+        super().bind(algorithm, options)
+
+    def _should_trace(self) -> Optional[Callable[[], bool]]:
+        interval = self.interval
+        countdown = [interval]
+
+        def should_trace():
+            countdown[0] -= 1
+            if countdown[0]:
+                return False
+            countdown[0] = interval
+            self.sampled_operations += 1
+            return True
+
+        return should_trace
+
+    def report(self) -> Optional[Dict[str, Any]]:
+        report = super().report()
+        if report is not None:
+            report["sampling"] = {
+                "interval": self.interval,
+                "sampled_operations": self.sampled_operations
+            }
+        return report
+
+
+# Tracer name -> class (used to resolve the ``tracer`` option)
+TRACERS: Dict[str, Type[Tracer]] = {
+    "none": NullTracer,
+    "counters": CounterTracer,
+    "full": InstrumentationTracer,
+    "sampling": SamplingTracer,
+}
+
+
+def register_tracer(name: str, tracer_class: Type[Tracer]) -> None:
+    """
+    Register a custom tracer class under a name usable in the ``tracer`` option.
+
+    Args:
+        name: Option value selecting the tracer
+        tracer_class: Tracer subclass constructible without arguments
+    """
+    TRACERS[name] = tracer_class
+
+
+def resolve_tracer(spec: Union[str, Tracer, Type[Tracer], None]) -> Tracer:
+    """
+    Create a tracer instance from the ``tracer`` option value.
+
+    Args:
+        spec: Tracer name, instance or class (None selects counters)
+
+    Returns:
+        Tracer instance
+
+    Raises:
+        ValueError: If the name is not registered
+    """
+    if spec is None:
+        return CounterTracer()
+    if isinstance(spec, Tracer):
+        return spec
+    if isinstance(spec, type) and issubclass(spec, Tracer):
+        return spec()
+    if spec not in TRACERS:
+        raise ValueError(f"Unknown tracer: {spec}. Available tracers: {', '.join(TRACERS)}")
+    return TRACERS[spec]()
@@ -37,7 +37,6 @@ import random
 import math
 import statistics
 from typing import List, Dict, Any, Union, Tuple, Callable, Optional, TypeVar, Set
-import numpy as np
 from collections import defaultdict
 
 # Type aliases for improved code clarity and static analysis
@@ -49,6 +48,33 @@ Distribution = Dict[str, Any]
 # Default random number generator for reproducibility control
 _RNG = random.Random()
 
+# NumPy is imported on first use; a seed set before that is applied at import.
+# _NO_SEED means set_seed was never called (None is a valid "reseed randomly")
+_NP = None
+_NO_SEED = object()
+_NP_PENDING_SEED: Any = _NO_SEED
+
+
+def _numpy():
+    """
+    Import NumPy on first use.
+
+    Returns:
+        The numpy module, or None if it is not installed (callers fall back
+        to the pure-Python implementations)
+    """
+    global _NP
+    if _NP is None:
+        try:
+            import numpy
+        except ImportError:
+            _NP = False
+        else:
+            if _NP_PENDING_SEED is not _NO_SEED:
+                numpy.random.seed(_NP_PENDING_SEED)
+            _NP = numpy
+    return _NP or None
+
 
 def set_seed(seed: Optional[int] = None) -> None:
     """
@@ -61,13 +87,13 @@ def set_seed(seed: Optional[int] = None) -> None:
     Args:
         seed: Integer seed for the random number generator. If None, uses a random seed.
     """
-    global _RNG
-    if seed is not None:
-        _RNG = random.Random(seed)
-        np.random.seed(seed)
-    else:
-        _RNG = random.Random()
-        np.random.seed(None)
+    global _RNG, _NP_PENDING_SEED
+    _RNG = random.Random(seed) if seed is not None else random.Random()
+
+    # Seed NumPy now if it is loaded, otherwise when it is first needed
+    _NP_PENDING_SEED = seed
+    if _NP:
+        _NP.random.seed(seed)
 
 
 def generate_dataset(data_type: str, size: int, **options) -> DataArray:
@@ -641,6 +667,7 @@ def generate_gaussian_distribution(size: int, min_val: int = 1, max_val: int = 1
     result = []
     
     # Generate values using Box-Muller transform or numpy
+    np = _numpy()
     if np:
         # NumPy is more efficient for large arrays
         raw_values = np.random.normal(mean, std_dev, size)
@@ -701,6 +728,7 @@ def generate_exponential_distribution(size: int, min_val: int = 1, max_val: int
     result = []
     value_range = max_val - min_val
     
+    np = _numpy()
     if np:
         # More efficient implementation with NumPy
         raw_values = np.random.exponential(1/lambda_param, size)
@@ -777,6 +805,7 @@ def generate_bimodal_distribution(size: int, min_val: int = 1, max_val: int = 10
     
     result = []
     
+    np = _numpy()
     if np:
         # Efficient NumPy implementation
         # Determine number of samples from each distribution
@@ -855,6 +884,7 @@ def generate_pareto_distribution(size: int, min_val: int = 1, max_val: int = 100
     result = []
     value_range = max_val - min_val
     
+    np = _numpy()
     if np:
         # Efficient NumPy implementation
         raw_values = np.random.pareto(alpha, size)
@@ -917,6 +947,7 @@ def generate_lognormal_distribution(size: int, min_val: int = 1, max_val: int =
     result = []
     value_range = max_val - min_val
     
+    np = _numpy()
     if np:
         # Efficient NumPy implementation
         raw_values = np.random.lognormal(mu, sigma, size)
@@ -1857,6 +1888,7 @@ def analyze_dataset(array: DataArray) -> Dict[str, Any]:
     result['uniqueness_ratio'] = unique_values / len(array)
     
     # Distribution analysis if numpy is available
+    np = _numpy()
     if np:
         result['std_dev'] = np.std(array)
         result['skewness'] = calculate_skewness(array)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Batch Execution Tests
+
+Verifies row offsets and chunk partitioning, that lists of rows and packed
+rows (JSON and binary, sorted in place in shared memory) come back sorted in
+their request layout with per-row metric columns, and that a failing row is
+reported without affecting the others.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import json
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from python.bridge.batch import partition_rows, row_bounds, run_batch
+from python.bridge.executor import ExecutionBackend, SharedInput
+from python.bridge.wire import WIRE_MIMETYPE, decode_array, encode_array
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+class BatchTest(unittest.TestCase):
+
+    ROWS = [[5, 3, 9], [], [2, 1], [7, 8, 6, 4]]
+
+    def packed(self):
+        data = [value for row in self.ROWS for value in row]
+        offsets = [0]
+        for row in self.ROWS:
+            offsets.append(offsets[-1] + len(row))
+        return data, offsets
+
+    def test_row_bounds(self):
+        self.assertEqual(row_bounds([0, 3, 3], 5), [(0, 3), (3, 3), (3, 5)])
+        self.assertEqual(row_bounds([0, 2, 5], 5), [(0, 2), (2, 5)])
+        for offsets in ([1, 3], [0, 4, 2], [0, 6]):
+            with self.assertRaises(ValueError):
+                row_bounds(offsets, 5)
+
+    def test_partition_rows(self):
+        ranges = partition_rows([10, 1, 1, 10, 0, 0, 10], 3)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], 7)
+        self.assertTrue(all(a[1] == b[0] for a, b in zip(ranges, ranges[1:])))
+        self.assertLessEqual(len(ranges), 3)
+        self.assertEqual(partition_rows([3, 3], 8), [(0, 1), (1, 2)])
+
+    def test_run_batch(self):
+        backend = ExecutionBackend(mode='inline')
+        entries = run_batch(backend, 'merge-sort', self.ROWS, None, {})
+        self.assertEqual([entry['result'] for entry in entries], [sorted(row) for row in self.ROWS])
+
+        data, offsets = self.packed()
+        with SharedInput(data) as shared:
+            entries = run_batch(backend, 'heap-sort', shared.ref, row_bounds(offsets, len(data)), {})
+            with shared.buffer as view, view.cast(shared.ref.typecode) as values:
+                self.assertEqual(values.tolist(), [value for row in self.ROWS for value in sorted(row)])
+        self.assertEqual(len(entries), len(self.ROWS))
+        self.assertNotIn('result', entries[0])
+        self.assertGreater(entries[3]['comparisons'], 0)
+
+    @unittest.skipUnless(FLASK_AVAILABLE, "flask is required")
+    def test_endpoint(self):
+        from python.bridge import server
+        backend, server.BACKEND = server.BACKEND, ExecutionBackend(mode='inline')
+        try:
+            client = server.app.test_client()
+            expected = [value for row in self.ROWS for value in sorted(row)]
+            data, offsets = self.packed()
+
+            body = client.post('/execute/batch', json={'algorithm': 'insertion-sort',
+                                                       'datasets': self.ROWS}).json
+            self.assertEqual(body['results'], [sorted(row) for row in self.ROWS])
+            self.assertEqual(len(body['metrics']['comparisons']), len(self.ROWS))
+            self.assertEqual(body['errors'], [])
+
+            body = client.post('/execute/batch', json={'algorithm': 'insertion-sort', 'data': data,
+                                                       'offsets': offsets[:-1]}).json
+            self.assertEqual((body['data'], body['offsets']), (expected, offsets))
+
+            body = client.post('/execute/batch', json={'algorithm': 'merge-sort', 'data': ['b', 'a', 'c'],
+                                                       'offsets': [0, 2]}).json
+            self.assertEqual(body['data'], ['a', 'b', 'c'])
+
+            response = client.post('/execute/batch', data=encode_array(data),
+                                   content_type='application/octet-stream',
+                                   headers={'X-Request': json.dumps({'algorithm': 'heap-sort',
+                                                                     'offsets': offsets})})
+            self.assertEqual(response.mimetype, WIRE_MIMETYPE)
+            self.assertEqual(decode_array(response.data), expected)
+            self.assertEqual(json.loads(response.headers['X-Batch-Metrics'])['rows'], len(self.ROWS))
+
+            rows = [[3, 2, 1], list(range(100, 0, -1))]
+            body = client.post('/execute/batch', json={'algorithm': 'insertion-sort', 'datasets': rows,
+                                                       'limits': {'maxComparisons': 10}}).json
+            self.assertEqual(body['results'][0], [1, 2, 3])
+            self.assertEqual([error['index'] for error in body['errors']], [1])
+            self.assertIn('budget_exceeded', body['errors'][0])
+            self.assertIsNone(body['metrics']['comparisons'][1])
+
+            response = client.post('/execute/batch', json={'algorithm': 'merge-sort', 'data': [1], 'offsets': [2]})
+            self.assertEqual(response.status_code, 400)
+        finally:
+            server.BACKEND = backend
+
+
+if __name__ == '__main__':
+    unittest.main()
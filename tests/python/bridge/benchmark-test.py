@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Scaling Benchmark Tests
+
+Verifies sweep resolution and the log-log fit, that generated datasets are
+identical across algorithms, that fitted exponents match known growth, and
+that /benchmark validates its input and reports failed points.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from python.bridge.benchmark import fit_power_law, run_benchmark, run_benchmark_point, sweep_sizes
+from python.bridge.executor import ExecutionBackend
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+class BenchmarkTest(unittest.TestCase):
+
+    DATASET = {'type': 'reversed', 'options': {'max_val': 10000}}
+
+    def test_sweep_sizes(self):
+        self.assertEqual(sweep_sizes(start=100, stop=800), [100, 200, 400, 800])
+        self.assertEqual(sweep_sizes([30, 10, 10]), [10, 30])
+        with self.assertRaises(ValueError):
+            sweep_sizes(start=10, stop=5)
+        with self.assertRaises(ValueError):
+            sweep_sizes([10 ** 9])
+
+    def test_fit_power_law(self):
+        sizes = [10, 100, 1000]
+        fit = fit_power_law(sizes, [3 * size ** 2 for size in sizes])
+        self.assertAlmostEqual(fit['exponent'], 2)
+        self.assertAlmostEqual(fit['constant'], 3)
+        self.assertAlmostEqual(fit['r2'], 1)
+        self.assertIsNone(fit_power_law(sizes, [0, 0, 5]))
+
+    def test_points_and_exponents(self):
+        first = run_benchmark_point('heap-sort', self.DATASET, 64, {})
+        second = run_benchmark_point('heap-sort', self.DATASET, 64, {}, repeats=3)
+        self.assertEqual(first['comparisons'], second['comparisons'])
+        self.assertEqual(len(second['times']), 3)
+
+        results = run_benchmark(ExecutionBackend(mode='inline'), ['insertion-sort', 'merge-sort'],
+                                self.DATASET, [50, 100, 200, 400], {})
+        self.assertAlmostEqual(results['insertion-sort']['fits']['comparisons']['exponent'], 2, delta=0.1)
+        self.assertAlmostEqual(results['merge-sort']['fits']['comparisons']['exponent'], 1.15, delta=0.15)
+
+    @unittest.skipUnless(FLASK_AVAILABLE, "flask is required")
+    def test_endpoint(self):
+        from python.bridge import server
+        backend, server.BATCH_BACKEND = server.BATCH_BACKEND, ExecutionBackend(mode='inline')
+        try:
+            client = server.app.test_client()
+            request = {'algorithms': ['merge-sort'], 'dataset': {'type': 'random', 'options': {'seed': 7}},
+                       'sweep': {'start': 32, 'stop': 128}}
+
+            response = client.post('/benchmark', json=request)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.json['sizes'], [32, 64, 128])
+            result = response.json['results']['merge-sort']
+            self.assertEqual([point['size'] for point in result['points']], [32, 64, 128])
+            self.assertGreater(result['fits']['comparisons']['exponent'], 1)
+
+            response = client.post('/benchmark', json=dict(request, algorithms=['insertion-sort'],
+                                                           limits={'maxComparisons': 1000}))
+            self.assertIn('error', response.json['results']['insertion-sort']['points'][-1])
+
+            self.assertEqual(client.post('/benchmark', json=dict(request, dataset={'type': 'nope'})).status_code, 400)
+            self.assertEqual(client.post('/benchmark', json=dict(request, sizes=[0])).status_code, 400)
+            self.assertEqual(client.post('/benchmark', json=dict(request, algorithms=['nope'])).status_code, 404)
+        finally:
+            server.BATCH_BACKEND = backend
+
+
+if __name__ == '__main__':
+    unittest.main()
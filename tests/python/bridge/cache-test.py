@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Result Cache Tests
+
+Verifies content addressing, LRU eviction under the byte budget, on-disk
+persistence, single-flight deduplication and the cached endpoints.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from python.bridge.cache import ResultCache, cache_key
+from python.bridge.executor import ExecutionBackend, RunOutput
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+def _output(size: int) -> RunOutput:
+    return RunOutput(b'x' * size, 0, 0.0)
+
+
+class ResultCacheTest(unittest.TestCase):
+
+    def test_cache_key(self):
+        key = cache_key('execute', 'merge-sort', {'b': 1, 'a': 2}, [3, 1, 2])
+        self.assertEqual(key, cache_key('execute', 'merge-sort', {'a': 2, 'b': 1}, [3, 1, 2]))
+        self.assertNotEqual(key, cache_key('compare', 'merge-sort', {'a': 2, 'b': 1}, [3, 1, 2]))
+        self.assertNotEqual(key, cache_key('execute', 'merge-sort', {'a': 2, 'b': 1}, [3, 1, 2.0]))
+        self.assertNotEqual(key, cache_key('execute', 'merge-sort', {'a': 2, 'b': 1}, [3, 1, 2],
+                                           {'max_comparisons': 10}))
+        self.assertEqual(cache_key('execute', 'x', {}, [2 ** 70]), cache_key('execute', 'x', {}, [2 ** 70]))
+
+    def test_lru_eviction(self):
+        cache = ResultCache(max_bytes=100, directory=None)
+        cache.put('a', _output(40))
+        cache.put('b', _output(40))
+        self.assertIsNotNone(cache.get('a'))  # 'b' is now least recently used
+        cache.put('c', _output(40))
+
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('a'))
+        self.assertEqual(cache.bytes, 80)
+        self.assertEqual(cache.stats['evictions'], 1)
+
+        cache.put('huge', _output(101))
+        self.assertIsNone(cache.get('huge'))
+
+    def test_disk_persistence(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = RunOutput(b'{}', 3, 0.5, comparisons=7)
+            ResultCache(max_bytes=1024, directory=directory).put('k', output)
+
+            cache = ResultCache(max_bytes=1024, directory=directory)
+            self.assertEqual(cache.get('k'), output)
+            self.assertEqual(cache.stats['disk_hits'], 1)
+
+    def test_single_flight(self):
+        cache = ResultCache(max_bytes=1024, directory=None)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return _output(10)
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('k', compute)))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(hit for _, hit in results), [False, True, True, True])
+
+    def test_errors_are_not_cached(self):
+        cache = ResultCache(max_bytes=1024, directory=None)
+
+        def fail():
+            raise RuntimeError('boom')
+
+        with self.assertRaises(RuntimeError):
+            cache.get_or_compute('k', fail)
+        self.assertEqual(cache.get_or_compute('k', lambda: _output(1)), (_output(1), False))
+
+    @unittest.skipUnless(FLASK_AVAILABLE, "flask is required")
+    def test_endpoints(self):
+        from python.bridge import server
+        backend, server.BACKEND = server.BACKEND, ExecutionBackend(mode='inline')
+        cache, server.RESULT_CACHE = server.RESULT_CACHE, ResultCache(max_bytes=1 << 20, directory=None)
+        try:
+            client = server.app.test_client()
+            request = {'algorithm': 'heap-sort', 'data': [4, 2, 3, 1]}
+            first = client.post('/execute', json=request)
+            second = client.post('/execute', json=request)
+            self.assertEqual(first.headers['X-Cache'], 'MISS')
+            self.assertEqual(second.headers['X-Cache'], 'HIT')
+            self.assertEqual(first.data, second.data)
+            self.assertEqual(client.post('/execute', json=dict(request, cache=False)).headers['X-Cache'], 'MISS')
+
+            request = {'algorithms': ['heap-sort', 'comb-sort'], 'data': [4, 2, 3, 1]}
+            client.post('/compare', json=dict(request, algorithms=['heap-sort']))
+            response = client.post('/compare', json=request)
+            self.assertEqual(response.headers['X-Cache'], 'PARTIAL')
+            self.assertEqual(response.json['comparison']['comb-sort']['result'], [1, 2, 3, 4])
+            self.assertEqual(client.post('/compare', json=request).headers['X-Cache'], 'HIT')
+            # A different timeout is a different run
+            response = client.post('/compare', json=dict(request, timeouts={'comb-sort': 5}))
+            self.assertEqual(response.headers['X-Cache'], 'PARTIAL')
+        finally:
+            server.BACKEND = backend
+            server.RESULT_CACHE = cache
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Column-Oriented History Tests
+
+Verifies that column-encoded histories decode to exactly the states the JSON
+encoding carries, that arrays, strings, counters and sparse keys use the
+documented columns, and that /execute negotiates the encoding through the
+Accept header.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import json
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from python.bridge.executor import (
+    ExecutionBackend, get_registry, run_execute, serialize_algorithm_state
+)
+from python.bridge.columnar import (
+    COLUMNS_MIMETYPE, decode_history_columns, encode_history_columns
+)
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+class ColumnarHistoryTest(unittest.TestCase):
+
+    DATA = list(range(60, 0, -1))
+
+    def test_roundtrip_matches_json(self):
+        for algorithm in ('insertion-sort', 'merge-sort', 'heap-sort', 'radix-sort'):
+            algorithm_class, _ = get_registry().load(algorithm)
+            instance = algorithm_class({})
+            instance.execute(self.DATA)
+
+            expected = json.loads(json.dumps([serialize_algorithm_state(s) for s in instance.history]))
+            encoded = json.dumps(encode_history_columns(instance.history))
+            self.assertEqual(decode_history_columns(json.loads(encoded)), expected, algorithm)
+            self.assertLess(len(encoded), len(json.dumps(expected)))
+
+    def test_run_execute(self):
+        text = run_execute('insertion-sort', self.DATA, {})
+        columns = run_execute('insertion-sort', self.DATA, {}, encoding='columns')
+        self.assertEqual(columns.mimetype, COLUMNS_MIMETYPE)
+        self.assertEqual(columns.history_states, text.history_states)
+        self.assertEqual(json.loads(columns.payload)['result'], json.loads(text.payload)['result'])
+
+    def test_array_diffs(self):
+        history = [{'array': [5, 4, 3, 2, 1]}, {'array': [5, 4, 3, 2, 1]}, {'array': [4, 5, 3, 2, 1]},
+                   {'array': [1, 2, 3, 4]}]
+        columns = encode_history_columns(history)['array']
+        self.assertEqual(columns['offsets'], [0, 0, 2, 2])
+        self.assertEqual(columns['indices'], [0, 1])
+        self.assertEqual(columns['values'], [4, 5])
+        self.assertEqual(columns['full'], {'3': [1, 2, 3, 4]})
+        self.assertEqual(decode_history_columns(encode_history_columns(history)), history)
+
+    def test_field_columns(self):
+        history = [{'type': 'compare', 'message': f'Comparing {i} and {i + 1}',
+                    'metrics': {'comparisons': i, 'execution_time': 0.5}} for i in range(20)]
+        history[5]['pivot'] = {1, 2}
+        fields = encode_history_columns(history)['fields']
+
+        self.assertEqual(fields['type'], {'names': ['compare'], 'codes': {'rle': [0, 20]}})
+        self.assertEqual(fields['message']['templates'], [['Comparing ', ' and ', '']])
+        self.assertEqual(fields['metrics']['fields']['comparisons'], {'deltas': {'rle': [0, 1, 1, 19]}})
+        self.assertEqual(fields['pivot']['steps'], [5])
+
+        decoded = decode_history_columns(encode_history_columns(history))
+        self.assertEqual(decoded[5]['pivot'], [1, 2])
+        del history[5]['pivot'], decoded[5]['pivot']
+        self.assertEqual(decoded, history)
+
+    def test_messages_roundtrip_exactly(self):
+        messages = ['Moved 007 to -3', 'Value 1.50 at 12345678901234567890', 'No numbers'] * 3
+        history = [{'message': message} for message in messages]
+        decoded = decode_history_columns(json.loads(json.dumps(encode_history_columns(history))))
+        self.assertEqual([state['message'] for state in decoded], messages)
+
+    def test_rejects_unknown_format(self):
+        with self.assertRaises(ValueError):
+            decode_history_columns({'format': 'rows', 'version': 1})
+
+    @unittest.skipUnless(FLASK_AVAILABLE, "Flask is not installed")
+    def test_negotiation(self):
+        from python.bridge import server
+        backend, server.BACKEND = server.BACKEND, ExecutionBackend(mode='inline')
+        try:
+            client = server.app.test_client()
+            request = {'algorithm': 'insertion-sort', 'data': [4, 2, 3, 1], 'cache': False}
+
+            response = client.post('/execute', json=request,
+                                   headers={'Accept': f'{COLUMNS_MIMETYPE}, application/json;q=0.5'})
+            self.assertEqual(response.mimetype, COLUMNS_MIMETYPE)
+            body = response.get_json(force=True)
+            self.assertEqual(body['result'], [1, 2, 3, 4])
+            self.assertEqual(decode_history_columns(body['history'])[-1]['array'], [1, 2, 3, 4])
+        finally:
+            server.BACKEND = backend
+
+
+if __name__ == '__main__':
+    unittest.main()
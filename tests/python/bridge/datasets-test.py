@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Dataset Spec Tests
+
+Verifies that specs are normalized and addressed independently of key
+style, that seeded specs are generated once and shared while seedless ones
+are not cached, that evicted datasets stay readable until their last lease
+is released, and that endpoints accept specs in place of data lists.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from python.bridge import datasets
+from python.bridge.datasets import DatasetCache, normalize_spec, spec_digest
+from python.bridge.executor import ExecutionBackend, InputRef, resolve_input
+from python.utils.data_generators import generate_dataset
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+class DatasetCacheTest(unittest.TestCase):
+
+    SPEC = {'type': 'gaussian', 'size': 500, 'seed': 7, 'minVal': 1, 'maxVal': 1000}
+
+    def test_normalize_spec(self):
+        camel = normalize_spec(self.SPEC)
+        snake = normalize_spec({'type': 'Gaussian', 'size': '500', 'seed': 7, 'min_val': 1, 'max_val': 1000})
+        self.assertEqual(camel, snake)
+        self.assertEqual(spec_digest(camel), spec_digest(snake))
+        self.assertNotEqual(spec_digest(camel), spec_digest(normalize_spec(dict(self.SPEC, seed=8))))
+        for spec in ({'size': 5}, {'type': 'random'}, {'type': 'random', 'size': -1}, [1, 2]):
+            with self.assertRaises(ValueError):
+                normalize_spec(spec)
+
+    def test_lease_and_reuse(self):
+        cache = DatasetCache()
+        self.addCleanup(cache.clear)
+        expected = generate_dataset('gaussian', 500, seed=7, min_val=1, max_val=1000)
+        with cache.lease(self.SPEC) as first, cache.lease(dict(self.SPEC)) as second:
+            self.assertIsInstance(first.ref, InputRef)
+            self.assertEqual(first.ref, second.ref)
+            self.assertEqual(resolve_input(first.ref), expected)
+        self.assertEqual((cache.stats['misses'], cache.stats['hits']), (1, 1))
+
+        with cache.lease({'type': 'random', 'size': 10}) as unseeded:
+            self.assertEqual(len(resolve_input(unseeded.ref)), 10)
+        self.assertEqual((cache.stats['uncached'], len(cache)), (1, 1))
+
+        with self.assertRaises(ValueError):
+            cache.lease({'type': 'unknown', 'size': 10, 'seed': 1})
+
+    def test_eviction_waits_for_leases(self):
+        cache = DatasetCache(max_bytes=8 * 600)
+        self.addCleanup(cache.clear)
+        held = cache.lease(self.SPEC)
+        cache.lease(dict(self.SPEC, seed=8)).close()
+        self.assertEqual(cache.stats['evictions'], 1)
+        self.assertEqual(len(resolve_input(held.ref)), 500)
+        held.close()
+        held.close()
+        with self.assertRaises(FileNotFoundError):
+            resolve_input(held.ref)
+
+    @unittest.skipUnless(FLASK_AVAILABLE, "flask is required")
+    def test_endpoints(self):
+        from python.bridge import server
+        backend, server.BACKEND = server.BACKEND, ExecutionBackend(mode='inline')
+        cache, datasets.DATASETS = datasets.DATASETS, DatasetCache()
+        self.addCleanup(datasets.DATASETS.clear)
+        try:
+            client = server.app.test_client()
+            expected = sorted(generate_dataset('gaussian', 500, seed=7, min_val=1, max_val=1000))
+
+            comparison = client.post('/compare', json={'algorithms': ['merge-sort', 'heap-sort'],
+                                                       'data': self.SPEC}).json['comparison']
+            self.assertEqual(comparison['merge-sort']['result'], expected)
+            self.assertEqual(comparison['heap-sort']['result'], expected)
+
+            response = client.post('/execute', json={'algorithm': 'insertion-sort', 'data': self.SPEC,
+                                                      'options': {'recordHistory': False}})
+            self.assertEqual(response.json['result'], expected)
+            self.assertEqual(datasets.DATASETS.stats['misses'], 1)
+
+            # Batches sort in place, which must not touch the cached dataset
+            client.post('/execute/batch', json={'algorithm': 'merge-sort', 'data': self.SPEC, 'offsets': [0]})
+            with datasets.DATASETS.lease(self.SPEC) as dataset:
+                self.assertNotEqual(resolve_input(dataset.ref), expected)
+
+            response = client.post('/execute', json={'algorithm': 'merge-sort', 'data': {'type': 'nope', 'size': 3}})
+            self.assertEqual(response.status_code, 400)
+        finally:
+            server.BACKEND = backend
+            datasets.DATASETS = cache
+
+
+if __name__ == '__main__':
+    unittest.main()
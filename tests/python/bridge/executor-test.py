@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Process-Pool Execution Backend Tests
+
+Verifies that runs dispatched to worker processes return the same JSON
+bodies as inline runs, that comparisons share their input and honour
+per-algorithm timeouts, and that the endpoints serve the results.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import json
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from python.bridge.executor import ExecutionBackend, InputRef, SharedInput, resolve_input, run_compare_entry
+from python.core.budget import BudgetExceeded
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+class ExecutionBackendTest(unittest.TestCase):
+
+    DATA = [5, 2, 9, 1, 7]
+
+    def test_inline_execute(self):
+        backend = ExecutionBackend(mode='inline')
+        output = backend.execute('insertion-sort', self.DATA, {})
+        body = json.loads(output.payload)
+        self.assertEqual(body['result'], sorted(self.DATA))
+        self.assertEqual(len(body['history']), output.history_states)
+        self.assertIn('comparisons', body['metrics'])
+
+    def test_process_pool(self):
+        backend = ExecutionBackend(mode='process', workers=2)
+        try:
+            backend.start(prestart=True)
+            output = backend.execute('heap-sort', self.DATA, {'record_history': False})
+            self.assertEqual(json.loads(output.payload)['result'], sorted(self.DATA))
+
+            entry = backend.submit(run_compare_entry, 'merge-sort', self.DATA, {}).result()
+            self.assertIn('execution_time', json.loads(entry.payload))
+
+            with self.assertRaises(ImportError):
+                backend.execute('pigeonhole-sort-missing', self.DATA, {})
+        finally:
+            backend.shutdown()
+
+    def test_shared_input(self):
+        with SharedInput([3, -1, 2 ** 40]) as shared:
+            self.assertIsInstance(shared.ref, InputRef)
+            self.assertEqual(resolve_input(shared.ref), [3, -1, 2 ** 40])
+        with SharedInput([0.5, 1.5]) as shared:
+            self.assertEqual(resolve_input(shared.ref), [0.5, 1.5])
+        with SharedInput([1, 'a']) as shared:
+            self.assertEqual(shared.ref, [1, 'a'])
+
+    def test_parallel_compare_with_timeout(self):
+        data = list(range(12, 0, -1))
+        backend = ExecutionBackend(mode='process', workers=2)
+        try:
+            outcomes = dict(backend.compare(
+                ['insertion-sort', 'bogo-sort', 'heap-sort'], data,
+                {'bogo-sort': {'max_iterations': 10 ** 9, 'record_history': False}},
+                timeouts={'bogo-sort': 0.5}, shared_input_min=1
+            ))
+            # The deadline stops the run cooperatively, with a partial report
+            self.assertIsInstance(outcomes['bogo-sort'], BudgetExceeded)
+            self.assertEqual(outcomes['bogo-sort'].reason, 'deadline')
+            self.assertEqual(len(outcomes['bogo-sort'].report['partial_result']), len(data))
+            for key in ('insertion-sort', 'heap-sort'):
+                self.assertEqual(json.loads(outcomes[key].payload)['result'], sorted(data))
+
+            fair = backend.compare(['merge-sort', 'shell-sort'], data, {}, fair_timing=True)
+            self.assertEqual([key for key, _ in fair], ['merge-sort', 'shell-sort'])
+        finally:
+            backend.shutdown()
+
+    def test_queued_compare_timeouts(self):
+        # Three runs that each use their whole timeout, one worker: the last
+        # starts long after the first timeout would have expired
+        data = list(range(3000, 0, -1))
+        algorithms = ['insertion-sort', 'bubble-sort', 'selection-sort']
+        backend = ExecutionBackend(mode='process', workers=1)
+        try:
+            outcomes = dict(backend.compare(
+                algorithms, data, {key: {'record_history': False} for key in algorithms},
+                timeouts=dict.fromkeys(algorithms, 0.5)
+            ))
+            for key in algorithms:
+                self.assertIsInstance(outcomes[key], BudgetExceeded, key)
+                self.assertEqual(outcomes[key].reason, 'deadline')
+        finally:
+            backend.shutdown()
+
+    def test_execute_limits(self):
+        backend = ExecutionBackend(mode='inline')
+        with self.assertRaises(BudgetExceeded) as context:
+            backend.execute('bubble-sort', list(range(300, 0, -1)), {}, {'max_history_states': 5})
+        self.assertEqual(context.exception.reason, 'history_states')
+        self.assertEqual(context.exception.report['history_states'], 5)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            ExecutionBackend(mode='threads')
+
+    @unittest.skipUnless(FLASK_AVAILABLE, "flask is required")
+    def test_endpoints(self):
+        from python.bridge import server
+        backend, server.BACKEND = server.BACKEND, ExecutionBackend(mode='inline')
+        try:
+            client = server.app.test_client()
+            response = client.post('/execute', json={'algorithm': 'shell-sort', 'data': self.DATA})
+            self.assertEqual(response.json['result'], sorted(self.DATA))
+
+            response = client.post('/compare', json={
+                'algorithms': ['comb-sort', 'no-such-sort'], 'data': self.DATA
+            })
+            comparison = response.json['comparison']
+            self.assertEqual(comparison['comb-sort']['result'], sorted(self.DATA))
+            self.assertIn('error', comparison['no-such-sort'])
+            self.assertEqual(response.json['input_size'], len(self.DATA))
+            self.assertEqual(sorted(response.json['completion_order']), ['comb-sort', 'no-such-sort'])
+
+            response = client.post('/execute', json={
+                'algorithm': 'selection-sort', 'data': list(range(200, 0, -1)),
+                'limits': {'maxComparisons': 100}
+            })
+            self.assertEqual(response.status_code, 422)
+            self.assertEqual(response.json['budget_exceeded']['reason'], 'comparisons')
+        finally:
+            server.BACKEND = backend
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Health Monitor Tests
+
+Verifies that rolling histograms estimate quantiles within their bucket
+resolution and forget observations older than the window, that counters
+roll the same way, and that /health reports latency, rejections, cache hit
+rates and memory, answering 503 when saturated.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import random
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from python.bridge import health
+from python.bridge.executor import ExecutionBackend
+from python.bridge.health import GROWTH, HealthMonitor, RollingCounter, RollingHistogram
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+class RollingTest(unittest.TestCase):
+
+    def test_quantiles(self):
+        histogram = RollingHistogram(window=60, slots=6)
+        values = [random.uniform(0.001, 2.0) for _ in range(5000)]
+        for value in values:
+            histogram.observe(value, now=100.0)
+
+        summary = histogram.quantiles(now=100.0)
+        self.assertEqual(summary['count'], 5000)
+        values.sort()
+        for quantile in (0.5, 0.95, 0.99):
+            exact = values[int(quantile * len(values)) - 1]
+            self.assertLess(abs(summary[f'p{quantile * 100:g}'] / exact - 1), GROWTH - 1)
+
+    def test_window(self):
+        histogram = RollingHistogram(window=60, slots=6)
+        counter = RollingCounter(window=60, slots=6)
+        histogram.observe(5.0, now=0.0)
+        counter.add(3, now=0.0)
+        histogram.observe(0.01, now=55.0)
+        counter.add(1, now=55.0)
+
+        self.assertEqual(histogram.quantiles(now=59.0)['count'], 2)
+        self.assertEqual(counter.total(now=59.0), 4)
+        summary = histogram.quantiles(now=65.0)
+        self.assertEqual(summary['count'], 1)
+        self.assertLess(summary['p99'], 0.02)
+        self.assertEqual(counter.total(now=65.0), 1)
+        self.assertIsNone(histogram.quantiles(now=200.0)['p50'])
+
+    def test_monitor(self):
+        monitor = HealthMonitor(window=60, slots=6)
+        monitor.request_started('/execute')
+        self.assertEqual(monitor.in_flight, 1)
+        monitor.request_finished('/execute', 'merge-sort', 0.2, 200, now=10.0)
+        monitor.request_started('/jobs')
+        monitor.request_finished('/jobs', 'heap-sort', 0.001, 429, now=10.0)
+        monitor.observe_cache('/execute', True, now=10.0)
+        monitor.observe_cache('/execute', False, now=10.0)
+
+        report = monitor.describe(now=11.0)
+        self.assertEqual(report['in_flight']['total'], 0)
+        self.assertEqual(report['latency']['/execute']['merge-sort']['count'], 1)
+        self.assertEqual(report['rejected'], {'/jobs': {'429': 1}})
+        self.assertEqual(report['cache']['/execute']['hit_rate'], 0.5)
+        self.assertEqual(monitor.describe(now=200.0)['requests'], {})
+
+    @unittest.skipUnless(FLASK_AVAILABLE, "flask is required")
+    def test_endpoint(self):
+        from python.bridge import server
+        backend, server.BACKEND = server.BACKEND, ExecutionBackend(mode='inline')
+        monitor, health.MONITOR = health.MONITOR, HealthMonitor()
+        try:
+            client = server.app.test_client()
+            client.post('/execute', json={'algorithm': 'merge-sort', 'data': [3, 1, 2], 'cache': False})
+            client.post('/execute', json={'algorithm': 'bogo-sort', 'data': list(range(40, 0, -1))})
+
+            response = client.get('/health')
+            self.assertEqual(response.status_code, 200)
+            report = response.json
+            self.assertEqual(report['status'], 'ok')
+            self.assertEqual(report['latency']['/execute']['merge-sort']['count'], 1)
+            self.assertEqual(report['rejected']['/execute'], {'422': 1})
+            self.assertGreater(report['memory']['server'], 0)
+            self.assertNotIn('/health', report['requests'])
+
+            health.MONITOR.max_in_flight = 0
+            response = client.get('/health')
+            self.assertEqual((response.status_code, response.json['status']), (503, 'saturated'))
+        finally:
+            server.BACKEND = backend
+            health.MONITOR = monitor
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Job Queue Tests
+
+Verifies that jobs start in priority order within the concurrency limit,
+that a full queue rejects jobs with a retry hint, that queued jobs can be
+cancelled, that queue wait and run time are reported, and that the /jobs
+endpoints answer 202, 429 and 409 as documented.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from python.bridge.executor import ExecutionBackend
+from python.bridge.jobs import JobQueue, QueueFull
+from python.bridge.runs import RunStore
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+class HeldBackend:
+    """Backend that runs each submitted job only when the test releases it."""
+
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.pending.append((fn, args, future))
+        return future
+
+    def release(self):
+        fn, args, future = self.pending.pop(0)
+        future.set_result(fn(*args))
+        return args[2]
+
+    def fail(self, error):
+        self.pending.pop(0)[2].set_exception(error)
+
+
+class JobQueueTest(unittest.TestCase):
+
+    DATA = [5, 3, 9, 1]
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.store = RunStore(os.path.join(self.directory, 'runs.sqlite3'))
+
+    def test_priority_order(self):
+        backend = HeldBackend()
+        queue = JobQueue(backend, self.store, max_queued=10, concurrency=1)
+        first = queue.submit('heap-sort', self.DATA, {})
+        low = queue.submit('merge-sort', self.DATA, {}, priority=-1)
+        high = queue.submit('shell-sort', self.DATA, {}, priority=5)
+        self.assertEqual(len(backend.pending), 1)
+        self.assertEqual(queue.get(high.id)['position'], 0)
+        self.assertEqual(queue.get(low.id)['position'], 1)
+
+        self.assertEqual([backend.release() for _ in range(3)], ['heap-sort', 'shell-sort', 'merge-sort'])
+        for job in (first, low, high):
+            description = queue.get(job.id)
+            self.assertEqual(description['status'], 'complete')
+            self.assertGreaterEqual(description['queue_wait'], 0)
+            self.assertGreaterEqual(description['run_time'], 0)
+            self.assertEqual(self.store.summary(description['run_id'])['result'], sorted(self.DATA))
+
+    def test_admission_and_cancel(self):
+        backend = HeldBackend()
+        queue = JobQueue(backend, self.store, max_queued=1, concurrency=1)
+        running = queue.submit('heap-sort', self.DATA, {})
+        waiting = queue.submit('heap-sort', self.DATA, {})
+        with self.assertRaises(QueueFull) as caught:
+            queue.submit('heap-sort', self.DATA, {})
+        self.assertGreaterEqual(caught.exception.retry_after, 1)
+
+        with self.assertRaises(RuntimeError):
+            queue.cancel(running.id)
+        self.assertEqual(queue.cancel(waiting.id)['status'], 'cancelled')
+        self.assertIsNone(queue.get(waiting.id))
+        queue.submit('heap-sort', self.DATA, {})
+        self.assertEqual(queue.describe()['queued'], 1)
+
+    def test_failed_job(self):
+        queue = JobQueue(ExecutionBackend(mode='inline'), self.store)
+        submitted = queue.submit('insertion-sort', list(range(40, 0, -1)), {}, {'max_comparisons': 10})
+        self.assertTrue(queue.drain(30))
+        job = queue.get(submitted.id)
+        self.assertEqual(job['status'], 'failed')
+        self.assertIn('comparisons', job['error'])
+
+    def test_jobs_visible_to_other_processes(self):
+        # Two queues on one store stand for two launcher workers
+        backend = HeldBackend()
+        owner = JobQueue(backend, self.store, concurrency=1)
+        other = JobQueue(HeldBackend(), self.store)
+        running = owner.submit('heap-sort', self.DATA, {})
+        waiting = owner.submit('merge-sort', self.DATA, {})
+
+        self.assertEqual(other.get(running.id)['status'], 'running')
+        self.assertEqual(other.get(waiting.id)['status'], 'queued')
+        with self.assertRaises(RuntimeError):
+            other.cancel(running.id)
+        self.assertEqual(other.cancel(waiting.id)['status'], 'cancelled')
+
+        # The owner skips the job cancelled elsewhere
+        backend.release()
+        self.assertEqual(backend.pending, [])
+        self.assertEqual(owner.get(waiting.id), None)
+        description = other.get(running.id)
+        self.assertEqual(description['status'], 'complete')
+        self.assertIsNotNone(description['run_id'])
+
+    def test_abandoned_jobs_fail(self):
+        queue = JobQueue(HeldBackend(), self.store, concurrency=1)
+        running = queue.submit('heap-sort', self.DATA, {})
+        waiting = queue.submit('merge-sort', self.DATA, {})
+        run_id = queue.get(running.id)['run_id']
+
+        # What the launcher's master does for a worker it had to kill
+        self.assertEqual(self.store.fail_jobs(os.getpid(), "Worker exited"), 2)
+        other = JobQueue(HeldBackend(), self.store)
+        for job in (running, waiting):
+            self.assertEqual(other.get(job.id)['status'], 'failed')
+        self.assertEqual(self.store.summary(run_id)['status'], 'failed')
+
+    def test_worker_failure_marks_run_failed(self):
+        backend = HeldBackend()
+        queue = JobQueue(backend, self.store, concurrency=1)
+        job = queue.submit('heap-sort', self.DATA, {})
+        backend.fail(BrokenProcessPool("worker died"))
+
+        description = queue.get(job.id)
+        self.assertEqual(description['status'], 'failed')
+        run = self.store.summary(description['run_id'])
+        self.assertEqual(run['status'], 'failed')
+        self.assertIn('BrokenProcessPool', run['error'])
+
+    def test_inline_backend_runs_in_background(self):
+        queue = JobQueue(ExecutionBackend(mode='inline'), self.store, concurrency=1)
+        started = time.perf_counter()
+        job = queue.submit('bubble-sort', list(range(200, 0, -1)), {})
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual(queue.get(job.id)['status'], 'running')
+
+        self.assertTrue(queue.drain(120))
+        self.assertEqual(queue.get(job.id)['status'], 'complete')
+
+    @unittest.skipUnless(FLASK_AVAILABLE, "flask is required")
+    def test_endpoints(self):
+        from python.bridge import server
+        backend = HeldBackend()
+        jobs, server.JOBS = server.JOBS, JobQueue(backend, self.store, max_queued=1, concurrency=1)
+        store, server.RUN_STORE = server.RUN_STORE, self.store
+        try:
+            client = server.app.test_client()
+            request = {'algorithm': 'heap-sort', 'data': self.DATA}
+
+            response = client.post('/jobs', json=request)
+            self.assertEqual(response.status_code, 202)
+            self.assertEqual(response.headers['Location'], f"/jobs/{response.json['id']}")
+            running = response.json['id']
+            queued = client.post('/jobs', json=dict(request, priority=3)).json['id']
+
+            response = client.post('/jobs', json=request)
+            self.assertEqual(response.status_code, 429)
+            self.assertGreaterEqual(int(response.headers['Retry-After']), 1)
+
+            self.assertEqual(client.delete(f'/jobs/{running}').status_code, 409)
+            self.assertEqual(client.get(f'/jobs/{queued}').json['status'], 'queued')
+            backend.release()
+            backend.release()
+
+            job = client.get(f'/jobs/{queued}').json
+            self.assertEqual(job['status'], 'complete')
+            self.assertEqual(job['run']['result'], sorted(self.DATA))
+            self.assertEqual(client.get(f"/runs/{job['run_id']}/steps?to=2").json['to'], 2)
+            self.assertEqual(client.get('/jobs/unknown').status_code, 404)
+        finally:
+            server.JOBS = jobs
+            server.RUN_STORE = store
+
+
+if __name__ == '__main__':
+    unittest.main()
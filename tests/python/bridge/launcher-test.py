@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pre-Fork Launcher Tests
+
+Starts the launcher in a subprocess and verifies that its workers serve
+requests, are recycled after their request quota, survive a SIGHUP reload,
+and shut down gracefully on SIGTERM.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import signal
+import socket
+import subprocess
+import unittest
+import urllib.request
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
+sys.path.append(ROOT)
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@unittest.skipUnless(FLASK_AVAILABLE and hasattr(os, 'fork'), "flask and fork() are required")
+class LauncherTest(unittest.TestCase):
+
+    def post(self, port: int, body: dict) -> dict:
+        request = urllib.request.Request(f'http://127.0.0.1:{port}/execute', data=json.dumps(body).encode(),
+                                         headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return json.loads(response.read())
+
+    def wait_until_serving(self, port: int, process: subprocess.Popen) -> None:
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            self.assertIsNone(process.poll(), "launcher exited early")
+            try:
+                with socket.create_connection(('127.0.0.1', port), timeout=1):
+                    return
+            except OSError:
+                time.sleep(0.2)
+        self.fail("launcher did not start")
+
+    def test_serve_recycle_reload_stop(self):
+        port = _free_port()
+        env = dict(os.environ, BRIDGE_LAUNCH_PORT=str(port), BRIDGE_LAUNCH_WORKERS='1',
+                   BRIDGE_LAUNCH_MAX_REQUESTS='2', BRIDGE_LAUNCH_MAX_REQUESTS_JITTER='0',
+                   BRIDGE_LAUNCH_GRACEFUL_TIMEOUT='5')
+        process = subprocess.Popen([sys.executable, '-m', 'python.bridge.launcher'], cwd=ROOT, env=env,
+                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        try:
+            self.wait_until_serving(port, process)
+            request = {'algorithm': 'merge-sort', 'data': [3, 1, 2], 'cache': False}
+            for _ in range(5):
+                self.assertEqual(self.post(port, request)['result'], [1, 2, 3])
+
+            process.send_signal(signal.SIGHUP)
+            time.sleep(1)
+            self.assertEqual(self.post(port, request)['result'], [1, 2, 3])
+
+            process.send_signal(signal.SIGTERM)
+            self.assertEqual(process.wait(timeout=15), 0)
+        finally:
+            if process.poll() is None:
+                process.kill()
+            output = process.communicate()[0]
+
+        # One worker at a time, two requests each: at least three served
+        workers = set(re.findall(r'\[(\d+)\] 127\.0\.0\.1 .*"POST /execute', output))
+        self.assertGreaterEqual(len(workers), 3)
+        self.assertIn('Reloading workers', output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WebSocket Live-Stepping Tests
+
+Verifies that live sessions only advance on demand, deliver the same states
+as a recorded history, seek forward and backward (including replays past the
+buffer), that producers also run on a process pool, and that the message
+protocol answers, pushes with credits and closes sessions.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from python.bridge.executor import ExecutionBackend, get_registry
+from python.bridge.live import LiveSession, LiveConnection
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+class LiveSessionTest(unittest.TestCase):
+
+    DATA = [5, 2, 9, 1, 7, 3]
+
+    def setUp(self):
+        algorithm_class, _ = get_registry().load('insertion-sort')
+        reference = algorithm_class()
+        reference.execute(self.DATA)
+        self.arrays = [state['array'] for state in reference.history]
+
+    def test_pull_driven(self):
+        session = LiveSession('insertion-sort', self.DATA, buffer_size=4)
+        try:
+            time.sleep(0.05)
+            self.assertEqual(session.produced, 0)  # nothing runs until asked
+
+            batch = session.step(3)
+            self.assertEqual([s['state']['array'] for s in batch['states']], self.arrays[:3])
+            self.assertEqual(session.produced, 3)
+            self.assertNotIn('outcome', batch)
+
+            delivered = 3
+            while 'outcome' not in batch:
+                batch = session.step(4)
+                delivered += len(batch['states'])
+            self.assertEqual(delivered, len(self.arrays))
+            self.assertEqual(batch['outcome']['result'], sorted(self.DATA))
+        finally:
+            session.close()
+
+    def test_seek(self):
+        session = LiveSession('insertion-sort', self.DATA, buffer_size=4)
+        try:
+            last = len(self.arrays) - 1
+            self.assertEqual(session.seek(last)['state']['array'], self.arrays[last])
+            self.assertEqual(session.seek(last - 2)['state']['array'], self.arrays[last - 2])
+            self.assertEqual(session.cursor, last - 1)
+
+            # Evicted from the buffer: replayed from the start
+            self.assertEqual(session.seek(1)['state']['array'], self.arrays[1])
+            self.assertEqual(session.step(1)['states'][0]['step'], 2)
+
+            beyond = session.seek(last + 10)
+            self.assertIsNone(beyond['state'])
+            self.assertTrue(beyond['done'])
+        finally:
+            session.close()
+
+    def test_pool_producer(self):
+        backend = ExecutionBackend(workers=1)
+        try:
+            session = LiveSession('insertion-sort', self.DATA, buffer_size=2, backend=backend)
+            batch = session.step(2)
+            self.assertEqual([s['state']['array'] for s in batch['states']], self.arrays[:2])
+
+            # Replays past the buffer restart the run on the pool
+            last = len(self.arrays) - 1
+            self.assertEqual(session.seek(last)['state']['array'], self.arrays[last])
+            self.assertEqual(session.seek(0)['state']['array'], self.arrays[0])
+            batch = session.seek(last + 1)
+            self.assertEqual(batch['outcome']['result'], sorted(self.DATA))
+            session.close()
+
+            # The worker is free again once the session closed
+            session = LiveSession('insertion-sort', self.DATA, backend=backend)
+            self.assertEqual(session.step(1)['states'][0]['state']['array'], self.arrays[0])
+            session.close()
+        finally:
+            backend.shutdown()
+
+    def test_limits(self):
+        session = LiveSession('selection-sort', list(range(50, 0, -1)), limits={'max_comparisons': 20})
+        try:
+            batch = session.seek(10 ** 6)
+            self.assertEqual(batch['outcome']['budget_exceeded']['reason'], 'comparisons')
+        finally:
+            session.close()
+
+    def test_pauses_excluded_from_run_time(self):
+        session = LiveSession('insertion-sort', self.DATA, limits={'deadline': 0.3, 'check_interval': 1})
+        try:
+            batch = session.step(2)
+            while 'outcome' not in batch:
+                time.sleep(0.1)
+                batch = session.step(4)
+            self.assertEqual(batch['outcome']['result'], sorted(self.DATA))
+            self.assertLess(batch['outcome']['metrics']['execution_time'], 0.3)
+        finally:
+            session.close()
+
+    def test_idle_timeout(self):
+        session = LiveSession('insertion-sort', self.DATA, idle_timeout=0.2)
+        try:
+            session.step(1)
+            time.sleep(0.5)
+            batch = session.step(4)
+            self.assertEqual(batch['outcome']['budget_exceeded']['reason'], 'idle')
+        finally:
+            session.close()
+
+    @unittest.skipUnless(FLASK_AVAILABLE, "flask is required")
+    def test_protocol(self):
+        sent = []
+
+        async def send(message):
+            sent.append(json.loads(message))
+
+        async def scenario():
+            connection = LiveConnection(send)
+            await connection.handle(json.dumps({'requestId': 1, 'endpoint': 'live/open',
+                                                'data': {'algorithm': 'insertion-sort', 'data': self.DATA}}))
+            session_id = sent[-1]['data']['session']
+
+            await connection.handle(json.dumps({'requestId': 2, 'endpoint': 'live/step',
+                                                'data': {'session': session_id, 'count': 2}}))
+            self.assertEqual(len(sent[-1]['data']['states']), 2)
+
+            await connection.handle(json.dumps({'requestId': 3, 'endpoint': 'live/play',
+                                                'data': {'session': session_id, 'window': 2}}))
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+            pushed = [m for m in sent if m.get('event') == 'state']
+            self.assertEqual([m['step'] for m in pushed], [2, 3])  # window exhausted
+
+            await connection.handle(json.dumps({'requestId': 4, 'endpoint': 'live/ack',
+                                                'data': {'session': session_id, 'count': 1000}}))
+            for _ in range(200):
+                if any(m.get('event') == 'done' for m in sent):
+                    break
+                await asyncio.sleep(0.01)
+            done = [m for m in sent if m.get('event') == 'done']
+            self.assertEqual(done[0]['result'], sorted(self.DATA))
+
+            await connection.handle(json.dumps({'requestId': 5, 'endpoint': 'execute', 'data': {}}))
+            self.assertIn('error', sent[-1])
+            await connection.handle(json.dumps({'requestId': 6, 'endpoint': 'live/open',
+                                                'data': {'algorithm': 'no-such-sort'}}))
+            self.assertIn('not found', sent[-1]['error'])
+
+            connection.close_all()
+            self.assertEqual(connection.sessions, {})
+
+        asyncio.run(scenario())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pipelined History Encoding Tests
+
+Verifies that pipelined bodies decode to the same history as the buffered
+encodings, that a slow encoder blocks recording instead of queueing without
+bound, that encoder and run failures stop the pipeline, and that /execute
+offers the encoding only to clients accepting deflate.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import json
+import time
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from python.bridge.executor import ExecutionBackend, run_execute
+from python.bridge.pipeline import (
+    PIPELINE_MIMETYPE, HistoryPipeline, decode_pipelined, run_pipelined
+)
+from python.core.budget import BudgetExceeded
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+class HistoryPipelineTest(unittest.TestCase):
+
+    DATA = list(range(80, 0, -1))
+
+    def test_matches_buffered_history(self):
+        text = json.loads(run_execute('insertion-sort', self.DATA, {}).payload)
+        output = run_pipelined('insertion-sort', self.DATA, {})
+        self.assertEqual(output.mimetype, PIPELINE_MIMETYPE)
+
+        decoded = decode_pipelined(output.payload)
+        self.assertEqual(decoded['result'], text['result'])
+        self.assertEqual(decoded['history_states'], len(text['history']))
+        self.assertEqual(output.history_states, len(text['history']))
+        for key in ('array', 'type', 'message'):
+            self.assertEqual([state.get(key) for state in decoded['history']],
+                             [state.get(key) for state in text['history']])
+        self.assertGreater(decoded['pipeline']['chunks'], 0)
+
+    def test_chunks(self):
+        parts = []
+        pipeline = HistoryPipeline(parts.append, chunk_states=3)
+        for step in range(7):
+            pipeline.sink(step, {'array': [step, 0], 'type': 'step'})
+        pipeline.finish({'type': 'result', 'result': [], 'metrics': {}, 'history_states': 7})
+
+        decoded = decode_pipelined(b''.join(parts))
+        self.assertEqual(decoded['pipeline']['chunks'], 3)
+        self.assertEqual([state['array'][0] for state in decoded['history']], list(range(7)))
+
+    def test_backpressure(self):
+        def slow_write(data):
+            time.sleep(0.02)
+
+        pipeline = HistoryPipeline(slow_write, chunk_states=1, max_queued=2)
+        for step in range(10):
+            pipeline.sink(step, {'array': [step]})
+            self.assertLessEqual(pipeline._queue.qsize(), 2)
+        pipeline.finish({'type': 'result'})
+        self.assertGreater(pipeline.stall_seconds, 0)
+        self.assertEqual(pipeline.chunks, 10)
+
+    def test_encoder_failure(self):
+        def failing_write(data):
+            raise OSError("disk full")
+
+        pipeline = HistoryPipeline(failing_write, chunk_states=1, max_queued=1)
+        with self.assertRaises(OSError):
+            for step in range(100):
+                pipeline.sink(step, {'array': [step]})
+                time.sleep(0.001)
+            pipeline.finish({'type': 'result'})
+
+    def test_budget_exceeded(self):
+        with self.assertRaises(BudgetExceeded):
+            run_pipelined('insertion-sort', self.DATA, {}, {'max_history_states': 10})
+
+    def test_incomplete_body(self):
+        parts = []
+        pipeline = HistoryPipeline(parts.append, chunk_states=1)
+        pipeline.sink(0, {'array': [1]})
+        pipeline.abort()
+        with self.assertRaises(ValueError):
+            decode_pipelined(b''.join(parts))
+
+    @unittest.skipUnless(FLASK_AVAILABLE, "Flask is not installed")
+    def test_negotiation(self):
+        from python.bridge import server
+        backend, server.BACKEND = server.BACKEND, ExecutionBackend(mode='inline')
+        try:
+            client = server.app.test_client()
+            request = {'algorithm': 'insertion-sort', 'data': [4, 2, 3, 1], 'cache': False}
+
+            response = client.post('/execute', json=request, headers={'Accept': PIPELINE_MIMETYPE})
+            self.assertEqual(response.mimetype, 'application/json')
+
+            response = client.post('/execute', json=request, headers={
+                'Accept': f'{PIPELINE_MIMETYPE}, application/json;q=0.5',
+                'Accept-Encoding': 'gzip, deflate'
+            })
+            self.assertEqual(response.mimetype, PIPELINE_MIMETYPE)
+            self.assertEqual(response.headers['Content-Encoding'], 'deflate')
+            self.assertIn('Accept-Encoding', response.headers['Vary'])
+            decoded = decode_pipelined(response.data)
+            self.assertEqual(decoded['result'], [1, 2, 3, 4])
+            self.assertEqual(decoded['history'][-1]['array'], [1, 2, 3, 4])
+        finally:
+            server.BACKEND = backend
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cost Planner Tests
+
+Verifies complexity parsing and input features, that estimates follow the
+declared growth and converge on observed runs, that oversized histories are
+sampled or disabled and hopeless runs rejected, that downgrades and routing
+are only advised until an algorithm is calibrated, that sampled histories
+keep every n-th state, and that /plan and /execute expose the decisions.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import json
+import random
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from python.bridge.executor import ExecutionBackend, get_registry, run_execute
+from python.core.budget import BudgetExceeded, RunBudget
+from python.bridge.planner import COMPLEXITY_CACHE, Planner, input_features, normalize_complexity
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+class PlannerTest(unittest.TestCase):
+
+    def test_normalize_complexity(self):
+        self.assertEqual(normalize_complexity('O(n log²(n))'), 'nlog^2n')
+        self.assertEqual(normalize_complexity('O(n × n!)'), 'n*n!')
+        self.assertEqual(normalize_complexity('O(n+k) time complexity, which can be O(n)'), 'n+k')
+        self.assertEqual(normalize_complexity('O(n^(4/3))'), 'n^(4/3)')
+
+    def test_input_features(self):
+        self.assertEqual(input_features(list(range(100)))['sortedness'], 1.0)
+        self.assertEqual(input_features(list(range(100, 0, -1)))['sortedness'], 0.0)
+        features = input_features([5, 1000, 7])
+        self.assertEqual((features['n'], features['k'], features['w']), (3, 996, 4))
+        self.assertFalse(input_features(['b', 'a'])['numeric'])
+
+    def test_growth_and_calibration(self):
+        planner = Planner()
+        sorted_plan = planner.plan('insertion-sort', list(range(400)), {})
+        reversed_plan = planner.plan('insertion-sort', list(range(400, 0, -1)), {})
+        self.assertGreater(reversed_plan.estimates['comparisons'], 50 * sorted_plan.estimates['comparisons'])
+        self.assertEqual(reversed_plan.calibrated, 0)
+
+        for n in (100, 200):
+            data = random.sample(range(10000), n)
+            plan = planner.plan('insertion-sort', data, {})
+            output = run_execute('insertion-sort', data, plan.options)
+            planner.observe(plan, output.comparisons, output.history_states, output.execution_time,
+                            len(output.payload))
+
+        data = random.sample(range(10000), 300)
+        plan = planner.plan('insertion-sort', data, {})
+        output = run_execute('insertion-sort', data, plan.options)
+        self.assertEqual(plan.calibrated, 2)
+        for estimate, observed in [(plan.estimates['comparisons'], output.comparisons),
+                                   (plan.estimates['history_states'], output.history_states)]:
+            self.assertLess(abs(estimate / observed - 1), 0.5)
+
+    def test_complexity_cache_bounded(self):
+        planner = Planner()
+        for seed in range(COMPLEXITY_CACHE + 10):
+            planner.plan('insertion-sort', [3, 1, 2], {'seed': seed})
+        self.assertEqual(len(planner._complexity), COMPLEXITY_CACHE)
+
+    def test_downgrade_and_reject(self):
+        planner = Planner(max_states=1000, calibration_runs=0)
+        plan = planner.plan('insertion-sort', list(range(300, 0, -1)), {})
+        self.assertEqual(plan.decision, 'downgrade')
+        interval = plan.options['history_interval']
+        self.assertGreater(interval, 1)
+
+        output = run_execute('insertion-sort', list(range(300, 0, -1)), plan.options)
+        full = run_execute('insertion-sort', list(range(300, 0, -1)), {})
+        # Every interval-th state, plus the final state when it falls between samples
+        expected = -(-full.history_states // interval) + (1 if (full.history_states - 1) % interval else 0)
+        self.assertEqual(output.history_states, expected)
+        self.assertLessEqual(output.history_states, 1000 * 2)
+        history = json.loads(output.payload)['history']
+        self.assertEqual(history[-1]['type'], 'final')
+        self.assertEqual(history[-1]['array'], list(range(1, 301)))
+
+        plan = planner.plan('insertion-sort', list(range(10 ** 6, 0, -1)), {})
+        self.assertFalse(plan.options['record_history'])
+
+        plan = Planner().plan('bogo-sort', random.sample(range(100), 30), {})
+        self.assertEqual(plan.decision, 'reject')
+        self.assertEqual(plan.route, 'batch')
+
+    def test_advisory_until_calibrated(self):
+        planner = Planner()
+        data = random.sample(range(100000), 2000)
+        plan = planner.plan('merge-sort', data, {})
+        self.assertEqual((plan.decision, plan.route, plan.options), ('accept', 'interactive', {}))
+        self.assertTrue(plan.advisory)
+        self.assertIn('batch pool', plan.reasons[0])
+
+        output = run_execute('merge-sort', data, plan.options)
+        planner.observe(plan, output.comparisons, output.history_states, output.execution_time,
+                        len(output.payload))
+        plan = planner.plan('merge-sort', data, {})
+        self.assertFalse(plan.advisory)
+        self.assertEqual(plan.calibrated, 1)
+
+        # Hopeless runs are rejected even before calibration
+        self.assertEqual(planner.plan('insertion-sort', list(range(10 ** 6, 0, -1)), {}).decision, 'reject')
+
+    def test_sampled_history_keeps_outcome(self):
+        data = list(range(30, 0, -1))
+        history = json.loads(run_execute('insertion-sort', data, {'history_interval': 7}).payload)['history']
+        self.assertEqual(history[-1]['type'], 'final')
+        self.assertEqual(history[-1]['array'], sorted(data))
+
+        algorithm_class, _ = get_registry().load('insertion-sort')
+        algorithm = algorithm_class({'history_interval': 7, 'budget': RunBudget(max_comparisons=5,
+                                                                                check_interval=1)})
+        with self.assertRaises(BudgetExceeded):
+            algorithm.execute(data)
+        self.assertEqual(algorithm.history[-1]['type'], 'error')
+
+    @unittest.skipUnless(FLASK_AVAILABLE, "flask is required")
+    def test_endpoints(self):
+        from python.bridge import server
+        backend, server.BACKEND = server.BACKEND, ExecutionBackend(mode='inline')
+        try:
+            client = server.app.test_client()
+
+            plan = client.post('/plan', json={'algorithm': 'merge-sort', 'data': [3, 1, 2]}).json
+            self.assertEqual((plan['decision'], plan['route']), ('accept', 'interactive'))
+            self.assertIn('seconds', plan['estimates'])
+
+            plans = client.post('/plan', json={'algorithms': ['merge-sort', 'bogo-sort'],
+                                               'data': list(range(40, 0, -1))}).json['plans']
+            self.assertEqual(plans['bogo-sort']['decision'], 'reject')
+
+            response = client.post('/execute', json={'algorithm': 'bogo-sort', 'data': list(range(40, 0, -1))})
+            self.assertEqual(response.status_code, 422)
+            self.assertEqual(response.json['plan']['decision'], 'reject')
+
+            response = client.post('/execute', json={'algorithm': 'merge-sort', 'data': [3, 1, 2], 'cache': False})
+            self.assertEqual(response.headers['X-Plan'], 'accept; route=interactive')
+
+            response = client.post('/compare', json={'algorithms': ['merge-sort', 'bogo-sort'],
+                                                     'data': list(range(40, 0, -1))})
+            comparison = response.json['comparison']
+            self.assertEqual(comparison['merge-sort']['result'], list(range(1, 41)))
+            self.assertEqual(comparison['bogo-sort']['plan']['decision'], 'reject')
+        finally:
+            server.BACKEND = backend
+
+
+if __name__ == '__main__':
+    unittest.main()
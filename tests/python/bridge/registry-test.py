@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Algorithm Discovery Registry Tests
+
+Verifies that every algorithm file is discovered under a normalized key,
+that classes are loaded by path and cached, and that warm-up tolerates
+broken implementations.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import pickle
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from python.core.base_algorithm import Algorithm
+from python.bridge.registry import AlgorithmRegistry, algorithm_key
+
+
+class RegistryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = AlgorithmRegistry()
+        self.registry.discover()
+
+    def test_key_normalization(self):
+        self.assertEqual(algorithm_key("bubble-sort.py"), "bubble-sort")
+        self.assertEqual(algorithm_key("quick-select-py.py"), "quick-select")
+        self.assertEqual(algorithm_key("cocktail_shaker_sort.py"), "cocktail-shaker-sort")
+
+    def test_discovers_all_algorithms(self):
+        self.assertEqual(len(self.registry), 24)
+        for key in ("bubble-sort", "cocktail-shaker-sort", "quick-select", "bitonic-sort"):
+            self.assertIn(key, self.registry)
+
+    def test_load_is_cached(self):
+        algorithm_class, error = self.registry.load("bubble-sort")
+        self.assertIsNone(error)
+        self.assertTrue(issubclass(algorithm_class, Algorithm))
+        self.assertIs(self.registry.load("bubble-sort")[0], algorithm_class)
+        self.assertEqual(algorithm_class().execute([3, 1, 2]), [1, 2, 3])
+
+        # Loaded classes pickle by reference for process pools
+        self.assertIs(pickle.loads(pickle.dumps(algorithm_class)), algorithm_class)
+
+    def test_unknown_key(self):
+        algorithm_class, error = self.registry.load("no-such-sort")
+        self.assertIsNone(algorithm_class)
+        self.assertIn("not found", error)
+
+    def test_preload_and_warm_up(self):
+        errors = self.registry.preload()
+        self.assertEqual([key for key, error in errors.items() if error], [])
+
+        results = self.registry.warm_up(["insertion-sort", "pigeonhole-sort"], size=8)
+        self.assertIsInstance(results["insertion-sort"], float)
+        self.assertIsInstance(results["pigeonhole-sort"], str)
+
+
+if __name__ == '__main__':
+    unittest.main()
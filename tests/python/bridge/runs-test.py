@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Run Store Tests
+
+Verifies that stored runs page back the same states as an in-memory run
+(across keyframes and from any offset), that summaries and failures are
+recorded, that old runs are pruned (but not runs still recording), that no
+connections are left open, and that the /runs endpoints page and validate
+ranges.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from python.bridge.executor import ExecutionBackend, run_execute
+from python.bridge.runs import KEYFRAME_INTERVAL, RunStore, run_recorded
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+class BrokenBackend:
+    """Backend whose worker pool has died."""
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+
+
+class RunStoreTest(unittest.TestCase):
+
+    DATA = list(range(40, 0, -1))
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.store = RunStore(os.path.join(self.directory, 'runs.sqlite3'))
+
+    @staticmethod
+    def untimed(state):
+        """Drop the fields that differ between two runs of the same input."""
+        return {key: value for key, value in state.items() if key not in ('timestamp', 'metrics')}
+
+    def record(self, algorithm_key='insertion-sort', data=None, limits=None):
+        data = self.DATA if data is None else data
+        run_id = self.store.create(algorithm_key, len(data))
+        run_recorded(self.store.path, run_id, algorithm_key, data, {}, limits)
+        return run_id
+
+    def test_pages_match_history(self):
+        run_id = self.record()
+        expected = json.loads(run_execute('insertion-sort', self.DATA, {}).payload)
+        summary = self.store.summary(run_id)
+        self.assertEqual(summary['status'], 'complete')
+        self.assertEqual(summary['result'], sorted(self.DATA))
+        self.assertEqual(summary['steps'], len(expected['history']))
+        self.assertGreater(summary['steps'], 2 * KEYFRAME_INTERVAL)
+
+        for start, stop in [(0, summary['steps']), (KEYFRAME_INTERVAL + 5, KEYFRAME_INTERVAL + 9),
+                            (summary['steps'] - 1, summary['steps'] + 10)]:
+            page = self.store.steps(run_id, start, stop)
+            self.assertEqual([entry['step'] for entry in page], list(range(start, min(stop, summary['steps']))))
+            self.assertEqual([self.untimed(entry['state']) for entry in page],
+                             [self.untimed(state) for state in expected['history'][start:stop]])
+
+    def test_failed_run(self):
+        run_id = self.record(limits={'max_comparisons': 10})
+        summary = self.store.summary(run_id)
+        self.assertEqual(summary['status'], 'failed')
+        self.assertIn('budget_exceeded', summary)
+        self.assertEqual(len(self.store.steps(run_id, 0, summary['steps'])), summary['steps'])
+
+    def test_fail_unfinished_run(self):
+        run_id = self.store.create('heap-sort', 3)
+        self.store.fail(run_id, "BrokenProcessPool: worker died")
+        summary = self.store.summary(run_id)
+        self.assertEqual((summary['status'], summary['error']), ('failed', "BrokenProcessPool: worker died"))
+
+        # A finished run keeps its stored outcome
+        finished = self.record()
+        self.store.fail(finished, "late failure")
+        self.assertEqual(self.store.summary(finished)['status'], 'complete')
+
+    def test_prune_and_delete(self):
+        self.store.max_runs = 2
+        first = self.record(data=[3, 1, 2])
+        recording = self.store.create('heap-sort', 3)
+        others = [self.store.create('heap-sort', 3) for _ in range(2)]
+        self.assertIsNone(self.store.summary(first))
+        # Still recording: kept until it finishes
+        self.assertIsNotNone(self.store.summary(recording))
+        self.assertTrue(self.store.delete(others[0]))
+        self.assertFalse(self.store.delete(others[0]))
+        self.assertIsNotNone(self.store.summary(others[1]))
+
+    @unittest.skipUnless(os.path.isdir('/proc/self/fd'), "requires /proc")
+    def test_connections_closed(self):
+        run_id = self.record(data=[3, 1, 2])
+        before = len(os.listdir('/proc/self/fd'))
+        for _ in range(20):
+            self.store.summary(run_id)
+            self.store.steps(run_id, 0, 2)
+        self.assertLessEqual(len(os.listdir('/proc/self/fd')), before)
+
+    @unittest.skipUnless(FLASK_AVAILABLE, "flask is required")
+    def test_endpoints(self):
+        from python.bridge import server
+        backend, server.BACKEND = server.BACKEND, ExecutionBackend(mode='inline')
+        store, server.RUN_STORE = server.RUN_STORE, self.store
+        try:
+            client = server.app.test_client()
+
+            response = client.post('/runs', json={'algorithm': 'insertion-sort', 'data': self.DATA})
+            self.assertEqual(response.status_code, 201)
+            run_id, total = response.json['id'], response.json['steps']
+
+            page = client.get(f'/runs/{run_id}/steps?from=3&to=7').json
+            self.assertEqual((page['from'], page['to'], page['total'], page['next']), (3, 7, total, 7))
+            self.assertEqual(len(page['steps']), 4)
+
+            page = client.get(f'/runs/{run_id}/steps?from={total - 2}').json
+            self.assertEqual((len(page['steps']), page['next']), (2, None))
+
+            self.assertEqual(client.get(f'/runs/{run_id}/summary').json['result'], sorted(self.DATA))
+            self.assertEqual(client.get(f'/runs/{run_id}/steps?from=5&to=1').status_code, 400)
+            self.assertEqual(client.delete(f'/runs/{run_id}').status_code, 204)
+            self.assertEqual(client.get(f'/runs/{run_id}/summary').status_code, 404)
+
+            server.BACKEND = BrokenBackend()
+            response = client.post('/runs', json={'algorithm': 'insertion-sort', 'data': self.DATA})
+            self.assertEqual(response.status_code, 201)
+            self.assertEqual(response.json['status'], 'failed')
+            self.assertEqual(self.store.summary(response.json['id'])['status'], 'failed')
+        finally:
+            server.BACKEND = backend
+            server.RUN_STORE = store
+
+
+if __name__ == '__main__':
+    unittest.main()
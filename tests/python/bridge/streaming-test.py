@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Streaming History Delivery Tests
+
+Verifies that streamed runs emit every state in order without retaining a
+history, that deltas reconstruct the full states, that closing the stream
+stops the producer, and that the endpoint frames NDJSON and SSE.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import json
+import threading
+import unittest
+import multiprocessing
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from python.bridge.executor import ExecutionBackend, get_registry
+from python.bridge.streaming import stream_run, run_stream, format_ndjson, format_sse
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+class StreamingTest(unittest.TestCase):
+
+    DATA = [5, 2, 9, 1, 7, 3]
+
+    def test_history_sink(self):
+        algorithm_class, _ = get_registry().load('insertion-sort')
+        received = []
+        algorithm = algorithm_class({'history_sink': lambda step, state: received.append(step)})
+        algorithm.execute(self.DATA)
+
+        reference = algorithm_class()
+        reference.execute(self.DATA)
+        self.assertEqual(received, list(range(len(reference.history))))
+        self.assertEqual(len(algorithm.history), len(reference.history))
+        self.assertEqual(algorithm.history[-1]['array'], sorted(self.DATA))
+        with self.assertRaises(IndexError):
+            algorithm.history[0]
+
+    def test_inline_stream(self):
+        messages = list(stream_run(ExecutionBackend(mode='inline'), 'selection-sort', self.DATA, {}))
+        kinds = [kind for kind, _ in messages]
+        self.assertEqual(kinds[-1], 'result')
+        self.assertTrue(all(kind == 'state' for kind in kinds[:-1]))
+
+        steps = [json.loads(body)['step'] for _, body in messages[:-1]]
+        self.assertEqual(steps, list(range(len(steps))))
+        result = json.loads(messages[-1][1])
+        self.assertEqual(result['result'], sorted(self.DATA))
+        self.assertEqual(result['history_states'], len(steps))
+
+    def test_delta_stream(self):
+        messages = list(stream_run(ExecutionBackend(mode='inline'), 'bubble-sort', self.DATA, {}, delta=True))
+        self.assertIn('delta', [kind for kind, _ in messages])
+
+        array = None
+        for kind, body in messages[:-1]:
+            message = json.loads(body)
+            if kind == 'state':
+                array = message['state']['array']
+            elif 'array' in message['diff']:
+                array = message['diff']['array']
+            elif 'array_changes' in message['diff']:
+                changes = message['diff']['array_changes']
+                for index, value in zip(changes['indices'], changes['values']):
+                    array[index] = value
+        self.assertEqual(array, sorted(self.DATA))
+
+    def test_errors_and_early_close(self):
+        messages = list(stream_run(ExecutionBackend(mode='inline'), 'selection-sort',
+                                   list(range(100, 0, -1)), {}, limits={'max_comparisons': 50}))
+        kind, body = messages[-1]
+        self.assertEqual(kind, 'error')
+        self.assertEqual(json.loads(body)['budget_exceeded']['reason'], 'comparisons')
+
+        completed = []
+        stream = stream_run(ExecutionBackend(mode='inline'), 'insertion-sort', list(range(300, 0, -1)), {},
+                            on_complete=lambda steps, seconds: completed.append(steps))
+        self.assertEqual(next(stream)[0], 'state')
+        stream.close()
+        self.assertEqual(completed, [])
+
+    def test_abandoned_stream_keeps_its_pipe(self):
+        backend = ExecutionBackend(mode='inline')
+        for _ in range(5):
+            abandoned = stream_run(backend, 'insertion-sort', list(range(300, 0, -1)), {})
+            next(abandoned)
+            abandoned.close()
+
+            messages = list(stream_run(backend, 'selection-sort', self.DATA, {}))
+            steps = [json.loads(body)['step'] for kind, body in messages if kind == 'state']
+            self.assertEqual(steps, list(range(len(steps))))
+            self.assertEqual(messages[-1][0], 'result')
+
+    def test_large_state_to_stalled_client(self):
+        # One state is far larger than the pipe buffer; nobody reads it
+        reader, writer = multiprocessing.Pipe(duplex=False)
+        try:
+            producer = threading.Thread(target=run_stream, daemon=True, args=(
+                'insertion-sort', list(range(50000, 0, -1)), {}, writer, False, None, 0.5))
+            producer.start()
+            producer.join(10)
+            self.assertFalse(producer.is_alive())
+        finally:
+            reader.close()
+
+    def test_large_states_reassembled(self):
+        data = list(range(20000, 0, -1))
+        stream = stream_run(ExecutionBackend(mode='inline'), 'insertion-sort', data, {})
+        kind, body = next(stream)
+        stream.close()
+        self.assertEqual(kind, 'state')
+        self.assertEqual(json.loads(body)['state']['array'], data)
+
+    def test_process_stream(self):
+        backend = ExecutionBackend(mode='process', workers=1)
+        try:
+            completed = []
+            messages = list(stream_run(backend, 'heap-sort', self.DATA, {},
+                                       on_complete=lambda steps, seconds: completed.append(steps)))
+            self.assertEqual(json.loads(messages[-1][1])['result'], sorted(self.DATA))
+            self.assertEqual(completed, [len(messages) - 1])
+        finally:
+            backend.shutdown()
+
+    def test_framing(self):
+        self.assertEqual(json.loads(format_ndjson('state', b'{"step":0}')), {'type': 'state', 'step': 0})
+        self.assertEqual(format_sse('result', b'{}'), b'event: result\ndata: {}\n\n')
+
+    @unittest.skipUnless(FLASK_AVAILABLE, "flask is required")
+    def test_endpoint(self):
+        from python.bridge import server
+        backend, server.STREAM_BACKEND = server.STREAM_BACKEND, ExecutionBackend(mode='inline')
+        try:
+            client = server.app.test_client()
+            request = {'algorithm': 'shell-sort', 'data': self.DATA}
+
+            response = client.post('/execute/stream', json=request)
+            self.assertEqual(response.mimetype, 'application/x-ndjson')
+            lines = [json.loads(line) for line in response.data.splitlines()]
+            self.assertEqual(lines[-1]['type'], 'result')
+            self.assertEqual(lines[-1]['result'], sorted(self.DATA))
+
+            response = client.post('/execute/stream', json=request, headers={'Accept': 'text/event-stream'})
+            self.assertEqual(response.mimetype, 'text/event-stream')
+            self.assertTrue(response.data.startswith(b'event: state\ndata: '))
+
+            self.assertEqual(client.post('/execute/stream', json={'algorithm': 'nope'}).status_code, 404)
+        finally:
+            server.STREAM_BACKEND = backend
+
+
+if __name__ == '__main__':
+    unittest.main()
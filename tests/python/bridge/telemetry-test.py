@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bridge Prometheus Exporter Tests
+
+Verifies that the /metrics endpoint exposes request latency, in-flight,
+error and per-run histograms with bounded labels.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+try:
+    import flask  # noqa: F401
+    import prometheus_client  # noqa: F401
+    DEPENDENCIES_AVAILABLE = True
+except ImportError:
+    DEPENDENCIES_AVAILABLE = False
+
+
+@unittest.skipUnless(DEPENDENCIES_AVAILABLE, "flask and prometheus-client are required")
+class TelemetryTest(unittest.TestCase):
+
+    def setUp(self):
+        from python.bridge import server, telemetry
+        self.telemetry = telemetry
+        self.client = server.app.test_client()
+
+    def sample(self, name, **labels):
+        return self.telemetry.REGISTRY.get_sample_value(name, labels) or 0.0
+
+    def test_metrics_endpoint(self):
+        self.client.get('/status')
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        body = response.get_data(as_text=True)
+        self.assertIn('bridge_request_latency_seconds_bucket{algorithm="unknown",endpoint="/status"', body)
+        self.assertIn('bridge_response_bytes_count{endpoint="/status"}', body)
+
+    def test_errors_use_bounded_labels(self):
+        before = self.sample('bridge_request_errors_total',
+                             endpoint='/execute', algorithm='unknown', status='404')
+        self.client.post('/execute', json={'algorithm': 'no-such-sort', 'data': [3, 1, 2]})
+        after = self.sample('bridge_request_errors_total',
+                            endpoint='/execute', algorithm='unknown', status='404')
+        self.assertEqual(after, before + 1)
+        self.assertNotIn('no-such-sort', self.client.get('/metrics').get_data(as_text=True))
+
+    def test_in_flight_returns_to_zero(self):
+        self.client.get('/status')
+        self.assertEqual(self.sample('bridge_requests_in_flight', endpoint='/status'), 0.0)
+
+    def test_observe_run(self):
+        before = self.sample('bridge_input_size_elements_count', endpoint='/execute', algorithm='probe')
+        self.telemetry.observe_run('/execute', 'probe', 1000, 250, 0.02)
+        self.assertEqual(self.sample('bridge_input_size_elements_count',
+                                     endpoint='/execute', algorithm='probe'), before + 1)
+        self.assertGreater(self.sample('bridge_history_states_sum', algorithm='probe'), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
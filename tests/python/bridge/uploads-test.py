@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Binary Request Body Tests
+
+Verifies that octet-stream and multipart inputs are read into shared memory
+(wire columns and raw dtypes), that malformed bodies are rejected with the
+right status, and that the endpoints sort binary inputs like JSON ones.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import io
+import os
+import sys
+import json
+import array
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from python.bridge.executor import ExecutionBackend, resolve_input
+from python.bridge.uploads import UploadError, receive_binary
+from python.bridge.wire import encode_array
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+class UploadsTest(unittest.TestCase):
+
+    DATA = [9, -4, 7, 1, 2 ** 31 - 1, 0]
+
+    def receive(self, payload, **fields):
+        shared = receive_binary(io.BytesIO(payload), len(payload), fields.get('dtype'), fields.get('length'))
+        self.addCleanup(shared.close)
+        return resolve_input(shared.ref)
+
+    def test_wire_column(self):
+        self.assertEqual(self.receive(encode_array(self.DATA)), self.DATA)
+        self.assertEqual(self.receive(encode_array([0.5, -1.25])), [0.5, -1.25])
+
+    def test_raw_dtypes(self):
+        self.assertEqual(self.receive(array.array('i', self.DATA).tobytes(), dtype='int32'), self.DATA)
+        self.assertEqual(self.receive(array.array('q', [2 ** 40]).tobytes(), dtype='int64'), [2 ** 40])
+        self.assertEqual(self.receive(array.array('f', [1.5]).tobytes(), dtype='float32'), [1.5])
+        self.assertEqual(self.receive(b'', dtype='float64'), [])
+
+    def test_malformed(self):
+        raw = array.array('i', self.DATA).tobytes()
+        cases = [
+            (lambda: receive_binary(io.BytesIO(raw), len(raw)), 400),                       # no dtype
+            (lambda: receive_binary(io.BytesIO(raw), None, 'int32'), 411),                 # unknown size
+            (lambda: receive_binary(io.BytesIO(raw[:-1]), len(raw) - 1, 'int32'), 400),    # partial item
+            (lambda: receive_binary(io.BytesIO(raw), len(raw), 'int32', 100), 400),        # truncated
+            (lambda: receive_binary(io.BytesIO(raw), len(raw), 'int32', 2), 400),          # trailing data
+            (lambda: receive_binary(io.BytesIO(raw), len(raw), 'int32', 2 ** 40), 413),    # too large
+        ]
+        for receive, status in cases:
+            with self.assertRaises(UploadError) as caught:
+                receive()
+            self.assertEqual(caught.exception.status, status)
+
+    def test_process_backend(self):
+        backend = ExecutionBackend(mode='process', workers=1)
+        payload = encode_array(self.DATA)
+        shared = receive_binary(io.BytesIO(payload), len(payload))
+        try:
+            output = backend.execute('merge-sort', shared.ref, {'record_history': False})
+            self.assertEqual(json.loads(output.payload)['result'], sorted(self.DATA))
+            outcomes = dict(backend.compare(['heap-sort'], shared.ref, {}))
+            self.assertEqual(json.loads(outcomes['heap-sort'].payload)['result'], sorted(self.DATA))
+        finally:
+            shared.close()
+            backend.shutdown()
+
+    @unittest.skipUnless(FLASK_AVAILABLE, "flask is required")
+    def test_endpoints(self):
+        from python.bridge import server
+        backend, server.BACKEND = server.BACKEND, ExecutionBackend(mode='inline')
+        try:
+            client = server.app.test_client()
+
+            response = client.post('/execute', data=encode_array(self.DATA),
+                                   content_type='application/octet-stream',
+                                   headers={'X-Request': json.dumps({'algorithm': 'shell-sort'})})
+            self.assertEqual(response.json['result'], sorted(self.DATA))
+
+            fields = json.dumps({'algorithms': ['heap-sort'], 'dtype': 'int32'})
+            response = client.post('/compare', content_type='multipart/form-data', data={
+                'request': fields,
+                'data': (io.BytesIO(array.array('i', self.DATA).tobytes()), 'data.bin')
+            })
+            self.assertEqual(response.json['comparison']['heap-sort']['result'], sorted(self.DATA))
+            self.assertEqual(response.json['input_size'], len(self.DATA))
+
+            response = client.post('/execute?request=' + json.dumps({'algorithm': 'shell-sort'}),
+                                   data=b'\x01\x02\x03', content_type='application/octet-stream')
+            self.assertEqual(response.status_code, 400)
+        finally:
+            server.BACKEND = backend
+
+
+if __name__ == '__main__':
+    unittest.main()
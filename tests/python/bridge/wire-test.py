@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Binary Wire Format Tests
+
+Verifies that binary /execute bodies decode to the same content as the JSON
+bodies, that column types and diff records are chosen as documented, that
+non-numeric data falls back to JSON, and that the endpoint negotiates the
+format through the Accept header.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import json
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+from python.bridge.executor import ExecutionBackend, run_execute
+from python.bridge.serialization import compress_array_data, decompress_array_data
+from python.bridge.wire import (
+    HEADER, RECORD_HEADER, RECORD_OPS, WIRE_MIMETYPE, WireEncodingError,
+    column_typecode, decode_array, decode_execution, encode_array, encode_execution
+)
+
+try:
+    import flask  # noqa: F401
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+
+class WireFormatTest(unittest.TestCase):
+
+    DATA = list(range(60, 0, -1))
+
+    def test_roundtrip_matches_json(self):
+        text = run_execute('insertion-sort', self.DATA, {})
+        binary = run_execute('insertion-sort', self.DATA, {}, encoding='binary')
+        self.assertEqual(binary.mimetype, WIRE_MIMETYPE)
+        self.assertEqual(binary.history_states, text.history_states)
+
+        expected = json.loads(text.payload)
+        decoded = decode_execution(binary.payload)
+        self.assertEqual(decoded['result'], expected['result'])
+        self.assertEqual([s['array'] for s in decoded['history']], [s['array'] for s in expected['history']])
+        self.assertEqual([s['type'] for s in decoded['history'] if 'type' in s],
+                         [s['type'] for s in expected['history'] if 'type' in s])
+
+    def test_ops_records(self):
+        history = [{'array': self.DATA}, {'array': [0] + self.DATA[1:]}]
+        payload = encode_execution(sorted(self.DATA), {}, history)
+        meta_len = HEADER.unpack_from(payload)[-1]
+        first = HEADER.size + meta_len + (-meta_len % 8)
+        second = first + RECORD_HEADER.size + len(self.DATA) * 4 + (-len(self.DATA) * 4 % 8)
+        self.assertEqual(RECORD_HEADER.unpack_from(payload, second), (RECORD_OPS, 1))
+        self.assertEqual(decode_execution(payload)['history'][1]['array'][0], 0)
+
+    def test_column_types(self):
+        self.assertEqual(column_typecode([1, -2]), 'i')
+        self.assertEqual(column_typecode([2 ** 40]), 'q')
+        self.assertEqual(column_typecode([1, 2.5]), 'd')
+        self.assertIsNone(column_typecode([2 ** 70]))
+        self.assertIsNone(column_typecode(['a', 1]))
+        self.assertIsNone(column_typecode([True]))
+
+        self.assertEqual(decode_array(encode_array([2 ** 40, -3])), [2 ** 40, -3])
+        with self.assertRaises(WireEncodingError):
+            encode_execution(['b', 'a'], {}, [{'array': ['a', 'b']}])
+
+    def test_fallback_to_json(self):
+        output = run_execute('insertion-sort', ['b', 'a', 'c'], {}, encoding='binary')
+        self.assertEqual(output.mimetype, 'application/json')
+        self.assertEqual(json.loads(output.payload)['result'], ['a', 'b', 'c'])
+
+    def test_compress_array_data(self):
+        for values in ([3, 1, 2], [0.5, 2], ['x', {'y': 1}]):
+            self.assertEqual(decompress_array_data(compress_array_data(values)), values)
+        numbers = list(range(1000))
+        self.assertLess(len(compress_array_data(numbers)), len(compress_array_data([str(n) for n in numbers])))
+
+    @unittest.skipUnless(FLASK_AVAILABLE, "flask is required")
+    def test_negotiation(self):
+        from python.bridge import server
+        backend, server.BACKEND = server.BACKEND, ExecutionBackend(mode='inline')
+        try:
+            client = server.app.test_client()
+            request = {'algorithm': 'heap-sort', 'data': [4, 2, 3, 1], 'cache': False}
+
+            response = client.post('/execute', json=request)
+            self.assertEqual(response.mimetype, 'application/json')
+
+            response = client.post('/execute', json=request,
+                                   headers={'Accept': f'{WIRE_MIMETYPE}, application/json;q=0.5'})
+            self.assertEqual(response.mimetype, WIRE_MIMETYPE)
+            self.assertIn('Accept', response.headers['Vary'])
+            self.assertEqual(decode_execution(response.data)['result'], [1, 2, 3, 4])
+        finally:
+            server.BACKEND = backend
+
+
+if __name__ == '__main__':
+    unittest.main()
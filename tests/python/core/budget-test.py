@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Run Budget and Cancellation Tests
+
+Verifies that deadlines, comparison and history limits and cancellation
+tokens stop a run from inside the primitives with a partial-result report,
+and that unlimited runs bind nothing.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import pickle
+import threading
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../python')))
+from core.base_algorithm import Algorithm
+from core.budget import BudgetExceeded, CancellationToken, RunBudget
+
+
+class BubbleProbe(Algorithm):
+    """Bubble sort recording one state per pass."""
+
+    def __init__(self, options=None):
+        super().__init__("Bubble Probe", "comparison", options)
+
+    def run(self, array, options):
+        self.set_phase("sorting")
+        n = len(array)
+        for i in range(n):
+            for j in range(n - 1 - i):
+                if self.compare(self.read(array, j), self.read(array, j + 1)) > 0:
+                    self.swap(array, j, j + 1)
+            self.record_state(array, {"type": "pass"})
+        return array
+
+
+class BudgetTest(unittest.TestCase):
+
+    DATA = list(range(400, 0, -1))
+
+    def run_until_exceeded(self, **options):
+        algorithm = BubbleProbe(options)
+        with self.assertRaises(BudgetExceeded) as context:
+            algorithm.execute(self.DATA)
+        return algorithm, context.exception
+
+    def test_max_comparisons(self):
+        _, error = self.run_until_exceeded(budget={"max_comparisons": 1000, "check_interval": 64})
+        self.assertEqual(error.reason, "comparisons")
+        self.assertLessEqual(error.observed, 1000 + 64)
+        self.assertEqual(error.report["phase"], "sorting")
+        self.assertEqual(sorted(error.report["partial_result"]), sorted(self.DATA))
+
+    def test_history_states_exact(self):
+        algorithm, error = self.run_until_exceeded(budget=RunBudget(max_history_states=10))
+        self.assertEqual(error.reason, "history_states")
+        self.assertEqual(error.report["history_states"], 10)
+        # The error state is still recorded for visualization
+        self.assertEqual(algorithm.history[-1]["type"], "error")
+
+    def test_deadline(self):
+        _, error = self.run_until_exceeded(budget={"deadline": 0.0, "check_interval": 1})
+        self.assertEqual(error.reason, "deadline")
+
+    def test_cancellation(self):
+        token = CancellationToken()
+        token.cancel("client disconnected")
+        _, error = self.run_until_exceeded(cancellation_token=token)
+        self.assertEqual(error.reason, "cancelled")
+        self.assertEqual(error.observed, "client disconnected")
+
+    def test_cancel_from_other_thread(self):
+        token = CancellationToken()
+        algorithm = BubbleProbe({"cancellation_token": token, "record_history": False,
+                                 "budget": {"check_interval": 16}})
+        algorithm.on("comparison", lambda data: None)
+        timer = threading.Timer(0.05, token.cancel)
+        timer.start()
+        with self.assertRaises(BudgetExceeded):
+            algorithm.execute(list(range(5000, 0, -1)))
+        timer.join()
+
+    def test_unlimited_run_binds_nothing(self):
+        algorithm = BubbleProbe({"budget": {"max_comparisons": None}})
+        self.assertIsNone(algorithm._bind_budget(algorithm.options))
+        self.assertEqual(algorithm.execute([3, 1, 2]), [1, 2, 3])
+
+    def test_tightened_and_pickling(self):
+        budget = RunBudget(deadline=10, max_comparisons=500).tightened(RunBudget(deadline=2))
+        self.assertEqual((budget.deadline, budget.max_comparisons), (2, 500))
+
+        error = pickle.loads(pickle.dumps(BudgetExceeded("memory", 64, 80.5, {"phase": "x"})))
+        self.assertEqual((error.reason, error.observed, error.report), ("memory", 80.5, {"phase": "x"}))
+
+
+if __name__ == '__main__':
+    unittest.main()
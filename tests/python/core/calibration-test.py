@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Instrumentation Overhead Calibration Tests
+
+Verifies that the calibration facility measures non-negative per-primitive
+costs, that profiles follow how the primitives were bound, and that
+Algorithm.execute reports corrected (on request) and paired raw timings.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import time
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../python')))
+from core.base_algorithm import Algorithm
+from core.calibration import calibrate, get_calibration, profile_key, CalibrationProfile, PRIMITIVES
+
+
+class InsertionProbe(Algorithm):
+    """Small instrumented insertion sort used as a calibration subject."""
+
+    def __init__(self, options=None):
+        super().__init__("Insertion Probe", "comparison", options)
+
+    def run(self, array, options):
+        for i in range(1, len(array)):
+            j = i
+            while j > 0 and self.compare(self.read(array, j - 1), self.read(array, j)) > 0:
+                self.swap(array, j - 1, j)
+                j -= 1
+            self.record_state(array, {"type": "insert", "index": i})
+        return array
+
+
+class CalibrationTest(unittest.TestCase):
+
+    def test_profile_covers_all_primitives(self):
+        profile = calibrate(iterations=200, repeats=2)
+        for primitive in PRIMITIVES:
+            self.assertIn(primitive, profile.per_call)
+            self.assertGreaterEqual(profile.per_call[primitive], 0.0)
+        self.assertIs(get_calibration(), profile)
+
+    def test_overhead_model(self):
+        profile = CalibrationProfile(
+            per_call={p: 1.0 for p in PRIMITIVES},
+            record_state_per_element=0.5,
+            iterations=1,
+            repeats=1
+        )
+        metrics = {"comparisons": 3, "swaps": 2, "reads": 6, "writes": 4}
+        # 3 compares + 2 swaps + (6 - 4) direct reads + 0 direct writes + 2 states * (1 + 0.5 * 4)
+        self.assertEqual(profile.estimate_overhead(metrics, states=2, elements_per_state=4), 13.0)
+        self.assertEqual(profile.estimate_overhead(metrics, states=2, state_time=0.25), 7.25)
+
+    def test_profile_keys(self):
+        self.assertEqual(profile_key("counters", ["swap", "comparison"]), "counters+comparison+swap")
+        self.assertEqual(profile_key("full", ["swap"]), "full")
+        self.assertEqual(profile_key("none", monitored=True), "monitoring")
+
+        profile = get_calibration("counters", ["comparison"])
+        self.assertEqual(profile.tracer, "counters+comparison")
+        self.assertIsNot(profile, get_calibration())
+
+    def test_execute_reports_corrected_time(self):
+        algorithm = InsertionProbe({"overhead_correction": True})
+        result = algorithm.execute([5, 4, 3, 2, 1, 0])
+
+        self.assertEqual(result, [0, 1, 2, 3, 4, 5])
+        self.assertGreater(algorithm.metrics["instrumentation_overhead"], 0.0)
+        self.assertLessEqual(algorithm.metrics["corrected_execution_time"],
+                             algorithm.metrics["execution_time"])
+
+    def test_paired_timing(self):
+        algorithm = InsertionProbe({"paired_timing": True})
+        algorithm.execute([3, 1, 2])
+
+        self.assertGreater(algorithm.metrics["raw_execution_time"], 0.0)
+        # The raw run must not leak into the instrumented run's counters or history
+        self.assertEqual(algorithm.metrics["comparisons"], 3)
+        self.assertEqual(algorithm.history[0]["type"], "initial")
+        self.assertTrue(algorithm.options["record_history"])
+
+    def test_correction_disabled(self):
+        algorithm = InsertionProbe()
+        algorithm.execute([2, 1])
+        self.assertEqual(algorithm.metrics["instrumentation_overhead"], 0)
+
+    def test_uncounted_run_charges_recording_only(self):
+        from core import calibration
+        calibration.reset_calibration()
+
+        # Nothing is counted to charge, so no profile is measured
+        algorithm = InsertionProbe({"overhead_correction": True, "tracer": "none"})
+        algorithm.execute([3, 2, 1])
+        self.assertEqual(calibration._PROFILES, {})
+        self.assertGreater(algorithm.metrics["instrumentation_overhead"], 0.0)
+
+    def test_idle_time_excluded(self):
+        def blocked_sink(step, state):
+            time.sleep(0.05)
+            algorithm.exclude_idle_time(0.05)
+
+        algorithm = InsertionProbe({"history_sink": blocked_sink})
+        algorithm.execute([3, 2, 1])
+
+        # The timestamps stay real; only the reported duration leaves the waits out
+        metrics = algorithm.metrics
+        self.assertGreaterEqual(metrics["end_time"] - metrics["start_time"], 0.15)
+        self.assertLess(metrics["execution_time"], 0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Multi-Process Metrics Aggregation Tests
+
+Verifies that worker counters survive parallel runs, are merged per phase
+and per worker, that load-imbalance statistics identify stragglers, and
+that runs which cannot be parallelized are rejected up front.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../python')))
+from core.base_algorithm import Algorithm
+from core.metrics_aggregation import MetricsAggregator, WorkerMetrics, partition
+
+
+class PhasedInsertionSort(Algorithm):
+    """Insertion sort with a scan phase and an insert phase."""
+
+    def __init__(self, options=None):
+        super().__init__("Phased Insertion Sort", "comparison", options)
+
+    def run(self, array, options):
+        self.set_phase("scan")
+        for i in range(len(array)):
+            self.read(array, i)
+        self.set_phase("insert")
+        for i in range(1, len(array)):
+            j = i
+            while j > 0 and self.compare(array[j - 1], array[j]) > 0:
+                self.swap(array, j - 1, j)
+                j -= 1
+        return array
+
+
+class FirstSelect(Algorithm):
+    """Returns the smallest element (not a sorted array)."""
+
+    def __init__(self, options=None):
+        super().__init__("First Select", "selection", options)
+
+    def run(self, array, options):
+        return min(array)
+
+
+class MetricsAggregationTest(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.data = [rng.randint(0, 1000) for _ in range(200)]
+
+    def test_partition(self):
+        chunks = partition(list(range(10)), 3)
+        self.assertEqual([len(c) for c in chunks], [4, 3, 3])
+        self.assertEqual(sum(chunks, []), list(range(10)))
+        self.assertEqual(len(partition([1, 2], 8)), 2)
+
+    def test_parallel_metrics_merged(self):
+        algorithm = PhasedInsertionSort()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            result = algorithm.execute_parallel(self.data, workers=4, executor=executor)
+
+        self.assertEqual(result, sorted(self.data))
+
+        info = algorithm.get_info()["parallel"]
+        self.assertEqual(info["workers"], 4)
+
+        # Totals hold measured counts only; the uninstrumented merge is an estimate
+        worker_comparisons = sum(w["counters"]["comparisons"] for w in info["per_worker"])
+        self.assertEqual(algorithm.metrics["comparisons"], worker_comparisons)
+        self.assertEqual(info["per_phase"]["merge"]["comparisons"], 0)
+        self.assertEqual(info["estimates"]["merge_comparisons"], len(self.data) * 2)
+
+        # The scan phase reads every element exactly once across workers
+        self.assertEqual(info["per_phase"]["scan"]["reads"], len(self.data))
+        self.assertEqual(len(info["per_phase"]["insert"]["worker_times"]), 4)
+        self.assertIn("straggler_worker", info["imbalance"]["wall_time"])
+
+    def test_rejected_up_front(self):
+        from core.budget import CancellationToken
+        from core.tracers import NullTracer
+
+        with self.assertRaises(ValueError):
+            FirstSelect().execute_parallel(self.data, workers=2)
+        for options in ({"cancellation_token": CancellationToken()}, {"tracer": NullTracer()}):
+            with self.assertRaises(ValueError):
+                PhasedInsertionSort(options).execute_parallel(self.data, workers=2)
+
+        # The history sink is dropped: workers record no history
+        algorithm = PhasedInsertionSort({"history_sink": lambda step, state: None})
+        self.assertEqual(algorithm.execute_parallel(self.data, workers=2), sorted(self.data))
+
+    def test_process_workers(self):
+        algorithm = PhasedInsertionSort()
+        result = algorithm.execute_parallel(self.data, workers=2)
+
+        self.assertEqual(result, sorted(self.data))
+        self.assertEqual(len(algorithm.get_info()["parallel"]["per_worker"]), 2)
+
+        # A regular run clears the parallel breakdown
+        algorithm.execute([2, 1])
+        self.assertNotIn("parallel", algorithm.get_info())
+
+    def test_calibration_outside_timed_window(self):
+        from core.calibration import reset_calibration
+        from core.metrics_aggregation import run_partition
+
+        reset_calibration()
+        _, worker = run_partition(PhasedInsertionSort, {"overhead_correction": True}, [3, 1, 2], 0)
+        # Calibration takes tens of milliseconds; sorting three elements does not
+        self.assertLess(worker["wall_time"], 0.01)
+
+    def test_imbalance_statistics(self):
+        aggregator = MetricsAggregator()
+        for worker_id, wall_time in enumerate([1.0, 1.0, 4.0]):
+            aggregator.add(WorkerMetrics(
+                worker_id=worker_id, pid=0, input_size=10, wall_time=wall_time,
+                cpu_time=wall_time, counters={"comparisons": 10}
+            ).to_dict())
+
+        summary = aggregator.summary()
+        wall = summary["imbalance"]["wall_time"]
+        self.assertEqual(wall["straggler_worker"], 2)
+        self.assertAlmostEqual(wall["imbalance_ratio"], 2.0)
+        self.assertAlmostEqual(summary["imbalance"]["parallel_efficiency"], 0.5)
+        self.assertEqual(summary["totals"]["comparisons"], 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+sys.monitoring Counting Backend Tests
+
+Verifies exact operation counts for algorithms written without wrapper
+methods, that calls through the bare primitives are counted, scoping to the
+algorithm's own code and thread, clean teardown, overhead correction with
+the monitoring profile, and the fallback to wrapper counters on
+interpreters without PEP 669.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import threading
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../python')))
+from core.base_algorithm import Algorithm
+from core.monitoring import MONITORING_AVAILABLE, create_monitor
+
+
+class PlainBubbleSort(Algorithm):
+    """Bubble sort written with bare operations (no wrapper calls)."""
+
+    def __init__(self, options=None):
+        super().__init__("Plain Bubble Sort", "comparison", options)
+
+    def run(self, array, options):
+        n = len(array)
+        for i in range(n - 1):
+            for j in range(n - 1 - i):
+                if array[j] > array[j + 1]:
+                    array[j], array[j + 1] = array[j + 1], array[j]
+        return array
+
+
+class WrapperBubbleSort(PlainBubbleSort):
+    """Bubble sort using the instrumentation wrappers."""
+
+    def run(self, array, options):
+        n = len(array)
+        for i in range(n - 1):
+            for j in range(n - 1 - i):
+                if self.compare(array[j], array[j + 1]) > 0:
+                    self.swap(array, j, j + 1)
+        return array
+
+
+class MonitoringBackendTest(unittest.TestCase):
+
+    @unittest.skipUnless(MONITORING_AVAILABLE, "requires sys.monitoring (Python 3.12+)")
+    def test_exact_counts_without_wrappers(self):
+        algorithm = PlainBubbleSort({"counting_backend": "monitoring", "record_history": False})
+        result = algorithm.execute([3, 2, 1])
+
+        self.assertEqual(result, [1, 2, 3])
+        self.assertEqual(algorithm.counting_backend, "monitoring")
+
+        counts = algorithm.metrics["monitored_operations"]
+        # 3 comparisons, each reading 2 elements; 3 swaps reading and writing 2 each
+        self.assertEqual(counts["comparisons"], 3)
+        self.assertEqual(counts["reads"], 12)
+        self.assertEqual(counts["writes"], 6)
+        # len() once, outer range() once, inner range() twice
+        self.assertEqual(counts["calls"], 4)
+
+        # The wrapper counters were never touched
+        self.assertEqual(algorithm.metrics["comparisons"], 0)
+
+    @unittest.skipUnless(MONITORING_AVAILABLE, "requires sys.monitoring (Python 3.12+)")
+    def test_primitive_calls_counted(self):
+        algorithm = WrapperBubbleSort({"counting_backend": "monitoring", "record_history": False})
+        algorithm.execute([3, 2, 1])
+
+        # The primitives run bare; no counting closures are bound
+        self.assertEqual(algorithm.tracer.name, "none")
+
+        counts = algorithm.metrics["monitored_operations"]
+        # 3 compare() calls plus the 3 "> 0" tests on their results; the
+        # a < b / a > b inside the primitive are not counted again
+        self.assertEqual(counts["comparisons"], 6)
+        # 6 bare reads for the arguments, 3 swaps reading and writing 2 each
+        self.assertEqual(counts["reads"], 12)
+        self.assertEqual(counts["writes"], 6)
+        # 3 compare() + 3 swap() calls on top of len() and three range() calls
+        self.assertEqual(counts["calls"], 10)
+
+        # The usual counters are maintained from the primitive calls
+        self.assertEqual(algorithm.metrics["comparisons"], 3)
+        self.assertEqual(algorithm.metrics["swaps"], 3)
+        self.assertEqual(algorithm.metrics["reads"], 6)
+
+    @unittest.skipUnless(MONITORING_AVAILABLE, "requires sys.monitoring (Python 3.12+)")
+    def test_other_threads_not_counted(self):
+        # Same class on wrappers, on another thread
+        other = threading.Thread(target=WrapperBubbleSort({"record_history": False}).execute,
+                                 args=([3, 2, 1],))
+        monitor = create_monitor(WrapperBubbleSort)
+        self.assertTrue(monitor.start())
+        try:
+            other.start()
+            other.join()
+        finally:
+            monitor.stop()
+        self.assertEqual(monitor.counts, {"comparisons": 0, "reads": 0, "writes": 0, "calls": 0})
+
+    @unittest.skipUnless(MONITORING_AVAILABLE, "requires sys.monitoring (Python 3.12+)")
+    def test_stop_releases_tool(self):
+        monitor = create_monitor(PlainBubbleSort)
+        self.assertTrue(monitor.start())
+        tool_id = monitor._tool_id
+        monitor.stop()
+
+        self.assertIsNone(sys.monitoring.get_tool(tool_id))
+        self.assertFalse(monitor.active)
+
+        # Counting stops once the monitor is off
+        PlainBubbleSort({"record_history": False}).execute([2, 1])
+        self.assertEqual(monitor.counts["comparisons"], 0)
+
+    @unittest.skipUnless(MONITORING_AVAILABLE, "requires sys.monitoring (Python 3.12+)")
+    def test_overhead_correction_uses_monitoring_profile(self):
+        from core.calibration import get_calibration
+
+        algorithm = PlainBubbleSort({"counting_backend": "monitoring", "record_history": False,
+                                     "overhead_correction": True})
+        algorithm.execute(list(range(50, 0, -1)))
+
+        profile = get_calibration("none", monitored=True)
+        self.assertEqual(profile.tracer, "monitoring")
+        self.assertIn("event", profile.per_call)
+        # Only the instruction events of the run's own code are charged
+        self.assertGreater(algorithm.metrics["instrumentation_overhead"], 0.0)
+        self.assertEqual(algorithm.metrics["comparisons"], 0)
+
+    def test_fallback_without_monitoring(self):
+        algorithm = WrapperBubbleSort({"counting_backend": "monitoring", "record_history": False})
+        algorithm.execute([2, 1])
+
+        if not MONITORING_AVAILABLE:
+            self.assertEqual(algorithm.counting_backend, "wrappers")
+            self.assertNotIn("monitored_operations", algorithm.metrics)
+        self.assertEqual(algorithm.metrics["comparisons"], 1)
+        self.assertEqual(algorithm.get_info()["counting_backend"], algorithm.counting_backend)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Startup Time Budget Tests
+
+Runs fresh interpreters with ``-X importtime`` and checks that importing
+python.core and the modules a bridge worker needs stays within budget and
+does not pull in heavy dependencies such as NumPy.
+
+The budgets are generous defaults for a cold CI machine and can be tightened
+with the STARTUP_BUDGET_MS and WORKER_SPAWN_BUDGET_MS environment variables.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import time
+import subprocess
+import unittest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
+
+CORE_MODULES = [
+    "python.core.base_algorithm",
+    "python.core.tracers",
+    "python.core.calibration",
+]
+WORKER_MODULES = CORE_MODULES + [
+    "python.bridge.serialization",
+    "python.bridge.registry",
+    "python.utils.data_generators",
+]
+HEAVY_MODULES = ("numpy", "matplotlib", "pandas")
+
+STARTUP_BUDGET_MS = float(os.environ.get("STARTUP_BUDGET_MS", 300))
+WORKER_SPAWN_BUDGET_MS = float(os.environ.get("WORKER_SPAWN_BUDGET_MS", 1500))
+
+
+def import_times(modules):
+    """
+    Import modules in a fresh interpreter and parse ``-X importtime``.
+
+    Returns:
+        Mapping of module name to cumulative import time in microseconds
+    """
+    code = "; ".join(f"import {name}" for name in modules)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+class StartupBudgetTest(unittest.TestCase):
+
+    def test_core_import_budget(self):
+        times = import_times(CORE_MODULES)
+        for name in HEAVY_MODULES:
+            self.assertNotIn(name, times)
+
+        total_ms = sum(times.get(name, 0) for name in CORE_MODULES) / 1000
+        self.assertLess(total_ms, STARTUP_BUDGET_MS)
+
+    def test_base_class_skips_inspect(self):
+        self.assertNotIn("inspect", import_times(["python.core.base_algorithm"]))
+
+    def test_worker_modules_skip_numpy(self):
+        times = import_times(WORKER_MODULES)
+        for name in HEAVY_MODULES:
+            self.assertNotIn(name, times)
+
+    def test_worker_spawn_budget(self):
+        code = "; ".join(f"import {name}" for name in WORKER_MODULES)
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, check=True)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.assertLess(elapsed_ms, WORKER_SPAWN_BUDGET_MS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pluggable Tracer Tests
+
+Verifies that each built-in tracer binds at execute time, produces the
+expected counters and reports, and leaves no instance-level primitives
+behind after the run.
+
+Author: Algorithm Visualization Platform Team
+License: MIT
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../python')))
+from core.base_algorithm import Algorithm
+from core.tracers import Tracer, BOUND_PRIMITIVES, register_tracer, resolve_tracer
+
+
+class SelectionProbe(Algorithm):
+    """Small instrumented selection sort used as a tracing subject."""
+
+    def __init__(self, options=None):
+        super().__init__("Selection Probe", "comparison", options)
+
+    def run(self, array, options):
+        self.set_phase("selecting")
+        n = len(array)
+        for i in range(n - 1):
+            smallest = i
+            for j in range(i + 1, n):
+                if self.compare(self.read(array, j), self.read(array, smallest)) < 0:
+                    smallest = j
+            self.swap(array, i, smallest)
+            self.record_state(array, {"type": "placed", "index": i})
+        return array
+
+
+class CountingTracer(Tracer):
+    """Custom tracer counting compare calls in its own field."""
+
+    name = "compare-counter"
+
+    def __init__(self):
+        self.calls = 0
+
+    def bind(self, algorithm, options):
+        base_compare = type(algorithm).compare
+
+        def compare(a, b, comparator=None):
+            self.calls += 1
+            return base_compare(algorithm, a, b, comparator)
+
+        algorithm.compare = compare
+
+
+class TracerTest(unittest.TestCase):
+
+    DATA = [4, 2, 5, 1, 3]
+
+    def run_with(self, tracer, **options):
+        algorithm = SelectionProbe(dict(options, tracer=tracer))
+        result = algorithm.execute(self.DATA)
+        self.assertEqual(result, [1, 2, 3, 4, 5])
+        for name in BOUND_PRIMITIVES:
+            self.assertNotIn(name, algorithm.__dict__)
+        return algorithm
+
+    def test_counters_default(self):
+        algorithm = self.run_with("counters")
+        self.assertEqual(algorithm.metrics["comparisons"], 10)
+        self.assertEqual(algorithm.metrics["reads"], 20 + 2 * algorithm.metrics["swaps"])
+        self.assertEqual(algorithm.get_info()["tracer"], "counters")
+        self.assertNotIn("instrumentation", algorithm.get_info())
+
+    def test_counters_keep_events_for_listeners(self):
+        algorithm = SelectionProbe({"tracer": "counters"})
+        seen = []
+        algorithm.on("comparison", seen.append)
+        algorithm.execute(self.DATA)
+        self.assertEqual(len(seen), 10)
+
+    def test_none_tracer(self):
+        algorithm = self.run_with("none")
+        self.assertEqual(algorithm.metrics["comparisons"], 0)
+        self.assertEqual(algorithm.metrics["swaps"], 0)
+
+    def test_full_tracer_report(self):
+        algorithm = self.run_with("full")
+        report = algorithm.get_info()["instrumentation"]
+        self.assertEqual(report["metrics"]["comparisons"], 10)
+        self.assertIn("selecting", report["phase_analysis"]["operations_per_phase"])
+        self.assertEqual(algorithm.metrics["comparisons"], 10)
+
+    def test_sampling_tracer(self):
+        algorithm = self.run_with("sampling", trace_sample_interval=5)
+        report = algorithm.get_info()["instrumentation"]
+        self.assertEqual(algorithm.metrics["comparisons"], 10)
+        self.assertEqual(report["sampling"]["interval"], 5)
+        self.assertGreater(report["sampling"]["sampled_operations"], 0)
+        self.assertLess(report["metrics"]["comparisons"], 10)
+
+    def test_custom_tracer_instance_and_registration(self):
+        tracer = CountingTracer()
+        self.run_with(tracer)
+        self.assertEqual(tracer.calls, 10)
+
+        register_tracer("compare-counter", CountingTracer)
+        self.assertIsInstance(resolve_tracer("compare-counter"), CountingTracer)
+
+    def test_history_disabled_skips_record_state(self):
+        algorithm = self.run_with("counters", record_history=False)
+        self.assertEqual(algorithm.history, [])
+
+    def test_unknown_tracer(self):
+        with self.assertRaises(ValueError):
+            resolve_tracer("does-not-exist")
+
+
+if __name__ == '__main__':
+    unittest.main()